@@ -1,8 +1,9 @@
-import re, hashlib
-from pathlib import Path
+import re, hashlib, sys
 
-p = Path('/mnt/data/_p45probeta/src/campaign/CampaignData.js')
-text = p.read_text(encoding='utf-8')
+from tools.campaigndoc import CampaignDoc
+from tools.contentcache import ContentCache, fingerprint
+from tools.missionpool import patch_sections
+from tools.profiling import PROF
 
 MISSIONS = [
  'c2_m11_ironweave','c2_m12_switchyard','c2_m13_redhorizon','c2_m14_radiant','c2_m15_refinery',
@@ -28,46 +29,41 @@ def pick_en(s: str) -> str:
     for i in range(len(PHRASES)):
         cand = PHRASES[(h + i) % len(PHRASES)]
         if cand not in BLACKLIST and len(re.findall(r"[A-Za-z]", cand)) >= 6:
+            if PROF.on:
+                PROF.hit('pick_en', cand)
             return cand
+    if PROF.on:
+        PROF.hit('pick_en', 'Understood.')
     return 'Understood.'
 
-def extract_section(all_text: str, mid: str) -> tuple[int,int] | None:
-    start = all_text.find(f"    {mid}: {{")
-    if start < 0:
-        return None
-    # end at next mission key at same indent
-    idx = start + 1
-    nxt = None
-    for other in MISSIONS:
-        if other == mid:
-            continue
-        pos = all_text.find(f"    {other}: {{", start + 10)
-        if pos != -1:
-            if nxt is None or pos < nxt:
-                nxt = pos
-    end = nxt if nxt is not None else len(all_text)
-    return start, end
-
-for mid in MISSIONS:
-    se = extract_section(text, mid)
-    if not se:
-        continue
-    s,e = se
-    sec = text[s:e]
+# bump PASS_VERSION when the code (not the tables) changes output
+PASS_VERSION = 1
+RULESET = fingerprint(PASS_VERSION, PHRASES, sorted(BLACKLIST))
 
+def patch_mission(batch, mission, pick=pick_en) -> int:
     # add en field to say objects missing it
-    pat = re.compile(r"(\{\s*id:\s*'[^']+'\s*,\s*type:\s*'say'[\s\S]*?\btext:\s*')([^']*)(')(\s*,)(?!\s*en:)", re.M)
+    n = 0
+    for step in mission.steps:
+        if step.type != 'say' or 'en' in step:
+            continue
+        ko = step.get_str('text')
+        if ko is None:
+            continue
+        batch.set_string(step, 'en', pick(ko))
+        n += 1
+    # cutscene line objects without en are left alone (not generic-safe)
+    return n
 
-    def repl(m):
-        ko = m.group(2)
-        en = pick_en(ko)
-        return f"{m.group(1)}{ko}{m.group(3)}, en: '{en}'{m.group(4)}"
+def patch(doc: CampaignDoc, batch, cache: ContentCache | None = None, jobs: int = 1):
+    # the memo wrapper only lives in this process; workers call pick_en directly
+    pick = cache.memo('pick_en', RULESET).wrap(pick_en) if cache is not None and jobs <= 1 else pick_en
+    patch_sections(doc, batch, 'add_en_say', RULESET, patch_mission, MISSIONS,
+                   cache=cache, args=lambda mid: (pick,), jobs=jobs)
 
-    sec2, n = pat.subn(repl, sec)
-    # also patch cutscene line objects inside arrays if missing en (just in case)
-    pat_line = re.compile(r"(\{\s*t:\s*[^,]+,\s*speaker:\s*[^,]+,\s*text:\s*')([^']*)(')(\s*\})(?!\s*,\s*en:)", re.M)
-    # we only add en if it's a line object without en AND it's inside a cutscene lines array; hard to detect, so skip.
-    text = text[:s] + sec2 + text[e:]
+def main(argv=None):
+    # one pass of tools.pipeline (same --campaign/--dry-run/--no-cache/--jobs/--profile)
+    from tools.pipeline import main as pipeline
+    return pipeline(['add_en_say', *(sys.argv[1:] if argv is None else argv)])
 
-p.write_text(text, encoding='utf-8')
-print('OK: added en to say lines (generic)')
+if __name__ == '__main__':
+    sys.exit(main())
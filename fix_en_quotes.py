@@ -1,67 +1,113 @@
-import pathlib
-
-path = pathlib.Path('src/campaign/CampaignData.js')
-text = path.read_text(encoding='utf-8')
-
-out = []
-i = 0
-n = len(text)
-converted = 0
-
-# Helper to check identifier boundary
-
-def is_id_char(c: str) -> bool:
-    return c.isalnum() or c in ['_', '$']
-
-while i < n:
-    # find 'en' key pattern: en: <ws> '...'
-    if text.startswith('en', i):
-        # ensure boundary
-        prev = text[i-1] if i > 0 else ''
-        nxt = text[i+2] if i+2 < n else ''
-        if (i == 0 or not is_id_char(prev)):
-            j = i + 2
-            # skip spaces
-            while j < n and text[j].isspace():
-                j += 1
-            if j < n and text[j] == ':':
-                j += 1
-                while j < n and text[j].isspace():
-                    j += 1
-                if j < n and text[j] == "'":
-                    # parse single-quoted JS string
-                    start = i
-                    out.append(text[i:j])  # include 'en:' and spaces up to quote
-                    j += 1
-                    buf = []
-                    while j < n:
-                        c = text[j]
-                        if c == '\\':
-                            if j+1 < n:
-                                buf.append(c)
-                                buf.append(text[j+1])
-                                j += 2
-                                continue
-                            else:
-                                buf.append(c)
-                                j += 1
-                                continue
-                        if c == "'":
-                            j += 1
-                            break
-                        buf.append(c)
-                        j += 1
-                    # Convert content to double-quoted string.
-                    content = ''.join(buf)
-                    # We keep existing backslash escapes as-is, but must escape double quotes.
-                    content = content.replace('"', '\\"')
-                    out.append('"' + content + '"')
-                    converted += 1
-                    i = j
-                    continue
-    out.append(text[i])
-    i += 1
-
-new_text = ''.join(out)
-path.write_text(new_text, encoding='utf-8')
-print(f'Converted en single-quoted strings -> double-quoted: {converted}')
+import argparse
+import io
+import os
+import re
+import sys
+from pathlib import Path
+
+from tools.campaigndoc import CAMPAIGN_JS
+from tools.jslex import StringScanner
+from tools.profiling import PROF, add_arguments, session
+
+CHUNK = 1 << 20
+TAIL = 128  # code lookbehind kept for matching `en:` before a quote
+
+# `en` key (identifier boundary) right before the opening quote
+EN_KEY_RE = re.compile(r"(?:^|[^\w$])en\s*:\s*$")
+# unescaped double quotes inside the string body
+DQUOTE_RE = re.compile(r'(\\[\s\S])|"')
+
+
+def _escape_dq(m):
+    return m.group(1) or '\\"'
+
+
+def convert(src, dst) -> int:
+    """Stream src -> dst, rewriting `en: '...'` to `en: "..."`.
+
+    Existing backslash escapes are kept as-is; bare double quotes in the
+    body get escaped. Strings/comments are tokenized, so `en:` inside other
+    literals is left alone.
+    """
+    scanner = StringScanner()
+    tail = ''
+    converting = False
+    converted = 0
+    prof = PROF.on
+
+    def run(pieces):
+        nonlocal tail, converting, converted
+        for kind, piece in pieces:
+            if kind == 'code':
+                tail = (tail + piece)[-TAIL:]
+                dst.write(piece)
+            elif kind == 'open':
+                converting = piece == "'" and EN_KEY_RE.search(tail) is not None
+                if prof:
+                    PROF.count('regex.evals', piece == "'")
+                tail = ''
+                dst.write('"' if converting else piece)
+            elif kind == 'body':
+                if converting:
+                    body, n = DQUOTE_RE.subn(_escape_dq, piece)
+                    if prof:
+                        PROF.count('regex.evals')
+                        PROF.count('dquotes.matched', n)
+                    dst.write(body)
+                else:
+                    dst.write(piece)
+            elif kind == 'close':
+                dst.write('"' if converting else piece)
+                converted += converting
+                converting = False
+            else:
+                tail = ''
+                dst.write(piece)
+
+    while True:
+        chunk = src.read(CHUNK)
+        if not chunk:
+            break
+        if prof:
+            PROF.count('bytes.scanned', len(chunk))
+        run(scanner.feed(chunk))
+    run(scanner.close())
+    if prof:
+        PROF.count('en.converted', converted)
+    return converted
+
+
+def patch(doc, batch, cache=None, jobs: int = 1):
+    """Pipeline pass: convert each mission section (and the text around
+    them) on its own; they are whole tokens, and unchanged ones queue no edit."""
+    spans = [m.section for m in doc.missions.values()]
+    if not spans:
+        spans = [(0, len(doc.text))]
+    bounds = [(0, spans[0][0])] + spans + [(spans[-1][1], len(doc.text))]
+    for s, e in bounds:
+        dst = io.StringIO(newline='')
+        if convert(io.StringIO(doc.text[s:e], newline=''), dst):
+            batch.replace(s, e, dst.getvalue())
+
+
+def main(argv=None):
+    # standalone: stream the file in constant memory, any JS file works;
+    # chained with other passes it runs as `python -m tools.pipeline fix_en_quotes ...`
+    ap = argparse.ArgumentParser(description="Rewrite `en: '...'` strings to double quotes.")
+    ap.add_argument('path', nargs='?', default=str(CAMPAIGN_JS))
+    add_arguments(ap)
+    args = ap.parse_args(argv)
+
+    path = Path(args.path)
+    tmp = path.with_name(path.name + f'.{os.getpid()}.tmp')
+    with session(args):
+        with PROF.stage('convert'), open(path, encoding='utf-8', newline='') as src, \
+                open(tmp, 'w', encoding='utf-8', newline='') as dst:
+            converted = convert(src, dst)
+        os.replace(tmp, path)
+    print(f'Converted en single-quoted strings -> double-quoted: {converted}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
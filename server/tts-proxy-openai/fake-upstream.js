@@ -0,0 +1,37 @@
+// Stand-in for the OpenAI speech endpoint, for exercising the proxy offline:
+//   node fake-upstream.js            (listens on FAKE_PORT, default 8788)
+//   OPENAI_BASE_URL=http://localhost:8788 OPENAI_API_KEY=dummy npm start
+// POST /audio/speech answers after FAKE_DELAY_MS with bytes derived from the
+// request, so identical requests get identical audio. GET /calls -> call count.
+
+import { createHash } from "node:crypto";
+import http from "node:http";
+
+const port = Number(process.env.FAKE_PORT || 8788);
+const delayMs = Number(process.env.FAKE_DELAY_MS || 300);
+let calls = 0;
+
+http.createServer((req, res) => {
+  if (req.method === "GET" && req.url === "/calls") {
+    res.setHeader("Content-Type", "application/json");
+    return res.end(JSON.stringify({ calls }));
+  }
+  if (req.method !== "POST" || req.url !== "/audio/speech") {
+    res.statusCode = 404;
+    return res.end();
+  }
+  const chunks = [];
+  req.on("data", (c) => chunks.push(c));
+  req.on("end", () => {
+    calls++;
+    const body = Buffer.concat(chunks);
+    const digest = createHash("sha256").update(body).digest();
+    const audio = Buffer.concat([Buffer.from("FAKEAUDIO"), ...Array(64).fill(digest)]);
+    setTimeout(() => {
+      res.setHeader("Content-Type", "audio/mpeg");
+      res.end(audio);
+    }, delayMs);
+  });
+}).listen(port, () => {
+  console.log(`[fake-upstream] listening on http://localhost:${port}`);
+});
@@ -1,4 +1,6 @@
 import express from "express";
+import { fileURLToPath } from "node:url";
+import { cacheKey, DiskCache } from "./ttsCache.js";
 
 const app = express();
 app.use(express.json({ limit: "256kb" }));
@@ -7,33 +9,55 @@ app.use(express.json({ limit: "256kb" }));
 app.use((req, res, next) => {
   res.setHeader("Access-Control-Allow-Origin", "*");
   res.setHeader("Access-Control-Allow-Methods", "POST, OPTIONS");
-  res.setHeader("Access-Control-Allow-Headers", "Content-Type, Authorization, X-Api-Key");
+  res.setHeader("Access-Control-Allow-Headers", "Content-Type, Authorization, X-Api-Key, If-None-Match");
+  res.setHeader("Access-Control-Expose-Headers", "ETag, X-Cache");
   if (req.method === "OPTIONS") return res.status(204).end();
   next();
 });
 
 const OPENAI_API_KEY = process.env.OPENAI_API_KEY;
+const OPENAI_BASE_URL = (process.env.OPENAI_BASE_URL || "https://api.openai.com/v1").replace(/\/+$/, "");
 const MODEL = process.env.OPENAI_TTS_MODEL || "gpt-4o-mini-tts";
 const DEFAULT_VOICE = process.env.OPENAI_TTS_VOICE || "marin";
+const CACHE_DIR = process.env.TTS_CACHE_DIR || fileURLToPath(new URL("./cache", import.meta.url));
+const CACHE_MAX_MB = Number(process.env.TTS_CACHE_MAX_MB || 512);
 
-app.get("/health", (req, res) => res.json({ ok: true }));
+const cache = await new DiskCache({ dir: CACHE_DIR, maxBytes: CACHE_MAX_MB * 1024 * 1024 }).init();
+const inflight = new Map(); // cache key -> Promise<{ buf, etag }>
 
-// Accepts: { text, voice?, instructions?, response_format? }
-// Returns: audio bytes
-app.post("/tts", async (req, res) => {
-  try {
-    if (!OPENAI_API_KEY) {
-      return res.status(500).json({ error: "Missing OPENAI_API_KEY env" });
-    }
+const timer = () => ({ count: 0, totalMs: 0, maxMs: 0 });
+const stats = {
+  hits: 0,
+  misses: 0,
+  coalesced: 0,
+  upstreamCalls: 0,
+  upstreamErrors: 0,
+  latency: { hit: timer(), miss: timer(), upstream: timer() },
+};
 
-    const text = String(req.body?.text ?? "").trim();
-    if (!text) return res.status(400).json({ error: "text is required" });
+function record(t, ms) {
+  t.count++;
+  t.totalMs += ms;
+  t.maxMs = Math.max(t.maxMs, ms);
+}
 
-    const voice = String(req.body?.voice || DEFAULT_VOICE);
-    const instructions = req.body?.instructions ? String(req.body.instructions) : undefined;
-    const response_format = String(req.body?.response_format || "mp3");
+function summary(t) {
+  return { count: t.count, avgMs: t.count ? +(t.totalMs / t.count).toFixed(1) : 0, maxMs: +t.maxMs.toFixed(1) };
+}
 
-    const r = await fetch("https://api.openai.com/v1/audio/speech", {
+class UpstreamError extends Error {
+  constructor(status, detail) {
+    super(`Upstream TTS error ${status}`);
+    this.status = status;
+    this.detail = detail;
+  }
+}
+
+async function synthesize({ text, voice, instructions, format }) {
+  const t0 = performance.now();
+  stats.upstreamCalls++;
+  try {
+    const r = await fetch(`${OPENAI_BASE_URL}/audio/speech`, {
       method: "POST",
       headers: {
         "Authorization": `Bearer ${OPENAI_API_KEY}`,
@@ -44,25 +68,98 @@ app.post("/tts", async (req, res) => {
         input: text,
         voice,
         ...(instructions ? { instructions } : {}),
-        response_format,
+        response_format: format,
       }),
     });
-
     if (!r.ok) {
       const msg = await r.text().catch(() => "");
-      return res.status(502).json({ error: "Upstream TTS error", status: r.status, detail: msg.slice(0, 500) });
+      throw new UpstreamError(r.status, msg.slice(0, 500));
     }
+    return Buffer.from(await r.arrayBuffer());
+  } catch (e) {
+    stats.upstreamErrors++;
+    throw e;
+  } finally {
+    record(stats.latency.upstream, performance.now() - t0);
+  }
+}
 
-    const buf = Buffer.from(await r.arrayBuffer());
-    res.setHeader("Content-Type", response_format === "wav" ? "audio/wav" : "audio/mpeg");
-    res.setHeader("Cache-Control", "no-store");
+// Cached audio for a request; identical requests in flight share one upstream call.
+async function getAudio(req) {
+  const key = cacheKey({ model: MODEL, ...req });
+  const hit = await cache.get(key);
+  if (hit) {
+    stats.hits++;
+    return { ...hit, cached: "HIT" };
+  }
+  let p = inflight.get(key);
+  if (p) {
+    stats.coalesced++;
+    return { ...(await p), cached: "COALESCED" };
+  }
+  stats.misses++;
+  p = synthesize(req).then(async (buf) => ({ buf, etag: await cache.put(key, buf) }));
+  inflight.set(key, p);
+  try {
+    return { ...(await p), cached: "MISS" };
+  } finally {
+    inflight.delete(key);
+  }
+}
+
+app.get("/health", (req, res) => res.json({
+  ok: true,
+  cache: {
+    entries: cache.size,
+    bytes: cache.bytes,
+    maxBytes: cache.maxBytes,
+    evictions: cache.evictions,
+    writeErrors: cache.writeErrors,
+    inflight: inflight.size,
+  },
+  hits: stats.hits,
+  misses: stats.misses,
+  coalesced: stats.coalesced,
+  upstream: { calls: stats.upstreamCalls, errors: stats.upstreamErrors, latency: summary(stats.latency.upstream) },
+  latency: { hit: summary(stats.latency.hit), miss: summary(stats.latency.miss) },
+}));
+
+// Accepts: { text, voice?, instructions?, response_format? | format? }
+// Returns: audio bytes (ETag + immutable caching; X-Cache: HIT | MISS | COALESCED)
+app.post("/tts", async (req, res) => {
+  const t0 = performance.now();
+  try {
+    if (!OPENAI_API_KEY) {
+      return res.status(500).json({ error: "Missing OPENAI_API_KEY env" });
+    }
+
+    const text = String(req.body?.text ?? "").trim();
+    if (!text) return res.status(400).json({ error: "text is required" });
+
+    const voice = String(req.body?.voice || DEFAULT_VOICE);
+    const instructions = req.body?.instructions ? String(req.body.instructions) : "";
+    // TTSManager sends `format`
+    const format = String(req.body?.response_format || req.body?.format || "mp3");
+
+    const { buf, etag, cached } = await getAudio({ text, voice, instructions, format });
+    record(cached === "HIT" ? stats.latency.hit : stats.latency.miss, performance.now() - t0);
+
+    res.setHeader("ETag", etag);
+    res.setHeader("Cache-Control", "public, max-age=31536000, immutable");
+    res.setHeader("X-Cache", cached);
+    const inm = String(req.get("If-None-Match") || "");
+    if (inm.split(",").some((t) => t.trim() === etag)) return res.status(304).end();
+    res.setHeader("Content-Type", format === "wav" ? "audio/wav" : "audio/mpeg");
     res.status(200).send(buf);
   } catch (e) {
+    if (e instanceof UpstreamError) {
+      return res.status(502).json({ error: "Upstream TTS error", status: e.status, detail: e.detail });
+    }
     res.status(500).json({ error: "Proxy crashed", detail: String(e?.message || e) });
   }
 });
 
 const port = Number(process.env.PORT || 8787);
 app.listen(port, () => {
-  console.log(`[tts-proxy] listening on http://localhost:${port}`);
+  console.log(`[tts-proxy] listening on http://localhost:${port} (cache ${CACHE_DIR}, ${CACHE_MAX_MB} MB)`);
 });
@@ -0,0 +1,148 @@
+// npm test (installs express first if it is missing): runs server.js against fake-upstream.js on free ports with a
+// throwaway cache dir (a few KB, so eviction kicks in after two clips).
+
+import { after, before, test } from "node:test";
+import assert from "node:assert/strict";
+import { spawn } from "node:child_process";
+import { mkdtemp, rm, writeFile } from "node:fs/promises";
+import net from "node:net";
+import os from "node:os";
+import path from "node:path";
+import { fileURLToPath } from "node:url";
+import { DiskCache } from "../ttsCache.js";
+
+const HERE = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.join(HERE, "..");
+const CLIP_BYTES = 9 + 64 * 32; // fake-upstream.js: "FAKEAUDIO" + 64 sha256 digests
+
+const procs = [];
+let tmp, proxy, upstream;
+
+function freePort() {
+  return new Promise((resolve, reject) => {
+    const srv = net.createServer().listen(0, () => {
+      const { port } = srv.address();
+      srv.close(() => resolve(port));
+    }).on("error", reject);
+  });
+}
+
+function start(script, env) {
+  const child = spawn(process.execPath, [script], { cwd: ROOT, env: { ...process.env, ...env }, stdio: ["ignore", "ignore", "pipe"] });
+  child.stderrText = "";
+  child.stderr.on("data", (d) => { child.stderrText += d; });
+  procs.push(child);
+  return child;
+}
+
+// Fails as soon as the child dies (e.g. express not installed) instead of
+// timing out, with its stderr in the message.
+async function waitFor(url, child) {
+  for (let i = 0; i < 100; i++) {
+    if (child.exitCode !== null) {
+      throw new Error(`${child.spawnargs[1]} exited with ${child.exitCode} (run npm install first?)\n${child.stderrText}`);
+    }
+    try {
+      if ((await fetch(url)).ok) return;
+    } catch { /* not listening yet */ }
+    await new Promise((r) => setTimeout(r, 50));
+  }
+  throw new Error(`${url} did not come up`);
+}
+
+const tts = (text, headers = {}) => fetch(`${proxy}/tts`, {
+  method: "POST",
+  headers: { "Content-Type": "application/json", ...headers },
+  body: JSON.stringify({ text, voice: "marin" }),
+});
+const health = async () => (await fetch(`${proxy}/health`)).json();
+const upstreamCalls = async () => (await (await fetch(`${upstream}/calls`)).json()).calls;
+
+before(async () => {
+  tmp = await mkdtemp(path.join(os.tmpdir(), "tts-proxy-test-"));
+  const [fakePort, port] = [await freePort(), await freePort()];
+  upstream = `http://127.0.0.1:${fakePort}`;
+  proxy = `http://127.0.0.1:${port}`;
+  const fake = start("fake-upstream.js", { FAKE_PORT: String(fakePort), FAKE_DELAY_MS: "200" });
+  await waitFor(`${upstream}/calls`, fake);
+  const server = start("server.js", {
+    PORT: String(port),
+    OPENAI_BASE_URL: upstream,
+    OPENAI_API_KEY: "dummy",
+    TTS_CACHE_DIR: path.join(tmp, "cache"),
+    TTS_CACHE_MAX_MB: String((2.5 * CLIP_BYTES) / (1024 * 1024)),
+  });
+  await waitFor(`${proxy}/health`, server);
+});
+
+after(async () => {
+  for (const p of procs) p.kill();
+  await rm(tmp, { recursive: true, force: true });
+});
+
+test("identical requests in flight share one upstream call", async () => {
+  const res = await Promise.all(Array.from({ length: 5 }, () => tts("coalesce me")));
+  const kinds = res.map((r) => r.headers.get("x-cache")).sort();
+  assert.deepEqual(kinds, ["COALESCED", "COALESCED", "COALESCED", "COALESCED", "MISS"]);
+  const bodies = await Promise.all(res.map((r) => r.arrayBuffer()));
+  assert.ok(bodies.every((b) => b.byteLength === CLIP_BYTES));
+  assert.equal(await upstreamCalls(), 1);
+});
+
+test("repeat requests hit the disk cache and honour If-None-Match", async () => {
+  const first = await tts("cache me");
+  assert.equal(first.headers.get("x-cache"), "MISS");
+  const etag = first.headers.get("etag");
+  const audio = Buffer.from(await first.arrayBuffer());
+
+  const again = await tts("cache me");
+  assert.equal(again.headers.get("x-cache"), "HIT");
+  assert.equal(again.headers.get("etag"), etag);
+  assert.deepEqual(Buffer.from(await again.arrayBuffer()), audio);
+
+  const cond = await tts("cache me", { "If-None-Match": etag });
+  assert.equal(cond.status, 304);
+  assert.equal((await cond.arrayBuffer()).byteLength, 0);
+  assert.equal(await upstreamCalls(), 2);
+});
+
+test("the cache stays under its size cap, dropping the least recently used clip", async () => {
+  await (await tts("cache me")).arrayBuffer(); // most recent of the two cached clips
+  await (await tts("third clip")).arrayBuffer();
+  const h = await health();
+  assert.equal(h.cache.entries, 2);
+  assert.ok(h.cache.bytes <= h.cache.maxBytes);
+  assert.equal(h.cache.evictions, 1);
+  assert.equal((await tts("cache me")).headers.get("x-cache"), "HIT");
+  assert.equal((await tts("coalesce me")).headers.get("x-cache"), "MISS");
+});
+
+test("/health counts hits, misses, coalesced requests and upstream calls", async () => {
+  const h = await health();
+  assert.equal(h.misses, 4);
+  assert.equal(h.hits, 4); // including the 304
+  assert.equal(h.coalesced, 4);
+  assert.equal(h.upstream.calls, await upstreamCalls());
+  assert.equal(h.upstream.errors, 0);
+  assert.equal(h.latency.hit.count, 4);
+  assert.equal(h.latency.miss.count, 8);
+  assert.equal(h.cache.inflight, 0);
+});
+
+test("a failed disk write still returns the etag and leaves the clip uncached", async () => {
+  const dir = path.join(tmp, "broken");
+  const cache = await new DiskCache({ dir, maxBytes: 1 << 20 }).init();
+  await rm(dir, { recursive: true });
+  await writeFile(dir, ""); // a file where the directory was: every write fails
+  const warn = console.warn;
+  console.warn = () => {};
+  try {
+    const etag = await cache.put("0".repeat(64), Buffer.from("audio"));
+    assert.match(etag, /^"[0-9a-f]{32}"$/);
+  } finally {
+    console.warn = warn;
+  }
+  assert.equal(cache.writeErrors, 1);
+  assert.equal(cache.size, 0);
+  assert.equal(cache.bytes, 0);
+});
@@ -0,0 +1,117 @@
+// Content-addressed disk cache for synthesized audio.
+// One file per key under `dir`; total size capped at `maxBytes`, least recently
+// used files are evicted first. Access order survives restarts via file mtimes.
+
+import { createHash } from "node:crypto";
+import { mkdir, readdir, readFile, rename, stat, unlink, utimes, writeFile } from "node:fs/promises";
+import path from "node:path";
+
+export function cacheKey({ model, voice, instructions, format, text }) {
+  const h = createHash("sha256");
+  for (const part of [model, voice, instructions || "", format, text]) {
+    const b = Buffer.from(String(part), "utf8");
+    const len = Buffer.alloc(8);
+    len.writeBigUInt64LE(BigInt(b.length));
+    h.update(len);
+    h.update(b);
+  }
+  return h.digest("hex");
+}
+
+export function etagFor(buf) {
+  return `"${createHash("sha256").update(buf).digest("hex").slice(0, 32)}"`;
+}
+
+export class DiskCache {
+  constructor({ dir, maxBytes }) {
+    this.dir = dir;
+    this.maxBytes = maxBytes;
+    this.bytes = 0;
+    this.evictions = 0;
+    this.writeErrors = 0;
+    this._index = new Map(); // key -> { size, etag|null }, least recently used first
+  }
+
+  async init() {
+    await mkdir(this.dir, { recursive: true });
+    const found = [];
+    for (const name of await readdir(this.dir)) {
+      if (!/^[0-9a-f]{64}$/.test(name)) continue;
+      try {
+        const st = await stat(path.join(this.dir, name));
+        found.push({ name, size: st.size, mtime: st.mtimeMs });
+      } catch { /* raced with a delete */ }
+    }
+    found.sort((a, b) => a.mtime - b.mtime);
+    for (const f of found) {
+      this._index.set(f.name, { size: f.size, etag: null });
+      this.bytes += f.size;
+    }
+    await this._evict();
+    return this;
+  }
+
+  get size() {
+    return this._index.size;
+  }
+
+  _file(key) {
+    return path.join(this.dir, key);
+  }
+
+  /** @returns {Promise<{ buf: Buffer, etag: string } | null>} */
+  async get(key) {
+    const entry = this._index.get(key);
+    if (!entry) return null;
+    let buf;
+    try {
+      buf = await readFile(this._file(key));
+    } catch {
+      this._drop(key);
+      return null;
+    }
+    this._index.delete(key);
+    this._index.set(key, entry);
+    if (!entry.etag) entry.etag = etagFor(buf);
+    const now = new Date();
+    utimes(this._file(key), now, now).catch(() => {});
+    return { buf, etag: entry.etag };
+  }
+
+  /** Store `buf`; a failed write is logged and leaves it uncached. @returns {Promise<string>} etag */
+  async put(key, buf) {
+    const etag = etagFor(buf);
+    if (buf.length > this.maxBytes) return etag;
+    const tmp = `${this._file(key)}.${process.pid}.tmp`;
+    try {
+      await writeFile(tmp, buf);
+      await rename(tmp, this._file(key));
+    } catch (e) {
+      this.writeErrors++;
+      console.warn(`[tts-cache] write failed for ${key}: ${e?.message || e}`);
+      unlink(tmp).catch(() => {});
+      return etag;
+    }
+    this._drop(key);
+    this._index.set(key, { size: buf.length, etag });
+    this.bytes += buf.length;
+    await this._evict();
+    return etag;
+  }
+
+  _drop(key) {
+    const entry = this._index.get(key);
+    if (!entry) return;
+    this._index.delete(key);
+    this.bytes -= entry.size;
+  }
+
+  async _evict() {
+    while (this.bytes > this.maxBytes && this._index.size) {
+      const key = this._index.keys().next().value;
+      this._drop(key);
+      this.evictions++;
+      await unlink(this._file(key)).catch(() => {});
+    }
+  }
+}
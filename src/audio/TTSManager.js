@@ -4,6 +4,10 @@
 // NOTE
 // - This module does NOT talk to paid TTS providers directly.
 // - Provide a small server proxy (see /server/tts-proxy) or set window.__strikegyTTS.endpoint.
+// - Campaign lines pre-rendered by tools/tts_prerender.py can ship as per-mission voice packs
+//   (assets/audio/voice/); clips found there play without any request. Packs are opt-in
+//   (window.__strikegyTTS.packs = true or localStorage.strikegy_tts_packs = '1'), so a site
+//   without them makes no manifest request.
 
 function djb2Hash(str) {
   let h = 5381;
@@ -12,6 +16,33 @@ function djb2Hash(str) {
   return (h >>> 0).toString(16);
 }
 
+// Same key tools/tts_prerender.py writes into voice packs.
+export function ttsCacheKey(lang, voice, style, text) {
+  return djb2Hash(`${lang}|${voice}|${style}|${text}`);
+}
+
+const VOICE_PACK_DIR = new URL('../../assets/audio/voice/', import.meta.url);
+const PACK_MAGIC = 0x4b505653; // 'SVPK' little-endian
+const PACK_VERSION = 1;
+const MAX_PACKS = 2; // current mission + prefetched next
+const DECODE_CACHE_MAX = 48;
+const PREFETCH_MAX = 12; // warmed but not yet spoken (tools/mission_timeline.py --budget)
+const PREFETCH_TTL_MS = 60000; // a warm line not spoken by then was skipped; stop counting it
+
+// -> Map(key -> Uint8Array clip bytes), views over `buffer`
+export function parseVoicePack(buffer) {
+  const dv = new DataView(buffer);
+  if (buffer.byteLength < 12 || dv.getUint32(0, true) !== PACK_MAGIC) throw new Error('Invalid voice pack: bad magic');
+  const version = dv.getUint16(4, true);
+  if (version !== PACK_VERSION) throw new Error(`Invalid voice pack: unsupported version ${version}`);
+  const metaLen = dv.getUint32(8, true);
+  const index = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 12, metaLen)));
+  const base = 12 + metaLen + ((4 - ((12 + metaLen) % 4)) % 4);
+  const clips = new Map();
+  for (const [key, [off, len]] of Object.entries(index)) clips.set(key, new Uint8Array(buffer, base + off, len));
+  return clips;
+}
+
 function clamp(x, a, b) {
   return Math.max(a, Math.min(b, x));
 }
@@ -37,7 +68,16 @@ export class TTSManager {
 
     this._ctx = null;
     this._out = null;
-    this._cache = new Map(); // key -> AudioBuffer
+    this._cache = new Map(); // key -> AudioBuffer, least recently used first
+    this.cacheMax = DECODE_CACHE_MAX;
+    this.prefetchMax = PREFETCH_MAX;
+    this._warming = new Map(); // key -> Promise<AudioBuffer|null> being prefetched
+    this._warm = new Map(); // key -> warmed-at ms, prefetched and not spoken yet (still cached)
+    this._warmGen = 0; // bumped by clearPrefetch(); stale warm-ups don't count
+    this.packsEnabled = false;
+    this.packDir = VOICE_PACK_DIR; // absolute URL of the tts_prerender output
+    this._packs = new Map(); // missionId -> { clips: Map|null, ready: Promise<boolean> }
+    this._manifest = null; // Promise<{ missionId: pack file }>
     this._current = null; // {src, gain}
 
     this.reloadConfig();
@@ -52,6 +92,8 @@ export class TTSManager {
         if (typeof cfg.endpoint === 'string') this.endpoint = cfg.endpoint;
         if (typeof cfg.lang === 'string') this.defaultLang = cfg.lang;
         if (typeof cfg.fallback === 'string') this.fallbackMode = cfg.fallback;
+        if (typeof cfg.packs === 'boolean') this.packsEnabled = cfg.packs;
+        if (typeof cfg.packDir === 'string' && cfg.packDir) this.packDir = new URL(cfg.packDir, document.baseURI);
       }
     } catch { /* ignore */ }
 
@@ -60,10 +102,12 @@ export class TTSManager {
       const en = localStorage.getItem('strikegy_tts_enabled');
       const lang = localStorage.getItem('strikegy_tts_lang');
       const fb = localStorage.getItem('strikegy_tts_fallback');
+      const packs = localStorage.getItem('strikegy_tts_packs');
       if (typeof ep === 'string' && ep.trim()) this.endpoint = ep.trim();
       if (typeof en === 'string') this.enabled = en === '1' || en.toLowerCase() === 'true';
       if (typeof lang === 'string' && lang.trim()) this.defaultLang = lang.trim();
       if (typeof fb === 'string' && fb.trim()) this.fallbackMode = fb.trim();
+      if (typeof packs === 'string') this.packsEnabled = packs === '1' || packs.toLowerCase() === 'true';
     } catch { /* ignore */ }
 
     // If no endpoint is set, we can still speak via fallback (optional).
@@ -113,6 +157,153 @@ export class TTSManager {
     return this.voiceMap[t] || 'default';
   }
 
+  _cacheGet(key) {
+    const buf = this._cache.get(key);
+    if (!buf) return null;
+    this._cache.delete(key);
+    this._cache.set(key, buf);
+    return buf;
+  }
+
+  _cacheSet(key, buf) {
+    this._cache.delete(key);
+    this._cache.set(key, buf);
+    while (this._cache.size > Math.max(1, this.cacheMax)) {
+      const old = this._cache.keys().next().value;
+      this._cache.delete(old);
+      this._warm.delete(old); // evicted before it was spoken
+    }
+  }
+
+  _loadManifest() {
+    if (!this._manifest) {
+      this._manifest = fetch(new URL('manifest.json', this.packDir), { cache: 'no-cache' })
+        .then((res) => (res.ok ? res.json() : null))
+        .then((m) => m?.missions || {})
+        .catch(() => ({}));
+    }
+    return this._manifest;
+  }
+
+  /**
+   * Fetch the pre-rendered voice pack of a mission (no-op unless packs are
+   * enabled, or if none was built for it).
+   * Keeps the MAX_PACKS most recently requested packs.
+   * @returns {Promise<boolean>} true if the pack is loaded
+   */
+  loadVoicePack(missionId) {
+    const id = String(missionId || '');
+    if (!id || !this.packsEnabled) return Promise.resolve(false);
+
+    let entry = this._packs.get(id);
+    if (entry) {
+      this._packs.delete(id);
+      this._packs.set(id, entry);
+      return entry.ready;
+    }
+    entry = { clips: null, ready: null };
+    entry.ready = this._loadManifest()
+      .then((missions) => {
+        if (!missions[id]) return false;
+        return fetch(new URL(missions[id], this.packDir))
+          .then((res) => {
+            if (!res.ok) throw new Error(`Voice pack fetch failed: ${res.status} ${res.statusText}`);
+            return res.arrayBuffer();
+          })
+          .then((buf) => {
+            entry.clips = parseVoicePack(buf);
+            return true;
+          });
+      })
+      .catch((e) => {
+        console.warn('[TTS] voice pack unavailable', id, e);
+        return false;
+      })
+      .then((ok) => {
+        if (!entry.clips) entry.clips = new Map();
+        return ok;
+      });
+    this._packs.set(id, entry);
+    while (this._packs.size > MAX_PACKS) this._packs.delete(this._packs.keys().next().value);
+    return entry.ready;
+  }
+
+  async _packClip(key) {
+    const pending = [];
+    for (const entry of this._packs.values()) {
+      if (entry.clips?.has(key)) return entry.clips.get(key);
+      if (!entry.clips) pending.push(entry.ready);
+    }
+    if (!pending.length) return null;
+    // a pack still downloading is still faster than rendering the line
+    await Promise.all(pending);
+    for (const entry of this._packs.values()) {
+      if (entry.clips?.has(key)) return entry.clips.get(key);
+    }
+    return null;
+  }
+
+  async _decode(arr) {
+    const ctx = this._ensureAudio();
+    if (!ctx) return null;
+    return await new Promise((resolve) => {
+      try {
+        ctx.decodeAudioData(arr, (buf) => resolve(buf), () => resolve(null));
+      } catch {
+        resolve(null);
+      }
+    });
+  }
+
+  /**
+   * Decode (voice pack) or render (endpoint) a line ahead of speak(), so it
+   * starts without a round trip. At most `prefetchMax` lines are held.
+   * CampaignRuntime drives this from the bundle's `prefetch` schedule.
+   * @returns {Promise<boolean>} true if the line is (being) warmed
+   */
+  prefetch({ text, lang, voice, style = '' } = {}) {
+    const t = String(text || '').trim();
+    if (!t) return Promise.resolve(false);
+    this.reloadConfig();
+    if (!this.enabled) return Promise.resolve(false);
+
+    const L = String(lang || this.defaultLang || 'en-GB');
+    const v = String(voice || 'default');
+    const key = ttsCacheKey(L, v, String(style || ''), t);
+    if (this._warming.has(key)) return this._warming.get(key).then((buf) => !!buf);
+    if (this._cache.has(key)) return Promise.resolve(true);
+    const now = performance.now();
+    for (const [k, at] of this._warm) if (now - at > PREFETCH_TTL_MS) this._warm.delete(k);
+    if (this._warm.size + this._warming.size >= Math.max(0, this.prefetchMax)) return Promise.resolve(false);
+
+    const gen = this._warmGen;
+    const p = (async () => {
+      const clip = await this._packClip(key);
+      if (clip) return await this._decode(clip.slice().buffer);
+      return await this._fetchBuffer({ text: t, lang: L, voice: v, style: style || '' });
+    })()
+      .catch(() => null)
+      .then((buf) => {
+        this._warming.delete(key);
+        if (buf) {
+          this._cacheSet(key, buf);
+          if (gen === this._warmGen) this._warm.set(key, performance.now());
+        }
+        return buf;
+      });
+    this._warming.set(key, p);
+    return p.then((buf) => !!buf);
+  }
+
+  /**
+   * Forget the prefetch schedule's lines (mission load/restart): they stay
+   * in the decode cache but no longer count against `prefetchMax`.
+   */
+  clearPrefetch() {
+    this._warm.clear();
+    this._warmGen++;
+  }
+
   async _fetchBuffer({ text, lang, voice, style } = {}) {
     const ep = String(this.endpoint || '').trim();
     if (!ep) return null;
@@ -133,16 +324,7 @@ export class TTSManager {
     if (!res.ok) return null;
     const arr = await res.arrayBuffer();
     if (!arr || arr.byteLength < 32) return null;
-
-    const ctx = this._ensureAudio();
-    if (!ctx) return null;
-    return await new Promise((resolve) => {
-      try {
-        ctx.decodeAudioData(arr.slice(0), (buf) => resolve(buf), () => resolve(null));
-      } catch {
-        resolve(null);
-      }
-    });
+    return await this._decode(arr.slice(0));
   }
 
   _buildChannelFx({ channel = 'RADIO', urgent = false } = {}) {
@@ -347,9 +529,24 @@ export class TTSManager {
 
     this.reloadConfig();
     if (!this.enabled) return false;
+
+    const v = String(voice || this._voiceForSpeakerTag(speakerTag));
+    const L = String(lang || this.defaultLang || 'en-GB');
+    const cacheKey = ttsCacheKey(L, v, String(style || ''), t);
+
+    // Decoded before, or pre-rendered into a loaded voice pack: no request needed.
+    let buf = this._cacheGet(cacheKey);
+    if (!buf && this._warming.has(cacheKey)) buf = await this._warming.get(cacheKey);
+    this._warm.delete(cacheKey);
+    if (!buf) {
+      const clip = await this._packClip(cacheKey);
+      if (clip) buf = await this._decode(clip.slice().buffer);
+      if (buf) this._cacheSet(cacheKey, buf);
+    }
+
     const ep = String(this.endpoint || '').trim();
     const fbMode = String(this.fallbackMode || 'auto').toLowerCase();
-    if (!ep) {
+    if (!buf && !ep) {
       if (fbMode === 'off') return false;
       // fallback: local WebSpeech (optional)
       if (fbMode === 'webspeech' || fbMode === 'auto') {
@@ -366,15 +563,10 @@ export class TTSManager {
     // NOTE: Do not force-cancel previous line; allow overlap/queue (WebSpeech queues naturally).
     // this.stop();
 
-    const v = String(voice || this._voiceForSpeakerTag(speakerTag));
-    const L = String(lang || this.defaultLang || 'en-GB');
-    const cacheKey = djb2Hash(`${L}|${v}|${String(style || '')}|${t}`);
-
-    let buf = this._cache.get(cacheKey) || null;
     if (!buf) {
       buf = await this._fetchBuffer({ text: t, lang: L, voice: v, style: style || '' });
       if (!buf) return false;
-      this._cache.set(cacheKey, buf);
+      this._cacheSet(cacheKey, buf);
     }
 
     const src = ctx.createBufferSource();
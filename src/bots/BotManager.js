@@ -1301,14 +1301,16 @@ export class BotManager {
     out.set(0,0,0);
 
     // 1) Wall repulsion (prevents long "rubbing" along walls)
-    const boxes = this.collisionWorld?.boxes || [];
+    const cw = this.collisionWorld;
+    const f = cw?.minmax;
+    const nBoxes = cw?.count || 0;
     const range = 1.15;
     const range2 = range*range;
-    for(const b of boxes){
+    for(let i=0, o=0; i<nBoxes; i++, o+=6){
       // ignore very low boxes (floor-ish) — our walls are tall anyway
-      if((b.max?.y ?? 0) < 0.5) continue;
-      const clx = Math.max(b.min.x, Math.min(bot.pos.x, b.max.x));
-      const clz = Math.max(b.min.z, Math.min(bot.pos.z, b.max.z));
+      if(f[o+4] < 0.5) continue;
+      const clx = Math.max(f[o], Math.min(bot.pos.x, f[o+3]));
+      const clz = Math.max(f[o+2], Math.min(bot.pos.z, f[o+5]));
       const dx = bot.pos.x - clx;
       const dz = bot.pos.z - clz;
       const d2 = dx*dx + dz*dz;
@@ -1331,17 +1333,18 @@ export class BotManager {
         const az = Math.cos(yaw + a);
         const px = bot.pos.x + ax * dist;
         const pz = bot.pos.z + az * dist;
-        for(const b of boxes){
-          if((b.max?.y ?? 0) < 0.5) continue;
+        for(let i=0, o=0; i<nBoxes; i++, o+=6){
+          if(f[o+4] < 0.5) continue;
+          const bminX = f[o], bminZ = f[o+2], bmaxX = f[o+3], bmaxZ = f[o+5];
           // If probe point is inside (or very close to) a wall AABB in XZ, push away.
-          const insideX = (px >= (b.min.x - pad)) && (px <= (b.max.x + pad));
-          const insideZ = (pz >= (b.min.z - pad)) && (pz <= (b.max.z + pad));
+          const insideX = (px >= (bminX - pad)) && (px <= (bmaxX + pad));
+          const insideZ = (pz >= (bminZ - pad)) && (pz <= (bmaxZ + pad));
           if(!insideX || !insideZ) continue;
           // Compute a cheap outward normal from nearest face
-          const dl = Math.abs(px - b.min.x);
-          const dr = Math.abs(b.max.x - px);
-          const df = Math.abs(pz - b.min.z);
-          const dbk= Math.abs(b.max.z - pz);
+          const dl = Math.abs(px - bminX);
+          const dr = Math.abs(bmaxX - px);
+          const df = Math.abs(pz - bminZ);
+          const dbk= Math.abs(bmaxZ - pz);
           const m = Math.min(dl, dr, df, dbk);
           let nx = 0, nz = 0;
           if(m === dl) nx = -1;
@@ -24,7 +24,8 @@ export class BotNavigator {
   // - slightly inflated agent radius (clearance)
   constructor({ collisionWorld, map, cellSize=1.4, agentRadius=0.55 }){
     const gs = map?.world?.groundSize || [200,200];
-    this.grid = new NavGrid({ collisionWorld, groundSize: gs, cellSize, agentRadius });
+    // map.navBake: grids from loadNavBake() (game.html fetches <map>.snav with the map)
+    this.grid = new NavGrid({ collisionWorld, groundSize: gs, cellSize, agentRadius, baked: map?.navBake || null });
     this.grid.rebuild();
 
     // cache for repeated path calls
@@ -3,16 +3,69 @@
 // - 2D XZ grid
 // - Cells are blocked if they overlap any solid AABB expanded by agentRadius
 // - World bounds derived from map.world.groundSize (plane centered at origin)
+// - Pre-baked grids (<map>.snav, tools/bake_navgrid.py) skip rebuild when the
+//   params and the collision-box hash match
 
 import * as THREE from "https://unpkg.com/three@0.160.0/build/three.module.js";
+import { hashBoxes } from "../../world/CollisionWorld.js";
+import { fetchAsset } from "../../core/AssetManifest.js";
 
-function aabbOverlapsXZ(boxMin, boxMax, x0, z0, x1, z1){
+function aabbOverlapsXZ(minX, minZ, maxX, maxZ, x0, z0, x1, z1){
   // AABB projection overlaps rectangle [x0,x1] x [z0,z1]
-  if (boxMax.x < x0 || boxMin.x > x1) return false;
-  if (boxMax.z < z0 || boxMin.z > z1) return false;
+  if (maxX < x0 || minX > x1) return false;
+  if (maxZ < z0 || minZ > z1) return false;
   return true;
 }
 
+/**
+ * Fetch + parse a baked nav file. Resolves to an array of grids or null
+ * (missing file, no DecompressionStream, bad data).
+ * @returns {Promise<{cellSize:number,agentRadius:number,yMin:number,yMax:number,
+ *   groundSize:[number,number],cols:number,rows:number,hash:number,
+ *   blocked:Uint8Array,open:Uint8Array}[]|null>}
+ */
+export async function loadNavBake(url){
+  try{
+    const res = await fetchAsset(url, "no-cache");
+    if(!res.ok) return null;
+    let buf = await res.arrayBuffer();
+    const head = new Uint8Array(buf, 0, Math.min(2, buf.byteLength));
+    if(head[0] === 0x1f && head[1] === 0x8b){
+      if(typeof DecompressionStream === 'undefined') return null;
+      const stream = new Blob([buf]).stream().pipeThrough(new DecompressionStream('gzip'));
+      buf = await new Response(stream).arrayBuffer();
+    }
+    return parseNavBake(buf);
+  }catch{
+    return null;
+  }
+}
+
+export function parseNavBake(buf){
+  const dv = new DataView(buf);
+  if(buf.byteLength < 8 || dv.getUint32(0, true) !== 0x56414e53) return null; // 'SNAV'
+  if(dv.getUint16(4, true) !== 1) return null;
+  const n = dv.getUint16(6, true);
+  const grids = [];
+  let off = 8;
+  for(let g=0; g<n; g++){
+    const f = (k)=> dv.getFloat64(off + k*8, true);
+    const cols = dv.getUint32(off + 48, true);
+    const rows = dv.getUint32(off + 52, true);
+    const hash = dv.getUint32(off + 56, true);
+    const cells = cols * rows;
+    const base = off + 60;
+    grids.push({
+      cellSize: f(0), agentRadius: f(1), yMin: f(2), yMax: f(3),
+      groundSize: [f(4), f(5)], cols, rows, hash,
+      blocked: new Uint8Array(buf, base, cells),
+      open: new Uint8Array(buf, base + cells, cells),
+    });
+    off = base + cells * 2;
+  }
+  return grids;
+}
+
 export class NavGrid {
   /**
    * @param {{
@@ -22,10 +75,14 @@ export class NavGrid {
    *  agentRadius?:number,
    *  yMin?:number,
    *  yMax?:number,
+   *  baked?:object[]|null,
    * }} opts
    */
-  constructor({ collisionWorld, groundSize, cellSize=2.0, agentRadius=0.45, yMin=0.0, yMax=1.85 }){
+  constructor({ collisionWorld, groundSize, cellSize=2.0, agentRadius=0.45, yMin=0.0, yMax=1.85, baked=null }){
     this.collisionWorld = collisionWorld;
+    /** grids from loadNavBake(); used by rebuild() when they match */
+    this.baked = Array.isArray(baked) ? baked : null;
+    this.fromBake = false;
     this.groundSize = groundSize || [200, 200];
     this.cellSize = Math.max(0.5, Number(cellSize)||2.0);
     this.agentRadius = Math.max(0, Number(agentRadius)||0.45);
@@ -49,7 +106,7 @@ export class NavGrid {
     /** @type {Uint8Array} walkable neighbor count (0..8). Used to bias paths away from walls. */
     this.open = new Uint8Array(this.cols * this.rows);
 
-    /** @type {{min:THREE.Vector3, max:THREE.Vector3}[]} */
+    /** @type {number[]} expanded solid boxes, 4 per box: minX, minZ, maxX, maxZ */
     this._expandedBoxes = [];
   }
 
@@ -89,20 +146,41 @@ export class NavGrid {
     return this.open[this.index(ix, iz)] || 0;
   }
 
+  _findBaked(){
+    if(!this.baked) return null;
+    const [W, D] = this.groundSize;
+    let hash = null;
+    for(const g of this.baked){
+      if(g.cellSize !== this.cellSize || g.agentRadius !== this.agentRadius) continue;
+      if(g.yMin !== this.yMin || g.yMax !== this.yMax) continue;
+      if(g.cols !== this.cols || g.rows !== this.rows) continue;
+      if(g.groundSize[0] !== W || g.groundSize[1] !== D) continue;
+      if(hash === null) hash = hashBoxes(this.collisionWorld);
+      if(g.hash === hash) return g;
+    }
+    return null;
+  }
+
   rebuild(){
-    this._expandedBoxes.length = 0;
-    const boxes = this.collisionWorld?.boxes || [];
+    const g = this._findBaked();
+    this.fromBake = !!g;
+    if(g){
+      this.blocked.set(g.blocked);
+      this.open.set(g.open);
+      return this;
+    }
+
+    const eb = this._expandedBoxes;
+    eb.length = 0;
+    const cw = this.collisionWorld;
+    const f = cw?.minmax;
+    const n = cw?.count || 0;
     const r = this.agentRadius;
 
-    for(const b of boxes){
-      if(!b?.min || !b?.max) continue;
+    for(let i=0, o=0; i<n; i++, o+=6){
       // vertical overlap filter
-      if(this.yMax < b.min.y || this.yMin > b.max.y) continue;
-      const min = b.min.clone();
-      const max = b.max.clone();
-      min.x -= r; min.z -= r;
-      max.x += r; max.z += r;
-      this._expandedBoxes.push({ min, max });
+      if(this.yMax < f[o+1] || this.yMin > f[o+4]) continue;
+      eb.push(f[o] - r, f[o+2] - r, f[o+3] + r, f[o+5] + r);
     }
 
     this.blocked.fill(0);
@@ -117,8 +195,8 @@ export class NavGrid {
         const x1 = x0 + cs;
 
         let blocked = 0;
-        for(const eb of this._expandedBoxes){
-          if(aabbOverlapsXZ(eb.min, eb.max, x0, z0, x1, z1)){
+        for(let k=0; k<eb.length; k+=4){
+          if(aabbOverlapsXZ(eb[k], eb[k+1], eb[k+2], eb[k+3], x0, z0, x1, z1)){
             blocked = 1;
             break;
           }
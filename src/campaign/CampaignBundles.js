@@ -0,0 +1,40 @@
+// src/campaign/CampaignBundles.js
+// Lazy per-mission data: CampaignIndex.js holds the lightweight registry,
+// ./bundles/<id>.json the script/translations
+// (both built by tools/build_campaign_bundles.py).
+
+import { CampaignDB } from './CampaignIndex.js';
+import { fetchAsset } from '../core/AssetManifest.js';
+
+const _pending = new Map(); // missionId -> Promise<mission>
+
+export function getMissionEntry(missionId){
+  return CampaignDB?.missions?.[missionId] || null;
+}
+
+// Resolves to the full mission (index entry + bundle), or null if unknown.
+export function loadMissionBundle(missionId){
+  const entry = getMissionEntry(missionId);
+  if(!entry?.bundle) return Promise.resolve(null);
+  let p = _pending.get(missionId);
+  if(!p){
+    const url = new URL(`./bundles/${entry.bundle}`, import.meta.url);
+    // `?v=<digest>` busts the cache in the source tree; built sites use the hashed name
+    p = fetchAsset(url, 'default')
+      .then((res)=>{
+        if(!res.ok) throw new Error(`Mission bundle fetch failed: ${res.status} ${res.statusText}`);
+        return res.json();
+      })
+      .then((data)=> Object.assign({}, entry, data));
+    // allow a retry after a failed fetch
+    p.catch(()=> _pending.delete(missionId));
+    _pending.set(missionId, p);
+  }
+  return p;
+}
+
+// Fire-and-forget warmup (e.g. nextMissionId while the current one plays).
+export function prefetchMissionBundle(missionId){
+  if(!missionId || !getMissionEntry(missionId)) return;
+  loadMissionBundle(missionId).catch(()=>{});
+}
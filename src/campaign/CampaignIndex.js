@@ -0,0 +1,63 @@
+// src/campaign/CampaignIndex.js
+// Auto-generated by tools/build_campaign_bundles.py from CampaignData.js — do not edit.
+// Mission script/translations: ./bundles/<id>.json (loaded by CampaignBundles.js).
+
+export const CAMPAIGN_KEY = "strikegy_campaign_v1";
+
+export const CampaignDB = {
+  order: ["c1_m1_insertion","c1_m2_blacksite","c1_m3_convoy","c1_m4_bridge","c1_m5_city","c1_m6_trench","c1_m7_ridge","c1_m8_counter","c1_m9_lab","c1_m10_exodus","c2_m1_blacktide","c2_m2_drydock","c2_m3_sandglass","c2_m4_wadi","c2_m5_greenline","c2_m6_ember","c2_m7_glasshouse","c2_m8_elevator","c2_m9_frostline","c2_m10_whiteout","c2_m11_ironweave","c2_m12_switchyard","c2_m13_redhorizon","c2_m14_radiant","c2_m15_refinery","c2_m16_breakwater","c2_m17_offshore","c2_m18_blackbox","c2_m19_scar","c2_m20_nemesis","c3_m1_ghostsignal","c3_m2_brokenchain","c3_m3_falseorders","c3_m4_redacted","c3_m5_noturningback","c3_m6_blacklist","c3_m7_pilotdown","c3_m8_darkmarket","c3_m9_glassroute","c3_m10_echochamber","c3_m11_cutthehand","c3_m12_firstshadow","c3_m13_papertrail","c3_m14_finaldelete","c3_m15_auditline","c3_m16_deadair","c3_m17_exitdenied","c3_m18_canyonrun","c3_m19_bunkerlights","c3_m20_underthedam","c3_m21_vacuum","c3_m22_handover"],
+  missions: {
+    "c1_m1_insertion": {"id":"c1_m1_insertion","title":"CH1 M1 — Insertion","chapter":1,"map":"maps/campaign/ch1_m1_insertion.json","bots":{"blue":0,"red":8},"nextMissionId":"c1_m2_blacksite","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["frag","flash","smoke"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"OP DUSTLINE — M1: INSERTION","location":"Sable Coast · Arakhan Delta (AO: SANDGLASS)","time":"05:10 LOCAL","tag":"LOW VIS · RADIO SILENCE","intel":"명분: ‘블랙사이트’의 위치를 확정하기 위한 첫 침투.\n상황: 적 캠프 통신이 루프를 돌고 있다. 임시 중계기를 끊으면 감시망이 30초 정도 흔들린다.\n결과: 루프 차단 후 흔적을 지우고 탈출. 데이터는 다음 작전(블랙사이트) 접근 루트로 연결된다.\n규칙: 불필요한 교전 금지. 발견되면 즉시 이탈 루트로 전환.","objectives":["집결 지점으로 이동","임시 중계기 해킹","추격 적 제거 (필요 최소)","탈출 지점 확보"]},"bundle":"c1_m1_insertion.json?v=c398fac85e"},
+    "c1_m2_blacksite": {"id":"c1_m2_blacksite","title":"CH1 M2 — Blacksite","chapter":1,"map":"maps/campaign/ch1_m2_blacksite.json","bots":{"blue":2,"red":10},"nextMissionId":"c1_m3_convoy","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"smg1","secondary":"pistol1","grenades":["flash","frag","smoke"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"OP DUSTLINE — M2: BLACKSITE","location":"Greyline Annex · Sublevel Facility (AO: COLDWALL)","time":"05:48 LOCAL","tag":"SILENT ENTRY","intel":"명분: 적 지휘망의 ‘진짜 중심’을 확인한다.\n상황: 구식 카메라 그리드. 조명 사이의 사각을 이용해 자료실까지 도달.\n결과: 데이터 확보 후, 추적이 붙기 전에 반대편으로 이탈. 확보 데이터는 ‘호송대(Convoy)’ 시간표를 포함한다.","objectives":["출입문 돌파","자료실에서 데이터 확보","복도 방어","탈출 지점으로 이동"]},"bundle":"c1_m2_blacksite.json?v=d36b3c7056"},
+    "c1_m3_convoy": {"id":"c1_m3_convoy","title":"CH1 M3 — Convoy","chapter":1,"map":"maps/campaign/ch1_m3_convoy.json","bots":{"blue":2,"red":12},"nextMissionId":"c1_m4_bridge","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar2","secondary":"pistol1","grenades":["frag","smoke","flash"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"OP DUSTLINE — M3: CONVOY","location":"Kharif Road · Dry Canal (AO: CINDER)","time":"06:22 LOCAL","tag":"ONE SHOT","intel":"명분: 호송대가 운반하는 ‘케이스’를 회수하면 다음 구역(교량/도시)로 이어지는 권한을 얻는다.\n상황: 호송대는 짧게 정차한다. 매복-회수-이탈, 세 단계로 끝낸다.\n결과: 케이스 회수 성공 시, 적은 통신을 끊고 지역 봉쇄를 시도할 것이다. 즉시 루트 변경.","objectives":["매복 지점 확보","케이스 회수","추격 적 저지(필요 최소)"]},"bundle":"c1_m3_convoy.json?v=754875bb86"},
+    "c1_m4_bridge": {"id":"c1_m4_bridge","title":"CH1 M4 — Bridge","chapter":1,"map":"maps/campaign/ch1_m4_bridge.json","bots":{"blue":3,"red":14},"nextMissionId":"c1_m5_city","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"lmg1","secondary":"pistol1","grenades":["smoke","frag","flash"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"OP DUSTLINE — M4: BRIDGE","location":"Ravel Crossing · Span-7 Bridge (AO: KNOT)","time":"06:54 LOCAL","tag":"FAST PUSH","intel":"명분: 강을 건너지 못하면 도시권 진입이 불가능하다.\n상황: 교량 위 시야가 길다. 연막/섬광으로 시선만 끊고 전진.\n결과: 교량 끝 확보 후, 도심 진입로가 열린다.","objectives":["교량 진입","교량 돌파","교량 끝 확보"]},"bundle":"c1_m4_bridge.json?v=6a2dd22d2d"},
+    "c1_m5_city": {"id":"c1_m5_city","title":"CH1 M5 — Cityline","chapter":1,"map":"maps/campaign/ch1_m5_city.json","bots":{"blue":2,"red":12},"nextMissionId":"c1_m6_trench","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["flash","smoke","frag"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"OP DUSTLINE — M5: CITY","location":"Novar District · Old Market Blocks (AO: VEIL)","time":"07:25 LOCAL","tag":"GHOST WALK","intel":"명분: 도심에 숨겨진 중계거점(다음 참호 구역 지시)을 찾는다.\n상황: 골목은 좁고 소음이 크게 울린다. 고지를 잡으면 이동이 쉬워진다.\n결과: 외곽으로 빠져나가며 다음 전장(참호선)으로 연결.","objectives":["골목길로 진입","고지 확보","도시 외곽으로 탈출"]},"bundle":"c1_m5_city.json?v=e54cae55ce"},
+    "c1_m6_trench": {"id":"c1_m6_trench","title":"CH1 M6 — Trenchwork","chapter":1,"map":"maps/campaign/ch1_m6_trench.json","bots":{"blue":3,"red":16},"nextMissionId":"c1_m7_ridge","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"sg1","secondary":"pistol1","grenades":["smoke","frag","flash"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"OP DUSTLINE — M6: TRENCH","location":"Hollow Front · Abandoned Lines (AO: IRONFURROW)","time":"08:05 LOCAL","tag":"LINE BY LINE","intel":"명분: 적이 버린 참호선을 ‘통로’로 바꾼다.\n상황: 참호는 안전하지만 출구마다 매복이 있다. 한 줄씩 밀어낸다.\n결과: 3차 참호선 확보 시, 능선 방향의 장비 야적장이 노출된다.","objectives":["1차 참호선 확보","2차 참호선 확보","3차 참호선 확보"]},"bundle":"c1_m6_trench.json?v=5584caf763"},
+    "c1_m7_ridge": {"id":"c1_m7_ridge","title":"CH1 M7 — Ridgeline","chapter":1,"map":"maps/campaign/ch1_m7_ridge.json","bots":{"blue":2,"red":12},"nextMissionId":"c1_m8_counter","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"sr1","secondary":"pistol1","grenades":["smoke","flash","frag"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"OP DUSTLINE — M7: RIDGE","location":"Scree Ridge · Scrap Yard (AO: SIGNALBREAK)","time":"08:44 LOCAL","tag":"CUT THE LINE","intel":"명분: 적이 산 능선에서 루프 신호를 증폭 중. 끊으면 추적이 급격히 느려진다.\n상황: 야적장 내부는 시야가 끊긴다. 소리로 위치를 잡는다.\n결과: 중계장치 파괴 후 즉시 이탈. 지역 봉쇄 전 2분.","objectives":["야적장 진입","중계장치 파괴","이탈"]},"bundle":"c1_m7_ridge.json?v=2413f4bfc1"},
+    "c1_m8_counter": {"id":"c1_m8_counter","title":"CH1 M8 — Counterstrike","chapter":1,"map":"maps/campaign/ch1_m8_counter.json","bots":{"blue":3,"red":18},"nextMissionId":"c1_m9_lab","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"lmg2","secondary":"pistol1","grenades":["smoke","frag","flash"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"OP DUSTLINE — M8: COUNTER","location":"Rail Platform · Switchyard (AO: TURNKEY)","time":"09:12 LOCAL","tag":"NOISE WINDOW","intel":"명분: 적 철도망을 역이용해 ‘터널 루트’를 연다.\n상황: 전환기 조작 순간 경보가 뜬다. 소음 시간(Noise Window) 20초.\n결과: 터널로 빠져나가면 감시망에서 사라진다.","objectives":["플랫폼 접근","전환기 조작","터널을 빠져나가기"]},"bundle":"c1_m8_counter.json?v=78ae85a758"},
+    "c1_m9_lab": {"id":"c1_m9_lab","title":"CH1 M9 — The Lab","chapter":1,"map":"maps/campaign/ch1_m9_lab.json","bots":{"blue":2,"red":12},"nextMissionId":"c1_m10_exodus","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"smg4","secondary":"pistol1","grenades":["flash","smoke","frag"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"OP DUSTLINE — M9: LAB","location":"Harrow Complex · Research Wing (AO: WHITEGLASS)","time":"09:48 LOCAL","tag":"SNATCH & RUN","intel":"명분: VIP 확보가 최우선. 정보를 ‘사람’에서 빼낸다.\n상황: 정문은 함정일 수 있다. 짧게 치고 들어가서 바로 빼낸다.\n결과: VIP 생존 확보 시, 최종 탈출(Exodus) 좌표가 열린다.","objectives":["정문 접근","VIP 확보","호위하며 탈출"]},"bundle":"c1_m9_lab.json?v=8113bd3bb7"},
+    "c1_m10_exodus": {"id":"c1_m10_exodus","title":"CH1 M10 — Exodus","chapter":1,"map":"maps/campaign/ch1_m10_exodus.json","bots":{"blue":3,"red":20},"nextMissionId":"c2_m1_blacktide","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar3","secondary":"pistol1","grenades":["smoke","flash","frag"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"OP DUSTLINE — M10: EXODUS","location":"Salt Flat · LZ ‘EMBER’ (AO: LASTLIGHT)","time":"10:20 LOCAL","tag":"EXFIL ONLY","intel":"명분: 작전 종료. 철수만 성공하면 된다.\n상황: 착륙지점은 열린 공간. 방어는 ‘시간 벌기’가 목적.\n결과: 탑승 성공 시, 챕터 1 종료. 챕터 2에서 후속 작전으로 전환된다.","objectives":["전진","착륙지점 방어","착륙지점 진입"]},"bundle":"c1_m10_exodus.json?v=928f39b2e5"},
+    "c2_m1_blacktide": {"id":"c2_m1_blacktide","title":"CH2 M1 — Black Tide","chapter":2,"map":"maps/campaign/ch2_m1_port.json","bots":{"blue":4,"red":18},"nextMissionId":"c2_m2_drydock","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","flash","frag"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m1_blacktide.json?v=fa586d6115"},
+    "c2_m2_drydock": {"id":"c2_m2_drydock","title":"CH2 M2 — Drydock","chapter":2,"map":"maps/campaign/ch2_m2_desert.json","bots":{"blue":4,"red":22},"nextMissionId":"c2_m3_sandglass","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"smg2","secondary":"pistol1","grenades":["flash","frag"],"extras":["smoke","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m2_drydock.json?v=c63b1422f4"},
+    "c2_m3_sandglass": {"id":"c2_m3_sandglass","title":"CH2 M3 — Sandglass","chapter":2,"map":"maps/campaign/ch2_m3_forest.json","bots":{"blue":3,"red":26},"nextMissionId":"c2_m4_wadi","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar3","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m3_sandglass.json?v=8964a1b508"},
+    "c2_m4_wadi": {"id":"c2_m4_wadi","title":"CH2 M4 — Wadi","chapter":2,"map":"maps/campaign/ch2_m4_city.json","bots":{"blue":3,"red":28},"nextMissionId":"c2_m5_greenline","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"dmr1","secondary":"pistol1","grenades":["smoke","flash"],"extras":["frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m4_wadi.json?v=70c27b5f11"},
+    "c2_m5_greenline": {"id":"c2_m5_greenline","title":"CH2 M5 — Greenline","chapter":2,"map":"maps/campaign/ch2_m5_mountains.json","bots":{"blue":4,"red":24},"nextMissionId":"c2_m6_ember","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"smg4","secondary":"pistol1","grenades":["flash","smoke"],"extras":["frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m5_greenline.json?v=b2d5115bf3"},
+    "c2_m6_ember": {"id":"c2_m6_ember","title":"CH2 M6 — Ember","chapter":2,"map":"maps/campaign/ch2_m6_refinery.json","bots":{"blue":4,"red":30},"nextMissionId":"c2_m7_glasshouse","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"lmg1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m6_ember.json?v=1e692cdfdb"},
+    "c2_m7_glasshouse": {"id":"c2_m7_glasshouse","title":"CH2 M7 — Glasshouse","chapter":2,"map":"maps/campaign/ch2_m7_ruins.json","bots":{"blue":3,"red":26},"nextMissionId":"c2_m8_elevator","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar2","secondary":"pistol1","grenades":["flash","smoke"],"extras":["frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m7_glasshouse.json?v=e1e5bf729b"},
+    "c2_m8_elevator": {"id":"c2_m8_elevator","title":"CH2 M8 — Elevator","chapter":2,"map":"maps/campaign/ch2_m8_trainyard.json","bots":{"blue":3,"red":32},"nextMissionId":"c2_m9_frostline","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"shotgun1","secondary":"pistol1","grenades":["flash"],"extras":["smoke","frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m8_elevator.json?v=1fa397ad2d"},
+    "c2_m9_frostline": {"id":"c2_m9_frostline","title":"CH2 M9 — Frostline","chapter":2,"map":"maps/campaign/ch2_m9_tundra.json","bots":{"blue":3,"red":24},"nextMissionId":"c2_m10_whiteout","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"sr1","secondary":"pistol1","grenades":["smoke","flash"],"extras":["frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m9_frostline.json?v=2210fffa33"},
+    "c2_m10_whiteout": {"id":"c2_m10_whiteout","title":"CH2 M10 — Whiteout","chapter":2,"map":"maps/campaign/ch2_m10_offshore.json","bots":{"blue":3,"red":34},"nextMissionId":"c2_m11_ironweave","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar3","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m10_whiteout.json?v=970154c819"},
+    "c2_m11_ironweave": {"id":"c2_m11_ironweave","title":"CH2 M11 — Ironweave","chapter":2,"map":"maps/campaign/ch2_m11_ironweave.json","bots":{"blue":4,"red":28},"nextMissionId":"c2_m12_switchyard","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"smg1","secondary":"pistol1","grenades":["flash","smoke"],"extras":["frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m11_ironweave.json?v=f5d1cfaebc"},
+    "c2_m12_switchyard": {"id":"c2_m12_switchyard","title":"CH2 M12 — Switchyard","chapter":2,"map":"maps/campaign/ch2_m12_switchyard.json","bots":{"blue":4,"red":34},"nextMissionId":"c2_m13_redhorizon","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"lmg2","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m12_switchyard.json?v=12cd90974c"},
+    "c2_m13_redhorizon": {"id":"c2_m13_redhorizon","title":"CH2 M13 — Red Horizon","chapter":2,"map":"maps/campaign/ch2_m13_redhorizon.json","bots":{"blue":3,"red":28},"nextMissionId":"c2_m14_radiant","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar2","secondary":"pistol1","grenades":["smoke","flash"],"extras":["frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m13_redhorizon.json?v=f775d9bc15"},
+    "c2_m14_radiant": {"id":"c2_m14_radiant","title":"CH2 M14 — Radiant","chapter":2,"map":"maps/campaign/ch2_m14_glassline.json","bots":{"blue":3,"red":36},"nextMissionId":"c2_m15_refinery","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"dmr2","secondary":"pistol1","grenades":["flash","frag"],"extras":["smoke","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m14_radiant.json?v=2f8c9dc2b7"},
+    "c2_m15_refinery": {"id":"c2_m15_refinery","title":"CH2 M15 — Refinery","chapter":2,"map":"maps/campaign/ch2_m15_refinerydepth.json","bots":{"blue":4,"red":30},"nextMissionId":"c2_m16_breakwater","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m15_refinery.json?v=0581a3a44a"},
+    "c2_m16_breakwater": {"id":"c2_m16_breakwater","title":"CH2 M16 — Breakwater","chapter":2,"map":"maps/campaign/ch2_m16_breakwater.json","bots":{"blue":4,"red":34},"nextMissionId":"c2_m17_offshore","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"smg3","secondary":"pistol1","grenades":["flash","smoke"],"extras":["frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m16_breakwater.json?v=d3346b18fc"},
+    "c2_m17_offshore": {"id":"c2_m17_offshore","title":"CH2 M17 — Offshore","chapter":2,"map":"maps/campaign/ch2_m17_whitesignal.json","bots":{"blue":3,"red":30},"nextMissionId":"c2_m18_blackbox","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"sr2","secondary":"pistol1","grenades":["smoke","flash"],"extras":["frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m17_offshore.json?v=ecf797d9fa"},
+    "c2_m18_blackbox": {"id":"c2_m18_blackbox","title":"CH2 M18 — Blackbox","chapter":2,"map":"maps/campaign/ch2_m18_manifest.json","bots":{"blue":3,"red":36},"nextMissionId":"c2_m19_scar","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar3","secondary":"pistol1","grenades":["flash","smoke"],"extras":["frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m18_blackbox.json?v=70c539be89"},
+    "c2_m19_scar": {"id":"c2_m19_scar","title":"CH2 M19 — Scar","chapter":2,"map":"maps/campaign/ch2_m19_scarfield.json","bots":{"blue":2,"red":40},"nextMissionId":"c2_m20_nemesis","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"dmr2","secondary":"pistol1","grenades":["smoke","flash"],"extras":["frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m19_scar.json?v=3ed5137a3b"},
+    "c2_m20_nemesis": {"id":"c2_m20_nemesis","title":"CH2 M20 — Nemesis","chapter":2,"map":"maps/campaign/ch2_m20_blacktide.json","bots":{"blue":3,"red":44},"nextMissionId":"c3_m1_ghostsignal","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar2","secondary":"pistol1","grenades":["smoke","flash","frag"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c2_m20_nemesis.json?v=6bdcb6bc6e"},
+    "c3_m1_ghostsignal": {"id":"c3_m1_ghostsignal","title":"CH3 M1 — Ghost Signal","chapter":3,"map":"maps/campaign/ch2_m17_whitesignal.json","bots":{"blue":0,"red":10},"nextMissionId":"c3_m2_brokenchain","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"smg2","secondary":"pistol1","grenades":["frag","flash","smoke"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"CH3 — M1: GHOST SIGNAL","location":"Suburban Relay Station · RAINFALL AO","time":"00:12 LOCAL","tag":"STEALTH · PROOF ONLY","intel":"종료된 채널이 다시 살아났다. 패턴은 Nemesis 서명과 일치.\n목표: 송신 장치/샘플을 확보하고 추적 태그를 제거한 뒤 즉시 이탈.\n규칙: 불필요한 교전 금지. 들키면 빠르게 돌파 후 이탈.","objectives":["외곽 접근 및 감시 확인","송신실 진입","기록 장치 확보 + 30초 샘플","추적 태그 제거 후 이탈"]},"bundle":"c3_m1_ghostsignal.json?v=fed5b8483d"},
+    "c3_m2_brokenchain": {"id":"c3_m2_brokenchain","title":"CH3 M2 — Broken Chain","chapter":3,"map":"maps/campaign/ch2_m18_manifest.json","bots":{"blue":0,"red":12},"nextMissionId":"c3_m3_falseorders","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar2","secondary":"pistol1","grenades":["frag","flash","smoke"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"CH3 — M2: BROKEN CHAIN","location":"Port Container Yard · FOG AO","time":"04:35 LOCAL","tag":"STEALTH · NO OVERREACH","intel":"NODE-07과 유사 신호가 두 곳 더 포착됐다. 오늘 밤 항만 수송 기록을 잡으면 노드가 보인다.\n목표: Manifest-Delta 확보, 중계 장비 회수/파괴, 필요 시 트럭을 폭발 없이 차단 후 이탈.","objectives":["야드 외곽 감시","Manifest-Delta 확보","중계 장비 회수/파괴","트럭 차단(선택)","이탈"]},"bundle":"c3_m2_brokenchain.json?v=236b194774"},
+    "c3_m3_falseorders": {"id":"c3_m3_falseorders","title":"CH3 M3 — False Orders","chapter":3,"map":"maps/campaign/ch2_m4_city.json","bots":{"blue":0,"red":14},"nextMissionId":"c3_m4_redacted","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"dmr1","secondary":"pistol1","grenades":["frag","flash","smoke"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"CH3 — M3: FALSE ORDERS","location":"Data Hub Complex · OUTSKIRTS","time":"01:20 LOCAL","tag":"CLEANUP ORDER","intel":"Havelock이 “파괴”를 지시했다. 하지만 노드 라우팅 서버는 증거 그 자체다.\n목표: 지하 서버실로 침투, 로그 백업을 확보하고, 파괴 연출로 위를 속인 뒤 이탈.","objectives":["빌딩 진입","지하 서버실 접근","로그 백업 확보","파괴 연출(전원 차단/연기)","이탈"]},"bundle":"c3_m3_falseorders.json?v=19f477d38e"},
+    "c3_m4_redacted": {"id":"c3_m4_redacted","title":"CH3 M4 — REDACTED","chapter":3,"map":"maps/campaign/ch2_m14_glassline.json","bots":{"blue":0,"red":16},"nextMissionId":"c3_m5_noturningback","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"smg3","secondary":"pistol1","grenades":["frag","flash","smoke"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"CH3 — M4: REDACTED","location":"Municipal Archives + Garage B2","time":"19:10 LOCAL","tag":"CIVILIANS · CCTV","intel":"정보원 PILOT이 연락 두절. 마지막 위치는 시청 기록 보관소.\n목표: 단서 회수 → REDACTED 기록 복구 → B2에서 PILOT을 확인(구출/사망) → 민간 피해 없이 이탈.","objectives":["보관소 진입(민간 회피)","PILOT 단서 추적","REDACTED 기록 복구","B2에서 PILOT 확인","추격 회피/이탈"]},"bundle":"c3_m4_redacted.json?v=3a4f3dde64"},
+    "c3_m5_noturningback": {"id":"c3_m5_noturningback","title":"CH3 M5 — No Turning Back","chapter":3,"map":"maps/campaign/ch2_m5_mountains.json","bots":{"blue":0,"red":18},"nextMissionId":"c3_m6_blacklist","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar3","secondary":"pistol1","grenades":["frag","flash","smoke"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"CH3 — M5: NO TURNING BACK","location":"Mountain Node Facility · SNOWLINE","time":"23:50 LOCAL","tag":"SABOTAGE · EVIDENCE","intel":"노드 시설이 산악에 존재한다. 목적 문서와 라우팅 키를 확보한 이상, 이제 남은 건 차단.\n목표: 시설 침투 → 라우팅 키 확보 → 메인 서버 과부하(연쇄) → 추격을 끊고 이탈.","objectives":["산악 접근","시설 침투","라우팅 키 확보","메인 서버 과부하","이탈"]},"bundle":"c3_m5_noturningback.json?v=d2d79ac67d"},
+    "c3_m6_blacklist": {"id":"c3_m6_blacklist","title":"CH3 M6 — BLACKLIST","chapter":3,"map":"maps/campaign/ch1_m9_lab.json","bots":{"blue":2,"red":12},"nextMissionId":"c3_m7_pilotdown","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"smg4","secondary":"pistol1","grenades":["flash","smoke","frag"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"CH3 M6 — BLACKLIST","location":"도심 외곽 은신처 + 소형 데이터센터(백업 스토리지) / 새벽 / 비상등","time":"04:12 LOCAL","tag":"BLACKLIST · TRACE","intel":"Havelock의 권한으로 RAVEN 팀이 '기록에서 삭제'됐다. 백업 드라이브를 확보해 삭제 명령의 흔적을 잡아라.","objectives":["은신처 확보(장비 재정비/추적 장치 탐지)","데이터센터 침투(경보 최소)","BLACKLIST 백업 드라이브 확보(물리 드라이브)","서버 “정리 연출”(부분 파손/로그 훼손)","추격 회피 후 이탈"]},"bundle":"c3_m6_blacklist.json?v=964c4a449f"},
+    "c3_m7_pilotdown": {"id":"c3_m7_pilotdown","title":"CH3 M7 — PILOT DOWN","chapter":3,"map":"maps/campaign/ch2_m12_switchyard.json","bots":{"blue":4,"red":34},"nextMissionId":"c3_m8_darkmarket","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"lmg2","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m7_pilotdown.json?v=20989142fa"},
+    "c3_m8_darkmarket": {"id":"c3_m8_darkmarket","title":"CH3 M8 — DARK MARKET","chapter":3,"map":"maps/campaign/ch2_m1_port.json","bots":{"blue":4,"red":18},"nextMissionId":"c3_m9_glassroute","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","flash","frag"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m8_darkmarket.json?v=96da40d7d0"},
+    "c3_m9_glassroute": {"id":"c3_m9_glassroute","title":"CH3 M9 — GLASS ROUTE","chapter":3,"map":"maps/campaign/ch1_m3_convoy.json","bots":{"blue":2,"red":12},"nextMissionId":"c3_m10_echochamber","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar2","secondary":"pistol1","grenades":["frag","smoke","flash"],"extras":["impact"]},"failOnDeath":true,"timeLimitSec":0,"briefing":{"title":"CH3 M9 — GLASS ROUTE","location":"고속도로 외곽(야간-새벽 경계) + 터널 + 임시 검문소","time":"05:30 LOCAL","tag":"AMBUSH · CORE","intel":"Nemesis 코어 운송 차량을 터널 출구에서 매복. 코어를 빼내면 판이 뒤집힌다.","objectives":["매복 지점 확보(터널 출구)","선두/후미 차단(차량 제어)","코어 차량 정지 및 코어 회수(물리 오브젝트)","추격 저지(선택)","이탈"]},"bundle":"c3_m9_glassroute.json?v=b6aba8e9b3"},
+    "c3_m10_echochamber": {"id":"c3_m10_echochamber","title":"CH3 M10 — ECHO CHAMBER","chapter":3,"map":"maps/campaign/ch2_m17_whitesignal.json","bots":{"blue":3,"red":30},"nextMissionId":"c3_m11_cutthehand","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"sr2","secondary":"pistol1","grenades":["smoke","flash"],"extras":["frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m10_echochamber.json?v=0cd53e31e1"},
+    "c3_m11_cutthehand": {"id":"c3_m11_cutthehand","title":"CH3 M11 — CUT THE HAND","chapter":3,"map":"maps/campaign/ch2_m16_breakwater.json","bots":{"blue":4,"red":34},"nextMissionId":"c3_m12_firstshadow","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"smg3","secondary":"pistol1","grenades":["flash","smoke"],"extras":["frag","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m11_cutthehand.json?v=4e91034333"},
+    "c3_m12_firstshadow": {"id":"c3_m12_firstshadow","title":"CH3 M12 — THE FIRST SHADOW","chapter":3,"map":"maps/campaign/ch2_m15_refinerydepth.json","bots":{"blue":4,"red":30},"nextMissionId":"c3_m13_papertrail","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m12_firstshadow.json?v=8c04d6c87d"},
+    "c3_m13_papertrail": {"id":"c3_m13_papertrail","title":"CH3 M13 — PAPER TRAIL","chapter":3,"map":"maps/campaign/ch2_m17_whitesignal.json","bots":{"blue":4,"red":28},"nextMissionId":"c3_m14_finaldelete","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m13_papertrail.json?v=d5b1e33103"},
+    "c3_m14_finaldelete": {"id":"c3_m14_finaldelete","title":"CH3 M14 — FINAL DELETE","chapter":3,"map":"maps/campaign/ch2_m18_manifest.json","bots":{"blue":4,"red":31},"nextMissionId":"c3_m15_auditline","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m14_finaldelete.json?v=737067a0a9"},
+    "c3_m15_auditline": {"id":"c3_m15_auditline","title":"CH3 M15 — AUDIT LINE","chapter":3,"map":"maps/campaign/ch2_m19_scarfield.json","bots":{"blue":4,"red":34},"nextMissionId":"c3_m16_deadair","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m15_auditline.json?v=2e5f6973b2"},
+    "c3_m16_deadair": {"id":"c3_m16_deadair","title":"CH3 M16 — DEAD AIR","chapter":3,"map":"maps/campaign/ch2_m20_blacktide.json","bots":{"blue":4,"red":37},"nextMissionId":"c3_m17_exitdenied","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m16_deadair.json?v=97abcd448a"},
+    "c3_m17_exitdenied": {"id":"c3_m17_exitdenied","title":"CH3 M17 — EXIT DENIED","chapter":3,"map":"maps/campaign/ch2_m10_offshore.json","bots":{"blue":4,"red":40},"nextMissionId":"c3_m18_canyonrun","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m17_exitdenied.json?v=baa02c5734"},
+    "c3_m18_canyonrun": {"id":"c3_m18_canyonrun","title":"CH3 M18 — CANYON RUN","chapter":3,"map":"maps/campaign/ch2_m11_ironweave.json","bots":{"blue":4,"red":43},"nextMissionId":"c3_m19_bunkerlights","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m18_canyonrun.json?v=3715671470"},
+    "c3_m19_bunkerlights": {"id":"c3_m19_bunkerlights","title":"CH3 M19 — BUNKER LIGHTS","chapter":3,"map":"maps/campaign/ch2_m12_switchyard.json","bots":{"blue":4,"red":46},"nextMissionId":"c3_m20_underthedam","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m19_bunkerlights.json?v=76ce5d11c4"},
+    "c3_m20_underthedam": {"id":"c3_m20_underthedam","title":"CH3 M20 — UNDER THE DAM","chapter":3,"map":"maps/campaign/ch2_m13_redhorizon.json","bots":{"blue":4,"red":49},"nextMissionId":"c3_m21_vacuum","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m20_underthedam.json?v=808b01a9b3"},
+    "c3_m21_vacuum": {"id":"c3_m21_vacuum","title":"CH3 M21 — VACUUM","chapter":3,"map":"maps/campaign/ch2_m14_glassline.json","bots":{"blue":4,"red":52},"nextMissionId":"c3_m22_handover","rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m21_vacuum.json?v=b888ee1d41"},
+    "c3_m22_handover": {"id":"c3_m22_handover","title":"CH3 M22 — HANDOVER","chapter":3,"map":"maps/campaign/ch2_m1_port.json","bots":{"blue":4,"red":55},"nextMissionId":null,"rules":{"noShop":true,"noClass":true,"noBandage":true,"autoRegen":true},"loadout":{"primary":"ar1","secondary":"pistol1","grenades":["smoke","frag"],"extras":["flash","impact"]},"failOnDeath":true,"timeLimitSec":0,"bundle":"c3_m22_handover.json?v=a852dd3241"},
+  },
+};
@@ -1,8 +1,10 @@
 // src/campaign/CampaignRuntime.js
 
-import { CampaignDB, CAMPAIGN_KEY } from './CampaignData.js';
+import { CampaignDB, CAMPAIGN_KEY } from './CampaignIndex.js';
+import { getMissionEntry, loadMissionBundle, prefetchMissionBundle } from './CampaignBundles.js';
 import { CampaignUI } from './CampaignUI.js';
-import { translateKOtoEN } from './CampaignTranslationKOEN.js';
+import { translateWith } from './CampaignTranslate.js';
+import { fetchAsset } from '../core/AssetManifest.js';
 
 function clamp(v, a, b) { return Math.max(a, Math.min(b, v)); }
 function lerp(a, b, t) { return a + (b - a) * t; }
@@ -179,13 +181,25 @@ export class CampaignRuntime {
     } catch { /* ignore */ }
   }
 
-  loadMission(missionId) {
-    const m = CampaignDB?.missions?.[missionId];
+  // Fetches the mission bundle (script/translations) and warms the next one.
+  async loadMission(missionId) {
+    let m = null;
+    try { m = await loadMissionBundle(missionId); }
+    catch (e) { console.warn('[Campaign] mission load failed', missionId, e); }
     if (!m) return null;
     this.mission = m;
     // HF9-C2: reset dialogue queue per mission load
     this._dialogueChain = Promise.resolve();
     this._dialoguePending = 0;
+    this._prefetch = null;
+    prefetchMissionBundle(m.nextMissionId);
+    // Pre-rendered voice packs (tools/tts_prerender.py), if enabled and built.
+    try{
+      const tts = this.ttsManager || window.ttsManager;
+      tts?.clearPrefetch?.();
+      tts?.loadVoicePack?.(missionId);
+      if(m.nextMissionId) tts?.loadVoicePack?.(m.nextMissionId);
+    }catch{}
     return m;
   }
 
@@ -306,7 +320,7 @@ export class CampaignRuntime {
 
 
   // HF9-C3b: supports mission select / replay / continue flags
-  start({ mapJson, continueFromSave = true, missionId = null, replayMode = false } = {}) {
+  async start({ mapJson, continueFromSave = true, missionId = null, replayMode = false } = {}) {
     this.loadSession({ createIfMissing: true });
 
     const requested = String(missionId || '').trim();
@@ -329,8 +343,17 @@ export class CampaignRuntime {
       this.saveSession(patch);
     }
 
-    this.loadMission(mid);
-    if (!this.mission) return;
+    // Hold the player until the bundle (script, cutscenes, dialogue) is in.
+    this._setPlayerLock(true);
+    this.ui.toast('미션 불러오는 중…', 30);
+    const loaded = await this.loadMission(mid);
+    if (!loaded) {
+      // Not half-started: no mission, player held, retry/menu buttons offered.
+      this.mission = null;
+      this.ui.hideToast();
+      this.ui.showResult({ title: 'MISSION LOAD FAILED', desc: '미션 데이터를 불러오지 못했습니다. 다시 시도하거나 캠페인 메뉴로 돌아가세요.' });
+      return;
+    }
 
     this.attachMap(mapJson);
     this.killCount = 0;
@@ -341,7 +364,7 @@ export class CampaignRuntime {
     this.stepIndex = allowContinue ? Math.max(0, Number(this.session?.stepIndex || 0)) : 0;
     // HF9-A: 기존 '브리핑 오버레이 컷신' 자동 삽입은 제거. (스크립트에서 컷신/대사 흐름을 직접 구성)
     this.stepState = null;
-    this._inCutscene = false;
+    this._setPlayerLock(false);
 
     // Build checklist from objective steps
     this.checklist = [];
@@ -640,6 +663,60 @@ export class CampaignRuntime {
     });
   }
 
+  // Bundle `prefetch` schedule (tools/mission_timeline.py): warm voice lines
+  // `[step, offset, target step, line index | -1 for a say]` once the player
+  // is `offset` seconds into `step` (entries of passed steps fire at once),
+  // and the next mission's map at `next`.
+  _tickPrefetch(t){
+    const pf = this.mission?.prefetch;
+    if(!pf) return;
+    const i = this.stepIndex;
+    if(!this._prefetch || i < this._prefetch.step) this._prefetch = { at: 0, step: i, next: false };
+    const st = this._prefetch;
+    st.step = i;
+    const warm = Array.isArray(pf.warm) ? pf.warm : [];
+    while(st.at < warm.length){
+      const [step, offset, target, line] = warm[st.at];
+      if(step > i || (step === i && offset > t)) break;
+      st.at++;
+      if(target >= i) this._ttsPrefetchLine(target, line);
+    }
+    const next = pf.next;
+    if(!st.next && Array.isArray(next) && (next[0] < i || (next[0] === i && next[1] <= t))){
+      st.next = true;
+      this._prefetchNextMap();
+    }
+  }
+
+  _ttsPrefetchLine(stepIdx, lineIdx){
+    try{
+      const tts = this.ttsManager || (typeof window !== 'undefined' ? window.ttsManager : null);
+      if(!tts?.prefetch) return;
+      const step = (this.mission?.script || [])[stepIdx];
+      const obj = (lineIdx < 0) ? step : step?.lines?.[lineIdx];
+      if(!obj || obj.tts === false) return;
+      let text = String(this._stripTagAndDetectChannel(this._pickTTSTextRaw(obj)).text || '').trim();
+      if(this._hasHangul(text)) text = '';
+      if(!text) return;
+      tts.prefetch({
+        text,
+        lang: String(this.mission?.lang || 'en-GB'),
+        voice: this._voiceForSpeaker(this._speakerTag(obj.speaker ?? '')),
+      }).catch(() => {});
+    }catch{}
+  }
+
+  // Warm the HTTP cache with the next mission's packed map and nav bake.
+  _prefetchNextMap(){
+    const path = getMissionEntry(this.mission?.nextMissionId)?.map;
+    if(!path || !path.endsWith('.json')) return;
+    for(const ext of ['.smap', '.snav']){
+      fetchAsset(path.replace(/\.json$/, ext))
+        .then((res) => (res.ok ? res.arrayBuffer() : null))
+        .catch(() => {});
+    }
+  }
+
   // HF9-C3a-3: Subtitles stay Korean, TTS speaks English (via KO->EN translation table)
   _hasHangul(s){
     return /[가-힣]/.test(String(s||''));
@@ -691,9 +768,9 @@ export class CampaignRuntime {
     if(enRaw && !this._looksBadEN(enRaw)) return enRaw;
 
     const base = this._pickSubtitleRaw(obj);
-    const mid = String(this.mission?.id || this.session?.missionId || '');
+    const tr = this.mission?.translations;
     try{
-      return translateKOtoEN(base, mid) || base;
+      return translateWith(base, tr?.mission, tr?.global) || base;
     }catch{
       return base;
     }
@@ -1001,6 +1078,7 @@ export class CampaignRuntime {
 
     this.stepState = { t: 0, done: false };
     this.saveSession({ stepIndex: this.stepIndex });
+    this._tickPrefetch(0);
 
     if (step.type === 'objective') {
       this.ui.setObjective(step.text || '');
@@ -1293,6 +1371,7 @@ export class CampaignRuntime {
     }
 
     if (!this.stepState) this.stepState = { t: 0, done: false };
+    this._tickPrefetch(this.stepState.t || 0);
 
     // HF9-B: allow timed dialogue lines during any step (reach/interact/kill/defend/wait)
     if (step.type !== 'cutscene') {
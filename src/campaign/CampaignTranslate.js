@@ -0,0 +1,76 @@
+// src/campaign/CampaignTranslate.js
+// KO -> EN subtitle lookup shared by CampaignTranslationKOEN.js (full tables)
+// and per-mission bundles (tables sliced by tools/build_campaign_bundles.py).
+
+export function stripLeadingBracketTag(s){
+  const m = String(s||'').trim().match(/^\[[^\]]+\]\s*(.*)$/);
+  return (m ? m[1] : String(s||'')).trim();
+}
+
+export function normalizeKey(s){
+  return stripLeadingBracketTag(s)
+    .replace(/\s+/g,' ')
+    .replace(/[“”]/g,'"')
+    .replace(/[‘’]/g,"'")
+    .trim();
+}
+
+function hasHangul(s){
+  return /[가-힣]/.test(String(s||''));
+}
+
+// very small fallback for unmapped short lines
+const FALLBACK_PAIRS = [
+  ['웨이포인트', 'waypoint'],
+  ['확인.', 'Copy.'],
+  ['확인', 'Copy'],
+  ['좋아.', 'Good.'],
+  ['좋아', 'Good'],
+  ['계속 간다.', 'Keep moving.'],
+  ['계속 간다', 'Keep moving'],
+  ['조심.', 'Stay sharp.'],
+  ['조심', 'Stay sharp'],
+];
+
+function phraseFallback(ko){
+  let out = String(ko||'');
+  for(const [a, b] of FALLBACK_PAIRS) out = out.split(a).join(b);
+  return out;
+}
+
+// byMission / global: { normalizedKo: en } (either may be null)
+export function translateWith(raw, byMission, global){
+  const full = String(raw||'').trim();
+  if(!full) return full;
+
+  // Preserve leading [채널] 태그는 그대로 두고 본문만 변환
+  let tag = '';
+  let body = full;
+  const m = full.match(/^(\[[^\]]+\])\s*(.*)$/);
+  if(m){
+    tag = m[1];
+    body = (m[2]||'').trim();
+  }
+
+  // 이미 영문이면 그대로
+  if(!hasHangul(body)) return full;
+
+  const key = normalizeKey(body);
+
+  let en = (byMission?.[key]) || (global?.[key]) || '';
+  if(!en){
+    // try mapping using full key as well
+    const k2 = normalizeKey(full);
+    en = (byMission?.[k2]) || (global?.[k2]) || '';
+  }
+  if(!en){
+    en = phraseFallback(body);
+    // if nothing changed, bail
+    if(en === body) return full;
+  }
+
+  // If mapping already includes a bracket tag, prefer it; else preserve original tag
+  const hasTag = /^\[[^\]]+\]/.test(en);
+  if(tag && !hasTag) return (tag + ' ' + en).trim();
+  return en;
+}
@@ -1,1398 +1,2931 @@
 // src/campaign/CampaignTranslationKOEN.js
-// Auto-generated from Strikegy_Campaign_Chapter2_HF9A_EN_dialogue.md + CampaignData.js
+// Auto-generated by tools/gen_trans.mjs from the en fields of CampaignData.js (tools/align_koen.py --from-campaign)
 // 목적: 영어 자막/TTS를 위해 한국어 대사를 (best-effort) 오프라인 매핑으로 변환
 
-export const KO_EN_BY_MISSION = {
-  "c1_m1_insertion": {
-    "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '중계기 차단(해킹/파괴)'까지.": "[radio] This is DUSTLINE. Kicking off OP DUSTLINE. Objective is relay disable—hack or destroy.",
-    "저시야 구간이다. 집결 지점 도달까지는 발자국도 줄여.": "[radio] Low-vis sector. Until you reach the rendezvous—keep your footprint light.",
-    "눈에 띄면 봉쇄가 떨어진다. 조용히.": "[radio] If you get spotted, lockdown drops. Stay quiet.",
-    "카피.": "[radio] Copy.",
-    "RAVEN, 웨이포인트는 믿되 맹신하지 마. 길이 '속일' 수 있어.": "[whisper] Raven—use the waypoint, don’t worship it. Routes can lie.",
-    "기억해. 우리가 찾는 건 사람보다 '증거'다.": "[radio] Remember—people are secondary. We’re here for evidence.",
-    "그리고… 방금 잡음. 채널에 낯선 손이 닿았다.": "[radio] And… jamming just hit. Someone unknown touched our net.",
-    "…계속해.": "[noise] …Continue.",
-    "방금 그거, 우리 채널 아니지?": "[radio] That wasn’t our net. Say again?",
-    "맞아. 적 무전에서 'RAVEN' 호출부호가 먼저 언급된다 — 누군가 네 존재를 이미 알고 있다.": "[radio] Yeah. Enemy comms mention “RAVEN” first—someone already knows you’re here.",
-    "집결 지점 도달. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-    "잠깐, 소리 난다. 멈춰.": "Secure the north exfil point. Good. Done.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-    "아니야. 반대편이다.": "Negative. Other side.",
-    "집결 지점 도달 클린하게 끝냈다.": "We’re made! Smoke out—break contact!",
-    "발각! 연막 던지고 각 잡아!": "Buying time. Move!",
-    "중계기 차단(해킹/파괴). 웨이포인트 확인해, RAVEN.": "Something’s off. Enemy comms lead with the callsign 'RAVEN.' Someone already knows you’re here.",
-    "왼쪽 시야, 움직임. 조심.": "Check complete. Keep moving.",
-    "시간 끈다. 움직여.": "[radio] Reset. Catch your breath—then we move.",
-    "이상해. 적 무전에서 'RAVEN' 호출부호가 먼저 언급된다 — 누군가 네 존재를 이미 알고 있다.": "[radio] I scrubbed our trail, but… enemy comms still lead with “RAVEN.” Someone knows you.",
-    "중계기 차단(해킹/파괴) 좋아, 됐다.": "[radio] You sure?",
-    "확인 끝. 계속 간다.": "[radio] Objective’s clear. Hesitate and you die.",
-    "적 순찰 최소화하며 통로 확보. 웨이포인트 확인해, RAVEN.": "[noise] Deletion authorized.",
-    "지금은 숨고, 지나가면 간다.": "[radio] That channel again. Someone’s on our tail.",
-    "적 순찰 최소화하며 통로 확보 완료. 다음으로.": "[radio] All the way."
-  },
-  "c1_m2_blacksite": {
-    "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '시설 내부 진입'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Enter the facility interior' until then.",
-    "저시야 구간이다. 외곽 감시 회피까지는 발자국도 줄여.": "[radio] Low-vis sector. Bypass outer surveillance until keep your footprint light.",
-    "이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Move fast in this sector. linger and you’ll get boxed in.",
-    "확인.": "[radio] Confirmed.",
-    "RAVEN, 웨이포인트는 믿되 맹신하지 마. 길이 '속일' 수 있어.": "[whisper] Raven—use the waypoint, don’t worship it. Routes can lie.",
-    "기억해. 우리가 찾는 건 사람보다 '증거'다.": "[radio] Remember—people are secondary. We’re here for evidence.",
-    "그리고… 방금 잡음. 채널에 낯선 손이 닿았다.": "[radio] And… jamming just hit. Someone unknown touched our net.",
-    "…확인했다.": "[noise] …Confirmed.",
-    "방금 그거, 우리 채널 아니지?": "[radio] That wasn’t our net. Say again?",
-    "맞아. 서버 로그에 '승인자: NEMESIS' 서명이 찍혀 있다 — '적'이 아니라 내부 결재다.": "[radio] Yeah. Server logs show “Approver: NEMESIS”—not enemy. Internal sign-off.",
-    "외곽 감시 회피. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-    "그림자 봤어. 너무 빨리 가지 마.": "Bag the evidence and exfil—now. Good. Done.",
-    "그쪽 아냐, 다시 표식 봐.": "Negative. Check the marker again.",
-    "잡음 커졌다. 추적 온다!": "Jamming just spiked—trackers inbound!",
-    "외곽 감시 회피 완료. 다음으로.": "If you stop, you're done.",
-    "지금 멈추면 끝이야.": "Hold—those tones match our crypto.",
-    "시설 내부 진입. 웨이포인트 확인해, RAVEN.": "Something’s off. Server logs show 'Approver: NEMESIS'—not enemy. Internal sign-off.",
-    "잠깐, 소리 난다. 멈춰.": "Check complete. Keep moving.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "[radio] Reset. Catch your breath—then we move.",
-    "이상해. 서버 로그에 '승인자: NEMESIS' 서명이 찍혀 있다 — '적'이 아니라 내부 결재다.": "[radio] I scrubbed our trail, but… Server logs show 'Approver: NEMESIS'—not enemy. Internal sign-off.",
-    "시설 내부 진입 클린하게 끝냈다.": "[radio] …That’s not right.",
-    "확인 끝. 계속 간다.": "[radio] Objective’s clear. Hesitate and you die.",
-    "서버룸에서 로그/사진 확보. 웨이포인트 확인해, RAVEN.": "[noise] Target moving.",
-    "서버룸에서 로그/사진 확보 성공적이다.": "[radio] All the way."
-  },
-  "c1_m3_convoy": {
-    "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '후미 트럭에서 케이스 회수'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Recover the case from the rear truck' until then.",
-    "저시야 구간이다. 매복 포지션 확보까지는 발자국도 줄여.": "[radio] Low-vis sector. Secure an ambush position until keep your footprint light.",
-    "이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Move fast in this sector. linger and you’ll get boxed in.",
-    "들었다.": "[radio] Heard it.",
-    "RAVEN, 웨이포인트는 믿되 맹신하지 마. 길이 '속일' 수 있어.": "[whisper] Raven—use the waypoint, don’t worship it. Routes can lie.",
-    "기억해. 우리가 찾는 건 사람보다 '증거'다.": "[radio] Remember—people are secondary. We’re here for evidence.",
-    "그리고… 방금 잡음. 채널에 낯선 손이 닿았다.": "[radio] And… jamming just hit. Someone unknown touched our net.",
-    "…계속해.": "[noise] …Continue.",
-    "방금 그거, 우리 채널 아니지?": "[radio] That wasn’t our net. Say again?",
-    "맞아. 케이스 봉인 라벨이 '우리 쪽 규격'이다. 내용물보다 '누가 보냈는지'가 이상하다.": "[radio] Yeah. Case seal label is our spec. Not what’s inside—who sent it is the problem.",
-    "매복 포지션 확보. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-    "잠깐, 소리 난다. 멈춰.": "Torch the route, then exfil. Clean. Move.",
-    "빨리, 창구가 닫힌다.": "Move—window’s closing.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-    "매복 포지션 확보 클린하게 끝냈다.": "Jamming just spiked—trackers inbound!",
-    "잡음 커졌다. 추적 온다!": "Stop. That way’s blocked.",
-    "후미 트럭에서 케이스 회수. 웨이포인트 확인해, RAVEN.": "Something’s off. Case seal label is our spec. Not what’s inside—who sent it is the problem.",
-    "그림자 봤어. 너무 빨리 가지 마.": "Check complete. Keep moving.",
-    "멈춰. 그 길은 막혔다.": "[radio] Reset. Catch your breath—then we move.",
-    "이상해. 케이스 봉인 라벨이 '우리 쪽 규격'이다. 내용물보다 '누가 보냈는지'가 이상하다.": "[radio] I scrubbed our trail, but… Case seal label is our spec. Not what’s inside—who sent it is the problem.",
-    "후미 트럭에서 케이스 회수 완료. 다음으로.": "[radio] …That’s not right.",
-    "확인 끝. 계속 간다.": "[radio] Objective’s clear. Hesitate and you die.",
-    "추격 분대 저지(필요 최소). 웨이포인트 확인해, RAVEN.": "[noise] Deletion authorized.",
-    "추격 분대 저지(필요 최소) 좋아, 됐다.": "[radio] All the way."
-  },
-  "c1_m4_bridge": {
-    "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '연막으로 시선 차단하며 전진'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Advance under smoke, break their sightline' until then.",
-    "저시야 구간이다. 교량 진입까지는 발자국도 줄여.": "[radio] Low-vis sector. Enter the bridge until keep your footprint light.",
-    "눈에 띄면 봉쇄가 떨어진다. 조용히.": "[radio] If you get spotted, lockdown drops. Stay quiet.",
-    "들었다.": "[radio] Heard it.",
-    "RAVEN, 웨이포인트는 믿되 맹신하지 마. 길이 '속일' 수 있어.": "[whisper] Raven—use the waypoint, don’t worship it. Routes can lie.",
-    "기억해. 우리가 찾는 건 사람보다 '증거'다.": "[radio] Remember—people are secondary. We’re here for evidence.",
-    "그리고… 방금 잡음. 채널에 낯선 손이 닿았다.": "[radio] And… jamming just hit. Someone unknown touched our net.",
-    "…기록 시작.": "[noise] …Recording.",
-    "방금 그거, 우리 채널 아니지?": "[radio] That wasn’t our net. Say again?",
-    "맞아. 적이 쓰는 암호 문구가 우리 쪽 '브리핑 문장'과 같다. 누가 흘렸나?": "[radio] Yeah. Their crypto phrase matches our briefing line. Somebody leaked it.",
-    "교량 진입. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-    "지금은 숨고, 지나가면 간다.": "Secure the far end of the bridge complete. Push on.",
-    "지금 멈추면 끝이야.": "Secure the city approach. Check your waypoint, Raven.",
-    "발각! 연막 던지고 각 잡아!": "Hold. I hear something. Freeze.",
-    "교량 진입 좋아, 됐다.": "Secure the city approach complete. Push on.",
-    "그쪽은 위험해. 돌아.": "If you stop, you're done.",
-    "연막으로 시선 차단하며 전진. 웨이포인트 확인해, RAVEN.": "We’re made! Smoke out—break contact!",
-    "그림자 봤어. 너무 빨리 가지 마.": "That route's hot. Reroute.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-    "이상해. 적이 쓰는 암호 문구가 우리 쪽 '브리핑 문장'과 같다. 누가 흘렸나?": "Something’s off. Their crypto phrase matches our own briefing line. Somebody leaked it.",
-    "연막으로 시선 차단하며 전진 완료. 다음으로.": "Check complete. Keep moving.",
-    "확인 끝. 계속 간다.": "[radio] Reset. Catch your breath—then we move.",
-    "고정 화점(저격/기관총) 무력화. 웨이포인트 확인해, RAVEN.": "[radio] I scrubbed our trail, but… Their crypto phrase matches our own briefing line. Somebody leaked it.",
-    "잠깐, 소리 난다. 멈춰.": "[radio] Just heard it.",
-    "고정 화점(저격/기관총) 무력화 클린하게 끝냈다.": "[radio] That channel again. Someone’s on our tail.",
-    "교량 끝 확보. 웨이포인트 확인해, RAVEN.": "[radio] Moving."
-  },
-  "c1_m5_city": {
-    "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '고지(옥상) 확보'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Secure the high ground (rooftop)' until then.",
-    "저시야 구간이다. 골목 진입까지는 발자국도 줄여.": "[radio] Low-vis sector. Enter the alley until keep your footprint light.",
-    "눈에 띄면 봉쇄가 떨어진다. 조용히.": "[radio] If you get spotted, lockdown drops. Stay quiet.",
-    "카피.": "[radio] Copy.",
-    "RAVEN, 웨이포인트는 믿되 맹신하지 마. 길이 '속일' 수 있어.": "[whisper] Raven—use the waypoint, don’t worship it. Routes can lie.",
-    "기억해. 우리가 찾는 건 사람보다 '증거'다.": "[radio] Remember—people are secondary. We’re here for evidence.",
-    "그리고… 방금 잡음. 채널에 낯선 손이 닿았다.": "[radio] And… jamming just hit. Someone unknown touched our net.",
-    "…기록 시작.": "[noise] …Recording.",
-    "방금 그거, 우리 채널 아니지?": "[radio] That wasn’t our net. Say again?",
-    "맞아. 카메라 허브에 'DUSTLINE' 움직임이 실시간으로 찍혀 있다. 우리가 먼저 노출됐다.": "[radio] Yeah. Camera hub shows DUSTLINE movement on a live feed. We were exposed first.",
-    "골목 진입. 웨이포인트 확인해, RAVEN.": "Stay low. Let them pass.",
-    "지금은 숨고, 지나가면 간다.": "Exfil the perimeter. Clean. Move.",
-    "지금 멈추면 끝이야.": "If you stop, you're done.",
-    "들켰다. 시선 끊어!": "We're made—break line of sight!",
-    "골목 진입 좋아, 됐다.": "Hold—those tones match our crypto.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Negative. Other side.",
-    "고지(옥상) 확보. 웨이포인트 확인해, RAVEN.": "Something’s off. Camera hub shows DUSTLINE movement on a live feed. We were exposed first.",
-    "아니야. 반대편이다.": "[radio] Reset. Catch your breath—then we move.",
-    "이상해. 카메라 허브에 'DUSTLINE' 움직임이 실시간으로 찍혀 있다. 우리가 먼저 노출됐다.": "[radio] I scrubbed our trail, but… Camera hub shows DUSTLINE movement on a live feed. We were exposed first.",
-    "고지(옥상) 확보 완료. 다음으로.": "[radio] …That’s not right.",
-    "확인 끝. 계속 간다.": "[radio] Objective’s clear. Hesitate and you die.",
-    "감시 카메라 허브 찾기. 웨이포인트 확인해, RAVEN.": "[noise] Pursuit resumed.",
-    "왼쪽 시야, 움직임. 조심.": "[radio] That channel again. Someone’s on our tail.",
-    "감시 카메라 허브 찾기 완료. 다음으로.": "[radio] All the way."
-  },
-  "c1_m6_trench": {
-    "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '2차 참호선 확보'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Secure the second trenchline' until then.",
-    "저시야 구간이다. 1차 참호선 확보까지는 발자국도 줄여.": "[radio] Low-vis sector. Secure the first trenchline until keep your footprint light.",
-    "총성은 마지막 수단이다. 길만 열어.": "[radio] Gunfire is last resort. just clear the route.",
-    "카피.": "[radio] Copy.",
-    "RAVEN, 웨이포인트는 믿되 맹신하지 마. 길이 '속일' 수 있어.": "[whisper] Raven—use the waypoint, don’t worship it. Routes can lie.",
-    "기억해. 우리가 찾는 건 사람보다 '증거'다.": "[radio] Remember—people are secondary. We’re here for evidence.",
-    "그리고… 방금 잡음. 채널에 낯선 손이 닿았다.": "[radio] And… jamming just hit. Someone unknown touched our net.",
-    "…확인했다.": "[noise] …Confirmed.",
-    "방금 그거, 우리 채널 아니지?": "[radio] That wasn’t our net. Say again?",
-    "맞아. 표식은 '우리 부대 코드'다. '이전 팀'이 여기서 사라졌다.": "[radio] Yeah. The marker is our unit code. The previous team vanished here.",
-    "1차 참호선 확보. 웨이포인트 확인해, RAVEN.": "Stay low. Let them pass.",
-    "그림자 봤어. 너무 빨리 가지 마.": "Recover the trench marker (patch/tag) complete. Push on.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-    "잡음 커졌다. 추적 온다!": "Jamming just spiked—trackers inbound!",
-    "1차 참호선 확보 클린하게 끝냈다.": "Move—window’s closing.",
-    "빨리, 창구가 닫힌다.": "Negative. Other side.",
-    "2차 참호선 확보. 웨이포인트 확인해, RAVEN.": "Something’s off. The marker is our unit code. The previous team vanished here.",
-    "왼쪽 시야, 움직임. 조심.": "Check complete. Keep moving.",
-    "아니야. 반대편이다.": "[radio] Reset. Catch your breath—then we move.",
-    "이상해. 표식은 '우리 부대 코드'다. '이전 팀'이 여기서 사라졌다.": "[radio] I scrubbed our trail, but… The marker is our unit code. The previous team vanished here.",
-    "2차 참호선 확보 완료. 다음으로.": "[radio] Just heard it.",
-    "확인 끝. 계속 간다.": "[radio] Objective’s clear. Hesitate and you die.",
-    "3차 참호선 확보. 웨이포인트 확인해, RAVEN.": "[noise] Target moving.",
-    "3차 참호선 확보 성공적이다.": "[radio] All the way."
-  },
-  "c1_m7_ridge": {
-    "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '중계장치에 폭약 설치'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Plant explosives on the relay unit' until then.",
-    "저시야 구간이다. 야적장 진입까지는 발자국도 줄여.": "[radio] Low-vis sector. Enter the yard until keep your footprint light.",
-    "교전은 최소. 목적만 하고 빠져.": "[radio] Minimize contact. hit the objective and get out.",
-    "카피.": "[radio] Copy.",
-    "RAVEN, 웨이포인트는 믿되 맹신하지 마. 길이 '속일' 수 있어.": "[whisper] Raven—use the waypoint, don’t worship it. Routes can lie.",
-    "기억해. 우리가 찾는 건 사람보다 '증거'다.": "[radio] Remember—people are secondary. We’re here for evidence.",
-    "그리고… 방금 잡음. 채널에 낯선 손이 닿았다.": "[radio] And… jamming just hit. Someone unknown touched our net.",
-    "…확인했다.": "[noise] …Confirmed.",
-    "방금 그거, 우리 채널 아니지?": "[radio] That wasn’t our net. Say again?",
-    "맞아. 정체불명 채널이 '폭약을 해제하라'고 지시한다. 임무와 정반대다.": "[radio] Yeah. Unknown net orders “disarm the explosives.” That’s the opposite of the mission.",
-    "야적장 진입. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-    "잠깐, 소리 난다. 멈춰.": "Exfil before lockdown. Good work.",
-    "아니야. 반대편이다.": "Negative. Other side.",
-    "지금 멈추면 끝이야.": "If you stop, you're done.",
-    "야적장 진입 클린하게 끝냈다.": "Hold—those tones match our crypto.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Alarm's up—move!",
-    "중계장치에 폭약 설치. 웨이포인트 확인해, RAVEN.": "Something’s off. Unknown net orders: 'Disarm the explosives.' That’s the opposite of the mission.",
-    "경보 올라간다. 빨리!": "[radio] Reset. Catch your breath—then we move.",
-    "이상해. 정체불명 채널이 '폭약을 해제하라'고 지시한다. 임무와 정반대다.": "[radio] I scrubbed our trail, but… Unknown net orders: 'Disarm the explosives.' That’s the opposite of the mission.",
-    "중계장치에 폭약 설치 좋아, 됐다.": "[radio] …That’s not right.",
-    "확인 끝. 계속 간다.": "[radio] Objective’s clear. Hesitate and you die.",
-    "기폭 후 교란 시간 버티기. 웨이포인트 확인해, RAVEN.": "[noise] Pursuit resumed.",
-    "기폭 후 교란 시간 버티기 클린하게 끝냈다.": "[radio] All the way."
-  },
-  "c1_m8_counter": {
-    "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '전환기 조작'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Operate the switch' until then.",
-    "저시야 구간이다. 플랫폼 접근까지는 발자국도 줄여.": "[radio] Low-vis sector. Approach the platform until keep your footprint light.",
-    "이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Move fast in this sector. linger and you’ll get boxed in.",
-    "확인.": "[radio] Confirmed.",
-    "RAVEN, 웨이포인트는 믿되 맹신하지 마. 길이 '속일' 수 있어.": "[whisper] Raven—use the waypoint, don’t worship it. Routes can lie.",
-    "기억해. 우리가 찾는 건 사람보다 '증거'다.": "[radio] Remember—people are secondary. We’re here for evidence.",
-    "그리고… 방금 잡음. 채널에 낯선 손이 닿았다.": "[radio] And… jamming just hit. Someone unknown touched our net.",
-    "…확인했다.": "[noise] …Confirmed.",
-    "방금 그거, 우리 채널 아니지?": "[radio] That wasn’t our net. Say again?",
-    "맞아. 경보 방송에 '블랙 타이드 프로토콜'이란 단어가 나온다. 작전명이 챕터2와 겹친다.": "[radio] Yeah. Emergency broadcast said “Black Tide Protocol.” Same op name as Chapter 2.",
-    "플랫폼 접근. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-    "지금은 숨고, 지나가면 간다.": "Exit the tunnel. Good work.",
-    "지금 멈추면 끝이야.": "If you stop, you're done.",
-    "그쪽은 위험해. 돌아.": "That route's hot. Reroute.",
-    "플랫폼 접근 클린하게 끝냈다.": "Hold—those tones match our crypto.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "We’re made! Smoke out—break contact!",
-    "전환기 조작. 웨이포인트 확인해, RAVEN.": "Something’s off. Emergency broadcast just said “Black Tide Protocol.” Same name as our Chapter 2 op.",
-    "왼쪽 시야, 움직임. 조심.": "Check complete. Keep moving.",
-    "발각! 연막 던지고 각 잡아!": "[radio] Reset. Catch your breath—then we move.",
-    "이상해. 경보 방송에 '블랙 타이드 프로토콜'이란 단어가 나온다. 작전명이 챕터2와 겹친다.": "[radio] I scrubbed our trail, but… Emergency broadcast just said “Black Tide Protocol.” Same name as our Chapter 2 op.",
-    "전환기 조작 좋아, 됐다.": "[radio] Just heard it.",
-    "확인 끝. 계속 간다.": "[radio] Objective’s clear. Hesitate and you die.",
-    "경보/추격 20초 버티기. 웨이포인트 확인해, RAVEN.": "[noise] Pursuit resumed.",
-    "그림자 봤어. 너무 빨리 가지 마.": "[radio] That channel again. Someone’s on our tail.",
-    "경보/추격 20초 버티기 완료. 다음으로.": "[radio] All the way."
-  },
-  "c1_m9_lab": {
-    "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '내부 전원 차단(감시 끊기)'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Cut internal power (break surveillance)' until then.",
-    "저시야 구간이다. 정문 접근까지는 발자국도 줄여.": "[radio] Low-vis sector. Approach the front gate until keep your footprint light.",
-    "눈에 띄면 봉쇄가 떨어진다. 조용히.": "[radio] If you get spotted, lockdown drops. Stay quiet.",
-    "들었다.": "[radio] Heard it.",
-    "RAVEN, 웨이포인트는 믿되 맹신하지 마. 길이 '속일' 수 있어.": "[whisper] Raven—use the waypoint, don’t worship it. Routes can lie.",
-    "기억해. 우리가 찾는 건 사람보다 '증거'다.": "[radio] Remember—people are secondary. We’re here for evidence.",
-    "그리고… 방금 잡음. 채널에 낯선 손이 닿았다.": "[radio] And… jamming just hit. Someone unknown touched our net.",
-    "…확인했다.": "[noise] …Confirmed.",
-    "방금 그거, 우리 채널 아니지?": "[radio] That wasn’t our net. Say again?",
-    "맞아. VIP가 말한다: 'BLACK TIDE는 적이 아니라 너희 결재라인이다.'": "[radio] Yeah. VIP says: “BLACK TIDE isn’t the enemy—it’s your approval chain.”",
-    "정문 접근. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-    "왼쪽 시야, 움직임. 조심.": "Escort VIP to exfil. Clean. Move.",
-    "빨리, 창구가 닫힌다.": "Break pursuit (seal doors/smoke). Check your waypoint, Raven.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Saw movement. Don't rush it.",
-    "정문 접근 성공적이다.": "Break pursuit (seal doors/smoke). Good work.",
-    "그쪽은 위험해. 돌아.": "Move—window’s closing.",
-    "내부 전원 차단(감시 끊기). 웨이포인트 확인해, RAVEN.": "Hold—those tones match our crypto.",
-    "지금은 숨고, 지나가면 간다.": "That route's hot. Reroute.",
-    "경보 올라간다. 빨리!": "Alarm's up—move!",
-    "이상해. VIP가 말한다: 'BLACK TIDE는 적이 아니라 너희 결재라인이다.'": "Something’s off. VIP: 'BLACK TIDE isn’t the enemy. It’s your approval chain.'",
-    "내부 전원 차단(감시 끊기) 성공적이다.": "Check complete. Keep moving.",
-    "확인 끝. 계속 간다.": "[radio] Reset. Catch your breath—then we move.",
-    "VIP 확보. 웨이포인트 확인해, RAVEN.": "[radio] I scrubbed our trail, but… VIP: 'BLACK TIDE isn’t the enemy. It’s your approval chain.'",
-    "VIP 확보 클린하게 끝냈다.": "[radio] That channel again. Someone’s on our tail.",
-    "VIP 호위 탈출. 웨이포인트 확인해, RAVEN.": "[radio] Moving.",
-    "잠깐, 소리 난다. 멈춰.": "[radio] All the way."
-  },
-  "c1_m10_exodus": {
-    "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '착륙지점 방어(시간 벌기)'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Defend the landing zone (buy time)' until then.",
-    "저시야 구간이다. LZ로 전진까지는 발자국도 줄여.": "[radio] Low-vis sector. Move to the LZ until keep your footprint light.",
-    "교전은 최소. 목적만 하고 빠져.": "[radio] Minimize contact. hit the objective and get out.",
-    "카피.": "[radio] Copy.",
-    "RAVEN, 웨이포인트는 믿되 맹신하지 마. 길이 '속일' 수 있어.": "[whisper] Raven—use the waypoint, don’t worship it. Routes can lie.",
-    "기억해. 우리가 찾는 건 사람보다 '증거'다.": "[radio] Remember—people are secondary. We’re here for evidence.",
-    "그리고… 방금 잡음. 채널에 낯선 손이 닿았다.": "[radio] And… jamming just hit. Someone unknown touched our net.",
-    "…계속해.": "[noise] …Continue.",
-    "방금 그거, 우리 채널 아니지?": "[radio] That wasn’t our net. Say again?",
-    "맞아. 구조 헬기 교신이 '우리'가 아니라 '그들'이다. 구출이 아니라 회수/삭제다.": "[radio] Yeah. Rescue helo comms aren’t ours—they’re theirs. Not rescue. Retrieval and delete.",
-    "LZ로 전진. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-    "지금은 숨고, 지나가면 간다.": "Final boarding / extraction complete. Push on.",
-    "잡음 커졌다. 추적 온다!": "Jamming just spiked—trackers inbound!",
-    "그쪽은 위험해. 돌아.": "That route's hot. Reroute.",
-    "LZ로 전진 좋아, 됐다.": "Buying time. Move!",
-    "시간 끈다. 움직여.": "Hold—those tones match our crypto.",
-    "착륙지점 방어(시간 벌기). 웨이포인트 확인해, RAVEN.": "Something’s off. Rescue helo comms aren’t ours—they’re theirs. Not a rescue. A retrieval and delete.",
-    "그림자 봤어. 너무 빨리 가지 마.": "Check complete. Keep moving.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "[radio] Reset. Catch your breath—then we move.",
-    "이상해. 구조 헬기 교신이 '우리'가 아니라 '그들'이다. 구출이 아니라 회수/삭제다.": "[radio] I scrubbed our trail, but… Rescue helo comms aren’t ours—they’re theirs. Not a rescue. A retrieval and delete.",
-    "착륙지점 방어(시간 벌기) 좋아, 됐다.": "[radio] …That’s not right.",
-    "확인 끝. 계속 간다.": "[radio] Objective’s clear. Hesitate and you die.",
-    "VIP 탑승 지원. 웨이포인트 확인해, RAVEN.": "[noise] Pursuit resumed.",
-    "VIP 탑승 지원 성공적이다.": "[radio] All the way."
-  },
-  "c2_m1_blacktide": {
-    "BLACK TIDE 업데이트. 항만 야간. 유령 회사 명의 선적. 실마리는 종이 한 장.": "[radio] BLACK TIDE Update: Night port. Cargo under shell companies—your lead is one sheet of paper.",
-    "목표는 '항만 진입'부터 '선적 서류 회수'까지. 총성은 마지막 수단이다. 길만 열어.": "[radio] Objectives: Enter the port through Recover the shipping documents. Gunfire is last resort. Just clear the route.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "컨테이너 구역 확보에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Secure the container yard, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 왼쪽 시야, 움직임. 조심.": "[radio] Raven, hold at the first corner. Movement left—stay sharp.",
-    "확인.": "[radio] Confirmed.",
-    "그리고 기억해. 서류의 발신인이 '너희 지원사(스폰서)'와 겹친다. 내부자 냄새.": "[radio] And remember: The sender on the paperwork matches your sponsor. Smells like an insider.",
-    "명령이… 이상하게 꼬인다.": "[radio] Orders… are getting tangled.",
-    "가자. 항만 진입로.": "[radio] Move. Enter the port.",
-    "항만 진입. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-    "지금은 숨고, 지나가면 간다.": "Copy gate/CCTV logs. Good work.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "Exfil. Check your waypoint, Raven.",
-    "확인 끝. 계속 간다.": "Saw movement. Don't rush it.",
-    "항만 진입 클린하게 끝냈다.": "Exfil. Good work.",
-    "그쪽은 위험해. 돌아.": "Eyes up. One thermal contact, right side.",
-    "컨테이너 구역 확보. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-    "왼쪽 시야, 움직임. 조심.": "That route's hot. Reroute.",
-    "지금 멈추면 끝이야.": "If you stop, you're done.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-    "컨테이너 구역 확보 좋아, 됐다.": "Something’s off. The sender on the paperwork matches your sponsor. Smells like an insider.",
-    "이상해. 서류의 발신인이 '너희 지원사(스폰서)'와 겹친다. 내부자 냄새.": "Alarm's up—move!",
-    "선적 서류 회수. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "잠깐, 소리 난다. 멈춰.": "I’ll hold them. You push.",
-    "경보 올라간다. 빨리!": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Paperwork points to the next location: Drydock vessel registry.",
-    "선적 서류 회수 성공적이다.": "[radio] Just pulled a weird pattern from the data. The sender on the paperwork matches your sponsor. Smells like an insider.",
-    "내가 막는다. 너희는 전진.": "[noise] Command routing.",
-    "게이트/CCTV 로그 복제. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "게이트/CCTV 로그 복제 성공적이다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m2_drydock": {
-    "BLACK TIDE 업데이트. 거대한 드라이독. 배의 이름이 바뀌면, 죄도 바뀐다.": "[radio] BLACK TIDE Update: Massive drydock. Change the ship’s name—change the crime.",
-    "목표는 '드라이독 잠입'부터 '하역 스케줄/거래 장부 확보'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Infil the drydock through Secure the offload schedule / transaction ledger. Move fast in this sector. Linger and you’ll get boxed in.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "선박 식별번호 확인에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Confirm the vessel ID number, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 왼쪽 시야, 움직임. 조심.": "[radio] Raven, hold at the first corner. Movement left—stay sharp.",
-    "카피.": "[radio] Copy.",
-    "그리고 기억해. 장부의 결재란에 또 'NEMESIS'가 있다. 한 번이 아니다 — 시스템이다.": "[radio] And remember: The ledger’s approval block has 'NEMESIS' again. Not once—systemic.",
-    "이상해. 누가 우릴 보고 있어.": "[radio] Something’s off. Someone’s watching us.",
-    "가자. 드라이독 잠입로.": "[radio] Move. Infil the drydock.",
-    "드라이독 잠입. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-    "왼쪽 시야, 움직임. 조심.": "Plant the tracker tag. Good work.",
-    "빨리, 창구가 닫힌다.": "Exfil. Check your waypoint, Raven.",
-    "확인 끝. 계속 간다.": "Saw movement. Don't rush it.",
-    "드라이독 잠입 성공적이다.": "Exfil. Good. Done.",
-    "이상해. 장부의 결재란에 또 'NEMESIS'가 있다. 한 번이 아니다 — 시스템이다.": "Move—window’s closing.",
-    "선박 식별번호 확인. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-    "지금은 숨고, 지나가면 간다.": "Something’s off. The ledger’s approval block has 'NEMESIS' again. Not once—systemic.",
-    "발각! 연막 던지고 각 잡아!": "We’re made! Smoke out—break contact!",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-    "선박 식별번호 확인 좋아, 됐다.": "Negative. Check the marker again.",
-    "그쪽 아냐, 다시 표식 봐.": "Eyes up. One thermal contact, right side.",
-    "하역 스케줄/거래 장부 확보. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "그림자 봤어. 너무 빨리 가지 마.": "I’ll hold them. You push.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Schedule: transfer at Sandglass. Time is an hourglass.",
-    "하역 스케줄/거래 장부 확보 완료. 다음으로.": "[radio] Just pulled a weird pattern from the data. The ledger’s approval block has 'NEMESIS' again. Not once—systemic.",
-    "내가 막는다. 너희는 전진.": "[noise] Packet loss.",
-    "추적 태그 심기. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "잠깐, 소리 난다. 멈춰.": "[radio] Voices can be spoofed. Trust words and you die.",
-    "추적 태그 심기 성공적이다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m3_sandglass": {
-    "BLACK TIDE 업데이트. 사막의 환적 지점. 바람이 흔적을 지운다. 그래서 더 무섭다.": "[radio] BLACK TIDE Update: Desert transfer point. Wind wipes tracks—makes it worse.",
-    "목표는 '관측점 확보'부터 '환적 트럭에서 장비 회수'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Secure the lookout point through Recover gear from the transfer truck. Move fast in this sector. Linger and you’ll get boxed in.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "이동 신호기/트랜스폰더 추적에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Track the beacon/transponder, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 지금은 숨고, 지나가면 간다.": "[radio] Raven, hold at the first corner. Stay low—let them pass.",
-    "카피.": "[radio] Copy.",
-    "그리고 기억해. 트랜스폰더에 '자산: RAVEN' 표기가 있다. 네가 물건 취급이다.": "[radio] And remember: Transponder reads 'Asset: RAVEN.' You’re being treated like property.",
-    "우리 쪽 채널이 새는 것 같다.": "[radio] Looks like our net is leaking.",
-    "가자. 관측점 확보로.": "[radio] Move. Secure the lookout point.",
-    "관측점 확보. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-    "왼쪽 시야, 움직임. 조심.": "Exfil through the sandstorm. Good work.",
-    "이상해. 트랜스폰더에 '자산: RAVEN' 표기가 있다. 네가 물건 취급이다.": "Something’s off. Transponder reads 'Asset: RAVEN.' You’re being treated like property.",
-    "그쪽은 위험해. 돌아.": "That route's hot. Reroute.",
-    "관측점 확보 완료. 다음으로.": "Hold—those tones match our crypto.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Buying time. Move!",
-    "이동 신호기/트랜스폰더 추적. 웨이포인트 확인해, RAVEN.": "We're made—break line of sight!",
-    "지금은 숨고, 지나가면 간다.": "Eyes up. One thermal contact, right side.",
-    "시간 끈다. 움직여.": "Check complete. Keep moving.",
-    "들켰다. 시선 끊어!": "Lock just popped. Buy me five seconds.",
-    "이동 신호기/트랜스폰더 추적 완료. 다음으로.": "I’ll hold them. You push.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "[radio] Good. You're still breathing.",
-    "환적 트럭에서 장비 회수. 웨이포인트 확인해, RAVEN.": "[radio] Copy. Coordinates lead to a contact in Wadi canyon.",
-    "잠깐, 소리 난다. 멈춰.": "[radio] Just pulled a weird pattern from the data. Transponder reads 'Asset: RAVEN.' You’re being treated like property.",
-    "확인 끝. 계속 간다.": "[noise] Command routing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Someone’s on our net. For real.",
-    "환적 트럭에서 장비 회수 성공적이다.": "[radio] Voices can be spoofed. Trust words and you die.",
-    "내가 막는다. 너희는 전진.": "[radio] Then what do we trust?",
-    "모래폭풍 속 이탈. 웨이포인트 확인해, RAVEN.": "[radio] Trust actions. Move."
-  },
-  "c2_m4_wadi": {
-    "BLACK TIDE 업데이트. 와디 협곡. 위에서 아래를 잡는 지형. 함정 같은 길.": "[radio] BLACK TIDE Update: Wadi canyon. High ground owns the low—roads are traps.",
-    "목표는 '협곡 진입'부터 '연락책/장비 확보'까지. 총성은 마지막 수단이다. 길만 열어.": "[radio] Objectives: Enter the canyon through Secure the contact and gear. Gunfire is last resort. Just clear the route.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "매복 구역 돌파에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Push through the ambush zone, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 잠깐, 소리 난다. 멈춰.": "[radio] Raven, hold at the first corner. Hold—noise. Freeze.",
-    "진입한다.": "[radio] Breach. Moving in.",
-    "그리고 기억해. 연락책의 마지막 말: '너희는 청소부야. 진짜 놈은 위에 있어.'": "[radio] And remember: The contact’s last words: 'You’re the cleanup crew. The real one is upstairs.'",
-    "이건 '작전'이 아니라 '정리' 같아.": "[radio] This doesn’t feel like an op. Feels like a cleanup.",
-    "가자. 협곡 진입로.": "[radio] Move. Enter the canyon.",
-    "협곡 진입. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-    "왼쪽 시야, 움직임. 조심.": "Block drone sightlines. Good. Done.",
-    "빨리, 창구가 닫힌다.": "Exfil. Check your waypoint, Raven.",
-    "확인 끝. 계속 간다.": "Stay low. Let them pass.",
-    "협곡 진입 완료. 다음으로.": "Exfil complete. Push on.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Move—window’s closing.",
-    "매복 구역 돌파. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-    "그림자 봤어. 너무 빨리 가지 마.": "Hold—those tones match our crypto.",
-    "그쪽 아냐, 다시 표식 봐.": "Negative. Check the marker again.",
-    "경보 올라간다. 빨리!": "Alarm's up—move!",
-    "매복 구역 돌파 완료. 다음으로.": "Eyes up. One thermal contact, right side.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "Something’s off. The contact’s last words: 'You’re the cleanup crew. The real one is upstairs.'",
-    "연락책/장비 확보. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "이상해. 연락책의 마지막 말: '너희는 청소부야. 진짜 놈은 위에 있어.'": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Keyword: GREENLINE—forest safe corridor.",
-    "연락책/장비 확보 클린하게 끝냈다.": "[radio] Just pulled a weird pattern from the data. The contact’s last words: 'You’re the cleanup crew. The real one is upstairs.'",
-    "내가 막는다. 너희는 전진.": "[noise] Recording continues.",
-    "드론 시선 차단. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "드론 시선 차단 좋아, 됐다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m5_greenline": {
-    "BLACK TIDE 업데이트. 숲의 안전회랑. '그린라인'은 탈출로이자 함정.": "[radio] BLACK TIDE Update: Forest safe corridor. The “Greenline” is an escape route—and a trap.",
-    "목표는 '그린라인 표식 따라 전진'부터 '은닉 창고 개방'까지. 교전은 최소. 목적만 하고 빠져.": "[radio] Objectives: Advance along the Greenline markers through Open the hidden warehouse. Minimize contact. Hit the objective and get out.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "통신탑에서 접근 코드 획득에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Get the access code from the comms tower, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 그림자 봤어. 너무 빨리 가지 마.": "[radio] Raven, hold at the first corner. Saw movement—don’t rush it.",
-    "들었다.": "[radio] Heard it.",
-    "그리고 기억해. 창고 음성메시지에 'SHADE' 목소리로 '증거를 태워'가 나온다. 하지만 SHADE는 옆에 있다 — 목소리 위조.": "[radio] And remember: Warehouse voicemail: 'Burn the evidence'—in SHADE’s voice. But SHADE’s right next to me. Voice spoof.",
-    "이상해. 누가 우릴 보고 있어.": "[radio] Something’s off. Someone’s watching us.",
-    "가자. 그린라인 표식 따라 전진로.": "[radio] Move. Advance along the Greenline markers.",
-    "그린라인 표식 따라 전진. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-    "지금은 숨고, 지나가면 간다.": "Cut the tracking signal complete. Push on.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Escape before the fire spreads. Check your waypoint, Raven.",
-    "확인 끝. 계속 간다.": "Saw movement. Don't rush it.",
-    "그린라인 표식 따라 전진 클린하게 끝냈다.": "Escape before the fire spreads. Good. Done.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "Hold—those tones match our crypto.",
-    "통신탑에서 접근 코드 획득. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-    "왼쪽 시야, 움직임. 조심.": "Eyes up. One thermal contact, right side.",
-    "발각! 연막 던지고 각 잡아!": "We’re made! Smoke out—break contact!",
-    "그쪽 아냐, 다시 표식 봐.": "Negative. Check the marker again.",
-    "통신탑에서 접근 코드 획득 완료. 다음으로.": "Pick up the pace. Lockdown’s coming.",
-    "속도 올려. 봉쇄 온다.": "Something’s off. Warehouse voicemail: 'Burn the evidence'—in SHADE’s voice. But SHADE’s right next to me. Voice spoof.",
-    "은닉 창고 개방. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "잠깐, 소리 난다. 멈춰.": "I’ll hold them. You push.",
-    "이상해. 창고 음성메시지에 'SHADE' 목소리로 '증거를 태워'가 나온다. 하지만 SHADE는 옆에 있다 — 목소리 위조.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Fire’s spreading. Next mission: Ember—push through the smoke.",
-    "은닉 창고 개방 클린하게 끝냈다.": "[radio] Just pulled a weird pattern from the data. Warehouse voicemail: 'Burn the evidence'—in SHADE’s voice. But SHADE’s right next to me. Voice spoof.",
-    "내가 막는다. 너희는 전진.": "[noise] Recording continues.",
-    "추적 신호 차단. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "추적 신호 차단 완료. 다음으로.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m6_ember": {
-    "BLACK TIDE 업데이트. 연기와 불. 적은 증거를 태우고, 우리는 길을 뚫는다.": "[radio] BLACK TIDE Update: Smoke and fire. They burn the evidence—we cut a path.",
-    "목표는 '연기 속 전진'부터 '흩어진 팀원 합류'까지. 눈에 띄면 봉쇄가 떨어진다. 조용히.": "[radio] Objectives: Push through the smoke through Rally with scattered teammates. If you get spotted, lockdown drops. Stay quiet.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "교차로 방어(40초)에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Hold the intersection (40 sec), if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 지금은 숨고, 지나가면 간다.": "[radio] Raven, hold at the first corner. Stay low—let them pass.",
-    "들었다.": "[radio] Heard it.",
-    "그리고 기억해. 불길 속에서 구조요청 채널이 잡히는데, 신호 발신지가 '우리 HQ'다. 누가 누구를 구하는 거지?": "[radio] And remember: In the fire we catch a distress net, but the transmitter is labeled 'our HQ.' Who’s rescuing who?",
-    "명령이… 이상하게 꼬인다.": "[radio] Orders… are getting tangled.",
-    "가자. 연기 속 전진로.": "[radio] Move. Push through the smoke.",
-    "연기 속 전진. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-    "잠깐, 소리 난다. 멈춰.": "Secure the exfil point complete. Push on.",
-    "속도 올려. 봉쇄 온다.": "Pick up the pace. Lockdown’s coming.",
-    "이상해. 불길 속에서 구조요청 채널이 잡히는데, 신호 발신지가 '우리 HQ'다. 누가 누구를 구하는 거지?": "Something’s off. In the fire we catch a distress net, but the transmitter is labeled 'our HQ.' Who’s rescuing who?",
-    "연기 속 전진 성공적이다.": "Hold—those tones match our crypto.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Check complete. Keep moving.",
-    "교차로 방어(40초). 웨이포인트 확인해, RAVEN.": "Alarm's up—move!",
-    "확인 끝. 계속 간다.": "Eyes up. One thermal contact, right side.",
-    "경보 올라간다. 빨리!": "Lock just popped. Buy me five seconds.",
-    "교차로 방어(40초) 성공적이다.": "I’ll hold them. You push.",
-    "멈춰. 그 길은 막혔다.": "[radio] Good. You're still breathing.",
-    "흩어진 팀원 합류. 웨이포인트 확인해, RAVEN.": "[radio] Copy. Next lead is Glasshouse—the city’s glass tower. We hit corporate servers.",
-    "그림자 봤어. 너무 빨리 가지 마.": "[radio] Just pulled a weird pattern from the data. In the fire we catch a distress net, but the transmitter is labeled 'our HQ.' Who’s rescuing who?",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "[noise] Recording continues.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Someone’s on our net. For real.",
-    "흩어진 팀원 합류 클린하게 끝냈다.": "[radio] Voices can be spoofed. Trust words and you die.",
-    "내가 막는다. 너희는 전진.": "[radio] Eyes front.",
-    "탈출 지점 확보. 웨이포인트 확인해, RAVEN.": "[radio] Trust actions. Move."
-  },
-  "c2_m7_glasshouse": {
-    "BLACK TIDE 업데이트. 기업 타워. 깨끗한 로비, 더러운 서버실.": "[radio] BLACK TIDE Update: Corporate tower. Clean lobby—dirty server rooms.",
-    "목표는 '외곽 진입'부터 '서버실 접근'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Enter the perimeter through Approach the server vault. Move fast in this sector. Linger and you’ll get boxed in.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "로비 확보에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Secure the lobby, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 왼쪽 시야, 움직임. 조심.": "[radio] Raven, hold at the first corner. Movement left—stay sharp.",
-    "진입한다.": "[radio] Breach. Moving in.",
-    "그리고 기억해. 서버 로그에 'DUSTLINE 모든 미션 타임라인'이 있다. 누가 처음부터 우리를 기록했나.": "[radio] And remember: Server logs include a full DUSTLINE mission timeline. Someone’s been recording us from day one.",
-    "이상해. 누가 우릴 보고 있어.": "[radio] Something’s off. Someone’s watching us.",
-    "가자. 외곽 진입로.": "[radio] Move. Enter the perimeter.",
-    "외곽 진입. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-    "지금은 숨고, 지나가면 간다.": "Extract the data. Good. Done.",
-    "빨리, 창구가 닫힌다.": "Escape underground. Check your waypoint, Raven.",
-    "확인 끝. 계속 간다.": "Hold. I hear something. Freeze.",
-    "외곽 진입 완료. 다음으로.": "Escape underground. Good. Done.",
-    "이상해. 서버 로그에 'DUSTLINE 모든 미션 타임라인'이 있다. 누가 처음부터 우리를 기록했나.": "Move—window’s closing.",
-    "로비 확보. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-    "왼쪽 시야, 움직임. 조심.": "Something’s off. Server logs include a full DUSTLINE mission timeline. Someone’s been recording us from day one.",
-    "들켰다. 시선 끊어!": "We're made—break line of sight!",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-    "로비 확보 성공적이다.": "Eyes up. One thermal contact, right side.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "That route's hot. Reroute.",
-    "서버실 접근. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "그쪽은 위험해. 돌아.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Only the elevator reaches the upper private servers. Next: Elevator.",
-    "서버실 접근 성공적이다.": "[radio] Just pulled a weird pattern from the data. Server logs include a full DUSTLINE mission timeline. Someone’s been recording us from day one.",
-    "내가 막는다. 너희는 전진.": "[noise] Command routing.",
-    "데이터 추출. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "그림자 봤어. 너무 빨리 가지 마.": "[radio] Voices can be spoofed. Trust words and you die.",
-    "데이터 추출 좋아, 됐다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m8_elevator": {
-    "BLACK TIDE 업데이트. 엘리베이터는 블라인드. 문이 열릴 때마다 다른 전장.": "[radio] BLACK TIDE Update: Elevator’s a blind box. Every door opens to a different fight.",
-    "목표는 '전원 복구'부터 '층별 차단(3개 체크포인트)'까지. 교전은 최소. 목적만 하고 빠져.": "[radio] Objectives: Restore power through Floor-by-floor lockout (3 checkpoints). Minimize contact. Hit the objective and get out.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "엘리베이터 탑승에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Ride the elevator, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 지금은 숨고, 지나가면 간다.": "[radio] Raven, hold at the first corner. Stay low—let them pass.",
-    "카피.": "[radio] Copy.",
-    "그리고 기억해. 상층 스피커에서 'NEMESIS' 음성이 직접 나온다. 그리고 그 목소리는… HART와 비슷하다.": "[radio] And remember: Upper-level speakers—NEMESIS, live. And that voice… sounds like HART.",
-    "명령은 단순해.": "[noise] Orders are simple.",
-    "가자. 전원 복구로.": "[radio] Move. Restore power.",
-    "전원 복구. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-    "그림자 봤어. 너무 빨리 가지 마.": "Take the upper control room. Good. Done.",
-    "들켰다. 시선 끊어!": "Cut the relay signal. Check your waypoint, Raven.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Stay low. Let them pass.",
-    "전원 복구 클린하게 끝냈다.": "Cut the relay signal. Good. Done.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "We're made—break line of sight!",
-    "엘리베이터 탑승. 웨이포인트 확인해, RAVEN.": "Hold—those tones match our crypto.",
-    "확인 끝. 계속 간다.": "Check complete. Keep moving.",
-    "아니야. 반대편이다.": "Negative. Other side.",
-    "엘리베이터 탑승 성공적이다.": "Something’s off. Upper-level speakers—NEMESIS, live. And that voice… sounds like HART.",
-    "이상해. 상층 스피커에서 'NEMESIS' 음성이 직접 나온다. 그리고 그 목소리는… HART와 비슷하다.": "Pick up the pace. Lockdown’s coming.",
-    "층별 차단(3개 체크포인트). 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "속도 올려. 봉쇄 온다.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. The disabled relay points to Frostline—north snowfield base.",
-    "층별 차단(3개 체크포인트) 성공적이다.": "[radio] Just pulled a weird pattern from the data. Upper-level speakers—NEMESIS, live. And that voice… sounds like HART.",
-    "내가 막는다. 너희는 전진.": "[noise] Packet loss.",
-    "상층 제어실 장악. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "왼쪽 시야, 움직임. 조심.": "[radio] Voices can be spoofed. Trust words and you die.",
-    "상층 제어실 장악 좋아, 됐다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m9_frostline": {
-    "BLACK TIDE 업데이트. 설원 기지. 소리가 먹히고, 숨이 보인다. 흔적이 남는다.": "[radio] BLACK TIDE Update: Snowfield base. Sound dies, breath shows—every trace sticks.",
-    "목표는 '설원 전진'부터 '냉동 저장고에서 드라이브 확보'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Push through the snowfield through Recover the drive from cold storage. Move fast in this sector. Linger and you’ll get boxed in.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "관측소 접근에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Approach the observation post, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 잠깐, 소리 난다. 멈춰.": "[radio] Raven, hold at the first corner. Hold—noise. Freeze.",
-    "진입한다.": "[radio] Breach. Moving in.",
-    "그리고 기억해. 드라이브 파일명: 'BT_SCORE_v3'. 타깃을 점수로 매기는 시스템이다.": "[radio] And remember: Drive filename: 'BT_SCORE_v3.' Targets get scored—someone’s ranking people like data.",
-    "이상해. 누가 우릴 보고 있어.": "[radio] Something’s off. Someone’s watching us.",
-    "가자. 설원 전진로.": "[radio] Move. Push through the snowfield.",
-    "설원 전진. 웨이포인트 확인해, RAVEN.": "Stay low. Let them pass.",
-    "잠깐, 소리 난다. 멈춰.": "Evade pursuit in the white zone. Good work.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "Exfil. Check your waypoint, Raven.",
-    "이상해. 드라이브 파일명: 'BT_SCORE_v3'. 타깃을 점수로 매기는 시스템이다.": "Movement left. Stay sharp.",
-    "설원 전진 성공적이다.": "Exfil. Good. Done.",
-    "시간 끈다. 움직여.": "Eyes up. One thermal contact, right side.",
-    "관측소 접근. 웨이포인트 확인해, RAVEN.": "Something’s off. Drive filename: 'BT_SCORE_v3.' Targets get scored—someone’s ranking people like data.",
-    "그림자 봤어. 너무 빨리 가지 마.": "Buying time. Move!",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-    "그쪽 아냐, 다시 표식 봐.": "Negative. Check the marker again.",
-    "관측소 접근 완료. 다음으로.": "We're made—break line of sight!",
-    "들켰다. 시선 끊어!": "Check complete. Keep moving.",
-    "냉동 저장고에서 드라이브 확보. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "확인 끝. 계속 간다.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Enemy’s launching a Whiteout chase to take the drive back.",
-    "냉동 저장고에서 드라이브 확보 성공적이다.": "[radio] Just pulled a weird pattern from the data. Drive filename: 'BT_SCORE_v3.' Targets get scored—someone’s ranking people like data.",
-    "내가 막는다. 너희는 전진.": "[noise] Packet loss.",
-    "백색지대에서 추적 회피. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "지금은 숨고, 지나가면 간다.": "[radio] Voices can be spoofed. Trust words and you die.",
-    "백색지대에서 추적 회피 성공적이다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m10_whiteout": {
-    "BLACK TIDE 업데이트. 눈보라 추격전. 방향도, 적도, 아군도 흐려진다.": "[radio] BLACK TIDE Update: Whiteout chase. Direction, friend, foe—everything blurs.",
-    "목표는 '화이트아웃 속 경로 찾기'부터 '추격 분대/드론 따돌리기'까지. 총성은 마지막 수단이다. 길만 열어.": "[radio] Objectives: Find the route in the whiteout through Lose the pursuit squad / drones. Gunfire is last resort. Just clear the route.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "임시 이동수단 확보에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Secure a temporary ride, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 지금은 숨고, 지나가면 간다.": "[radio] Raven, hold at the first corner. Stay low—let them pass.",
-    "들었다.": "[radio] Heard it.",
-    "그리고 기억해. 추격 드론의 등록번호가 '우리 조달 코드'다. 우리 장비가 우리를 쫓는다.": "[radio] And remember: The pursuit drone’s registration ties back to our procurement code. Our gear is hunting us.",
-    "이상해. 누가 우릴 보고 있어.": "[radio] Something’s off. Someone’s watching us.",
-    "가자. 화이트아웃 속 경로 찾기로.": "[radio] Move. Find the route in the whiteout.",
-    "화이트아웃 속 경로 찾기. 웨이포인트 확인해, RAVEN.": "Stay low. Let them pass.",
-    "잠깐, 소리 난다. 멈춰.": "Secure the cliffside passage complete. Push on.",
-    "그쪽 아냐, 다시 표식 봐.": "Enter the lodge (safe room). Check your waypoint, Raven.",
-    "확인 끝. 계속 간다.": "Stay low. Let them pass.",
-    "화이트아웃 속 경로 찾기 완료. 다음으로.": "Enter the lodge (safe room). Clean. Move.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Negative. Check the marker again.",
-    "임시 이동수단 확보. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "Eyes up. One thermal contact, right side.",
-    "발각! 연막 던지고 각 잡아!": "We’re made! Smoke out—break contact!",
-    "임시 이동수단 확보 클린하게 끝냈다.": "If you stop, you're done.",
-    "지금 멈추면 끝이야.": "Something’s off. The pursuit drone’s registration ties back to our procurement code. Our gear is hunting us.",
-    "추격 분대/드론 따돌리기. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "왼쪽 시야, 움직임. 조심.": "I’ll hold them. You push.",
-    "이상해. 추격 드론의 등록번호가 '우리 조달 코드'다. 우리 장비가 우리를 쫓는다.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Lodge map marks Ironweave rail factory. Next is the train.",
-    "추격 분대/드론 따돌리기 성공적이다.": "[radio] Just pulled a weird pattern from the data. The pursuit drone’s registration ties back to our procurement code. Our gear is hunting us.",
-    "내가 막는다. 너희는 전진.": "[noise] Packet loss.",
-    "절벽 통로 확보. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "지금은 숨고, 지나가면 간다.": "[radio] Voices can be spoofed. Trust words and you die.",
-    "절벽 통로 확보 완료. 다음으로.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m11_ironweave": {
-    "BLACK TIDE 업데이트. 철도 공장. 쇠 냄새와 오일. 생산 라인이 '전쟁'을 뽑는다.": "[radio] BLACK TIDE Update: Rail factory. Steel and oil. The line manufactures war.",
-    "목표는 '공장 외곽 잠입'부터 '생산 라인에서 부품/서류 회수'까지. 교전은 최소. 목적만 하고 빠져.": "[radio] Objectives: Infil the factory perimeter through Recover parts/docs from the production line. Minimize contact. Hit the objective and get out.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "전력실 차단에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Cut power at the power room, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 지금은 숨고, 지나가면 간다.": "[radio] Raven, hold at the first corner. Stay low—let them pass.",
-    "확인.": "[radio] Confirmed.",
-    "그리고 기억해. 송장에 우리 조직명과 동일한 약자가 찍혀 있다. '공급자=우리'.": "[radio] And remember: Invoice carries our org’s exact initials. 'Supplier = us.'",
-    "이건 '작전'이 아니라 '정리' 같아.": "[radio] This doesn’t feel like an op. Feels like a cleanup.",
-    "가자. 공장 외곽 잠입로.": "[radio] Move. Infil the factory perimeter.",
-    "공장 외곽 잠입. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-    "왼쪽 시야, 움직임. 조심.": "Disable the alarm. Good. Done.",
-    "확인 끝. 계속 간다.": "Move to the rail yard. Check your waypoint, Raven.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "Hold. I hear something. Freeze.",
-    "공장 외곽 잠입 완료. 다음으로.": "Move to the rail yard. Clean. Move.",
-    "아니야. 반대편이다.": "Check complete. Keep moving.",
-    "전력실 차단. 웨이포인트 확인해, RAVEN.": "Eyes up. One thermal contact, right side.",
-    "그림자 봤어. 너무 빨리 가지 마.": "Negative. Other side.",
-    "이상해. 송장에 우리 조직명과 동일한 약자가 찍혀 있다. '공급자=우리'.": "Something’s off. Invoice carries our org’s exact initials. 'Supplier = us.'",
-    "시간 끈다. 움직여.": "Buying time. Move!",
-    "전력실 차단 완료. 다음으로.": "Hold—those tones match our crypto.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Jamming just spiked—trackers inbound!",
-    "생산 라인에서 부품/서류 회수. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "지금은 숨고, 지나가면 간다.": "I’ll hold them. You push.",
-    "잡음 커졌다. 추적 온다!": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Recovered docs say the black box route runs through Switchyard.",
-    "생산 라인에서 부품/서류 회수 좋아, 됐다.": "[radio] Just pulled a weird pattern from the data. Invoice carries our org’s exact initials. 'Supplier = us.'",
-    "내가 막는다. 너희는 전진.": "[noise] Packet loss.",
-    "경보 차단. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "경보 차단 좋아, 됐다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m12_switchyard": {
-    "BLACK TIDE 업데이트. 전환기, 선로, 그리고 한 대의 화물차. 방향을 바꾸면 역사가 바뀐다.": "[radio] BLACK TIDE Update: A switch, rail line, and one freight truck. Change the route—change history.",
-    "목표는 '플랫폼 접근'부터 '블랙박스 화물차 연결'까지. 눈에 띄면 봉쇄가 떨어진다. 조용히.": "[radio] Objectives: Approach the platform through Link up the black-box truck. If you get spotted, lockdown drops. Stay quiet.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "전환기 조작에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Operate the switch, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 그림자 봤어. 너무 빨리 가지 마.": "[radio] Raven, hold at the first corner. Saw movement—don’t rush it.",
-    "카피.": "[radio] Copy.",
-    "그리고 기억해. 본부가 '열차를 폭파하라'고 지시한다. 하지만 화물차엔 작업자 태그가 찍혀 있다. 명령이 틀렸다.": "[radio] And remember: HQ orders: 'Blow the train.' But the truck’s tagged with worker IDs. That order’s wrong.",
-    "우리 쪽 채널이 새는 것 같다.": "[radio] Looks like our net is leaking.",
-    "가자. 플랫폼 접근로.": "[radio] Move. Approach the platform.",
-    "플랫폼 접근. 웨이포인트 확인해, RAVEN.": "Stay low. Let them pass.",
-    "왼쪽 시야, 움직임. 조심.": "Hold the movement lane. Clean. Move.",
-    "이상해. 본부가 '열차를 폭파하라'고 지시한다. 하지만 화물차엔 작업자 태그가 찍혀 있다. 명령이 틀렸다.": "Enter the tunnel. Check your waypoint, Raven.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Stay low. Let them pass.",
-    "플랫폼 접근 완료. 다음으로.": "Enter the tunnel. Clean. Move.",
-    "속도 올려. 봉쇄 온다.": "Something’s off. HQ orders: 'Blow the train.' But the truck’s tagged with worker IDs. That order’s wrong.",
-    "전환기 조작. 웨이포인트 확인해, RAVEN.": "Hold—those tones match our crypto.",
-    "지금은 숨고, 지나가면 간다.": "Pick up the pace. Lockdown’s coming.",
-    "확인 끝. 계속 간다.": "Check complete. Keep moving.",
-    "아니야. 반대편이다.": "Negative. Other side.",
-    "전환기 조작 좋아, 됐다.": "We’re made! Smoke out—break contact!",
-    "발각! 연막 던지고 각 잡아!": "Eyes up. One thermal contact, right side.",
-    "블랙박스 화물차 연결. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "잠깐, 소리 난다. 멈춰.": "I’ll hold them. You push.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. We’re taking the alternate route to Red Horizon. This is open defiance.",
-    "블랙박스 화물차 연결 완료. 다음으로.": "[radio] Just pulled a weird pattern from the data. HQ orders: 'Blow the train.' But the truck’s tagged with worker IDs. That order’s wrong.",
-    "내가 막는다. 너희는 전진.": "[noise] Recording continues.",
-    "이동 구간 방어. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "이동 구간 방어 클린하게 끝냈다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m13_redhorizon": {
-    "BLACK TIDE 업데이트. 붉은 노을 능선. 여기서 보면, 거짓이 더 잘 보인다.": "[radio] BLACK TIDE Update: Red-sunset ridgeline. Up here, lies stand out.",
-    "목표는 '능선 따라 전진'부터 '적 통신중계 파괴'까지. 총성은 마지막 수단이다. 길만 열어.": "[radio] Objectives: Advance along the ridgeline through Destroy the enemy comms relay. Gunfire is last resort. Just clear the route.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "관측 지점 확보에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Secure the observation point, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 잠깐, 소리 난다. 멈춰.": "[radio] Raven, hold at the first corner. Hold—noise. Freeze.",
-    "들었다.": "[radio] Heard it.",
-    "그리고 기억해. 적 무전: 'HART 제거 명령 확인.' — 표적이 네 상관으로 바뀐다.": "[radio] And remember: Enemy comms: 'Confirm the order—remove HART.' Target just switched to your handler.",
-    "우리 쪽 채널이 새는 것 같다.": "[radio] Looks like our net is leaking.",
-    "가자. 능선 따라 전진로.": "[radio] Move. Advance along the ridgeline.",
-    "능선 따라 전진. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-    "지금은 숨고, 지나가면 간다.": "Cross the canyon bridge. Clean. Move.",
-    "이상해. 적 무전: 'HART 제거 명령 확인.' — 표적이 네 상관으로 바뀐다.": "Exfil the camp. Check your waypoint, Raven.",
-    "속도 올려. 봉쇄 온다.": "Movement left. Stay sharp.",
-    "능선 따라 전진 완료. 다음으로.": "Exfil the camp. Clean. Move.",
-    "확인 끝. 계속 간다.": "Something’s off. Enemy comms: 'Confirm the order—remove HART.' Target just switched to your handler.",
-    "관측 지점 확보. 웨이포인트 확인해, RAVEN.": "Pick up the pace. Lockdown’s coming.",
-    "그림자 봤어. 너무 빨리 가지 마.": "Check complete. Keep moving.",
-    "아니야. 반대편이다.": "Negative. Other side.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-    "관측 지점 확보 완료. 다음으로.": "We're made—break line of sight!",
-    "들켰다. 시선 끊어!": "Eyes up. One thermal contact, right side.",
-    "적 통신중계 파괴. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "잠깐, 소리 난다. 멈춰.": "I’ll hold them. You push.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Next is Radiant. Prep to transmit from the mountain uplink.",
-    "적 통신중계 파괴 클린하게 끝냈다.": "[radio] Just pulled a weird pattern from the data. Enemy comms: 'Confirm the order—remove HART.' Target just switched to your handler.",
-    "내가 막는다. 너희는 전진.": "[radio] Run. I’ll cut the route behind you.",
-    "협곡 다리 건너기. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "협곡 다리 건너기 클린하게 끝냈다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m14_radiant": {
-    "BLACK TIDE 업데이트. 빛나는 돔. 센서와 레이저. 한 번만 삐끗하면 전부 켜진다.": "[radio] BLACK TIDE Update: The shining dome. Sensors and lasers—one slip and it all lights up.",
-    "목표는 '레이더 돔 접근'부터 '업링크 장치 확보/해킹'까지. 교전은 최소. 목적만 하고 빠져.": "[radio] Objectives: Approach the radar dome through Secure/hack the uplink device. Minimize contact. Hit the objective and get out.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "센서 구간 무사 통과에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Clear the sensor zone, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 잠깐, 소리 난다. 멈춰.": "[radio] Raven, hold at the first corner. Hold—noise. Freeze.",
-    "진입한다.": "[radio] Breach. Moving in.",
-    "그리고 기억해. 업링크 로그에 'NEMESIS=음성 합성/명령 라우터' 설명이 있다. '사람'이 아니라 '시스템'이다.": "[radio] And remember: Uplink logs describe 'NEMESIS = voice synthesis / command router.' Not a person—a system.",
-    "이건 '작전'이 아니라 '정리' 같아.": "[radio] This doesn’t feel like an op. Feels like a cleanup.",
-    "가자. 레이더 돔 접근로.": "[radio] Move. Approach the radar dome.",
-    "레이더 돔 접근. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-    "지금은 숨고, 지나가면 간다.": "Transmit evidence packets (partial). Clean. Move.",
-    "발각! 연막 던지고 각 잡아!": "Break pursuit and escape. Check your waypoint, Raven.",
-    "이상해. 업링크 로그에 'NEMESIS=음성 합성/명령 라우터' 설명이 있다. '사람'이 아니라 '시스템'이다.": "Movement left. Stay sharp.",
-    "레이더 돔 접근 좋아, 됐다.": "Break pursuit and escape. Clean. Move.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "We’re made! Smoke out—break contact!",
-    "센서 구간 무사 통과. 웨이포인트 확인해, RAVEN.": "Something’s off. Uplink logs describe 'NEMESIS = voice synthesis / command router.' Not a person—a system.",
-    "왼쪽 시야, 움직임. 조심.": "Hold—those tones match our crypto.",
-    "아니야. 반대편이다.": "Negative. Other side.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "Eyes up. One thermal contact, right side.",
-    "센서 구간 무사 통과 완료. 다음으로.": "Check complete. Keep moving.",
-    "확인 끝. 계속 간다.": "Move—window’s closing.",
-    "업링크 장치 확보/해킹. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "그림자 봤어. 너무 빨리 가지 마.": "I’ll hold them. You push.",
-    "빨리, 창구가 닫힌다.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Remaining evidence is in the refinery—the black box’s physical module.",
-    "업링크 장치 확보/해킹 클린하게 끝냈다.": "[radio] Just pulled a weird pattern from the data. Uplink logs describe 'NEMESIS = voice synthesis / command router.' Not a person—a system.",
-    "내가 막는다. 너희는 전진.": "[noise] Command routing.",
-    "증거 패킷 송출(부분). 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "증거 패킷 송출(부분) 클린하게 끝냈다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m15_refinery": {
-    "BLACK TIDE 업데이트. 정유시설. 냄새, 열기, 경보. 잘못 건드리면 끝.": "[radio] BLACK TIDE Update: Refinery. Stench, heat, alarms—one mistake and it’s over.",
-    "목표는 '외곽 침투'부터 '연료 기록/서버 백업 회수'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Infiltrate the perimeter through Recover fuel records / server backup. Move fast in this sector. Linger and you’ll get boxed in.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "밸브/펌프 차단에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Shut down the valves/pumps, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 그림자 봤어. 너무 빨리 가지 마.": "[radio] Raven, hold at the first corner. Saw movement—don’t rush it.",
-    "진입한다.": "[radio] Breach. Moving in.",
-    "그리고 기억해. 차단 순간 NEMESIS가 말한다: '그건 네 임무가 아니야.' — 누가 임무를 정하나?": "[radio] And remember: The moment you cut the signal, NEMESIS says: 'That’s not your mission.' So who sets the mission?",
-    "너희는 선택하지 않아.": "[noise] You don’t get to choose.",
-    "가자. 외곽 침투로.": "[radio] Move. Infiltrate the perimeter.",
-    "외곽 침투. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-    "왼쪽 시야, 움직임. 조심.": "Escape via the emergency passage. Good. Done.",
-    "아니야. 반대편이다.": "Negative. Other side.",
-    "잡음 커졌다. 추적 온다!": "Jamming just spiked—trackers inbound!",
-    "외곽 침투 좋아, 됐다.": "Eyes up. One thermal contact, right side.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "Hold—those tones match our crypto.",
-    "밸브/펌프 차단. 웨이포인트 확인해, RAVEN.": "Move—window’s closing.",
-    "그림자 봤어. 너무 빨리 가지 마.": "Something’s off. The moment you cut the signal, NEMESIS says: 'That’s not your mission.' So who sets the mission?",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Check complete. Keep moving.",
-    "빨리, 창구가 닫힌다.": "Lock just popped. Buy me five seconds.",
-    "밸브/펌프 차단 좋아, 됐다.": "I’ll hold them. You push.",
-    "이상해. 차단 순간 NEMESIS가 말한다: '그건 네 임무가 아니야.' — 누가 임무를 정하나?": "[radio] Good. You're still breathing.",
-    "연료 기록/서버 백업 회수. 웨이포인트 확인해, RAVEN.": "[radio] Copy. Chokepoint to the sea. Secure the gear at Breakwater—coastal ruins.",
-    "확인 끝. 계속 간다.": "[noise] Recording continues.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Someone’s on our net. For real.",
-    "연료 기록/서버 백업 회수 클린하게 끝냈다.": "[radio] Voices can be spoofed. Trust words and you die.",
-    "내가 막는다. 너희는 전진.": "[radio] Eyes front.",
-    "비상 통로로 탈출. 웨이포인트 확인해, RAVEN.": "[radio] Trust actions. Move."
-  },
-  "c2_m16_breakwater": {
-    "BLACK TIDE 업데이트. 전쟁이 지나간 해안 폐허. 방파제는 마지막 관문.": "[radio] BLACK TIDE Update: War-torn coastal ruins. The breakwater is the last gate.",
-    "목표는 '해안 폐허 진입'부터 '대공/레이더 장비 확보'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Enter the coastal ruins through Secure AA/radar gear. Move fast in this sector. Linger and you’ll get boxed in.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "방파제 상부 확보에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Secure the top of the breakwater, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 그림자 봤어. 너무 빨리 가지 마.": "[radio] Raven, hold at the first corner. Saw movement—don’t rush it.",
-    "들었다.": "[radio] Heard it.",
-    "그리고 기억해. 장비 시리얼이 '드라이독 장부'와 일치한다. 모든 길이 하나로 이어진다.": "[radio] And remember: Gear serial matches the drydock ledger. Every road leads to the same place.",
-    "명령이… 이상하게 꼬인다.": "[radio] Orders… are getting tangled.",
-    "가자. 해안 폐허 진입로.": "[radio] Move. Enter the coastal ruins.",
-    "해안 폐허 진입. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-    "잠깐, 소리 난다. 멈춰.": "Transmit the distress signal. Good. Done.",
-    "시간 끈다. 움직여.": "Board the boat. Check your waypoint, Raven.",
-    "잡음 커졌다. 추적 온다!": "Stay low. Let them pass.",
-    "해안 폐허 진입 클린하게 끝냈다.": "Board the boat complete. Push on.",
-    "그쪽 아냐, 다시 표식 봐.": "Buying time. Move!",
-    "방파제 상부 확보. 웨이포인트 확인해, RAVEN.": "Jamming just spiked—trackers inbound!",
-    "지금은 숨고, 지나가면 간다.": "Negative. Check the marker again.",
-    "확인 끝. 계속 간다.": "Check complete. Keep moving.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-    "방파제 상부 확보 완료. 다음으로.": "Something’s off. Gear serial matches the drydock ledger. Every road leads to the same place.",
-    "이상해. 장비 시리얼이 '드라이독 장부'와 일치한다. 모든 길이 하나로 이어진다.": "Eyes up. One thermal contact, right side.",
-    "대공/레이더 장비 확보. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Next is Offshore. We go up on the platform.",
-    "대공/레이더 장비 확보 클린하게 끝냈다.": "[radio] Just pulled a weird pattern from the data. Gear serial matches the drydock ledger. Every road leads to the same place.",
-    "내가 막는다. 너희는 전진.": "[noise] Command routing.",
-    "구조 신호 발신. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "왼쪽 시야, 움직임. 조심.": "[radio] Voices can be spoofed. Trust words and you die.",
-    "구조 신호 발신 좋아, 됐다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m17_offshore": {
-    "BLACK TIDE 업데이트. 해상 플랫폼 침투. 바람, 금속, 끝없는 바다. 도망칠 곳이 없다.": "[radio] BLACK TIDE Update: Offshore platform infil. Wind, steel, endless sea—nowhere to run.",
-    "목표는 '플랫폼 접근'부터 '제어실 점거'까지. 총성은 마지막 수단이다. 길만 열어.": "[radio] Objectives: Approach the platform through Seize the control room. Gunfire is last resort. Just clear the route.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "갑판 정리에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Clear the deck, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 왼쪽 시야, 움직임. 조심.": "[radio] Raven, hold at the first corner. Movement left—stay sharp.",
-    "확인.": "[radio] Confirmed.",
-    "그리고 기억해. 제어실 화면에 우리 작전이 '실시간 방송'으로 표시된다. 누군가 보고 있다.": "[radio] And remember: In the control room, our op is on a live feed. Someone’s watching.",
-    "이건 '작전'이 아니라 '정리' 같아.": "[radio] This doesn’t feel like an op. Feels like a cleanup.",
-    "가자. 플랫폼 접근로.": "[radio] Move. Approach the platform.",
-    "플랫폼 접근. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-    "잠깐, 소리 난다. 멈춰.": "Locate the server module. Good. Done.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "Secure the helipad / exfil route. Check your waypoint, Raven.",
-    "확인 끝. 계속 간다.": "Movement left. Stay sharp.",
-    "플랫폼 접근 성공적이다.": "Secure the helipad / exfil route complete. Push on.",
-    "지금 멈추면 끝이야.": "Eyes up. One thermal contact, right side.",
-    "갑판 정리. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-    "발각! 연막 던지고 각 잡아!": "We’re made! Smoke out—break contact!",
-    "갑판 정리 클린하게 끝냈다.": "Something’s off. In the control room, our op is on a live feed. Someone’s watching.",
-    "이상해. 제어실 화면에 우리 작전이 '실시간 방송'으로 표시된다. 누군가 보고 있다.": "That route's hot. Reroute.",
-    "제어실 점거. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "그림자 봤어. 너무 빨리 가지 마.": "I’ll hold them. You push.",
-    "그쪽은 위험해. 돌아.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. The black box is moving back to the refinery.",
-    "제어실 점거 완료. 다음으로.": "[radio] Just pulled a weird pattern from the data. In the control room, our op is on a live feed. Someone’s watching.",
-    "내가 막는다. 너희는 전진.": "[noise] Recording continues.",
-    "서버 모듈 위치 파악. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "서버 모듈 위치 파악 좋아, 됐다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m18_blackbox": {
-    "BLACK TIDE 업데이트. 블랙박스 인양. 데이터는 금고처럼 잠겨 있고, 누군가는 태우려 한다.": "[radio] BLACK TIDE Update: Black box recovery. Data’s locked like a vault—and someone wants it burned.",
-    "목표는 '정유시설 재진입'부터 '잠금 해제 키 적용'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Re-enter the refinery through Apply the unlock key. Move fast in this sector. Linger and you’ll get boxed in.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "블랙박스 컨테이너 확보에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Secure the black box container, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 왼쪽 시야, 움직임. 조심.": "[radio] Raven, hold at the first corner. Movement left—stay sharp.",
-    "카피.": "[radio] Copy.",
-    "그리고 기억해. 블랙박스에 '원격 삭제 스위치'가 달려 있다. 시간 싸움이다.": "[radio] And remember: The black box has a 'remote wipe switch.' It’s a race.",
-    "이상해. 누가 우릴 보고 있어.": "[radio] Something’s off. Someone’s watching us.",
-    "가자. 정유시설 재진입로.": "[radio] Move. Re-enter the refinery.",
-    "정유시설 재진입. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-    "잠깐, 소리 난다. 멈춰.": "Copy the data. Good work.",
-    "이상해. 블랙박스에 '원격 삭제 스위치'가 달려 있다. 시간 싸움이다.": "Stop the counterattack, then exfil. Check your waypoint, Raven.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "Hold. I hear something. Freeze.",
-    "정유시설 재진입 좋아, 됐다.": "Stop the counterattack, then exfil. Clean. Move.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Something’s off. The black box has a 'remote wipe switch.' It’s a race.",
-    "블랙박스 컨테이너 확보. 웨이포인트 확인해, RAVEN.": "Eyes up. One thermal contact, right side.",
-    "지금은 숨고, 지나가면 간다.": "Hold—those tones match our crypto.",
-    "확인 끝. 계속 간다.": "Check complete. Keep moving.",
-    "잡음 커졌다. 추적 온다!": "Jamming just spiked—trackers inbound!",
-    "블랙박스 컨테이너 확보 완료. 다음으로.": "Negative. Other side.",
-    "아니야. 반대편이다.": "Pick up the pace. Lockdown’s coming.",
-    "잠금 해제 키 적용. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "그림자 봤어. 너무 빨리 가지 마.": "I’ll hold them. You push.",
-    "속도 올려. 봉쇄 온다.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Uploading the copied data is only possible from the 'Scar' high ground.",
-    "잠금 해제 키 적용 성공적이다.": "[radio] Just pulled a weird pattern from the data. The black box has a 'remote wipe switch.' It’s a race.",
-    "내가 막는다. 너희는 전진.": "[noise] Packet loss.",
-    "데이터 복제. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "데이터 복제 성공적이다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m19_scar": {
-    "BLACK TIDE 업데이트. 산의 흉터 같은 협곡. 여기서 업로드하면, 세상이 바뀐다. 그래서 다들 막는다.": "[radio] BLACK TIDE Update: Canyon like a scar. Upload from here and the world shifts—so they’ll stop you.",
-    "목표는 '협곡 통과'부터 '업로드 송신기 설치'까지. 눈에 띄면 봉쇄가 떨어진다. 조용히.": "[radio] Objectives: Push through the canyon through Plant the upload transmitter. If you get spotted, lockdown drops. Stay quiet.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "매복 돌파에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Break the ambush, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 왼쪽 시야, 움직임. 조심.": "[radio] Raven, hold at the first corner. Movement left—stay sharp.",
-    "카피.": "[radio] Copy.",
-    "그리고 기억해. RUNE가 말한다: 'NEMESIS는 사람도, AI도 아니다. '명령' 그 자체다.'": "[radio] And remember: RUNE: 'NEMESIS isn’t human or AI. It’s the command itself.'",
-    "이건 '작전'이 아니라 '정리' 같아.": "[radio] This doesn’t feel like an op. Feels like a cleanup.",
-    "가자. 협곡 통과로.": "[radio] Move. Push through the canyon.",
-    "협곡 통과. 웨이포인트 확인해, RAVEN.": "Stay low. Let them pass.",
-    "그림자 봤어. 너무 빨리 가지 마.": "Buy time for the upload. Good. Done.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "Open the final exfil route. Check your waypoint, Raven.",
-    "아니야. 반대편이다.": "Hold. I hear something. Freeze.",
-    "협곡 통과 좋아, 됐다.": "Open the final exfil route. Good work.",
-    "이상해. RUNE가 말한다: 'NEMESIS는 사람도, AI도 아니다. '명령' 그 자체다.'": "Eyes up. One thermal contact, right side.",
-    "매복 돌파. 웨이포인트 확인해, RAVEN.": "Negative. Other side.",
-    "왼쪽 시야, 움직임. 조심.": "Something’s off. RUNE: 'NEMESIS isn’t human or AI. It’s the command itself.'",
-    "발각! 연막 던지고 각 잡아!": "We’re made! Smoke out—break contact!",
-    "확인 끝. 계속 간다.": "Check complete. Keep moving.",
-    "매복 돌파 성공적이다.": "Hold—those tones match our crypto.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Buying time. Move!",
-    "업로드 송신기 설치. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "지금은 숨고, 지나가면 간다.": "I’ll hold them. You push.",
-    "시간 끈다. 움직여.": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Next is Offshore. We go up on the platform.",
-    "업로드 송신기 설치 좋아, 됐다.": "[radio] Just pulled a weird pattern from the data. RUNE: 'NEMESIS isn’t human or AI. It’s the command itself.'",
-    "내가 막는다. 너희는 전진.": "[radio] Run. I’ll cut the route behind you.",
-    "업로드 시간 벌기. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "업로드 시간 벌기 좋아, 됐다.": "[radio] Next sector’s a short window. Move."
-  },
-  "c2_m20_nemesis": {
-    "BLACK TIDE 업데이트. 네메시스. 모든 채널의 목소리. 누구의 명령도 아닌, 진실의 끝.": "[radio] BLACK TIDE Update: NEMESIS. A voice on every channel. Nobody’s orders—just the end of the truth.",
-    "목표는 '플랫폼 최종 진입'부터 '블랙타이드 핵심 서버 장악'까지. 총성은 마지막 수단이다. 길만 열어.": "[radio] Objectives: Final breach onto the platform through Seize the BLACK TIDE core server. Gunfire is last resort. Just clear the route.",
-    "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-    "NEMESIS 중계 코어 접근에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Approach the NEMESIS relay core, if there’s an electronic lock, I’ll pop it. On my mark.",
-    "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-    "RAVEN, 첫 코너에서 멈춰. 그림자 봤어. 너무 빨리 가지 마.": "[radio] Raven, hold at the first corner. Saw movement—don’t rush it.",
-    "카피.": "[radio] Copy.",
-    "그리고 기억해. NEMESIS가 마지막으로 말한다: '너희가 선택해도 결과는 같다.' — 그래서 '선택'이 중요해진다.": "[radio] And remember: NEMESIS: 'No matter what you choose, the outcome’s the same.' That’s why the choice matters now.",
-    "명령은 단순해.": "[noise] Orders are simple.",
-    "가자. 플랫폼 최종 진입로.": "[radio] Move. Final breach onto the platform.",
-    "플랫폼 최종 진입. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-    "잠깐, 소리 난다. 멈춰.": "Choose: upload or delete the evidence. Clean. Move.",
-    "확인 끝. 계속 간다.": "Exfil—or hold the line. Check your waypoint, Raven.",
-    "지금 멈추면 끝이야.": "Saw movement. Don't rush it.",
-    "플랫폼 최종 진입 클린하게 끝냈다.": "Exfil—or hold the line complete. Push on.",
-    "이상해. NEMESIS가 마지막으로 말한다: '너희가 선택해도 결과는 같다.' — 그래서 '선택'이 중요해진다.": "Check complete. Keep moving.",
-    "NEMESIS 중계 코어 접근. 웨이포인트 확인해, RAVEN.": "If you stop, you're done.",
-    "그림자 봤어. 너무 빨리 가지 마.": "Something’s off. NEMESIS: 'No matter what you choose, the outcome’s the same.' That’s why the choice matters now.",
-    "그쪽 아냐, 다시 표식 봐.": "Negative. Check the marker again.",
-    "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-    "NEMESIS 중계 코어 접근 클린하게 끝냈다.": "Eyes up. One thermal contact, right side.",
-    "상공 시야 확보. 오른쪽에 열상 하나.": "Jamming just spiked—trackers inbound!",
-    "블랙타이드 핵심 서버 장악. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-    "왼쪽 시야, 움직임. 조심.": "I’ll hold them. You push.",
-    "잡음 커졌다. 추적 온다!": "[radio] Good. You're still breathing.",
-    "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. (Chapter 3 tease) After the upload, the same protocol lights up in another region.",
-    "블랙타이드 핵심 서버 장악 좋아, 됐다.": "[radio] Just pulled a weird pattern from the data. NEMESIS: 'No matter what you choose, the outcome’s the same.' That’s why the choice matters now.",
-    "내가 막는다. 너희는 전진.": "[radio] Evidence turns to fire—and fire gets forgotten.",
-    "증거 최종 업로드/삭제 선택. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-    "증거 최종 업로드/삭제 선택 클린하게 끝냈다.": "[radio] Next sector’s a short window. Move."
-  }
-};
+import { translateWith } from './CampaignTranslate.js';
+
+// String pool: every distinct Korean key / English line once.
+const S = [
+  "DUSTLINE 투입. 오늘은 길게 안 간다—끊고, 지우고, 빠진다.",
+  "[RADIO] DUSTLINE is in. We keep this short—cut it, wipe it, exfil.",
+  "모래가 시야를 씹어먹는다. 대신 소리는 살아—발소리부터 죽여.",
+  "[RADIO] Sand eats the visibility. Sound still carries—kill your footsteps first.",
+  "이 구역, 한 번 뜨면 바로 봉쇄 내려온다. 깔끔하게.",
+  "[RADIO] If we pop on their feed, they lock this whole AO down. Stay clean.",
+  "표식 보이면 따라가. 근데… 표식만 믿지는 마. 여기서 길이 사람을 속여.",
+  "[WHISPER] Follow the mark, but don’t marry it. This place lies to people.",
+  "우리가 찾는 건 적 얼굴이 아니라 흔적이다. 로그, 케이블, 발자국.",
+  "[RADIO] We’re not hunting faces. We’re hunting traces—logs, cables, footprints.",
+  "…채널에 손 탔다. 잡음이 우리 암호 리듬이랑 겹친다.",
+  "[RADIO] …Channel’s been touched. The noise is matching our cipher rhythm.",
+  "…계속해.",
+  "[NOISE] …Continue.",
+  "방금, 우리 채널 아니다. 누가 끼어들었다.",
+  "[RADIO] That wasn’t ours. Someone just cut in.",
+  "더 문제는… 적 무전에서 네 콜사인이 먼저 나왔어, RAVEN. 우리보다 먼저.",
+  "[RADIO] Worse—enemy comms said your callsign first, Raven. Before we did.",
+  "바람 등지고 붙어. 실루엣 뜨면 바로 끝이다.",
+  "Back to the wind. If your silhouette pops, we’re done.",
+  "멈춰—모래가 한 번 꺼졌다. 감지기 있으면 저런 티 난다.",
+  "Hold—sand just “dropped.” That’s what sensors look like.",
+  "담장 따라 오른쪽으로. 넓은 데는 비워 둬.",
+  "Right side, ride the wall. Leave the open ground empty.",
+  "금속 긁는 소리… 순찰이 생각보다 가깝다. 숨 낮춰.",
+  "Metal scrape… patrol’s closer than I like. Keep it low.",
+  "집결 찍히면 바로 다음으로 넘긴다. 여기서 머물 틈 없다.",
+  "Once we tag the rally, we move. No loitering.",
+  "집결 확인. 바로 넘어간다.",
+  "Rally confirmed. We roll, now.",
+  "소리 죽여. 여기선 작은 것도 크게 튄다.",
+  "Mute everything. Small noise echoes big out here.",
+  "집결 지점 확인. 다음 목표로.",
+  "Rally point secured. Next objective.",
+  "중계기 보이면 손 대. 시간이 적이다.",
+  "Touch that relay the moment you see it. Time is the enemy.",
+  "조명 깜빡임이 규칙적이야. 누가 원격으로 상태를 읽는 느낌.",
+  "Lights are blinking on a pattern. Feels like someone’s reading it remotely.",
+  "문 여는 소리 나면 바로 엎드려. 소리 들키면 봉쇄 떨어진다.",
+  "If a door clicks, you drop. Noise triggers lockdown.",
+  "케이블 주변 흙이 새로 파였어… 우리 전에 누가 먼저 만졌어.",
+  "Fresh dig marks around the cable… someone touched this before us.",
+  "차단 끝나면 뒤 안 본다. 흔적만 남기고, 사람은 사라져.",
+  "Once it’s cut, we don’t look back. Leave traces—no bodies.",
+  "손 댔다. 누가 보고 있으면, 지금 반응한다.",
+  "I’m on it. If someone’s watching, they’ll react now.",
+  "끝나면 바로 이탈. 여기서 시간을 태우지 마.",
+  "When it’s done, we exfil. Don’t burn time here.",
+  "차단 완료. 이동.",
+  "Relay is down. Move.",
+  "왼쪽 두 명. 대화 끊겼다—지금이 창구야.",
+  "Two left. Their chatter stopped—window’s open.",
+  "총성 금지. 필요하면 던지고 지나가. 소음 남기지 마.",
+  "No gunfire. Toss and pass if you have to. Don’t leave noise.",
+  "발자국… 우리 게 아닌데? 패턴이 너무 일정해.",
+  "Footprints… not ours. Pattern’s too consistent.",
+  "누가 길을 정리해놨다는 소리냐. 더 불쾌한데.",
+  "You’re saying someone “prepared” our path? That’s worse.",
+  "저 앞 표식이 벽을 뚫고 가. GPS가 미친 게 아니라… 유도 같아.",
+  "The marker’s cutting through a wall. GPS isn’t broken… it’s guiding us.",
+  "지금. 지나간다.",
+  "Now. We push through.",
+  "저쪽 시야 끊겼어. 붙어.",
+  "Their sightline’s broken. Stick close.",
+  "통로 확보. 계속 간다.",
+  "Route secured. Keep moving.",
+  "북쪽 출구 보인다. 마지막까지 조용히 간다.",
+  "North exit in sight. Quiet to the end.",
+  "또 잡음… 이번엔 숨소리까지 따라 한다. 아예 우리처럼 군다.",
+  "Noise again… it’s copying our breathing now. It’s acting like us.",
+  "봉쇄 뜨기 전에 빠져. 뛰지 말고—짧게, 정확히.",
+  "Before lockdown hits—go. Don’t sprint. Short and precise.",
+  "적 무전… \"RAVEN 위치 갱신\"이라는데? 누가 저걸 넘겼지.",
+  "Enemy comms: “Update Raven’s position.” Who fed them that?",
+  "나가면 정리한다. 다음 좌표 확인—BLACKSITE 냄새 난다.",
+  "We sort it once we’re out. Check the next coords—smells like BLACKSITE.",
+  "출구 확보. 나간다.",
+  "Exfil point secured. We’re out.",
+  "적이 네 이름을 먼저 안다. 우연 아니다.",
+  "They knew your name first. That’s not luck.",
+  "이탈 지점 확보. 종료한다.",
+  "Exfil secured. Ending this.",
+  "나왔다. 중계기 죽었다—근데 기분이 더러워.",
+  "[RADIO] We’re out. Relay is dead… but something’s off.",
+  "적이 네 이름을 먼저 안다? 우연 아니야. 명단이 돌고 있어.",
+  "[RADIO] They knew your name first? Not chance. A roster’s circulating.",
+  "좌표 파편 수신. 출처는?",
+  "[RADIO] I’m receiving coordinate fragments. Source?",
+  "모른다. 근데 '누군가'가 다음 문을 열어줬다.",
+  "[RADIO] Unknown. But someone just opened the next door for us.",
+  "…확인.",
+  "[NOISE] …Confirmed.",
+  "저 목소리. 들을수록… 관리자 톤이야.",
+  "[RADIO] That voice… the more I hear it, the more it sounds like an admin.",
+  "BLACKSITE로 간다. 거기서 답을 뜯어내.",
+  "[RADIO] We go to BLACKSITE. We rip the answers out there.",
+  "…우린 이미 누군가의 화면 안에 있어. 그게 제일 문제야.",
+  "[WHISPER] …We’re already on someone’s screen. That’s the problem.",
+  "이동.",
+  "[RADIO] Move.",
+  "BLACKSITE 외곽 도착. 목표는 짧게—안으로 들어가서, 서버룸 긁고, 즉시 이탈.",
+  "[RADIO] BLACKSITE perimeter. Keep it short—go in, scrape the server room, exfil.",
+  "이상해. 경계가… 없다. 문도 열려 있어.",
+  "[RADIO] Weird. No security. Doors are open.",
+  "그게 더 위험하지. 빈 곳은 항상 누가 비운 거야.",
+  "[RADIO] That’s what makes it dangerous. Empty means someone cleared it.",
+  "외곽 카메라 각도 확인.",
+  "[RADIO] Checking camera angles.",
+  "표식이 안 맞는다. GPS가 벽에 튕겨—눈으로 잡아.",
+  "[WHISPER] Marker’s drifting. GPS is bouncing off walls—use your eyes.",
+  "길게 머물면 포위다. 발각보다 '체류'가 더 치명적이야.",
+  "[RADIO] Stay too long and we’re boxed in. Loitering kills more than detection.",
+  "…채널 잡음 다시. 이번엔 아예 우리 패킷을 복사해.",
+  "[RADIO] …Noise is back. It’s copying our packets now.",
+  "…확인했다.",
+  "저 목소리, 우리랑 너무 가깝다. 누가 '흉내' 내고 있어.",
+  "[RADIO] That voice is too close to ours. Someone’s mimicking.",
+  "서버 로그에 찍혔어. 승인자: NEMESIS. 이건 적 서명이 아니라… 내부 결재야.",
+  "[RADIO] Server logs show it. Approver: NEMESIS. Not enemy—internal sign-off.",
+  "카메라 돔이 살아있어… 근데 움직임이 없어. 자동이 아니라 '대기' 같아.",
+  "Camera domes are live… but they’re not moving. Feels like “standby,” not auto.",
+  "벽 붙어. 실루엣만 뜨면 끝.",
+  "Stick to the wall. Silhouette pops and we’re done.",
+  "바닥에 테이프 자국… 장비 옮긴 흔적이야. 최근이다.",
+  "Tape marks on the floor… gear was moved. Recent.",
+  "이곳은 비어있지 않아. 비워진 거야.",
+  "This place isn’t empty. It was emptied.",
+  "외곽 통과. 소리 최소.",
+  "Perimeter clear. Noise minimized.",
+  "너무 조용해. 매복이 아니라 '대기'야.",
+  "Too quiet. Not an ambush—standby.",
+  "멈추지 마. 멈추면 여기서 문서가 된다.",
+  "Don’t stop. You stop, you become a file.",
+  "외곽 통과. 계속.",
+  "Perimeter passed. Keep going.",
+  "문이 열려 있으면 더 조심해. 들어가라가 아니라, 들어오라…일 수 있어.",
+  "Open doors mean extra caution. It’s not “go in”… it’s “come in.”",
+  "형광등… 한 박자 늦게 켜져. 센서가 사람을 '확인'하는 느낌.",
+  "Fluorescents lag a beat. Like sensors are “verifying” people.",
+  "발이 멈추면, 마음이 먼저 흔들린다. 멈추지 마.",
+  "Feet stop, mind wobbles first. Don’t stop.",
+  "안내 음성 반복된다. \"환영합니다\"… 이거, 환영 아니야.",
+  "Guide voice keeps looping—“Welcome.” This isn’t a welcome.",
+  "내부 진입. 이제부터는 증거만 보고 나간다.",
+  "We’re inside. From here on, eyes on evidence—then out.",
+  "누가 우리를 적으로 보는 게 아니야… 처리 대상처럼 봐.",
+  "They’re not treating us like enemies… more like items to process.",
+  "서버룸까지 직행.",
+  "Straight to the server room.",
+  "진입 완료. 서버룸으로.",
+  "Entry complete. Server room.",
+  "이상할 정도로 먼지 없다. 사람이 없다는 게 아니라… 누가 청소했어.",
+  "[RADIO] No dust—too clean. Not empty… cleaned.",
+  "누가 흔적을 지우는지, 우리가 지금 보러 왔다.",
+  "[RADIO] And we’re here to see who’s wiping tracks.",
+  "서버룸 문, 잠금 해제 흔적.",
+  "[RADIO] Server room door—signs of forced unlock.",
+  "그리고 잡음이… 이제는 우리 말 끝을 따라 와.",
+  "[RADIO] And the noise… it’s chasing the end of our sentences.",
+  "따라오게 두지 마. 말 줄여.",
+  "[RADIO] Don’t let it tail us. Cut the chatter.",
+  "…대상 확인.",
+  "[NOISE] …Target confirmed.",
+  "보고서 문장 같은 톤이야. 사람 목소리인데, 사람 같지 않아.",
+  "[RADIO] It talks like a report. Human voice… not human.",
+  "들어가서 끝내. 우릴 찍는 눈이 뭔지 확인한다.",
+  "[RADIO] Go in and finish it. Find what’s watching us.",
+  "케이블 뽑는 소리도 기록된다. 손 빠르게.",
+  "Cable pull gets logged too. Hands fast.",
+  "화면에 '승인자: NEMESIS'… 봤지? 전장 용어가 아니야. 사무실 언어야.",
+  "“Approver: NEMESIS”… see it? Not battlefield language. Office language.",
+  "사진은 최소. 필요한 것만.",
+  "Minimal photos. Only what we need.",
+  "시간표 떠… \"케이스 호송\". 다음 미션으로 길을 내주는 거다.",
+  "Schedule’s up… “Case convoy.” They’re paving our next mission.",
+  "확보 끝. 이제 숨 쉬지 말고 나가.",
+  "Acquisition done. Now exfil—no breathing.",
+  "회수팀 온다. 소리 난다.",
+  "Recovery team’s coming. I hear it.",
+  "증거 챙겼다. 나가자.",
+  "We’ve got it. Out.",
+  "서버룸 확보. 이탈 준비.",
+  "Server room scraped. Prep to exfil.",
+  "뒤에서 엔진 소리. 호송대가 아니라 '회수팀' 같아.",
+  "Engines behind us. Not a convoy—feels like a recovery team.",
+  "출구 바꾸자. 들어온 길은 이미 표시 됐어.",
+  "Swap exits. Our entry route is already flagged.",
+  "잡음 커졌다—이제는 신호가 아니라 명령처럼 눌러온다.",
+  "Noise is louder—no longer signal, more like an order.",
+  "뛰지 마. 뛰면 더 큰 소리다. 짧게, 낮게.",
+  "Don’t sprint. Sprint is louder. Short and low.",
+  "이탈 완료.",
+  "Exfil complete.",
+  "멈추지 마. 지금 멈추면 끝.",
+  "Keep moving. Stop and it’s over.",
+  "이탈 성공. 다음 단계로.",
+  "Exfil successful. Next phase.",
+  "밖으로 나왔다. 이제부터는, 증거가 우리를 무겁게 만든다.",
+  "[RADIO] We’re out. From here on, the evidence weighs us down.",
+  "\"승인자: NEMESIS\"… 이건 누가 총을 쐈냐가 아니야. 누가 '사인'했냐야.",
+  "[RADIO] “Approver: NEMESIS.” Not who fired—who signed.",
+  "내부 결재면… 내부 작전?",
+  "[RADIO] If it’s internal sign-off… internal op?",
+  "단정하지 마. 하지만, 냄새는 맞아.",
+  "[RADIO] Don’t lock it in. But the smell fits.",
+  "대상 이동.",
+  "[NOISE] Target moving.",
+  "또 왔다. 그리고 또—우릴 '대상'이라 부른다.",
+  "[RADIO] Again. And again—calling us “targets.”",
+  "로그에 시간표가 떠. \"케이스 호송\". 다음은 도로다.",
+  "[RADIO] Logs show a schedule. “Case convoy.” Next is the road.",
+  "호송대를 치면, 실물이 나온다.",
+  "[RADIO] We hit the convoy, we get something real.",
+  "이번엔 빠르고 더러워도 된다. 하지만, 살아서.",
+  "[RADIO] This one can be fast and dirty—just survive it.",
+  "…우리 전투가 아니라, 누군가의 서류 작업 같아져.",
+  "[WHISPER] …Feels less like a fight… more like someone’s paperwork.",
+  "도로로 간다. 목표는 케이스 회수. 매복-회수-이탈, 세 단계로 끝낸다.",
+  "[RADIO] We’re on the road. Objective: recover the case. Ambush—grab—exfil.",
+  "호송대가 멈추는 시간 짧아. 타이밍 놓치면, 다음 기회 없다.",
+  "[RADIO] Convoy stop is brief. Miss the timing—no second chance.",
+  "총성은 최소. 대신 케이스는 반드시.",
+  "[RADIO] Minimal shots. But the case is non-negotiable.",
+  "위치 확인. 매복 지점으로.",
+  "[RADIO] Position confirmed. Moving to ambush.",
+  "바람 방향 봐. 모래가 우리 편이면, 소리도 묻힌다.",
+  "[WHISPER] Watch the wind. If sand’s with us, it buries sound too.",
+  "케이스 라벨 확인됐다. 이상하게… 우리 규격이다.",
+  "[RADIO] Case label checked. Weird… it matches our spec.",
+  "내용물보다 누가 보냈는지가 문제야.",
+  "[RADIO] The sender matters more than what’s inside.",
+  "…진행.",
+  "[NOISE] …Proceed.",
+  "누가 우리 길을 계속 '열어' 주고 있다.",
+  "[RADIO] Someone keeps “opening” our path.",
+  "그래서 더 조심해. 열어주는 문은 보통… 닫히면서 목을 친다.",
+  "[RADIO] Then be careful. Open doors usually close on throats.",
+  "매복은 총이 아니라 각도다. 사선 잡아.",
+  "Ambush isn’t firepower—it’s angles. Set your lanes.",
+  "도로 반사광 조심. 눈이 아니라 금속이 우리를 배신해.",
+  "Watch road glare. Metal will betray you before eyes do.",
+  "들키면 바로 회수로 전환. 교전은 부수다.",
+  "If we’re made, we switch to grab. Fight is secondary.",
+  "엔진 소리 온다. 창구 열린다.",
+  "Engines incoming. Window’s opening.",
+  "포지션 확보. 대기.",
+  "Position set. Holding.",
+  "지금부터 숨도 계산해.",
+  "From here—count your breaths.",
+  "호송대 정차. 간다.",
+  "Convoy stopping. Go.",
+  "매복 준비 끝. 회수로.",
+  "Ambush set. Move to recovery.",
+  "후미로 붙어. 케이스만 집어. 사람은 최소.",
+  "Stick to the tail. Grab the case. Minimal bodies.",
+  "라벨 봤어? 우리 규격이야. 이거… 누가 \"넘겨준\" 거다.",
+  "See the label? Our spec. This was “handed off.”",
+  "그러면 더 빨라. 답은 케이스 안에 있겠지.",
+  "Then we go faster. Answers are in that box.",
+  "순찰이 우리 쪽으로 꺾는다. 창구 닫힌다.",
+  "Patrol is turning toward us. Window’s closing.",
+  "케이스 확보.",
+  "Case secured.",
+  "회수팀 올 수 있어. 빨리.",
+  "Recovery team could roll in. Hurry.",
+  "확보 확인. 다음은 저지.",
+  "Confirmed. Next—hold them off.",
+  "회수 완료. 추격 저지.",
+  "Recovery complete. Hold the chase.",
+  "추격 붙는다. 발자국이 '우릴' 가리킨다.",
+  "They’re on us. Footprints are pointing straight at us.",
+  "필요 최소만 꺾어. 길 열면 바로 빠진다.",
+  "Break contact—minimum required. Once the lane opens, we leave.",
+  "잡음이 명령처럼 들린다. \"대상 유지\".",
+  "Noise sounds like orders now. “Maintain target.”",
+  "그럼 우리가 답장하자. 총은 짧게.",
+  "Then we answer back. Short bursts.",
+  "추격 분대 처리.",
+  "Pursuit element down.",
+  "창구 닫힌다. 지금!",
+  "Window’s closing. Now!",
+  "왼쪽 둘, 오른쪽 하나.",
+  "Two left, one right.",
+  "저지 완료. 루트 소각으로 간다.",
+  "Contact broken. Move to route burn.",
+  "흔적 지워. 케이스 들고 흔적 남기면, 우리는 표식이다.",
+  "Wipe tracks. Carrying the case makes us a beacon.",
+  "바람 방향 바꿨다. 이제 소리 더 멀리 간다. 조심.",
+  "Wind shifted. Sound travels farther now. Careful.",
+  "길 바꾼다. 우리가 왔던 길은 이미 데이터로 남았어.",
+  "Changing route. Our entry path is already data.",
+  "잡음이 따라온다… 근데 이번엔 \"승인\" 같은 단어가 섞여.",
+  "Noise is trailing… now it’s mixing in words like “approved.”",
+  "이탈 지점 확인.",
+  "Exfil point confirmed.",
+  "여기서 끝낸다. 다음은 교량.",
+  "We end it here. Next is the bridge.",
+  "케이스… 무겁다. 내용물보다 \"서명\"이 무거워.",
+  "This case is heavy. The signature is heavier than the contents.",
+  "이탈. 교량으로 간다.",
+  "Exfil. Moving to the bridge.",
+  "케이스 확보. 봉쇄 움직임 보인다. 교량으로 붙는다.",
+  "[RADIO] Case secured. Lockdown is moving. We push the bridge.",
+  "라벨이 우리 규격이면, 누군가 우리를 \"공식 루트\"로 태운다.",
+  "[RADIO] If the label’s our spec, someone’s putting us on an “official route.”",
+  "그럼 목적지는?",
+  "[RADIO] Then what’s the destination?",
+  "아직 몰라. 하지만 교량을 지나면, 도시다.",
+  "[RADIO] Don’t know yet. Past the bridge—cityline.",
+  "경로 승인.",
+  "[NOISE] Route approved.",
+  "들었지? 또 \"승인\".",
+  "[RADIO] Heard that? “Approved” again.",
+  "계속 간다. 답은 케이스 안이든, 서명 위든—둘 다 뜯는다.",
+  "[RADIO] We keep moving. Answer’s in the box or on the signature—either way, we rip it.",
+  "교량 접근. 여기서부터는 빛보다 \"선\"이 위험하다—센서, 케이블, 시야.",
+  "[RADIO] Approaching the bridge. From here, “lines” are lethal—sensors, cables, sight.",
+  "교량 아래, 물소리 없다. 흐르는 게 아니라… 멈춘다. 인공이다.",
+  "[RADIO] No water sound under the bridge. It’s not flowing… it’s stopped. Artificial.",
+  "목표는 진입, 통제실, 차단, 그리고 넘어간다.",
+  "[RADIO] Objective: enter, reach control, cut it, cross.",
+  "교량 구조 확인.",
+  "[RADIO] Bridge layout confirmed.",
+  "바람이 멎었어. 이런 순간엔 소리가 더 멀리 간다.",
+  "[WHISPER] Wind’s dead. In moments like this, sound travels farther.",
+  "케이스는 아직 닫아 둬. 열면 우리도 열린다.",
+  "[RADIO] Keep the case sealed. Open it—and we open ourselves.",
+  "구간 통과.",
+  "[NOISE] Segment pass.",
+  "또 \"구간\". 여긴 전장이 아니라… 체크리스트야.",
+  "[RADIO] “Segment” again. This isn’t a battlefield… it’s a checklist.",
+  "체크리스트든 뭐든. 우리는 통과한다.",
+  "[RADIO] Checklist or not—we pass.",
+  "그리고 누가 체크하는지… 곧 보겠지.",
+  "[RADIO] And we’ll see who’s checking it.",
+  "아래로 간다. 위는 시야, 아래는 소리—둘 중 하나만 피하면 돼.",
+  "We go low. Up is sight, down is sound—avoid one.",
+  "금속 울림 조심. 한 번 울리면, 교량이 위치를 \"말해\".",
+  "Watch metal ring. One ping and the bridge “talks.”",
+  "센서 선 보이면 건드리지 마. 선은 곧 경보다.",
+  "Don’t touch sensor lines. Lines are alarms.",
+  "빛이 아니라 '선'. 맞아… 여기 시스템은 선으로 우리를 잡아.",
+  "Not light—lines. Yeah… their system grabs us by lines.",
+  "하부 진입.",
+  "Lower entry.",
+  "좋아. 통제실로.",
+  "Good. To control.",
+  "잡음… 더 가까워.",
+  "Noise… closer.",
+  "진입 완료.",
+  "Entry complete.",
+  "통제실 문, 이상하게 깨끗해. 손자국도 없어.",
+  "Control room door—too clean. No prints.",
+  "그럼 누가 장갑 끼고 다닌다는 거지. 더 싫다.",
+  "Means someone’s wearing gloves. I hate that more.",
+  "표식이 통제실 안에서 깜빡인다. 초대장 같아.",
+  "Marker’s blinking inside the control room. Like an invitation.",
+  "초대받아도, 우린 손님이 아니라 도둑이다. 들어간다.",
+  "Invitation or not—we’re thieves, not guests. Going in.",
+  "통제실 접근.",
+  "Approaching control.",
+  "문 열렸다… 너무 쉽게.",
+  "Door’s open… too easy.",
+  "확보. 차단으로 간다.",
+  "Secured. Move to cut.",
+  "통제실 확보.",
+  "Control secured.",
+  "화면에… \"구간 통과\" 기록이 쌓여. 우리가 지나간 자리마다 스탬프 찍혀.",
+  "[RADIO] Screen shows “segment pass” logs stacking. Every step gets stamped.",
+  "그럼 스탬프 찍는 손을 찾아서 잘라.",
+  "[RADIO] Then find the hand—and cut it off.",
+  "통제 모듈… 외부 접속 유지.",
+  "[RADIO] Control module… external link is active.",
+  "저기… \"승인 대기\" 라인. 또 그 단어야.",
+  "[RADIO] There—“approval pending.” Same word again.",
+  "승인.",
+  "[NOISE] Approved.",
+  "…진짜로 '누가' 눌러.",
+  "[RADIO] …Someone is actually clicking it.",
+  "더 늦기 전에 차단한다.",
+  "[RADIO] We cut it before it cuts us.",
+  "준비.",
+  "[RADIO] Ready.",
+  "차단한다. 흔들리면 끝.",
+  "Cutting it. Wobble and we’re done.",
+  "여기선 \"발각\"이 아니라 \"기록\"이야. 기록되면 끝.",
+  "Here it’s not detection—it’s recording. Once recorded, it’s over.",
+  "그럼 기록을 찢어. 케이블 뽑아.",
+  "Then tear the record. Pull the cable.",
+  "잡음… 명령이 된다. \"대상 유지\".",
+  "Noise… turning into orders. “Maintain target.”",
+  "차단 완료.",
+  "Cut complete.",
+  "지금. 뽑아.",
+  "Now. Pull it.",
+  "…잠깐, 화면이 우리를 다시 잡아.",
+  "…Hold—screen just reacquired us.",
+  "차단 성공. 넘어간다.",
+  "Cut successful. Cross.",
+  "도시 불빛 보인다. 하지만 빛보다 소리가 먼저다.",
+  "City lights ahead. But sound arrives first.",
+  "멈추지 마. 멈추면 다시 \"승인 대기\"가 된다.",
+  "Don’t stop. Stop and we’re “pending approval” again.",
+  "추적이 붙는다. 이제부터는 도시가 우리를 삼켜.",
+  "They’re on us. From here, the city swallows.",
+  "좋아. 삼키기 전에 우리가 먼저 찢고 나간다.",
+  "Good. Before it swallows us—we cut our way out.",
+  "도시 진입.",
+  "Entering city.",
+  "도시선 진입. 다음은 CITYLINE.",
+  "Cityline entry. Next—CITYLINE.",
+  "이제부터는 귀로 싸운다.",
+  "From here, we fight with our ears.",
+  "교량 넘었다. 이제부터는 도시다.",
+  "[RADIO] Bridge crossed. City from here.",
+  "우리가 시스템을 끊었는데도… \"승인\"은 계속 떠.",
+  "[RADIO] We cut the system… but “approval” still pops.",
+  "누가 유지하지.",
+  "[RADIO] Someone’s maintaining it.",
+  "CITYLINE에서 허브를 찾는다. 거기서 끝내.",
+  "[RADIO] We find the hub in CITYLINE. We end it there.",
+  "추적 유지.",
+  "[NOISE] Maintain tracking.",
+  "\"유지\". 그 단어만 계속.",
+  "[RADIO] “Maintain.” Same word, over and over.",
+  "그럼 우리가 끊는다.",
+  "[RADIO] Then we cut it.",
+  "CITYLINE 진입. 여기선 총보다 소리가 먼저 죽인다.",
+  "[RADIO] CITYLINE entry. Here, sound kills before bullets.",
+  "도시가 \"듣고\" 있어. 발각은 시야가 아니라 소리로 온다.",
+  "[RADIO] The city is listening. Detection comes by sound, not sight.",
+  "목표는 허브. 감시 카메라 허브에서 로그를 뜯고 끝낸다.",
+  "[RADIO] Objective: the hub. Rip logs from the camera hub and end it.",
+  "동선 확인.",
+  "[RADIO] Route confirmed.",
+  "제기랄—소리 내지 마. 도시가 답장한다.",
+  "[WHISPER] Damn it—don’t make noise. The city answers back.",
+  "들켰다는 말 하지 마. 이미 노출이야. 지금은 회피만.",
+  "[RADIO] Don’t say “spotted.” We’re already exposed. Just evade.",
+  "기록 시작.",
+  "[NOISE] Recording start.",
+  "…또 '기록'. 이건 전투가 아니라 감시다.",
+  "[RADIO] …“Recording” again. This isn’t combat. It’s surveillance.",
+  "허브에서 끝낸다.",
+  "[RADIO] We end it at the hub.",
+  "그리고 누가 기록하는지… 확인한다.",
+  "[RADIO] And we find who’s recording.",
+  "아스팔트는 소리를 튕겨. 발끝으로 간다.",
+  "Asphalt bounces sound. Move on your toes.",
+  "골목으로. 넓은 길은 카메라가 먹는다.",
+  "Into the alleys. Wide streets get eaten by cameras.",
+  "벽에 반사되는 그림자 조심. 도시엔 거울이 많아.",
+  "Watch reflected shadows. City’s full of mirrors.",
+  "허브까지 직행. 돌아가면 기록만 늘어난다.",
+  "Straight to the hub. Detours just add records.",
+  "골목 진입.",
+  "Entered alleys.",
+  "도시가 귀라면… 우린 숨이야.",
+  "If the city is ears… we’re breath.",
+  "숨도 조용히.",
+  "Then breathe quietly.",
+  "허브 신호 잡았다. 근데… 너무 쉽게 잡혀.",
+  "Got the hub signal… too easily.",
+  "일부러 보여주는 거지. 우릴 유도해.",
+  "They’re showing it on purpose. Guiding us.",
+  "화면… 우리 움직임이 표시된다.",
+  "Screen… our movement is marked.",
+  "실시간이다. 지연이 없어. 감시가 아니라… 생중계야.",
+  "It’s live. No latency. Not surveillance… a broadcast.",
+  "그래서 기록 시작. 우린 이미 캡처된 상태.",
+  "So “recording start.” We’re already captured.",
+  "…추적 재개.",
+  "[NOISE] …Tracking resumed.",
+  "봤지? \"재개\"래. 끊긴 적이 없었어.",
+  "See that? “Resumed.” It never stopped.",
+  "신호 추적 완료. 허브로.",
+  "Signal tracked. To the hub.",
+  "그래서 '기록 시작'. 우린 이미 캡처된 상태.",
+  "[RADIO] That’s why it says “recording start.” We’re already captured.",
+  "\"재개\"래. 끊긴 적 없었어. 그냥 잠깐 숨겨줬던 거야.",
+  "[RADIO] “Resumed.” It never stopped—just hid us for a moment.",
+  "허브에서 로그만 뜯고 나가. 우린 지금 무대 위야.",
+  "[RADIO] Rip the logs and get out. We’re on stage.",
+  "허브 케이블 뽑는다. 손 떨지 마. 떨리면 소리 난다.",
+  "Pulling the hub cable. Don’t shake—shake makes noise.",
+  "화면에 'DUSTLINE' 태그… 누가 우리 팀명을 시스템에 등록했지?",
+  "Screen says “DUSTLINE” tag… who registered our name in the system?",
+  "질문은 접어. 지금은 로그. 증거만.",
+  "Questions later. Logs now. Evidence only.",
+  "지도에 다음 통로 뜬다… \"Trenchwork\". 누가 길을 그려 놨어.",
+  "Map’s drawing the next route… “Trenchwork.” Someone sketched our path.",
+  "허브 확보 완료.",
+  "Hub secured.",
+  "지금. 로그 뜯어.",
+  "Now. Pull the logs.",
+  "도시가 귀야. 빨리.",
+  "City’s listening. Hurry.",
+  "허브 로그 확보.",
+  "Hub logs acquired.",
+  "이제부터는 빛이 아니라 소리를 피해야 돼. 이 도시는 귀가 많아.",
+  "From here, avoid sound, not light. This city has ears.",
+  "출구 바꾼다. 우리가 올 때 밟은 길은 이미 하이라이트 됐어.",
+  "Changing exits. Our entry path is already highlighted.",
+  "\"추격 재개\" 이후로 잡음이 달라. 더 선명해… 가까워졌다.",
+  "After “tracking resumed,” the noise changed. Sharper… closer.",
+  "멈추지 마. 멈추면 다시 \"기록 시작\"이 된다.",
+  "Don’t stop. Stop and it’s “recording start” again.",
+  "외곽 이탈 성공.",
+  "Outer exfil successful.",
+  "들켰다는 말 하지 마. 이미 노출이야.",
+  "Don’t say “spotted.” We’re already exposed.",
+  "회피로 끝낸다.",
+  "We end this by evasion.",
+  "허브에서 확인했다. 우린 추적당한 게 아니라… 관리되고 있었다.",
+  "[RADIO] Confirmed at the hub. We weren’t hunted… we were managed.",
+  "DUSTLINE 이동이 실시간으로 찍힌다. 이건 정보전이 아니야. 출입 기록이야.",
+  "[RADIO] DUSTLINE movement is live. Not intel warfare—an access log.",
+  "누가?",
+  "[RADIO] By who?",
+  "아직 이름은 없어. 대신 방법이 있어—길을 Trenchwork로 안내한다.",
+  "[RADIO] No name yet. But there’s a method—guiding us to Trenchwork.",
+  "추적 재개.",
+  "[NOISE] Tracking resumed.",
+  "또 '재개'. 끊긴 적 없었지. 우리한테 끊긴 척 했을 뿐.",
+  "[RADIO] “Resumed” again. It never stopped—just pretended for us.",
+  "다음은 참호선. 은폐는 되겠지. 대신… 사라지기 좋은 지형이야.",
+  "[RADIO] Next is the trench line. Good cover… also good for disappearing.",
+  "그럼 거기서 끝낸다.",
+  "[RADIO] Then we end it there.",
+  "끝내자. 우리가 누구의 기록인지 확인하자.",
+  "[RADIO] End it. And find whose record we are.",
+  "…이제는 적이 무섭다기보다, 서명하는 손이 무섭다.",
+  "[WHISPER] …Enemy’s not what scares me. The hand that signs does.",
+  "DUSTLINE. 작전 개시한다. 오늘은 참호를 한 줄씩 밀어낸다.",
+  "DUSTLINE. We are green. Push the trench line by line.",
+  "시야가 죽어. 발자국, 장전음… 전부 줄여.",
+  "Visibility is trash. Footsteps, reloads… keep it quiet.",
+  "교전은 마지막 수단. 길만 열고 지나가.",
+  "Weapons are last resort. Cut a path and move.",
+  "RAVEN, 표식만 따라가지 마. 참호는 사람을 속인다.",
+  "RAVEN, do not worship the marker. Trenches lie.",
+  "우리가 찾는 건 인물이 아니다. 증거다.",
+  "We are not hunting a man. We are hunting proof.",
+  "잡음… 누가 우리 채널에 손댔다.",
+  "Static… someone is on our channel.",
+  "…수신.",
+  "…Received.",
+  "방금, 우리 코드 아니었지?",
+  "That was not our code, was it?",
+  "아니. 그런데… 이 참호에 우리 패치가 있다. 먼저 들어온 팀이 여기서 끊겼어.",
+  "No. But… our patch is down there. The team before us went dark here.",
+  "1선 진입. 코너마다 멈춰, 각 확인.",
+  "Entering line one. Stop at every corner, check angles.",
+  "발자국이 끊겨. 누가 여기서 숨었다.",
+  "Tracks stop here. Someone tucked in.",
+  "멈춰. 저 리듬… 우리 암호랑 닮았어.",
+  "Hold. That cadence… it matches our cipher.",
+  "잡음이 커진다. 누가 우릴 재고 있어.",
+  "Static is spiking. Someone is measuring us.",
+  "1선 확보. 흔적 지워.",
+  "Line one secured. Wipe your trace.",
+  "출구 열리면 바로 넘어가.",
+  "Once the exit opens, we flow.",
+  "2선 간다. 여기서부터는 매복이 진짜다.",
+  "Pushing line two. Real ambush country from here.",
+  "금속 긁는 소리… 위에서 본다. 고개 숙여.",
+  "Metal scrape… eyes above. Keep your head down.",
+  "출구마다 킬존이다. 머리만 내밀지 마.",
+  "Every exit is a kill box. Do not show your head.",
+  "표식이 더 있다… 우리 부대 코드. 이건 사고가 아니야.",
+  "More markings… our unit code. This was no accident.",
+  "2선 정리. 심호흡 한 번.",
+  "Line two cleared. One breath.",
+  "잡음이 계속 커져. 기분 나쁘게 따라와.",
+  "Static keeps climbing. It is following us.",
+  "3선. 끝이 보인다—방심 금지.",
+  "Line three. End is close—no relax.",
+  "저 앞, 역광 실루엣. 움직이면 죽는다.",
+  "Front—backlit silhouette. Move and die.",
+  "왼쪽 코너, 신선한 탄피. 누가 방금 있었다.",
+  "Left corner, fresh brass. Someone was just here.",
+  "그 채널이 따라온다. 딱 붙었어.",
+  "That channel is tailing us. Tight.",
+  "3선 확보. 이제 표식만 챙긴다.",
+  "Line three secured. Now we grab the marker.",
+  "표식 회수하면 바로 철수한다.",
+  "Once we have it, we exfil.",
+  "표식 찾는다. 바닥, 벽, 시체… 전부 본다.",
+  "Find the marker. Floor, wall, bodies—scan all.",
+  "불 끄고 감으로 가. 빛은 총알이야.",
+  "Lights off, feel it out. Light is a bullet.",
+  "패치 확인. 핏자국은… 오래됐어.",
+  "Patch confirmed. Blood is… old.",
+  "잡으면 바로 빠져. 여기 오래 있으면 묻힌다.",
+  "Grab and move. Stay and we get buried.",
+  "표식 확보. 좌표가 찍혔다.",
+  "Marker secured. Coordinates are on it.",
+  "다음은 능선 야적장이다.",
+  "Next stop—Ridgeline scrap yard.",
+  "좋다. 정리한다—우린 아직 들키지 않았다.",
+  "Good. Quick recap—we are still clean.",
+  "패치 회수 완료. 근데 코드가 우리 부대 코드야. 누가 우리 이름을 쓴다.",
+  "Patch recovered. But that code is ours. Someone is wearing our name.",
+  "그래서 채널이 따라온 거군.",
+  "So that is why the channel is tailing us.",
+  "흔들리면 끝이다. 임무만 본다.",
+  "Do not wobble. Eyes on mission only.",
+  "Target moving.",
+  "또 들린다. 우리 뒤로 한 발자국.",
+  "There it is again. One step behind us.",
+  "표식 뒷면 좌표—능선 야적장, Ridgeline이다.",
+  "Back of the marker has coords—Ridgeline scrap yard.",
+  "Moving.",
+  "끝까지 간다.",
+  "We go to the end.",
+  "끝이… 우리 편이었으면 좋겠네.",
+  "I hope the end is still on our side.",
+  "Ridgeline 도착. 야적장 안에 중계기가 있다.",
+  "We are on Ridgeline. Relay sits inside the scrap yard.",
+  "금속 더미가 다 엄폐다. 동시에 다 함정이기도 해.",
+  "Metal piles are cover—and traps.",
+  "중계기만 날리면 그 채널도 약해진다.",
+  "We drop the relay, that channel weakens.",
+  "폭약 준비.",
+  "Charges ready.",
+  "폭약 해체. 반복한다. 폭약 해체.",
+  "Disarm explosives. Repeat. Disarm explosives.",
+  "웃기네. 우릴 돕는 척하면서 손을 묶는다.",
+  "Cute. Pretends to help while tying our hands.",
+  "명령 무시. 중계기 파괴가 우선이다.",
+  "Ignore it. Relay first.",
+  "RAVEN, 네 손은 빠르지. 설치하고 바로 빠져.",
+  "RAVEN, you are quick. Plant and move.",
+  "폭발 후 30초 버틴다. 그 시간에 이탈로 뚫어.",
+  "After detonation, hold 30 seconds. Use it to break out.",
+  "야적장 진입. 금속 소리 하나도 내지 마.",
+  "Enter the yard. No metal noise.",
+  "시야가 복잡해. 대신 발소리도 튀어. 천천히.",
+  "Sightlines are messy, but footsteps echo. Slow.",
+  "철덩이 사이로 간다. 소리 죽여.",
+  "Move through the metal. Kill the noise.",
+  "그 명령, 계속 들어온다. 무시해.",
+  "That order keeps coming. Ignore it.",
+  "진입 완료. 중계기 쪽으로 붙는다.",
+  "Entry complete. Closing on the relay.",
+  "저 채널… 우리 호흡을 듣고 있어.",
+  "That channel… it hears our breathing.",
+  "중계기에 폭약 설치한다. 손 떨지 마.",
+  "Planting charges on the relay. Steady hands.",
+  "폭약 해체. 반복한다.",
+  "Disarm explosives. Repeat.",
+  "설치 지점 도착. 손이 먼저야, 총은 나중.",
+  "At the plant point. Hands first, guns second.",
+  "설치하면 뒤로 빠져. 폭발 반동 커.",
+  "After plant, back off. Big blast.",
+  "설치 끝. 떨어져.",
+  "Planted. Get distance.",
+  "폭발 나면, 놈들이 들끓는다. 대비해.",
+  "After the blast, they will swarm. Ready up.",
+  "폭발 30초 버틴다. 여기선 숨도 방패다.",
+  "Hold 30 seconds. Even breath is cover.",
+  "연막은 숨, 섬광은 시간. 둘 다 아껴.",
+  "Smoke is concealment, flash is time. Use smart.",
+  "버텨. 30초면 충분하다.",
+  "Hold. Thirty seconds is enough.",
+  "머리 내밀면 끝. 낮게!",
+  "Head up and you die. Stay low.",
+  "버텼다. 이탈한다.",
+  "We held. Exfil now.",
+  "추적이 오기 전에 터널로 사라진다.",
+  "We vanish into the tunnel before they arrive.",
+  "이탈 지점으로 간다. 노출 최소.",
+  "Move to exfil. Minimize exposure.",
+  "놈들 시야에 걸리면 바로 포위다. 끊어서 가.",
+  "If they see you, they swarm. Slice through.",
+  "이탈로! 금속 더미 뒤가 길이다.",
+  "To exfil. Use the scrap as cover.",
+  "추적 끊어. 숨을 끊어.",
+  "Break the tail. Break your breathing.",
+  "이탈 성공. 다음은 플랫폼이다.",
+  "Exfil complete. Next is the platform.",
+  "명령이 꼬이면, 누군가 조종 중이란 뜻이야.",
+  "When orders tangle, someone is steering.",
+  "중계기 끝났다. 채널 잡음이—잠깐, 더 또렷해졌다.",
+  "Relay is down. The static—hold, it got clearer.",
+  "지점 고정. 회수팀 접근.",
+  "Hold position. Retrieval team inbound.",
+  "회수? 우리를.",
+  "Retrieval? Of us.",
+  "이제 확실하다. 우린 표적이다.",
+  "Now it is clear. We are the target.",
+  "다음 단서?",
+  "Next lead?",
+  "야적장 끝, 철도 플랫폼. 전환기 조작하면 터널 루트가 열린다.",
+  "End of the yard—rail platform. Hit the switch, tunnel route opens.",
+  "좋다. 추적이 오기 전에 터널로 사라진다.",
+  "Good. We disappear into the tunnel before they arrive.",
+  "Maintain tracking.",
+  "움직여.",
+  "Move.",
+  "놈들이 \"해체\"를 외칠수록, 우린 더 깊이 박는다.",
+  "The more they yell “disarm,” the deeper we dig in.",
+  "전환기 한 번이면 터널 루트가 열린다. 대신 바로 경보가 뜬다.",
+  "One switch opens the tunnel route. It will also trigger an alarm.",
+  "소음 창은 20초. 그 안에 밀고 들어가야 한다.",
+  "Noise window is 20 seconds. We push inside that.",
+  "플랫폼은 직선이다. 숨을 곳이 없다.",
+  "Platform is a straight line. No places to hide.",
+  "RAVEN, 소리부터 죽여. 표식은 따라가되, 네 귀가 먼저야.",
+  "RAVEN, kill noise first. Follow the mark, but trust your ears.",
+  "전환기 누르면, 추격이 시작된다. 미리 숨길 각을 만들어.",
+  "Once you hit the switch, chase starts. Build your angles now.",
+  "…승인 대기.",
+  "…Approval pending.",
+  "방금 방송에 \"블랙 타이드 프로토콜\"이 나왔다. 챕터2 작전명과 겹친다.",
+  "Broadcast just said “Black Tide Protocol.” It overlaps Chapter 2.",
+  "겹치면 내부다. 더 빨리 끝낸다.",
+  "If it overlaps, it is internal. We finish fast.",
+  "접근한다.",
+  "Approaching.",
+  "플랫폼 접근. 직선 구간이다—노출 최소.",
+  "Approach the platform. Straight lane—minimize exposure.",
+  "발자국 소리, 여기선 총성만큼 커. 조심해.",
+  "Footsteps here are as loud as gunshots. Careful.",
+  "플랫폼은 킬존. 오른쪽 기둥으로 붙어.",
+  "Platform is a kill box. Hug the right pillars.",
+  "소리 내면 끝. 발을 꾹 눌러.",
+  "Make noise and it ends. Plant your steps.",
+  "플랫폼 접선. 스위치까지 한 번에 간다.",
+  "On the platform. One push to the switch.",
+  "잡음이… 아까보다 선명해졌다.",
+  "The static… it is clearer now.",
+  "전환기 조작한다. 누르는 순간, 지옥문 열린다.",
+  "Hit the switch. The moment you touch it, hell opens.",
+  "스위치 누르면 20초. 그게 전부야.",
+  "Once pressed, 20 seconds. That is all.",
+  "제기랄, 소리 내지 마! 들리면 바로 뜬다!",
+  "Damn it, do not make noise. One ping and it blows.",
+  "방송에 \"블랙 타이드 프로토콜\"… 챕터2랑 겹친다.",
+  "Broadcast says “Black Tide Protocol”… overlaps Chapter 2.",
+  "스위치 완료. 경보 온다—준비!",
+  "Switch done. Alarm incoming—ready.",
+  "터널 쪽으로 길 열린다. 밀어!",
+  "Tunnel route is open. Push.",
+  "추격 20초 버텨. 이건 전투가 아니라 시간 싸움이다.",
+  "Hold 20 seconds. This is time, not war.",
+  "서로 보이면 끝. 연막으로 시야 끊어.",
+  "If they see us, it is over. Smoke the sightlines.",
+  "시간만 버텨. 20초면 터널로 빠진다.",
+  "Just hold time. Twenty seconds then we drop into the tunnel.",
+  "뒤로 밀리면 끝. 연막 깔고 각 잡아.",
+  "If they push us back, it is over. Smoke, set angles.",
+  "20초 버텼다. 터널로!",
+  "Twenty seconds held. Tunnel—go.",
+  "아까 그 단어… 블랙 타이드. 우연이 아니다.",
+  "That word… Black Tide. Not a coincidence.",
+  "터널 탈출. 안으로 들어가면 감시가 끊긴다.",
+  "Escape via tunnel. Once inside, surveillance drops.",
+  "뒤를 보지 마. 뒤를 보면 발이 느려져.",
+  "Do not look back. It slows your feet.",
+  "터널 입구! 섬광 던지고 뛰어!",
+  "Tunnel mouth! Flash and go.",
+  "들어가면 소리도 죽는다. 지금이다.",
+  "Once in, the sound dies. Now.",
+  "터널 진입 완료. 숨 돌려.",
+  "Tunnel entry complete. Catch breath.",
+  "다음은 실험실. VIP가 거기로 갔다.",
+  "Next is the lab. VIP went there.",
+  "터널로 빠졌다. 감시망이 끊긴다—잠깐, 저 잡음은 살아있어.",
+  "We are in the tunnel. Cameras drop—hold, static is still alive.",
+  "놈들은 우리를 \"사라지게\" 하지 못해도, \"추적\"은 한다.",
+  "They may not erase us yet, but they can track us.",
+  "Resume tracking.",
+  "다음은 LAB 표식. VIP가 그쪽으로 이동했다.",
+  "Next—LAB marker. VIP moved that way.",
+  "블랙 타이드… 단어 자체가 열쇠다.",
+  "Black Tide… the word itself is a key.",
+  "흔들리지 마. 실험실로 간다.",
+  "Do not wobble. We go to the lab.",
+  "20초… 그게 경고였을까, 테스트였을까.",
+  "Twenty seconds… warning, or test.",
+  "답은 안에서 나온다.",
+  "Answer is inside.",
+  "WHITEGLASS. 실험실 접근. 정면은 함정일 수 있다.",
+  "WHITEGLASS. Approaching the lab. Front door may be bait.",
+  "내부 감시 끊어야 한다. 전원부터.",
+  "We need to cut internal eyes. Power first.",
+  "VIP는 \"정보\"다. 살아서 데려온다.",
+  "VIP is information. We bring him alive.",
+  "진입 준비.",
+  "Ready to breach.",
+  "삭제 승인.",
+  "Deletion approved.",
+  "삭제? 우리를 지운다는 뜻이지.",
+  "Deletion? They mean us.",
+  "VIP가 말한다: BLACK TIDE는 적이 아니라 너희 결재라인이다.",
+  "VIP says: Black Tide is not the enemy—it is your approval chain.",
+  "그러니까… 명령이 적이란 말이네.",
+  "So… the enemy is the order.",
+  "질문은 나중. 지금은 확보.",
+  "Questions later. Secure now.",
+  "정문 접근. 미끼일 수 있다—각부터 본다.",
+  "Approach the front. Could be bait—check angles first.",
+  "유리와 불빛… 소리도 잘 튄다. 숨을 낮춰.",
+  "Glass and light… sound carries. Keep breath low.",
+  "정문은 시선이 몰린다. 우회해서 들어가.",
+  "Front door is watched. Go around.",
+  "바로 안으로. 오래 있지 마.",
+  "Straight in. Do not linger.",
+  "접근 완료. 안으로 찌른다.",
+  "Approach complete. We punch in.",
+  "여기 냄새… 소독약. 그리고 피.",
+  "Disinfectant smell… and blood.",
+  "감시 끊는다. 내부 전원부터 차단.",
+  "Cut surveillance. Power first.",
+  "전원 내려가면, 우리 발소리도 덜 들린다. 지금.",
+  "When power drops, we get quieter. Now.",
+  "전원함. 열어. 눈부터 뽑아.",
+  "Power box. Open it. Pull the eyes.",
+  "BLACK TIDE… 결재라인이라더라. 그럼 우리 승인도 거기서?",
+  "Black Tide… approval chain. So our approvals come from it too?",
+  "전원 차단. 눈을 뽑았다.",
+  "Power cut. Eyes are out.",
+  "삭제 승인… 누가 우리를 지우려 한다.",
+  "Deletion approved… someone wants us erased.",
+  "VIP 확보. 살아서 데려온다.",
+  "Secure the VIP. Bring him alive.",
+  "그 사람이 \"결재라인\"을 안다. 입이 무기야.",
+  "He knows the approval chain. Mouth is a weapon.",
+  "VIP 위치. 방 안쪽. 소리 없이.",
+  "VIP location. Deep inside. Quiet.",
+  "시간 없다. 잡고 나간다.",
+  "No time. Snatch and go.",
+  "VIP 확보 완료. 이동.",
+  "VIP secured. Moving.",
+  "BLACK TIDE가 적이 아니면… 누가 적이지?",
+  "If Black Tide is not the enemy… then who is?",
+  "VIP 호위 탈출. 속도와 엄폐, 둘 다.",
+  "Escort exfil. Speed and cover.",
+  "등 뒤가 뚫리면 VIP부터 날아간다. 붙어.",
+  "If our back opens, VIP goes first. Stay tight.",
+  "VIP 붙잡아. 연막으로 시야 끊어.",
+  "Keep the VIP close. Smoke the sightlines.",
+  "그 채널 또 온다. 우리를 \"폐기\"라 부른다.",
+  "That channel again. It calls us “disposable.”",
+  "탈출 경로 확보. 아직 끝 아냐.",
+  "Exfil route secured. Not over.",
+  "본부가 \"회수\"를 말해. 근데… 느낌이 달라.",
+  "HQ says “retrieve.” But… it feels wrong.",
+  "추적 끊기. 문 봉쇄하고 연막으로 지워.",
+  "Break the tail. Seal doors, smoke out.",
+  "놈들이 우리 발자국을 읽는다. 지워.",
+  "They read our footprints. Wipe them.",
+  "문 봉쇄 지점. 닫고, 가스처럼 빠져.",
+  "Door seal point. Close it, flow out.",
+  "발소리 남기지 마. 흔적이 곧 위치다.",
+  "Do not leave footsteps. Trace equals location.",
+  "추적 끊었다. 숨 돌려.",
+  "Tail broken. Breathe.",
+  "다음 좌표: 해상 플랫폼. 함정 냄새 난다.",
+  "Next coordinates: offshore platform. Smells like a trap.",
+  "VIP 확보. 말은 그쪽이 더 빠르다.",
+  "VIP secured. His mouth is faster than our feet.",
+  "본부가 \"회수\"를 말하는데… 어감이 다르다.",
+  "HQ keeps saying “retrieve”… but it sounds wrong.",
+  "회수. 필요시 폐기.",
+  "Retrieve. Dispose if required.",
+  "우리를 폐기 대상으로 보는 건가.",
+  "They see us as disposable.",
+  "VIP가 좌표를 넘겼다. 해상 플랫폼.",
+  "VIP handed coordinates. Offshore platform.",
+  "그러면 거기서 답을 찾는다.",
+  "Then we find answers there.",
+  "하지만 지금은 탈출. 추적 끊어.",
+  "But first, exfil. Break the tail.",
+  "결재라인… 그럼 누가 도장 찍고 있지?",
+  "Approval chain… then who is stamping it?",
+  "LZ EMBER. 열린 소금벌판이다. 엄폐 없다.",
+  "LZ EMBER. Open salt flat. No cover.",
+  "방어는 \"승리\"가 아니라 \"시간\"이다.",
+  "Defense is not victory. It is time.",
+  "VIP 탑승까지 버티고, 우리도 탄다.",
+  "Hold until VIP boards, then we board.",
+  "헬기 ETA?",
+  "Helicopter ETA?",
+  "회수팀 접근.",
+  "Retrieval team inbound.",
+  "교신이 이상하다. 구조가 아니라 \"회수/삭제\"다.",
+  "Comms are wrong. It is not rescue. It is retrieve and erase.",
+  "그럼 우리가 먼저 탄다. 그들 전에.",
+  "Then we board first. Before them.",
+  "RAVEN, 네가 맨 앞에서 길을 열어.",
+  "RAVEN, you lead. Cut the lane.",
+  "목표: 전진, 방어, 탑승. 단순하게 간다.",
+  "Objectives: advance, hold, board. Keep it simple.",
+  "LZ로 전진. 벌판은 눈이다—노출 줄여.",
+  "Advance to LZ. The flat is an eye—reduce exposure.",
+  "땅이 울린다. 발을 가볍게, 숨을 짧게.",
+  "Ground carries. Light steps, short breath.",
+  "벌판이다. 지형으로 가려. 낮게!",
+  "Open flat. Use terrain. Stay low.",
+  "추적 온다. 소리 내면 바로 찍혀.",
+  "They are coming. Noise gets you tagged.",
+  "전진 완료. 이제 시간 싸움이다.",
+  "Advance complete. Now it is time.",
+  "헬기까지 버틴다. 그게 전부야.",
+  "We hold until the helicopter. That is it.",
+  "착륙지점 방어. 이건 방어가 아니라 지연이다.",
+  "Defend the LZ. This is delay, not defense.",
+  "엄폐 없으면 연막이 엄폐다. 아껴서 깔아.",
+  "No cover means smoke is cover. Use it smart.",
+  "시간만 벌어. 탄은 아끼지 마.",
+  "Just buy time. Do not save rounds.",
+  "헬기 교신… 우리 편 아니다. 회수/삭제다.",
+  "Heli comms… not ours. Retrieve and erase.",
+  "시간 벌었다. VIP 올린다.",
+  "Time bought. VIP boarding.",
+  "교신이 이상해. 우리를 \"회수\"한댔지?",
+  "Comms are wrong. They said “retrieve,” right?",
+  "VIP 탑승 지원. 먼저 태우고, 우리가 산다.",
+  "Support VIP boarding. He boards, we live.",
+  "시야 끊어주면 밀어 넣어. 망설이면 끝.",
+  "Cut sightlines, shove him in. Hesitate and it ends.",
+  "VIP 먼저! 시야 끊어주면 넣어!",
+  "VIP first. Cut sightlines and shove him in.",
+  "우린 마지막. 하지만 멈추면 다 끝.",
+  "We board last. Stop and it ends.",
+  "VIP 탑승 완료. 우리 차례다.",
+  "VIP boarded. Our turn.",
+  "문 닫히면 끝. 뛰어.",
+  "When the door shuts, it is done. Run.",
+  "최종 탑승. 뒤를 정리하고 들어간다.",
+  "Final board. Clear the tail and get in.",
+  "그 채널… 아직도 붙었다. 하지만 지금은 탑승!",
+  "That channel is still on us. But board now.",
+  "탑승 지점! 뛰어!",
+  "Board point. Go.",
+  "문 닫히기 전에 들어가!",
+  "Get in before the door shuts.",
+  "철수 완료. 챕터1 끝.",
+  "Exfil complete. Chapter 1 ends.",
+  "끝났다고 믿고 싶다… 하지만 잡음이 안 죽어.",
+  "I want to believe it is over… but the static lives.",
+  "탑승 완료. 챕터1 종료다.",
+  "Boarding complete. Chapter 1 ends here.",
+  "근데… 아직도 잡음이 따라온다.",
+  "But… the static is still with us.",
+  "이제부터는 우리가 쫓기는 쪽이다.",
+  "From here, we are the hunted.",
+  "비상 채널. 너희가 표적이 됐다. Black Tide를 추적해.",
+  "Emergency channel. You are the target now. Track Black Tide.",
+  "Nova? 살아있었어.",
+  "Nova? You are alive.",
+  "설명은 나중. 챕터2에서 합류한다.",
+  "Explanations later. We link in Chapter 2.",
+  "결재라인이 우리를 먹었다.",
+  "The approval chain just ate us.",
+  "BLACK TIDE 업데이트. 항만 야간 선적, 유령 회사 명의. 실마리는 종이 한 장이다.",
+  "[RADIO] Update: BLACK TIDE. Night shipment at the port under a shell company. Paperwork is the lead.",
+  "오늘은 \"이기러\" 가는 게 아니다. **들어가서, 가져오고, 빠진다.**",
+  "[RADIO] We're not here to win. In, grab it, out.",
+  "상공 시야 열었다. 열상 패턴은 깨끗한데… 깨끗한 게 더 이상해.",
+  "[RADIO] Overwatch is up. Thermals look clean... too clean.",
+  "전자 잠금 걸리면 내가 뚫어. 대신 타이밍은 한 번뿐이야.",
+  "[RADIO] If an electronic lock trips, I'll crack it. One-shot timing.",
+  "연막/섬광 체크. 뒤는 내가 접는다. 너희는 앞으로만 봐.",
+  "[RADIO] Smoke/flash check. I'll cover the rear. Eyes forward.",
+  "RAVEN, 첫 코너에서 멈춰. 소리… 사람 셋. 발목부터 조심해.",
+  "[RADIO] RAVEN, stop at the first corner. Three contacts—watch your feet.",
+  "확인.",
+  "[RADIO] Confirm.",
+  "서류 발신인이 \"너희 지원사(스폰서)\"와 겹친다. 이건 적이 아니라 **라인**이다.",
+  "[RADIO] The sender overlaps our sponsor. This isn't enemy—it's a line.",
+  "…좋아. 그럼 더 조용히 간다. 우리 발자국이 기록되면 끝이니까.",
+  "[RADIO] Go quieter. If our footsteps get logged, we're done.",
+  "[STATIC] Approval pending.",
+  "오른쪽 컨테이너 뒤, 발소리 둘. 숨죽이고 지나가.",
+  "Right.",
+  "연막은 아직 아껴. \"필요할 때\"는 꼭 온다.",
+  "Smoke out. Break line of sight.",
+  "컨테이너 구역 들어가면 동선이 갈린다. **혼자 놀지 마.**",
+  "Move in. Stay low.",
+  "서류 위치 확인. 손대기 전에 사진—증거부터.",
+  "Stand by.",
+  "서류 냄새가… 새거야. 어제 찍은 것처럼. 이상하지?",
+  "Move. Now.",
+  "탈출 라인으로. 여기서부터는 \"조용히\"보다 \"끊기\"다. 흔적을 끊어.",
+  "Stay quiet. Hold your noise.",
+  "섬광 던진다. 시선 끊고, 발소리도 같이 묻어.",
+  "Flash out. Blind them.",
+  "드라이독 진입. 숨을 줄여. 여기선 숨도 기록이 된다.",
+  "왼쪽 사다리, 금속 울림 심해. 땅으로 돌아.",
+  "Left.",
+  "열상 두 개. 시야 겹친다. 박자 맞춰 지나가.",
+  "연막. 시선 끊고, 출구 고정. 뒤는 ATLAS.",
+  "I'll cover the rear.",
+  "이탈 완료. 태그가 살아있어… 이제 모래시계가 돌아간다.",
+  "Exfil. Move now.",
+  "상공은 못 믿는다. 대신 내가 멀리 열상 흔적만 찍어줄게.",
+  "Overwatch is up. Thermals look clean... too clean.",
+  "오른쪽 골짜기, 열상 한 줄. 트럭 동선 같다.",
+  "이탈 라인 확보. 다음은 협곡—Wadi로 간다.",
+  "Area secure.",
+  "지금이다. 소리 끊겼다—매복이 숨 쉬는 타이밍.",
+  "연막! 시선 끊고, 각 잡아—지금이 창구야!",
+  "장비만 확보한다. 대화 길게 하지 마.",
+  "드론 접근. 기록 시작하면, 탈출은 \"추적 이벤트\"가 된다.",
+  "차단 성공. 기록 끊겼다. 이제 탈출.",
+  "뒤쪽 바람 세다. 화염 번지면, 길이 막힌다.",
+  "락 해제 들어간다. 5초. 그 5초에 소리 내지 마.",
+  "문 열리면 들어가서 끝. 오래 머물지 않는다.",
+  "차단 성공하면 추적이 \"끊기는 게 아니라\" \"재탐색\"으로 바뀐다. 그 순간이 위험해.",
+  "We're being tailed. Keep moving.",
+  "길 막히기 전에 나가. 여기서 멈추면, 타버린다.",
+  "연기 속으로. 벽 따라가. 넓은 데는 비워.",
+  "왼쪽에 열상 흔적. 가까워—조심.",
+  "연막은 겹치지 마. 연기 속 연막은 \"깊이\"만 잃는다.",
+  "시간 끝. 지금 이동! 지금이 창구야!",
+  "합류 완료. 전력 회복. 이제 탈출 지점으로.",
+  "숨 돌아왔다. 근데 추적도 숨 돌아왔겠지.",
+  "출구 방향 열상 증가. 그쪽이 막히기 전에 열어야 해.",
+  "확보하면 끝. 오래 있지 않는다.",
+  "확보 완료. 다음은 유리처럼 깨지는 곳… Glasshouse.",
+  "로비는 사선 지옥이다. 모서리만 먹고 전진해.",
+  "섬광! 시선 끊고, 로비 중앙은 밟지 마!",
+  "소리 줄었다… 너무 줄었다. 누가 숨을 죽였다.",
+  "로비 확보. 이제 서버실로.",
+  "열리면 들어가서 끝. 멈추지 마.",
+  "상공에서 패턴 변화. 추적이 이 건물로 몰린다.",
+  "로그 키워드—BLACK TIDE, 승인, 회수. 다 떠.",
+  "Approval received.",
+  "지하 출구 확보. 다음은 Elevator. 전원을 되살려야 한다.",
+  "제어실 장악. 여기서부터는 \"권한\" 싸움이다.",
+  "콘솔 접근. 로그가 뜬다… 승인자 태그가 반복.",
+  "승인자… 이름이 아니라 \"역할\" 같아. 사람을 이름으로 부르지 않아.",
+  "장악 완료. 릴레이로 간다.",
+  "릴레이 끊으면 추적이 한 번 흔들린다. 그 순간을 노려.",
+  "상공 패턴 변화—추적이 재탐색 모드로 바뀐다.",
+  "발자국 간격 넓히지 마. 일정하면 추적이 쉬워.",
+  "연막은 눈 위에서 더 눈에 띈다. 필요할 때만.",
+  "냉기 속 소리… 누가 숨 쉬는 것 같다.",
+  "드라이브 확보. 이게 \"승인 라인\"의 손목이다.",
+  "추적 회피 성공. 숨 고르지 마. 아직 끝 아니다.",
+  "탈출 라인 확보. 다음은 Whiteout. 진짜 백색지대다.",
+  "바람이 오른쪽에서 때린다. 그럼 절벽은 왼쪽일 확률이 커.",
+  "흔적 남기지 마. 일정하게 걷지 마. 추적은 패턴을 먹어.",
+  "이동수단 확보하면, 전장이 바뀐다. 걸어서 이길 싸움이 아니다.",
+  "확보했다. 이제 \"속도\"로 끊는다.",
+  "추격 떨어졌다. 하지만 완전히는 아니야. 다시 붙을 수 있어.",
+  "통로 확보. 이제 산장이다.",
+  "진입. 숨은 쉬되, 잠들진 마. 다음은 더 깊다.",
+  "공장 외곽 잠입 완료. 다음으로.",
+  "좋아, 그 15초에 '위치' 바꾼다. 뛰지 말고, 끊어서 이동.",
+  "내가 막는다. 너희는 전진.",
+  "경보 라인 우회할게. 끊으면 정문 쪽 센서가 잠깐 멍해진다.",
+  "Alarm is up. Stay sharp.",
+  "경보 차단 좋아, 됐다.",
+  "선로 쪽 차량 이동 감지. 너희 쪽으로 '맞춰' 온다.",
+  "철도 구역으로 이동 클린하게 끝냈다.",
+  "오른쪽 사다리 라인에 경비 둘. 둘 다 시야가 겹친다—한 번에 넘기지 마.",
+  "발각! 연막 던지고 각 잡아!",
+  "방어. 여기서 밀리면 터널 문이 닫힌다. 넓게 서지 말고, 각을 끊어.",
+  "Hold. Keep them off us.",
+  "이동 구간 방어 클린하게 끝냈다.",
+  "터널 입구 확보 확인. 이제 아래는 너희 영역.",
+  "들어가면 소리가 먹힌다. 대신… 뒤가 닫힌다. 후회할 시간 없다.",
+  "터널 진입 클린하게 끝냈다.",
+  "오른쪽 능선 끝, 작은 반사 봤다. 스코프일 확률 높아.",
+  "능선 따라 전진 완료. 다음으로.",
+  "패널 잡았다. 열면 내부 센서가 잠깐 켜질 수 있어. 그 순간만 버텨.",
+  "관측 지점 확보하면, 중계 위치 딱 찍는다. 그때 움직인다.",
+  "관측 지점 확보 완료. 다음으로.",
+  "연막은 발밑이 아니라 '상대 시야'에 깔아. 방향 헷갈리게.",
+  "야영지 이탈 클린하게 끝냈다.",
+  "멈추는 건 '휴식'이 아니라 '준비'다. 다음 이동을 만들자.",
+  "업링크 장치 확보/해킹 클린하게 끝냈다.",
+  "탈출로, 돔 뒤편 경사. 거기서 아래로 떨어지면 시야 끊긴다.",
+  "연막. 이번엔 우리 발밑이 아니라, 상대 '예상 경로'에 깔자.",
+  "추격을 떨치고 탈출 클린하게 끝냈다.",
+  "상공 시야 확보. 오른쪽에 열상 하나.",
+  "밸브 패널 열림. 차단하면 경보등이 한 번은 깜빡일 거야.",
+  "USB/모듈 확보. 흔들림 없이.",
+  "비상 통로로 탈출 좋아, 됐다.",
+  "해안 폐허 진입 클린하게 끝냈다.",
+  "상부는 넓고 비어. 그래서 위험해. 각을 끊어서 올라가.",
+  "방파제 상부 확보 완료. 다음으로.",
+  "그 5초를 우리가 만든다. 한 발만 더 버텨.",
+  "Hold for 5 seconds.",
+  "대공/레이더 장비 확보 클린하게 끝냈다.",
+  "도어 잠금 우회 시작. 열리면 바로 들어가서 패널부터 잡아!",
+  "들어가면 좌/우 동시에. 한쪽만 들어가면 문이 다시 닫힌다.",
+  "헬리포트 쪽 경비 이동. 너희를 봉쇄하려 한다.",
+  "연막 깔고 이동. 바람에 흩어지기 전에 통과.",
+  "헬리포트/탈출로 확보 완료. 다음으로.",
+  "정유시설 재진입 좋아, 됐다.",
+  "블랙박스 컨테이너 확보 완료. 다음으로.",
+  "이탈 각 열어. 짧게 교전하고, 끊어.",
+  "반격 저지 후 이탈 클린하게 끝냈다.",
+  "섬광으로 한쪽 눈 뽑고, 반대쪽으로 빠져!",
+  "이제 길을 연다. 이탈 루트 쪽으로!",
+  "최종 이탈 루트 개방 성공적이다.",
+  "플랫폼 최종 진입 클린하게 끝냈다.",
+  "자리 잡는다. 문 열리면 3초 안에 내부 장악.",
+  "서버룸 진입. 화면… '승인/삭제'가 버튼처럼 떠.",
+  "블랙타이드 핵심 서버 장악 좋아, 됐다.",
+  "헬리포트 방향 막힌다. 탈출은 오른쪽 난간 아래.",
+  "연막 전부 쓴다. 지금은 '보여주지 않는' 게 전부야.",
+  "탈출 또는 최후 방어 완료. 다음으로.",
+  "전부 집중. 유령 신호가 잡혔다.",
+  "[RADIO] Eyes up. We caught a ghost signal.",
+  "챕터2에서 종료한 작전 채널이… 다시 살아났어요.",
+  "[RADIO] A closed op channel from Chapter 2 just lit up again.",
+  "끝난 채널이 다시? 누가 장난치나.",
+  "[RADIO] A dead channel comes back? Someone’s messing with us.",
+  "장난이면 다행이죠. 패턴이… Nemesis 서명과 일치합니다.",
+  "[RADIO] If it is, we’re lucky. The pattern matches a Nemesis signature.",
+  "확인만 해라. 흔적은 남기지 말고.",
+  "[RADIO] Verify only. Leave no footprint.",
+  "Raven. 네가 들어간다. 송신 장치부터 확보.",
+  "[RADIO] Raven, you’re going in. Secure the transmitter first.",
+  "확인. 송신지 좌표는?",
+  "[RADIO] Copy. Coordinates on the source?",
+  "교외 중계소. 경계는 약하지만… 지키는 놈이 있을 수 있어요.",
+  "[RADIO] Suburban relay station. Light security, but it may be watched.",
+  "불필요한 교전 금지. 증거 확보 후 즉시 이탈.",
+  "[RADIO] No unnecessary firefights. Grab proof and exfil immediately.",
+  "신호만 잡으면, 다음이 보인다. 움직여.",
+  "[RADIO] Once we have the signal, we see what’s next. Move.",
+  "조용히. 조명 피해서 간다.",
+  "[RADIO] Stay quiet. Avoid the lights.",
+  "신호 강도 상승. 방향 맞아요.",
+  "[RADIO] Signal strength rising. You’re on track.",
+  "비가 발소리 덮는다. 지금이 창이야.",
+  "[RADIO] Rain covers footsteps. This is your window.",
+  "외곽 도착. 카메라 두 대.",
+  "[RADIO] At perimeter. Two cameras.",
+  "좌측 문. 강행하지 마.",
+  "[RADIO] Left door. Don’t force it.",
+  "그쪽 아니에요. 신호가 멀어져요.",
+  "[RADIO] Wrong way. Signal’s fading.",
+  "문 열리면 10초 안에 소스 잡혀요.",
+  "[RADIO] Once you’re in, we lock the source in ten.",
+  "실내 진입. 전력 살아있다.",
+  "[RADIO] Inside. Power’s on.",
+  "누가 관리 중이란 뜻이지. 귀 열어.",
+  "[RADIO] Means someone’s maintaining it. Ears open.",
+  "접촉. 숨고 지나가.",
+  "[RADIO] Contact. Hide and let it pass.",
+  "송신실 우측 랙. 레코더… 물리 장치예요.",
+  "[RADIO] Right rack. Recorder… it’s physical.",
+  "장치 확보. 샘플 시작.",
+  "[RADIO] On device. Starting capture.",
+  "움직임 있으면 중단하고 숨는다. 장치가 우선.",
+  "[RADIO] If you see movement, break off and hide. Device first.",
+  "지금 코드가 떠요… GHOSTLINE.",
+  "[RADIO] Tag just appeared… GHOSTLINE.",
+  "사람 이름 같냐, 시스템 같냐?",
+  "[RADIO] Person name… or machine?",
+  "샘플 완료. 회수.",
+  "[RADIO] Capture complete. Secured.",
+  "추적 태그 있어요. 제거해야 돼요.",
+  "[RADIO] Tracking tag detected. Strip it.",
+  "이탈 경로 변경. 북쪽 골목.",
+  "[RADIO] Exfil route changed. North alley.",
+  "반응 떴어요! 신호가 더 강해져!",
+  "[RADIO] Response triggered! Signal’s spiking!",
+  "교전 허가. 멈추지 마.",
+  "[RADIO] Weapons free. Don’t stall.",
+  "좋아 Raven. 나오면 문 닫는다.",
+  "[RADIO] Good, Raven. Once you’re out, we close it.",
+  "탈출 지점 시야 확보.",
+  "[RADIO] Eyes on exfil.",
+  "단순 송신기가 아니에요.",
+  "[RADIO] This isn’t a simple transmitter.",
+  "뭐가 나왔지?",
+  "[RADIO] What did we get?",
+  "식별자. NEMESIS_NODE-07.",
+  "[RADIO] Identifier. NEMESIS_NODE-07.",
+  "노드면… 여러 개인데.",
+  "[RADIO] Node means… there are more.",
+  "GHOSTLINE은?",
+  "[RADIO] GHOSTLINE?",
+  "송신 주체 태그. 사람/시스템 불명.",
+  "[RADIO] Source tag. Person or system—unknown.",
+  "원본은 내가 관리한다. 즉시 넘겨.",
+  "[RADIO] Original is under my authority. Hand it over.",
+  "분석이 필요—",
+  "[RADIO] We need analysis—",
+  "필요는 내가 판단한다. 다음 좌표로 이동해.",
+  "[RADIO] I decide what’s needed. Move to the next coordinates.",
+  "이건… 누가 켜둔 흔적이에요.",
+  "[WHISPER] This was left running on purpose.",
+  "NODE-07은 단독이 아니에요. 유사 신호가 두 곳 더.",
+  "[RADIO] NODE-07 isn’t alone. Two more matching signals.",
+  "그럼 체인이다. 연결 고리 찾는다.",
+  "[RADIO] Then it’s a chain. We find the link.",
+  "항만이면… 물건이 쏟아지는 곳이지.",
+  "[RADIO] A port… where stuff never stops moving.",
+  "오늘 밤 수송이 있어요. 기록을 잡으면 노드가 보여요.",
+  "[RADIO] There’s a shipment tonight. Records will show the node.",
+  "과잉 개입 금지. 증거만 확보.",
+  "[RADIO] No overreach. Secure evidence only.",
+  "증거만으론 부족해. 체인을 끊는다.",
+  "[RADIO] Evidence isn’t enough. We cut the chain.",
+  "Warden. 선 넘지 마라.",
+  "[RADIO] Warden. Don’t cross the line.",
+  "목표 확인. 기록과 중계 장비.",
+  "[RADIO] Targets confirmed. Records and relay gear.",
+  "가능한 한 조용히.",
+  "[RADIO] As quiet as possible.",
+  "조용히 못 하면… 길게 간다.",
+  "[RADIO] If it goes loud… it goes long.",
+  "패턴 보고.",
+  "[RADIO] Report pattern.",
+  "3인 순찰. 40초 루프.",
+  "[RADIO] Three-man patrol. Forty-second loop.",
+  "신호가 야드 중앙으로 끌려요.",
+  "[RADIO] Signal pulls to the center.",
+  "컨테이너는 미로야. 길 외워.",
+  "[RADIO] Containers are a maze. Memorize your lane.",
+  "오늘 물량 늦는다. 조명 켜.",
+  "[RADIO] Shipment’s late. Turn the lights on.",
+  "사무 컨테이너 진입.",
+  "[RADIO] Entering admin container.",
+  "단말 로그. Manifest-Delta.",
+  "[RADIO] Terminal log. Manifest-Delta.",
+  "키보드 소리 조심.",
+  "[RADIO] Watch your keystrokes.",
+  "오래 끌지 마. 눈이 많다.",
+  "[RADIO] Don’t linger. Too many eyes.",
+  "기록 확보.",
+  "[RADIO] Records secured.",
+  "휴대형 증폭기. 노드 중계 장비.",
+  "[RADIO] Portable amp. Node relay gear.",
+  "회수 우선. 안 되면 파괴.",
+  "[RADIO] Recover first. If not, destroy.",
+  "라벨… NODE-12.",
+  "[RADIO] Label… NODE-12.",
+  "확정. 노드가 여러 개.",
+  "[RADIO] Confirmed. Multiple nodes.",
+  "그럼 누가 이걸 돌려?",
+  "[RADIO] Then who’s running it?",
+  "트럭 출발한다.",
+  "[RADIO] Truck’s rolling.",
+  "폭발 금지. 타이어만.",
+  "[RADIO] No explosives. Tires only.",
+  "차단 완료. 운전석 비움.",
+  "[RADIO] Stopped. Cab is empty.",
+  "자동 운행. 원격 통제.",
+  "[RADIO] Autonomous run. Remote control.",
+  "이탈. 미로에서 나오면 끝.",
+  "[RADIO] Exfil. Out of the maze, we’re clear.",
+  "오른쪽. 신호 잔향이 거기예요.",
+  "[RADIO] Right. Signal echo is there.",
+  "Engaging. 이동 유지.",
+  "[RADIO] Engaging. Keep moving.",
+  "기록에 노드가 더 있어요. NODE-12, NODE-19…",
+  "[RADIO] Records show more nodes. NODE-12, NODE-19…",
+  "Nemesis는 망이다.",
+  "[RADIO] Nemesis is a net.",
+  "트럭이 비어 있었다.",
+  "[RADIO] Truck was empty.",
+  "수송이 자동화. 누가 원격으로.",
+  "[RADIO] Shipment’s automated. Someone remote.",
+  "GHOSTLINE 연동?",
+  "[RADIO] GHOSTLINE link?",
+  "가능성 높아요.",
+  "[RADIO] High probability.",
+  "장비 폐기. 추적 위험.",
+  "[RADIO] Dispose the gear. Trace risk.",
+  "폐기? 분석이 필요—",
+  "[RADIO] Dispose? We need analysis—",
+  "명령이다.",
+  "[RADIO] That’s an order.",
+  "우리가 보지 못하길 원해요.",
+  "[WHISPER] Someone doesn’t want us to see.",
+  "이번 목표는 단순하다. 서버를 정리해라.",
+  "[RADIO] This one’s simple. Clean the server.",
+  "정리? 회수는?",
+  "[RADIO] Clean? Recovery?",
+  "불필요. 파괴가 우선.",
+  "[RADIO] Unnecessary. Destruction first.",
+  "그 서버는 노드 라우팅—",
+  "[RADIO] That server routes node traffic—",
+  "Kade. 선 넘지 마.",
+  "[RADIO] Kade. Don’t cross the line.",
+  "이번엔 증거가 아니라 청소네.",
+  "[RADIO] This is cleanup, not proof.",
+  "겉으론 파괴. 속으론 회수.",
+  "[RADIO] Destroy outside. Recover inside.",
+  "확인. 백업 우선.",
+  "[RADIO] Copy. Backup first.",
+  "승인 흔적이 남아 있을 거예요.",
+  "[RADIO] Approval trails may exist.",
+  "실패하면 너희가 책임진다.",
+  "[RADIO] If you fail, you own it.",
+  "도시 소음에 묻혀. 빠르게.",
+  "[RADIO] City noise covers you. Move.",
+  "측면 진입.",
+  "[RADIO] Side entry.",
+  "유리 깨지 마.",
+  "[RADIO] Don’t break glass.",
+  "내부망 잡히면 위치 찍어요.",
+  "[RADIO] Once on LAN, I’ll mark it.",
+  "지하 점검 끝났나? 문 잠가.",
+  "[RADIO] Basement check done? Lock the door.",
+  "지하 접근.",
+  "[RADIO] Basement.",
+  "패널 4자리. 3회 제한.",
+  "[RADIO] Panel. Four digits. Three tries.",
+  "틀리면 사이렌.",
+  "[RADIO] Miss and it screams.",
+  "해제.",
+  "[RADIO] Unlocked.",
+  "랙 3번. NEMESIS_ROUTER.",
+  "[RADIO] Rack three. NEMESIS_ROUTER.",
+  "이미징 시작.",
+  "[RADIO] Imaging started.",
+  "60초.",
+  "[RADIO] Sixty seconds.",
+  "누가 오면… 너부터.",
+  "[RADIO] If someone comes… you first.",
+  "백업 완료.",
+  "[RADIO] Backup complete.",
+  "승인 로그… 있어요.",
+  "[RADIO] Approval log… found.",
+  "[RADIO] Who?",
+  "HAVELOCK 서명.",
+  "[RADIO] HAVELOCK signature.",
+  "그럼 위에서 알고 있었다.",
+  "[RADIO] Then command knew.",
+  "증거 확보.",
+  "[RADIO] Proof secured.",
+  "Nemesis는 운영 중.",
+  "[RADIO] Nemesis is being operated.",
+  "우린 표적이다.",
+  "[RADIO] We are targets.",
+  "좋아. 이제 진짜.",
+  "[RADIO] Fine. Now it’s real.",
+  "추적 태그… 또.",
+  "[RADIO] Tracking tag… again.",
+  "파괴 연출.",
+  "[RADIO] Staging destruction.",
+  "흔적 남기고 나와.",
+  "[RADIO] Leave the footprint and go.",
+  "원격 삭제 시도. 서둘러요.",
+  "[RADIO] Remote wipe attempt. Hurry.",
+  "Engaging. 계단 막아.",
+  "[RADIO] Engaging. Hold the stairs.",
+  "Havelock이 승인했다.",
+  "[RADIO] Havelock approved it.",
+  "절차처럼요.",
+  "[RADIO] Like procedure.",
+  "우린 청소부였다.",
+  "[RADIO] We were cleanup.",
+  "다음.",
+  "[RADIO] Next.",
+  "정보원이 필요.",
+  "[RADIO] We need an insider.",
+  "백업 즉시 제출.",
+  "[RADIO] Submit that backup now.",
+  "분석 후.",
+  "[RADIO] After analysis.",
+  "거부하면 격리.",
+  "[RADIO] Refuse, isolation.",
+  "우릴?",
+  "[RADIO] Us?",
+  "움직여요. 사라지기 전에.",
+  "[RADIO] Move. Before they vanish.",
+  "정보원 PILOT 연락 두절.",
+  "[RADIO] Insider PILOT went dark.",
+  "마지막 위치.",
+  "[RADIO] Last location.",
+  "시청 보관소. 삭제 명령 직후.",
+  "[RADIO] Municipal archives. Right after the wipe order.",
+  "민간인 많다.",
+  "[RADIO] Civilians everywhere.",
+  "민간 피해 금지.",
+  "[RADIO] No civilian harm.",
+  "방해만 없으면.",
+  "[RADIO] If nobody interferes.",
+  "정보원 우선.",
+  "[RADIO] Insider first.",
+  "REDACTED 블록 복구 가능.",
+  "[RADIO] REDACTED blocks are recoverable.",
+  "그 전에 누가 태워버리겠지.",
+  "[RADIO] Before someone burns it.",
+  "소리 최소. 빠르게.",
+  "[RADIO] Minimal noise. Fast.",
+  "민간인. 총은 최후.",
+  "[RADIO] Civilians. Guns last.",
+  "소리 나면 끝.",
+  "[RADIO] Noise ends it.",
+  "카메라 사각 표시.",
+  "[RADIO] Marking blind spots.",
+  "여기 출입 금지예요…!",
+  "You can’t be in here…!",
+  "진정시켜. 흔적 남기지 마.",
+  "[RADIO] Calm them down. No trace.",
+  "임시 폰 발견.",
+  "[RADIO] Burner phone found.",
+  "메시지: 지하 B2.",
+  "[RADIO] Message: garage B2.",
+  "함정 같다.",
+  "[RADIO] Feels like a trap.",
+  "그래도 간다.",
+  "[RADIO] We go.",
+  "복구 시작.",
+  "[RADIO] Recovery started.",
+  "주변 확보.",
+  "[RADIO] Securing.",
+  "민간인 이동.",
+  "[RADIO] Move civilians.",
+  "목적이 떠요.",
+  "[RADIO] Purpose is surfacing.",
+  "발소리. 뒤.",
+  "[RADIO] Footsteps. Rear.",
+  "복구 완료. 목적 명시.",
+  "[RADIO] Recovered. Purpose stated.",
+  "읽어.",
+  "[RADIO] Read.",
+  "분쟁 유지, 균형 조정, 확전 방지.",
+  "[RADIO] Maintain conflict. Tune balance. Prevent escalation.",
+  "확전 방지? 무기를 뿌리면서?",
+  "[RADIO] Prevent escalation while flooding guns?",
+  "관리 시스템.",
+  "[RADIO] Management system.",
+  "승인 라인… 상부 직속.",
+  "[RADIO] Approval chain… top-level direct.",
+  "Havelock.",
+  "[RADIO] Havelock.",
+  "PILOT가 이걸 넘기려다 잡혔다.",
+  "[RADIO] PILOT tried to pass this and got grabbed.",
+  "맞아요.",
+  "[RADIO] Correct.",
+  "지하 진입.",
+  "[RADIO] Going underground.",
+  "PILOT 신호… 미약.",
+  "[RADIO] PILOT signal… weak.",
+  "Engaging. 민간 피해 금지.",
+  "[RADIO] Engaging. No civilian harm.",
+  "PILOT는?",
+  "[RADIO] PILOT?",
+  "혈흔. 끌림 흔적.",
+  "[RADIO] Blood. Drag marks.",
+  "구출이 아니라 수습.",
+  "[RADIO] Not rescue. Cleanup.",
+  "목적 문서 확보.",
+  "[RADIO] Purpose doc secured.",
+  "그 문서 폐기.",
+  "[RADIO] Destroy that document.",
+  "거부한다.",
+  "[RADIO] Negative.",
+  "격리 대상.",
+  "[RADIO] You are isolated.",
+  "통신 지연… 차단.",
+  "[RADIO] Comms throttled… blocked.",
+  "아군 아니네.",
+  "[RADIO] Not friendly.",
+  "다음은 노드. 균형을 깨.",
+  "[RADIO] Next node. Break the balance.",
+  "노드 시설. 여기서 끊는다.",
+  "[RADIO] Node facility. We cut it here.",
+  "눈 때문에 발자국 남아.",
+  "[RADIO] Snow leaves tracks.",
+  "라우팅 키만 확보하면 노드 무력화 가능.",
+  "[RADIO] With the routing key, we can neutralize the node.",
+  "작전 중지. 즉시 철수하라.",
+  "[RADIO] Abort mission. Stand down now.",
+  "명령 위반. 무력 사용 허가.",
+  "[RADIO] Order violation. Use of force authorized.",
+  "아군이 우릴 쏜다고?",
+  "[RADIO] Friendlies shooting us?",
+  "이제부터는 적이다.",
+  "[RADIO] From here on, they’re hostile.",
+  "서버 과부하 시 연쇄 다운 가능.",
+  "[RADIO] Overload will cascade. Whole chain goes down.",
+  "그럼 돌아갈 길 없다. 진행.",
+  "[RADIO] Then there’s no way back. Proceed.",
+  "바람 소리로 움직여.",
+  "[RADIO] Move with the wind.",
+  "접근 중.",
+  "[RADIO] Closing in.",
+  "열 신호 두 개. 감시탑.",
+  "[RADIO] Two heat signatures. Watchtower.",
+  "우회. 흔적 지워.",
+  "[RADIO] Go around. Erase tracks.",
+  "후문. 20초.",
+  "[RADIO] Back door. Twenty seconds.",
+  "내부 진입.",
+  "[RADIO] Inside.",
+  "키가 또 바뀌었어. 누가 건드렸지?",
+  "Key changed again. Who touched it?",
+  "들었지? 내부 요원.",
+  "[RADIO] Heard that? Inside staff.",
+  "키는 금고/터미널 중 하나.",
+  "[RADIO] Key is in a safe or terminal.",
+  "확보 시도.",
+  "[RADIO] Attempting grab.",
+  "키 확인. NODE-19 루트.",
+  "[RADIO] Key verified. NODE-19 route.",
+  "이제 끝낸다.",
+  "[RADIO] We end it now.",
+  "과부하 시작하면 되돌릴 수 없어요.",
+  "[RADIO] Once overload starts, no rollback.",
+  "그러니까 지금 한다.",
+  "[RADIO] That’s why we do it now.",
+  "멈춰. 마지막 경고다.",
+  "[RADIO] Stop. Final warning.",
+  "너무 늦었어.",
+  "[RADIO] Too late.",
+  "연쇄 다운… 시작.",
+  "[RADIO] Cascade… initiated.",
+  "추격 온다. 멈추지 마.",
+  "[RADIO] Pursuit inbound. Don’t stop.",
+  "노드 신호… 꺼져요.",
+  "[RADIO] Node signal… going dark.",
+  "NODE-07, 12, 19… 전부 다운.",
+  "[RADIO] NODE-07, 12, 19… all down.",
+  "균형이 깨졌다.",
+  "[RADIO] Balance is broken.",
+  "이제 진짜 전쟁이 온다.",
+  "[RADIO] Now the real war comes.",
+  "너희는 반역자다.",
+  "[RADIO] You are traitors.",
+  "우리는 증거를 가졌다.",
+  "[RADIO] We have proof.",
+  "증거는 사라진다.",
+  "[RADIO] Proof disappears.",
+  "그럼 누가 네메시스를 차지하지?",
+  "[RADIO] Then who takes Nemesis?",
+  "'잔재'가 움직일 거예요.",
+  "[RADIO] The remnants will move.",
+  "아직 이름은 없어요. 하지만… 전파에 흔적.",
+  "[RADIO] No name yet. But there’s a signature in the air.",
+  "Havelock이 우리를 적으로 지정했다.",
+  "Havelock flagged us hostile.",
+  "방금… ID가 바뀌었어요. 우리 이름이 사라져요.",
+  "Our IDs just changed. Our names are disappearing.",
+  "말이 돼? 우린 방금까지 '아군'이었잖아.",
+  "How is that real? We were friendly an hour ago.",
+  "BLACKLIST 서버가 돌아가요. 기록을 지우고 새로 씁니다.",
+  "A BLACKLIST server is active. It erases and rewrites records.",
+  "그럼 우리도 '없는 사람'이다.",
+  "Then we’re ghosts.",
+  "\"격리 대상. 접촉 금지. 필요 시 제거.\"",
+  "“Isolate them. No contact. Eliminate if necessary.”",
+  "목표?",
+  "Objective?",
+  "서버 백업을 뽑는다. 우리를 지운 '증거'가 필요해.",
+  "Pull the backup. We need proof they erased us.",
+  "들어가면 3분. 그 뒤엔 추적이 붙어요.",
+  "Once in, you have three minutes. Then you’re tracked.",
+  "좋아. 우릴 지우려면… 먼저 손을 잘라야지.",
+  "Fine. If they want us erased… we cut their hand first.",
+  "은신처 주변에 스캐너 반응. 뭔가 심어놨어요.",
+  "Scanner ping. Something’s planted nearby.",
+  "또 태그야? 아주 습관이네.",
+  "Another tag? They really love tagging.",
+  "발견. 제거한다.",
+  "Found it. Removing.",
+  "손 빠르게. 시간 없다.",
+  "Fast hands. No time.",
+  "좋아요. 이제 외부 추적이 한 번 끊겼어요.",
+  "Good. External trace dropped once.",
+  "데이터센터는 조용히. 경비 깨우지 마.",
+  "Quiet in the data center. Don’t wake security.",
+  "\"목표는 4인. Raven 포함. 사진 업데이트.\"",
+  "“Targets are four. Raven included. Updated photos.”",
+  "사진 업데이트? 미쳤네.",
+  "Photo updates? That’s insane.",
+  "내부망 연결되면 바로 타이머 시작.",
+  "Once on LAN, the timer starts.",
+  "진입. 서버룸 확인.",
+  "In. Server room visual.",
+  "백업 드라이브는 레드 라벨. 'BL-VAULT'.",
+  "Backup drive has a red label. BL-VAULT.",
+  "드라이브부터. 다른 건 나중.",
+  "Drive first. Everything else later.",
+  "확보.",
+  "Secured.",
+  "오른쪽 계단. 출구는 남쪽.",
+  "Right stairs. Exit is south.",
+  "들켰다. Engaging!",
+  "We’re blown. Engaging!",
+  "멈추지 마. 이탈이 목표다.",
+  "Don’t stop. Exfil is the mission.",
+  "추격 확인.",
+  "Pursuit confirmed.",
+  "백업 안에… '승인자' 필드가 있어요.",
+  "The backup has an “approver” field.",
+  "Havelock 서명 잡아.",
+  "Get Havelock’s signature.",
+  "백업에 승인 로그가 있어요. 삭제 지시가… 상부로부터.",
+  "Backup shows approval logs. The deletion order came from the top.",
+  "그럼 이제 증거는 하나.",
+  "Then we have one piece of proof.",
+  "하나론 부족해. 세상은 안 믿어.",
+  "One isn’t enough. The world won’t believe it.",
+  "Next.",
+  "PILOT… 살아있을 가능성 있어요. 이동 흔적이 남아.",
+  "PILOT might be alive. There’s a transfer trail.",
+  "어디로.",
+  "Where to.",
+  "비공식 구금시설. AEGIS 라인.",
+  "An off-book holding site. AEGIS line.",
+  "좋다. 살아있으면 말하게 만들자.",
+  "Good. If he’s alive, he talks.",
+  "\"너희는 더 이상 우리 편이 아니다.\"",
+  "“You are no longer ours.”",
+  "상관없다. 이제부터는 우리가 정한다.",
+  "Doesn’t matter. We decide now.",
+  "이동 기록 확인. PILOT는 '정리'가 아니라 '이송'됐어요.",
+  "Transfer logs confirm. PILOT was moved, not cleaned.",
+  "그럼 아직 살아있다.",
+  "Then he’s still alive.",
+  "아니면… 살아있는 척만 하게 해놨겠지.",
+  "Or they’re keeping him “alive enough.”",
+  "시설은 폐공장으로 위장. 내부는 AEGIS가 지켜요.",
+  "The site is a disguised factory. AEGIS runs it.",
+  "\"PILOT는 입을 열면 안 된다.\"",
+  "“PILOT must not talk.”",
+  "목표는 구출.",
+  "Objective is extraction.",
+  "구출 + 증언. 녹음 확보.",
+  "Extract and record. Get testimony.",
+  "시설 안쪽에서만 통신 가능. 외부는 먹통.",
+  "Comms only work inside. Outside is dead.",
+  "좋네. 그럼 조용히 찢고 들어가자.",
+  "Great. Then we cut in quiet.",
+  "Raven 선두. 문 열면 끝까지 간다.",
+  "Raven on point. Once the door opens, we commit.",
+  "조용히. 여기서 들키면 문이 잠긴다.",
+  "Quiet. If we’re spotted, doors lock down.",
+  "외곽 확인. 감시 2, 순찰 1.",
+  "Perimeter visual. Two watchers, one patrol.",
+  "열화상에 한 명이 '무전기' 들고 있어요. 리더.",
+  "Thermal shows one with a radio. Likely lead.",
+  "리더부터 눕히면 조용해진다.",
+  "Drop the lead, it gets quiet.",
+  "\"침입 징후 있으면 즉시 격리. 질문 금지.\"",
+  "“Any intrusion, isolate immediately. No questions.”",
+  "진입.",
+  "In.",
+  "구금동 패널은 2단. 먼저 전원 차단.",
+  "Detention panel is two-stage. Cut power first.",
+  "전원? 좋아. 어둠은 우리 편.",
+  "Power? Good. Dark is our friend.",
+  "문 개방.",
+  "Door open.",
+  "Raven. 소리 최소.",
+  "Raven. Minimal noise.",
+  "대상 확인. PILOT.",
+  "Visual on target. PILOT.",
+  "…Raven? 진짜냐…",
+  "Raven… is that real…",
+  "말은 나중에. 움직일 수 있어?",
+  "Talk later. Can you move?",
+  "Havelock… 그가… 전부 승인했어.",
+  "Havelock… he approved all of it.",
+  "녹음 켜요. 지금.",
+  "Start recording. Now.",
+  "짧게. 핵심만.",
+  "Short. Only key points.",
+  "Nemesis는… 균형 장치야. 누군가가 전쟁을 '조절'해.",
+  "Nemesis is a balance device. Someone “controls” war.",
+  "경보! 문 잠김!",
+  "Alarm! Doors locking!",
+  "Engaging! 뚫는다!",
+  "Engaging! We punch through!",
+  "PILOT 지켜. 이탈!",
+  "Protect PILOT. Exfil!",
+  "그들은 기록을 지우고… 사람도 지운다.",
+  "They erase records… and they erase people.",
+  "BLACKLIST는 Havelock 직속.",
+  "BLACKLIST is Havelock direct.",
+  "Nemesis 잔재는 어디로 간다.",
+  "Where does the Nemesis residue go.",
+  "암시장. 'MERCER'… 장부를 갖고 있어.",
+  "The black market. Mercer… he has the ledger.",
+  "이름 나왔다. 좋다.",
+  "We got a name. Good.",
+  "SPECTER… 그 태그 봤다고 했죠?",
+  "SPECTER… you saw that tag, right?",
+  "봤어. 누군가가 잔재를 '승계'하려 해.",
+  "I did. Someone’s trying to inherit the residue.",
+  "그게 다음 전쟁이다.",
+  "That’s the next war.",
+  "\"증언은 무의미하다. 세상은 듣지 않는다.\"",
+  "“Testimony is meaningless. The world won’t listen.”",
+  "녹음 확보. 이건 '증언'이에요.",
+  "Recording secured. That’s testimony.",
+  "증언만으로는 부족하다.",
+  "Testimony isn’t enough.",
+  "그래서 장부가 필요.",
+  "That’s why we need the ledger.",
+  "MERCER는 거래로만 움직여… 돈, 혹은 공포.",
+  "Mercer moves by deals… money or fear.",
+  "다음 목표. 암시장.",
+  "Next target. The black market.",
+  "경로는 항만. 야간 시장이 열려요.",
+  "Route is the docks. Night market opens.",
+  "\"PILOT는 회수 대상. 즉시 반납.\"",
+  "“PILOT is reclaimable. Return him now.”",
+  "반납은 없다.",
+  "No returns.",
+  "이제부터는 우리가 사냥꾼이다.",
+  "From now on, we hunt.",
+  "서두르자… 그들이 먼저 찾기 전에.",
+  "Hurry… before they reach him first.",
+  "MERCER. 장부를 가진 브로커.",
+  "Mercer. The broker with the ledger.",
+  "암시장 통신에 그의 태그가 보여요. 'MRC-R'.",
+  "I see his tag on black-market comms. MRC-R.",
+  "사람 많은 곳. 총 쏘면 끝.",
+  "Crowded place. Gunfire ends it.",
+  "MERCER는 안전을 산다. 자기만의 룸이 있어.",
+  "Mercer buys safety. He has his own room.",
+  "접근 방식?",
+  "Approach?",
+  "대화로 들어가고, 필요하면 빼앗는다.",
+  "We enter by talk, and we take if needed.",
+  "장부는 실물일 확률 높아요. 디지털은 너무 위험.",
+  "Ledger is likely physical. Digital is too risky.",
+  "좋아. 그러면 가방 하나면 끝.",
+  "Good. Then it’s one bag and done.",
+  "\"시장에 손대면, 전부 불태운다.\"",
+  "“Touch the market, I burn it all.”",
+  "불태우기 전에 꺼내온다.",
+  "We pull it out before it burns.",
+  "인파는 방패이자 감옥이다.",
+  "Crowds are shields and cages.",
+  "무기 반출 태그 차단했어요. 겉으론 민간인.",
+  "Weapon tags masked. You look civilian.",
+  "시장 진입.",
+  "Entering market.",
+  "MERCER 태그, 30미터 전방. 컨테이너 안쪽.",
+  "Mercer tag, thirty meters. Inside the container line.",
+  "눈 마주치지 마. 걸어.",
+  "Don’t make eye contact. Walk.",
+  "MERCER는 네가 '겁먹지' 않았는지 본다.",
+  "Mercer checks if you’re scared.",
+  "목표 시야 확보.",
+  "Visual on target.",
+  "누굴 찾지?",
+  "Who are you looking for?",
+  "장부. Nemesis 잔재 거래.",
+  "The ledger. Nemesis residue deals.",
+  "그 단어 함부로 꺼내지 마. 여기선 다 죽어.",
+  "Don’t say that word out loud. People die here.",
+  "우리도 죽을 줄 알아.",
+  "We know how to die.",
+  "주변 보안 움직임. AEGIS가 시장에 들어왔어요.",
+  "Security movement. AEGIS entered the market.",
+  "거래 끝. 장부 내놔.",
+  "Deal’s over. Hand the ledger.",
+  "공짜는 없어. \"대가\"가 필요해.",
+  "Nothing’s free. I need payment.",
+  "대가는 여기.",
+  "Payment is here.",
+  "가방 확보!",
+  "Bag secured!",
+  "총기 감지! Engaging 전환!",
+  "Gun scan! Switching to engaging!",
+  "인파 피해서 좌측 라인!",
+  "Left lane. Avoid the crowd!",
+  "이탈.",
+  "Exfil.",
+  "장부에 노드 거래 내역이 있어요.",
+  "The ledger has node deal records.",
+  "이름.",
+  "Names.",
+  "수신자 코드… 'SHADE'라는 중간 태그.",
+  "Receiver code… a middle tag named SHADE.",
+  "SPECTER 쪽 냄새다.",
+  "Smells like SPECTER.",
+  "SHADE는 얼굴이 없어. 움직이는 건 '사람'이 아니라 '흐름'.",
+  "SHADE has no face. It’s not a person—it's a flow.",
+  "다음 목표?",
+  "Next target?",
+  "장부에 '코어 운송' 일정. 내일 새벽.",
+  "Ledger shows a core transport schedule. Tomorrow dawn.",
+  "매복한다. 물증이 필요해.",
+  "We ambush. We need physical proof.",
+  "\"암시장을 건드렸다. 이제 경고는 없다.\"",
+  "“You touched the market. No more warnings.”",
+  "좋아. 우리도 경고는 끝.",
+  "Fine. Warnings are over for us too.",
+  "장부에 나온 '코어 운송'이 오늘입니다.",
+  "The core transport is today.",
+  "경로.",
+  "Route.",
+  "터널 통과 후 검문소. 거기서 속도가 떨어져요.",
+  "After the tunnel, a checkpoint. Speed drops there.",
+  "거기서 잡는다. 짧게, 세게.",
+  "We hit there. Short and hard.",
+  "코어는 증거이자 미끼야. 누가 회수하러 올 거다.",
+  "The core is proof and bait. Someone will come to reclaim it.",
+  "목표는 코어 확보.",
+  "Objective: secure the core.",
+  "폭발은 최소. 코어 손상 금지.",
+  "Minimal explosives. Do not damage the core.",
+  "차량 3대. 가운데가 코어.",
+  "Three vehicles. Middle carries the core.",
+  "그럼 가운데만 꺾으면 된다.",
+  "Then we bend the middle.",
+  "교전은 짧게. 이탈이 중요.",
+  "Keep the fight short. Exfil matters.",
+  "터널 출구. 여기서 숨겨.",
+  "Tunnel exit. Hide here.",
+  "차량 접근. 30초.",
+  "Vehicles inbound. Thirty seconds.",
+  "숨 쉬지 마.",
+  "Don’t breathe.",
+  "시야 확보.",
+  "Visual.",
+  "가운데 차량. 속도 일정.",
+  "Middle vehicle. Steady speed.",
+  "선두부터 꺾어.",
+  "Bend the lead first.",
+  "Engaging!",
+  "선두 정지.",
+  "Lead stopped.",
+  "후미가 우회! 조심!",
+  "Rear is diverting! Watch it!",
+  "코어 차량에 붙어!",
+  "Stick to the core vehicle!",
+  "코어 차량 정지.",
+  "Core vehicle stopped.",
+  "그 상자… 신호가 '살아있어요'.",
+  "That box… the signal is alive.",
+  "그게 Nemesis의 심장 조각이다.",
+  "That’s a piece of Nemesis heart.",
+  "이거 들고 나가면 세상이 믿겠지.",
+  "With this, the world might believe.",
+  "AEGIS 접근! 드론!",
+  "AEGIS inbound! Drones!",
+  "이탈 루트 변경. 우측 산길.",
+  "Route change. Right mountain road.",
+  "코어 확보. 이동.",
+  "Core secured. Moving.",
+  "추격 한 대 눕혔다!",
+  "Dropped one pursuer!",
+  "놔둬. 코어가 우선.",
+  "Leave it. Core first.",
+  "코어의 서명… Nemesis 라우팅과 동일.",
+  "Core signature matches Nemesis routing.",
+  "이제 물증은 두 개. 백업과 코어.",
+  "Now we have two pieces. Backup and core.",
+  "충분하냐?",
+  "Is it enough?",
+  "송출하면… 흔들릴 겁니다.",
+  "If we broadcast it… it will shake things.",
+  "HAVELOCK은 막을 거야. 전파든, 사람을 보내든.",
+  "Havelock will stop it. Signal or soldiers.",
+  "그럼 방송 시설.",
+  "Then we hit broadcast.",
+  "다음 미션. 송출.",
+  "Next mission. Broadcast.",
+  "시설은 오래된 송신탑. 하지만 커버리지가 커요.",
+  "Old broadcast tower. Wide coverage.",
+  "좋아. 세상이 듣게 하자.",
+  "Good. Let the world hear.",
+  "\"코어를 넘겨라. 마지막 기회다.\"",
+  "“Hand over the core. Last chance.”",
+  "코어, 백업, 증언. 세 개를 묶어 송출한다.",
+  "Core, backup, testimony. We broadcast all three.",
+  "송신탑에 들어가면, 90초면 송출 가능.",
+  "Inside the tower, ninety seconds to air.",
+  "90초면… 세상이 바뀌거나, 우리가 죽거나.",
+  "Ninety seconds… world changes or we die.",
+  "송출만 되면, Havelock은 '부정'하기 어려워.",
+  "If it airs, Havelock can’t easily deny it.",
+  "방해 요소?",
+  "Interference?",
+  "전파 재머 가능성. AEGIS도 올 거예요.",
+  "Signal jammer possible. AEGIS will come.",
+  "Raven, 장비실 확보. Kade는 업링크.",
+  "Raven, secure the equipment room. Kade handles uplink.",
+  "내가 문 막는다. 들어오면… 끝.",
+  "I’ll hold the door. If they come in… it ends.",
+  "\"송출은 반역이다.\"",
+  "“Broadcast is treason.”",
+  "반역이 아니라, 진실이다.",
+  "Not treason. Truth.",
+  "바람이 세요. 발소리 덜 들릴 겁니다.",
+  "Wind’s strong. Footsteps are masked.",
+  "이번엔 바람이 우리 편.",
+  "This time, the wind helps.",
+  "탑 진입.",
+  "Entering tower.",
+  "장비실부터. 위로 올라가면 끝.",
+  "Equipment room first. Then we climb.",
+  "전원 켜야 해요. 스위치 두 개.",
+  "Need power. Two switches.",
+  "스위치 확보.",
+  "Switches secured.",
+  "업링크 시작. 90초.",
+  "Uplink started. Ninety seconds.",
+  "90초. 짧다.",
+  "Ninety seconds. Short.",
+  "\"송신탑 확보. 대상 제거.\"",
+  "“Secure the tower. Remove targets.”",
+  "왔다. Engaging 준비.",
+  "They’re here. Prep engaging.",
+  "재머 신호! 출력이 떨어져요!",
+  "Jammer! Output dropping!",
+  "재머 위치?",
+  "Jammer location?",
+  "옥상 서쪽. 안테나 옆.",
+  "West rooftop. Near antenna.",
+  "내가 막는다. 너는 부숴.",
+  "I’ll hold. You break it.",
+  "재머 파괴.",
+  "Jammer destroyed.",
+  "출력 회복! 30초!",
+  "Output restored! Thirty seconds!",
+  "세상이 듣게 해…",
+  "Let them hear…",
+  "전부는 못 나갔어요. 하지만 '코어 서명'은 나갔어요.",
+  "Not all of it aired. But the core signature did.",
+  "그걸로 충분하다. 씨앗은 심었다.",
+  "That’s enough. The seed is planted.",
+  "대신 우리 위치는 전부 까였지.",
+  "And our location got burned.",
+  "Havelock이 직접 움직일 거야.",
+  "Havelock will move personally.",
+  "\"불법 송출 확인. 대상 즉시 사살.\"",
+  "“Illegal broadcast confirmed. Kill on sight.”",
+  "…새 태그. SHADE가 반응했어요.",
+  "New tag. SHADE reacted.",
+  "SPECTER 라인이 움직인다.",
+  "SPECTER line is moving.",
+  "그러면 전쟁이 '업그레이드' 되는 거네.",
+  "Then the war just got upgraded.",
+  "송출! 일부 나갔어요!",
+  "Broadcast! Partial air!",
+  "위치 노출! 전부 달라붙어요!",
+  "Position exposed! Everyone’s converging!",
+  "일부 송출로도 반응이 커요. 내부 포럼이 난리예요.",
+  "Even partial air caused a huge reaction. Internal boards are on fire.",
+  "좋다. 흔들렸다.",
+  "Good. It shook.",
+  "이제 AEGIS가 더 독해진다.",
+  "Now AEGIS gets meaner.",
+  "AEGIS의 키를 뺏어야 해. 그래야 숨을 쉰다.",
+  "We need AEGIS keys. That’s how we breathe.",
+  "다음 목표는 AEGIS.",
+  "Next target is AEGIS.",
+  "PALADIN이 현장 통제를 해요. 그를 끊으면 추적이 느려져요.",
+  "Paladin controls field ops. Cut him, pursuit slows.",
+  "M11. 손 자른다.",
+  "M11. We cut the hand.",
+  "\"너희가 한 일의 대가를 치러라.\"",
+  "“Pay for what you’ve done.”",
+  "오케이. 계산하자.",
+  "Fine. Let’s do the math.",
+  "AEGIS 전진 지휘소 위치 잡았어요. 드론 패드가 있어요.",
+  "Located AEGIS forward post. It has a drone pad.",
+  "드론이 우리를 따라붙는다. 그걸 끊는다.",
+  "Drones keep tracking us. We cut that.",
+  "PALADIN도 거기?",
+  "Paladin there too?",
+  "확실치 않아요. 하지만 통제 키는 있어요.",
+  "Not sure. But control keys are there.",
+  "키만 빼앗아도 '블라인드' 만들 수 있어.",
+  "With the keys, we can blind them.",
+  "목표는 통신룸.",
+  "Objective is comm room.",
+  "조용히 들어가. 키 확보. 드론 패드 무력화.",
+  "Quiet entry. Secure keys. Disable drone pad.",
+  "\"AEGIS는 흔들리면 안 된다.\"",
+  "“AEGIS must not be shaken.”",
+  "그럼 흔들어야지.",
+  "Then we shake it.",
+  "시작.",
+  "Go.",
+  "외곽 카메라 루프 12초. 그때 지나가요.",
+  "Camera loop is twelve seconds. Move then.",
+  "이 정도면 거의 '군대'가 아니라 '청소팀'인데.",
+  "This feels like a cleanup crew, not an army.",
+  "맞아. 그게 AEGIS야.",
+  "Exactly. That’s AEGIS.",
+  "\"대상 사진 갱신. 접근 시 사살.\"",
+  "“Update target photos. Shoot on contact.”",
+  "통신룸 문. 오른쪽.",
+  "Comm room door. Right.",
+  "패널에서 'AUTH-FRAG' 찾으세요.",
+  "Look for AUTH-FRAG on the panel.",
+  "좋아. 이제 드론 눈을 뽑자.",
+  "Good. Now we pull the drone eyes.",
+  "드론 패드는 전원 2개 끊으면 끝.",
+  "Drone pad goes down if we cut two feeds.",
+  "전원 차단.",
+  "Power cut.",
+  "\"침입! 통신룸!\"",
+  "“Intrusion! Comm room!”",
+  "Engaging. 하지만 짧게.",
+  "Engaging. Keep it short.",
+  "나간다!",
+  "We’re out!",
+  "추적 드론 신호… 끊겼어요. 좋아요.",
+  "Drone tracking signal… dropped. Good.",
+  "키 조각이면… Havelock 라인 일부 열릴 거야.",
+  "With the key fragment… we can open part of Havelock’s line.",
+  "M12. 다음은 '누가' 잔재를 모으는지다.",
+  "M12. Next, who’s collecting the residue.",
+  "SHADE 위치가 떠요. 단, 함정일 수 있어요.",
+  "SHADE location popped. Could be a trap.",
+  "키 조각 확보. 이걸로 일부 권한을 가장할 수 있어요.",
+  "Key fragment secured. We can spoof partial authority.",
+  "추적 압박은?",
+  "Pursuit pressure?",
+  "드론은 잠깐 눈이 멀었어요. 하지만 오래 안 가요.",
+  "Drones are blind for now. Not for long.",
+  "그럼 빨리 끝내야 한다.",
+  "Then we finish fast.",
+  "SHADE를 잡아야 해. 그게 SPECTER 라인이야.",
+  "We need SHADE. That’s the SPECTER line.",
+  "다음 목표. SHADE 접촉.",
+  "Next target. SHADE contact.",
+  "\"너희는 스스로를 파괴하고 있다.\"",
+  "“You are destroying yourselves.”",
+  "아니. 우리는 진실을 드러낸다.",
+  "No. We expose the truth.",
+  "좌표 전송. M12.",
+  "Sending coordinates. M12.",
+  "좋아. 그림자 잡자.",
+  "Good. Let’s catch the shadow.",
+  "SHADE 좌표는 지하 터널. 오래된 물류거점.",
+  "SHADE coordinates: underground tunnel. Old logistics hub.",
+  "함정일 확률.",
+  "High chance of trap.",
+  "함정이면… 우리가 터뜨리면 된다.",
+  "If it’s a trap… we break it.",
+  "SHADE는 직접 나오지 않아. 대신 '거래'만 남겨.",
+  "SHADE won’t show in person. Only deals and trails.",
+  "목표는 정보 확보.",
+  "Objective is intel capture.",
+  "그들이 잔재를 회수하는 방식이 보이면, 다음이 보입니다.",
+  "If we see how they collect residue, we see what’s next.",
+  "Raven 선두. 증거 우선. 생포 가능하면 생포.",
+  "Raven on point. Proof first. Capture if possible.",
+  "\"SPECTER 태그는 존재하지 않는다.\"",
+  "“SPECTER does not exist.”",
+  "존재하지 않는데… 왜 부정하지?",
+  "It doesn’t exist… so why deny it?",
+  "움직인다.",
+  "터널은 메아리 커요. 소리 관리.",
+  "Tunnel echoes. Manage noise.",
+  "소리 관리… 참 어렵다.",
+  "Noise control… sure.",
+  "조명 피해서 이동.",
+  "Move off the lights.",
+  "바닥에 마킹. 회수팀이 쓴 표식.",
+  "Floor markings. Recovery team signs.",
+  "그 표식… Nemesis 잔재 거래에서 봤어.",
+  "Those signs… I’ve seen them in residue trades.",
+  "물류거점 도착.",
+  "At hub.",
+  "코어는 버리고 잔재만 챙긴다고?",
+  "They ditch the core and grab residue?",
+  "잔재가 '키'일 수도 있어요. 권한, 접근, 통제.",
+  "Residue could be a key. Access. Control.",
+  "SHADE 흔적 찾는다.",
+  "Find SHADE’s trail.",
+  "단서 확보. 음성 파일.",
+  "Intel secured. Audio file.",
+  "\"전쟁은 끝나지 않는다. 주인만 바뀐다.\"",
+  "“War never ends. Only the owner changes.”",
+  "SHADE 음성… '주인'이라는 표현.",
+  "SHADE voice… the word “owner.”",
+  "Nemesis는 도구였다. 이제 누가 들고 있지?",
+  "Nemesis was a tool. Who holds it now?",
+  "SPECTER. 잔재를 모아 '계승'하려 해.",
+  "SPECTER. He collects residue to inherit it.",
+  "그래서 '잔재'만 챙기는 거구나.",
+  "That’s why they only take residue.",
+  "\"너희가 건드린 건, 내 통제 밖이다.\"",
+  "“What you touched is beyond my control.”",
+  "처음으로 인정했군.",
+  "First time you admit it.",
+  "새 태그 활성화… 'SPECTER_ROUTE'.",
+  "New tag active… SPECTER_ROUTE.",
+  "접촉 증가.",
+  "Contacts increasing.",
+  "전쟁 2라운드다.",
+  "This is war, round two.",
+  "…이건 선언이에요.",
+  "That’s a declaration.",
+  "\"회수 개시. 방해자 제거.\"",
+  "“Recovery started. Remove interferers.”",
+  "Engaging. 핵심 오브젝트 우선.",
+  "Engaging. Secure the key object.",
+  "이놈들… AEGIS가 아니야.",
+  "These guys… not AEGIS.",
+  "맞아. '새 조직'이야.",
+  "Right. A new group.",
+  "터널 붕괴 징후! 이탈!",
+  "Tunnel collapse warning! Exfil!",
+  "SHADE 메시지 확보. 그리고 회수팀 장비.",
+  "SHADE message secured. And recovery gear.",
+  "확인됐다. 잔재 승계.",
+  "Confirmed. Residue inheritance.",
+  "Havelock은 이제 '주인'이 아니라 '장애물'.",
+  "Havelock isn’t the owner anymore. He’s an obstacle.",
+  "하지만 그는 아직 강해. AEGIS도 살아있고.",
+  "But he’s still strong. AEGIS is still alive.",
+  "다음?",
+  "Next?",
+  "Pro 구간에서, SPECTER 라인의 핵심 인물/거점을 찾아야 해요.",
+  "In Pro, we must locate the SPECTER line’s core people and hubs.",
+  "그리고 Havelock의 마지막 카드를 뺏는다.",
+  "And we take Havelock’s last card.",
+  "\"너희는… 통제 불가다.\"",
+  "“You are… uncontrollable.”",
+  "맞아. 이제부터 '통제'는 끝.",
+  "Correct. Control ends now.",
+  "M13로 간다.",
+  "We go to M13.",
+  "HAVELOCK 은폐 문서가 '아카이브'에 있어요.",
+  "Havelock’s cover docs are in an archive.",
+  "문서만으론 부족하다. 서명과 흐름이 필요해.",
+  "Docs alone aren’t enough. We need signatures and flow.",
+  "그가 '정리'할 때 쓰는 문장… 항상 같았어.",
+  "His cleanup wording… always the same.",
+  "같은 문장은 흔적이지.",
+  "Same words leave a trail.",
+  "문서 확보. 그리고 내부 고발자(BISHOP) 접촉.",
+  "Secure the docs, then contact Bishop.",
+  "BISHOP는 겁먹었어요. 우리가 먼저 가야 해.",
+  "Bishop is scared. We go first.",
+  "\"기록은 진실이 아니다. 기록이 진실을 만든다.\"",
+  "“Records aren’t truth. Records make truth.”",
+  "그럼 오늘은 기록을 훔치자.",
+  "Then we steal the record today.  ------------------------------ M13 — Objectives (3~5) ------------------------------ O1. 아카이브 잠입(보안 회피) O2. “정리 지시 문서” 확보(서명/타임스탬프) O3. BISHOP와 접선(안전 라인) O4. 추적 회피 후 이탈  ------------------------------",
+  "카메라 각도 3초 빈틈. 지금.",
+  "Camera gap, three seconds. Now.",
+  "종이 때문에 목숨 거는 것도 웃기네.",
+  "Dying for paper is funny.",
+  "종이가 사람을 살린다.",
+  "Paper saves people.",
+  "폴더명 'ISOLATION—AEGIS'.",
+  "Folder name: ISOLATION—AEGIS.",
+  "문서 확인. 서명… HAVELOCK.",
+  "Confirmed. Signature… Havelock.",
+  "그 서명… 내가 본 그 서명이야.",
+  "That signature… I’ve seen it.",
+  "\"접근 권한 없음.\"",
+  "“Access denied.”",
+  "경보 전 단계. 20초.",
+  "Pre-alarm stage. Twenty seconds.",
+  "필요 자료만. 나간다.",
+  "Only what we need. Move.",
+  "너희… 진짜로 살아있었구나.",
+  "You… you’re really alive.",
+  "말해. HAVELOCK이 뭘 숨겨.",
+  "Talk. What is he hiding.",
+  "회계가… 코어 운송에 붙어있어. '비공식 예산'.",
+  "Finance ties to core transports. Off-book funding.",
+  "좌표?",
+  "Coordinates?",
+  "전진 지휘 벙커. 거기서 '최종 삭제'를 해.",
+  "A forward bunker. That’s where final deletion happens.",
+  "최종 삭제? 듣기 싫은 단어네.",
+  "Final deletion… hate that phrase.",
+  "\"문서를 가져가도 늦었다.\"",
+  "“Taking documents won’t change the outcome.”  ------------------------------ M13 — Cutscene B (DEBRIEF) [8+] ------------------------------ 1) KADE KO: 문서 + 회계 단서 확보. 이젠 ‘흐름’이 보여요. EN: Docs and finance leads secured. We see the flow now.",
+  "다음은 벙커.",
+  "Next is the bunker.",
+  "벙커면 AEGIS 풀세트겠네.",
+  "A bunker means full AEGIS.",
+  "HAVELOCK은 거기서 사람도 지워.",
+  "Havelock deletes people there too.",
+  "그럼 거길 부순다.",
+  "Then we break it.",
+  "M14. \"Final Delete\" 노드 접근.",
+  "M14. Access the Final Delete node.",
+  "\"증인부터 회수한다.\"",
+  "“Recover the witness first.”",
+  "PILOT은 우리가 지킨다.",
+  "We protect Pilot.",
+  "문서 + 회계 단서 확보. 이젠 '흐름'이 보여요.",
+  "Docs and finance leads secured. We see the flow now.",
+  "벙커 안에 '삭제 노드'가 있어요.",
+  "The bunker houses a deletion node.",
+  "그걸 뽑으면? 기록 복구 가능?",
+  "If we pull it, can we restore records?",
+  "일부는 가능. 최소한 '누가' 했는지는 박혀요.",
+  "Partially. At least “who” is stamped.",
+  "그럼 박아두고 세상에 던지자.",
+  "Then we stamp it and throw it to the world.",
+  "HAVELOCK이 여기 자주 와. 직접 확인해.",
+  "Havelock visits this place. He checks it himself.",
+  "목표는 노드.",
+  "Objective is the node.",
+  "내부 민간인 없나?",
+  "Any civilians inside?",
+  "없어. '없는 사람'만 있어요.",
+  "No. Only “non-people.”",
+  "\"정리 완료까지 30분.\"",
+  "“Cleanup completes in thirty minutes.”",
+  "그 전에 끝낸다.",
+  "We finish before that.  ------------------------------ M14 — Objectives (3~5) ------------------------------ O1. 벙커 침투(외곽 감시 무력화) O2. 삭제 노드 룸 진입(2단 잠금) O3. 삭제 노드(하드/키) 확보 O4. 추적 차단(전원 차단/재머) O5. 이탈  ------------------------------",
+  "문이 두 겹. 첫 번째는 카드, 두 번째는 생체.",
+  "Two-layer door. Card first, bio second.",
+  "생체? 그럼 손이 필요하네.",
+  "Bio? Then we need a hand.",
+  "확보한다.",
+  "I’ll get it.",
+  "\"지하 구역 봉쇄. 대상 접근 시 사살.\"",
+  "“Lock the underground. Kill on approach.”",
+  "Raven, 서두른다.",
+  "Raven, hurry.",
+  "생체 통과.",
+  "Bio passed.",
+  "노드 룸… 신호가 이상해요. '이중 라인'.",
+  "Node room… strange signal. Dual line.",
+  "SPECTER 라인… 섞였을 수도.",
+  "SPECTER line… could be mixed in.",
+  "좋아. 둘 다 뽑자.",
+  "Good. We pull both.",
+  "노드 확보.",
+  "Node secured.",
+  "이거… '삭제 목록'이 실시간 업데이트 중.",
+  "This… deletion list updates live.",
+  "이름 읽지 마. 집중.",
+  "Don’t read names. Focus.",
+  "\"침입 감지.\"",
+  "“Intrusion detected.”",
+  "삭제 목록… '승인자 HAVELOCK'. 반복이에요.",
+  "Deletion list… approver: Havelock. Repeating.",
+  "충분하다.",
+  "That’s enough.",
+  "…내 이름도 있었어.",
+  "…My name was on it.",
+  "이제 그가 끝이야.",
+  "Then he’s done.",
+  "근데… 다른 승인자도 있어요. SHADE.",
+  "But… there’s another approver. SHADE.",
+  "SPECTER가 이미 끼어들었다.",
+  "SPECTER is already inside.",
+  "\"그 노드를 내려놔라. 지금.\"",
+  "“Put that node down. Now.”",
+  "거절.",
+  "Negative.",
+  "M15로. 이걸 '법'에 넣어야 해요.",
+  "To M15. We put this into law.  ------------------------------",
+  "전원 차단하면 추적이 느려져요.",
+  "Cut power, pursuit slows.",
+  "Move out!",
+  "\"너희는 증거를 가져가도 무너진다.\"",
+  "“Even with proof, you will fall.”  ------------------------------ M14 — Cutscene M (THE LIST) [8+] ------------------------------ 트리거: O3 노드 확보 직후",
+  "BISHOP가 말한 '감사 라인'… 접속 가능해요.",
+  "Bishop’s audit line… we can access it.",
+  "그럼 공식 절차로 죽여버리자.",
+  "Then we kill him with procedure.",
+  "공식 절차? 그는 그걸 비웃어.",
+  "Procedure? He laughs at that.",
+  "그래서 실물로 때린다.",
+  "That’s why we hit with physical proof.",
+  "M15. 감사 서버 업로드.",
+  "M15. Upload to audit servers.",
+  "\"업로드하면, 너희를 폭도로 만든다.\"",
+  "“Upload it, and I’ll brand you terrorists.”",
+  "이미 폭도 취급이잖아요.",
+  "We’re already branded.",
+  "삭제 노드 확보. 이제 숨길 수 없다.",
+  "Deletion node secured. He can’t hide now.",
+  "감사 서버는 민간 위장. 총 쏘면 끝.",
+  "Audit servers are civilian-front. Gunfire ends it.",
+  "그럼 조용히 박는다.",
+  "Then we plant it quietly.",
+  "박는 건 좋은데, AEGIS도 올 거야.",
+  "Planting is fine. AEGIS will come.",
+  "HAVELOCK은 '테러' 프레임 씌울 거야.",
+  "Havelock will frame us as terrorists.",
+  "업로드 목표.",
+  "Upload objective.",
+  "노드 데이터 + 코어 서명 + 증언을 패키지로.",
+  "Node data, core signature, testimony—one package.",
+  "업로드가 끝나면, 시스템이 자동으로 복제한다.",
+  "Once uploaded, the system auto-replicates.",
+  "\"복제 전에 제거해.\"",
+  "“Remove them before replication.”",
+  "늦었어.",
+  "Too late.  ------------------------------ M15 — Objectives (3~5) ------------------------------ O1. 허브 내부 침투(민간 피해 0) O2. 감사 라인 접속(서버 룸) O3. 증거 패키지 업로드(카운트다운) O4. 회수팀 저지(필수) O5. 민간 구역으로 빠져나가 이탈  ------------------------------",
+  "민간 많아요. 소리 줄여요.",
+  "Civilians everywhere. Keep it down.",
+  "오늘은 '신사'로 하자.",
+  "Today we play gentlemen.",
+  "서버룸 진입.",
+  "In server room.",
+  "업로드 시작. 60초.",
+  "Upload started. Sixty seconds.",
+  "60초면 끝이다.",
+  "Sixty seconds and done.",
+  "\"증거 회수. 흔적 제거.\"",
+  "“Recover evidence. Remove traces.”",
+  "클리너? 와… 지저분하네.",
+  "Cleaner? That’s dirty.",
+  "복제 단계 진입. 30초.",
+  "Replication stage. Thirty seconds.",
+  "접촉.",
+  "Contact.",
+  "Engaging. 하지만 민간 쪽으로 밀지 마.",
+  "Engaging. Keep it away from civilians.",
+  "오른쪽 라인 정리!",
+  "Right line cleared!",
+  "내 목소리도… 올라가?",
+  "My voice… is it going up too?",
+  "올라가요. 이제 못 지워요.",
+  "Yes. It can’t be erased now.",
+  "완료! 복제 시작!",
+  "Done! Replication started!",
+  "\"그래도 너희는 죽는다.\"",
+  "“You still die.”",
+  "죽기 전에 끝낸다.",
+  "We end it first.",
+  "이제 '공식'으로 전쟁이다.",
+  "Now it’s official war.  ------------------------------ M15 — Cutscene B (DEBRIEF) [8+] ------------------------------ 1) KADE KO: 업로드 성공. 시스템에 박혔어요. EN: Upload success. It’s embedded in the system.",
+  "HAVELOCK 반응은?",
+  "Havelock response?",
+  "전국 수배 + 자산 동결. 그리고… '직접 추적' 지시.",
+  "Nationwide manhunt, asset freeze, and… a direct hunt order.",
+  "하하. 드디어 얼굴 보여주나.",
+  "Heh. So he shows his face now.",
+  "그가 도망칠 거야. 마지막 거래를 하려고.",
+  "He’ll run. For one last deal.",
+  "Where.",
+  "산악 통신기지. 그곳에서 전파를 끊고 빠져나갈 수 있어.",
+  "Mountain comms base. He can cut signals and slip out.",
+  "M16. 통신기지.",
+  "M16. Comms base.",
+  "업로드 성공. 시스템에 박혔어요.",
+  "Upload success. It’s embedded in the system.",
+  "HAVELOCK이 통신기지를 켰어요. '블라인드 존'을 만들 겁니다.",
+  "Havelock activated the comm base. He’ll create a blind zone.",
+  "진실을 덮는 거지.",
+  "He’s burying the truth.",
+  "덮기 전에 찢자.",
+  "Let’s rip it open.",
+  "그 기지는 AEGIS 핵심이야. 팔라딘도 올 거야.",
+  "That base is AEGIS core. Paladin will be there.",
+  "목표는 전파.",
+  "Objective is the signal.",
+  "돔 안에 재머 코어. 꺼야 해요.",
+  "Inside the dome is a jammer core. It must go down.",
+  "민간 피해는?",
+  "Civilian risk?",
+  "없음. 대신… 추락 위험. 폭발 금지.",
+  "None. But… fall risk. No big explosives.",
+  "\"침묵이 곧 질서다.\"",
+  "“Silence is order.”",
+  "그 질서, 깨자.",
+  "We break that order.  ------------------------------ M16 — Objectives (3~5) ------------------------------ O1. 기지 외곽 침투(눈보라 시야 활용) O2. 레이더 돔 진입(경비 우회) O3. 재머 코어 비활성화(손상 최소) O4. PALADIN 접촉/교전 O5. 이탈(설원 추격)  ------------------------------",
+  "바람 때문에 발자국이 빨리 지워져요.",
+  "Wind erases footprints fast.",
+  "이번엔 자연이 도와준다.",
+  "Nature’s helping us.",
+  "돔 시야 확보.",
+  "Visual on dome.",
+  "조용히 올라간다.",
+  "We climb quiet.",
+  "\"기지 방어. 재머 유지.\"",
+  "“Hold the base. Keep jammer online.”",
+  "코어 접근. 배선 3개.",
+  "Core access. Three lines.",
+  "절단.",
+  "Cutting.",
+  "출력 하락. 50%.",
+  "Output down. Fifty percent.",
+  "계속해!",
+  "Keep going!",
+  "코어 비활성.",
+  "Core offline.",
+  "전파 복구. 블라인드 존 붕괴.",
+  "Signal restored. Blind zone collapsed.",
+  "너희가 문제다.",
+  "You are the problem.",
+  "아니. 네 상관이 문제다.",
+  "No. Your boss is.",
+  "Havelock 전용 채널이… 잠깐 열렸어요.",
+  "Havelock’s private channel… briefly opened.",
+  "\"너희는… 시스템을 모른다.\"",
+  "“You… don’t understand the system.”",
+  "시스템이 사람을 지우면, 그건 시스템이 아니다.",
+  "If a system erases people, it isn’t a system.",
+  "\"질서가 필요했다.\"",
+  "“Order was necessary.”",
+  "질서? 너는 편했겠지.",
+  "Order? Must’ve been convenient.",
+  "\"SPECTER는 내가 통제할 수 없다…\"",
+  "“SPECTER is beyond my control…”",
+  "인정했어요. SPECTER 존재.",
+  "He admitted it. SPECTER exists.",
+  "M17. 도주 루트를 끊는다.",
+  "M17. We cut his escape route.  ------------------------------",
+  "Havelock 위치가 흔들려요. 기지 의존이 컸어요.",
+  "Havelock’s position is slipping. He relied on this base.",
+  "그는 이제 도망칠 거야. 안전한 곳으로.",
+  "He’ll run now. Somewhere safe.",
+  "안전한 곳은 없다.",
+  "There is no safe place.  ------------------------------ M16 — Cutscene M (HAVELOCK’S CRACK) [8+] ------------------------------ 트리거: O3 코어 비활성화 직후",
+  "이제 그가 도망치면, 도망 '증거'도 남는다.",
+  "If he runs now, even the run is proof.",
+  "팔라딘은?",
+  "Paladin?",
+  "살아있어. 하지만 흔들렸어요.",
+  "Alive. But shaken.",
+  "흔들리면 더 위험해져.",
+  "Shaken men become dangerous.",
+  "M17로.",
+  "To M17.",
+  "도주 루트는 철도 화물선 + 헬기.",
+  "Escape route is rail freight and a helicopter.",
+  "끊는다.",
+  "We cut it.",
+  "전파 복구. 그리고 '직접 음성' 확보.",
+  "Signal restored. And we got his direct voice.",
+  "HAVELOCK 도주 준비. 화물기지에서 이동.",
+  "Havelock prepping escape. Moving via rail yard.",
+  "오늘 끊는다.",
+  "We cut it today.",
+  "도주 루트 끊고… 그를 끌어내.",
+  "Cut the escape and drag him out.",
+  "그는 '거래'로 빠질 거야. 잔재를 넘기고 살 길을 찾겠지.",
+  "He’ll try a deal. Trade residue for survival.",
+  "목표는 이동 차단.",
+  "Objective: stop the move.",
+  "열차 차량 1대가 '보안'으로 따로 움직여요.",
+  "One rail car moves under extra security.",
+  "그게 HAVELOCK 카드다.",
+  "That’s Havelock’s card.",
+  "\"출발. 흔적 남기지 마.\"",
+  "“Depart. Leave no trace.”",
+  "흔적? 우리가 남겨주지.",
+  "Trace? We’ll leave one.  ------------------------------ M17 — Objectives (3~5) ------------------------------ O1. 화물기지 잠입(경비 회피) O2. 보안 차량 식별 및 정지 O3. 도주 수단(헬기/열차) 무력화 O4. “거래 패킷”(잔재 이동 문서/키) 확보 O5. 이탈  ------------------------------",
+  "열차 출발 4분 전.",
+  "Train departs in four minutes.",
+  "4분이면 충분해.",
+  "Four minutes is enough.",
+  "보안 차량 확인.",
+  "Security car visual.",
+  "정지시켜.",
+  "Stop it.",
+  "\"출발 유지. 방해자 제거.\"",
+  "“Maintain departure. Remove interferers.”",
+  "헬기 패드에도 움직임. '특수 화물' 적재.",
+  "Movement at helipad. Loading special cargo.",
+  "두 갈래다. Raven, 패킷부터.",
+  "Two lanes. Raven, get the packet first.",
+  "패킷 확보.",
+  "Packet secured.",
+  "내용… '잔재 인계'. 수신자: SHADE.",
+  "Contents… residue handoff. Receiver: SHADE.",
+  "그가 SPECTER에게 살 길을 구걸한다.",
+  "He’s begging SPECTER for a way out.",
+  "헬기 날린다!",
+  "Helicopter’s going down!",
+  "좋아. 이제 도망은 없다.",
+  "Good. No escape now.",
+  "\"너희가 날 잡아도, 끝나지 않는다.\"",
+  "“Even if you catch me, it won’t end.”",
+  "끝나게 만든다.",
+  "We make it end.",
+  "좌표 갱신. HAVELOCK이 '벙커'로 이동.",
+  "New ping. Havelock is moving to a bunker.",
+  "Act V 시작이다.",
+  "Act V begins.  ------------------------------ M17 — Cutscene B (DEBRIEF) [8+] ------------------------------ 1) WARDEN KO: 도주 수단 끊음. 패킷 확보. EN: Escape cut. Packet secured.",
+  "수신자 SHADE 명시. 이제 SPECTER 라인도 잡을 실마리.",
+  "SHADE named. We can trace the SPECTER line now.",
+  "하지만 HAVELOCK은 아직 숨는다.",
+  "But Havelock still hides.",
+  "벙커로 가면… 최후의 삭제를 할 거야.",
+  "In the bunker… he’ll attempt final deletion.",
+  "그 전에 끝.",
+  "Before that, we end it.",
+  "M18. 벙커 진입 루트는 협곡. 차량 이동.",
+  "M18. Canyon route. Vehicle move.",
+  "\"Act V? 너희는 이야기를 모른다.\"",
+  "“Act V? You don’t know the story.”",
+  "우리는 결말을 쓴다.",
+  "We write the ending.",
+  "도주 수단 끊음. 패킷 확보.",
+  "Escape cut. Packet secured.",
+  "벙커 입구는 협곡 끝. 이동 중 매복 예상.",
+  "Bunker entry at canyon end. Expect ambush.",
+  "벙커만 닿으면 된다.",
+  "We just need to reach it.",
+  "닿기 전에 부서질 수도 있지.",
+  "Might break before we reach.",
+  "AEGIS는 여기서 끝내려 할 거야.",
+  "AEGIS will try to finish us here.",
+  "우회로 하나. 하지만 지뢰 가능성.",
+  "One detour. Mines possible.",
+  "우회로 간다. 느려도 살아야 해.",
+  "Take detour. Slow but alive.",
+  "\"협곡에서 끝내.\"",
+  "“End them in the canyon.”",
+  "오케이. 협곡에서 춤추자.",
+  "Fine. Let’s dance in the canyon.  ------------------------------ M18 — Objectives (3~5) ------------------------------ O1. 협곡 진입(차량 이동) O2. 매복 돌파(지뢰/장애물) O3. AEGIS 차량 저지(선택) O4. 벙커 입구 도달  ------------------------------",
+  "전방 장애물. 속도 줄여요.",
+  "Obstacle ahead. Slow down.",
+  "지뢰 냄새 난다.",
+  "Smells like mines.",
+  "Checking.",
+  "드론 접근. AEGIS.",
+  "Drones inbound. AEGIS.",
+  "Engaging 유지. 멈추면 죽는다.",
+  "Stay engaging. Stop and you die.",
+  "왼쪽 터졌다!",
+  "Left side blew!",
+  "우회.",
+  "Detouring.",
+  "벙커만 가면… 끝낼 수 있어.",
+  "Reach the bunker… and we can end it.",
+  "후방 차량 접근. 두 대.",
+  "Two vehicles closing from rear.",
+  "하나는 내가 막는다!",
+  "I’ll block one!",
+  "Raven, 앞만 봐.",
+  "Raven, eyes forward.",
+  "추격 한 대 정지 확인!",
+  "One pursuer disabled!",
+  "추격 유지! 더 가까워요!",
+  "Pursuit holding! They’re closer!",
+  "벙커 입구 시야.",
+  "Visual on bunker entry.",
+  "들어간다.",
+  "Go in.",
+  "\"문을 닫아.\"",
+  "“Close the door.”",
+  "문 닫히기 전에! 뛰어요!",
+  "Before it seals! Run!",
+  "In.  ------------------------------ M18 — Cutscene B (DEBRIEF) [8+] ------------------------------ 1) WARDEN KO: 벙커 진입 성공. 이제 위는 닫혔다. EN: We’re in the bunker. Surface is sealed.",
+  "안쪽 네트워크가 살아있어요. HAVELOCK이 여기 있어요.",
+  "Inside network is live. Havelock is here.",
+  "그럼 이제 사냥 끝.",
+  "Then the hunt ends.",
+  "…조심해. 그는 마지막에 가장 위험해.",
+  "…Careful. He’s most dangerous at the end.",
+  "M19.",
+  "벙커 진입 성공. 이제 위는 닫혔다.",
+  "We’re in the bunker. Surface is sealed.",
+  "벙커는 3구역. 서버룸-작전실-탈출로.",
+  "Bunker has three sectors. Server, ops, escape.",
+  "HAVELOCK은 작전실. 삭제 명령을 내릴 거다.",
+  "Havelock is in ops. He’ll issue deletion.",
+  "그럼 먼저 서버룸부터.",
+  "Then server room first.",
+  "팔라딘이 문을 막을 거야.",
+  "Paladin will block the doors.",
+  "목표는 서버 + 작전실.",
+  "Objectives: server and ops.",
+  "서버룸에서 \"최종 키\"를 뽑아야 삭제가 멈춰요.",
+  "Pull the final key in server to stop deletion.",
+  "키 뽑고, HAVELOCK 잡는다.",
+  "Pull key, then catch Havelock.",
+  "\"삭제 시작.\"",
+  "“Deletion begins.”",
+  "그럼 더 빨리 가자.",
+  "Then we go faster.  ------------------------------ M19 — Objectives (3~5) ------------------------------ O1. 서버룸 돌파(키 확보) O2. “최종 삭제” 정지(키 제거/코드) O3. PALADIN 교전(문 봉쇄 해제) O4. 작전실 진입(HAVELOCK 위치 압박)  ------------------------------",
+  "삭제 카운트다운. 5분.",
+  "Deletion countdown. Five minutes.",
+  "5분이면 충분.",
+  "Five is enough.",
+  "서버룸 접촉.",
+  "Contact at server room.",
+  "문 두꺼워. 내가 연다.",
+  "Thick door. I’ll open it.",
+  "최종 키… 찾았어요. 빼면 멈춰요.",
+  "Found the final key. Pull it to stop.",
+  "키 확보.",
+  "Key secured.",
+  "삭제 정지. 목록 업데이트 멈춤.",
+  "Deletion stopped. List updates halted.",
+  "너희는 여기서 끝난다.",
+  "You end here.",
+  "아니. 너부터 끝난다.",
+  "No. You end first.",
+  "팔라딘 강하다!",
+  "Paladin is strong!",
+  "그는 명령만 본다. 명령을 끊어!",
+  "He only sees orders. Cut the order!",
+  "그의 단말기! 지휘 채널!",
+  "His device! Command channel!",
+  "단말기 파괴.",
+  "Device destroyed.",
+  "…명령…?",
+  "…Orders…?",
+  "끝.",
+  "End.",
+  "작전실 문 열렸어요!",
+  "Ops door is open!",
+  "\"여기까지 오나…\"",
+  "“You came all this way…”",
+  "끝낼 때가 됐다.",
+  "Time to end it.",
+  "\"너희가 진실이라 믿는 건… 조작이다.\"",
+  "“What you call truth… is manipulation.”",
+  "조작은 당신이 했어요.",
+  "You did the manipulation.",
+  "\"SPECTER가 이길 거다.\"",
+  "“SPECTER will win.”",
+  "그럼 너부터 지워.",
+  "Then we delete you first.",
+  "…그의 탈출로를 찾아.",
+  "…Find his escape.",
+  "\"마지막 문은… 내 것이다.\"",
+  "“The last door… is mine.”  ------------------------------",
+  "In.  ------------------------------ M19 — Cutscene M (DOOR TO HAVELOCK) [8+] ------------------------------ 트리거: O3 완료 직후",
+  "지하 수로. 출구는 댐 아래.",
+  "Underground waterway. Exit under the dam.",
+  "좋아. 물길이면… 추격전이다.",
+  "Good. Waterway means chase.",
+  "그가 나가면, SPECTER와 거래할 거야.",
+  "If he gets out, he’ll deal with SPECTER.",
+  "못 나간다.",
+  "He won’t.",
+  "M20. 수로.",
+  "M20. The waterway.",
+  "HAVELOCK이 작전실에서 빠져나갔어요. 탈출로.",
+  "Havelock slipped from ops. Escape route.",
+  "수로는 소리 크고, 시야 좁아요.",
+  "Waterway is loud and tight.",
+  "HAVELOCK은 혼자?",
+  "Havelock alone?",
+  "호위 잔존. 그리고… 다른 팀 신호.",
+  "Some escort remains. And… another team signal.",
+  "다른 팀?",
+  "Another team?",
+  "SPECTER 라인일 수도 있어.",
+  "Could be SPECTER line.",
+  "목표는 HAVELOCK 확보.",
+  "Objective: secure Havelock.",
+  "사살 가능. 하지만 가능하면 '말'하게 해.",
+  "Kill authorized. But if possible, make him talk.",
+  "\"너희는 나 없으면 더 빨리 무너진다.\"",
+  "“Without me, you collapse faster.”",
+  "상관없어.",
+  "Doesn’t matter.  ------------------------------ M20 — Objectives (3~5) ------------------------------ O1. 수로 진입 및 추격(호위 제거) O2. HAVELOCK 위치 압박(탈출 차단) O3. 최종 대치(확보 또는 사살) O4. ‘거래 패킷’ 최종 회수(선택)  ------------------------------",
+  "물소리 때문에 무전이 깨져요. 짧게 말해요.",
+  "Water noise breaks comms. Keep it short.",
+  "알겠어. 짧게 죽여.",
+  "Copy. Short kills.",
+  "흔적 확인.",
+  "Trail confirmed.",
+  "오른쪽 갈림길.",
+  "Right fork.",
+  "\"대상( HAVELOCK ) 확보 우선. 방해자 제거.\"",
+  "“Secure Havelock first. Remove interferers.”",
+  "SPECTER 라인이다.",
+  "That’s SPECTER line.",
+  "그가 거래하려는 거야… 진짜로.",
+  "He’s really trying to deal.",
+  "멈춰. 내가 가진 걸로… 너희도 살 수 있다.",
+  "Stop. With what I have… you can survive too.",
+  "살려고 사람을 지웠나.",
+  "You erased people to survive.",
+  "질서가 필요했다. 내가 아니면 누가 했겠나.",
+  "Order was needed. If not me, who?",
+  "SPECTER가 하고 있어요.",
+  "SPECTER is doing it now.",
+  "그놈은 미쳤다! 너희는… 도구가 될 거다!",
+  "He’s insane! You’ll become tools!",
+  "도구는 네가 만들었지.",
+  "You made tools.",
+  "Raven. 끝내.",
+  "Raven. End it.",
+  "패킷 회수! SHADE 좌표 포함!",
+  "Packet recovered! SHADE coordinates included!",
+  "…이건 끝이 아니다…",
+  "…This isn’t the end…",
+  "끝이다.",
+  "It ends.",
+  "다른 팀이 온다. 이탈!",
+  "Another team’s coming. Exfil!  ------------------------------ M20 — Cutscene B (DEBRIEF) [8+] ------------------------------ 1) WARDEN KO: HAVELOCK 사망 확인. EN: Havelock is confirmed dead.",
+  "…세상은 이제 '공백'을 본다.",
+  "The world will see a vacuum now.",
+  "공백은 누가 채우지?",
+  "Who fills a vacuum?",
+  "SPECTER. 그건 이미 시작됐어.",
+  "SPECTER. It already started.",
+  "패킷에 SHADE 좌표가 있으면, 아직 끊을 수 있어요.",
+  "If the packet has SHADE coords, we can still cut it.",
+  "다음 목표. SHADE.",
+  "Next target. SHADE.",
+  "Act V는 끝났지만, 전쟁은 시작이다.",
+  "Act V ends, but the war begins.",
+  "\"주인이 바뀌었다. 축하해.\"",
+  "“The owner changed. Congratulations.”",
+  "…이새X들.",
+  "…Those bastards.",
+  "HAVELOCK 사망 확인.",
+  "Havelock is confirmed dead.",
+  "HAVELOCK 사망 소식이 퍼졌어요. 잔재 시장이 폭발 중.",
+  "Havelock’s death is out. Residue market is exploding.",
+  "누가 들어오나.",
+  "Who’s moving in?",
+  "IRON VOW, CIPHER CELL… 그리고 SHADE 라인.",
+  "Iron Vow, Cipher Cell… and the SHADE line.",
+  "한 장소에 다 모인다고?",
+  "All in one place?",
+  "공백은 모두를 미치게 해.",
+  "Vacuum makes everyone insane.",
+  "목표.",
+  "Objective.",
+  "충돌 속에서 \"잔재 컨테이너\" 확보. 그리고 SHADE 흔적 추적.",
+  "Secure the residue container and trace SHADE.",
+  "컨테이너엔 '증폭기 파편'이 있어요. 키가 될 수 있어요.",
+  "The container holds amplifier shards. Could be keys.",
+  "오케이. 그럼 우리가 키를 가진다.",
+  "Okay. Then we hold the keys.  ------------------------------ M21 — Objectives (3~5) ------------------------------ O1. 창고지대 진입(교전 회피 불가) O2. 잔재 컨테이너 확보(봉인 해제) O3. 다중 세력 교전 속 이탈로 확보 O4. SHADE 흔적(표식/무전) 확보  ------------------------------",
+  "무전이 셋이 겹쳐요. 세력 세 개.",
+  "Three radio nets overlapping. Three factions.",
+  "지옥이다.",
+  "This is hell.",
+  "\"컨테이너 확보! 잔재는 무기다!\"",
+  "“Secure the container! Residue is a weapon!”",
+  "\"가격 올려. 이건 키야.\"",
+  "“Raise the price. This is a key.”",
+  "Raven, 컨테이너만 보고 가.",
+  "Raven, eyes only on the container.",
+  "봉인장치 2개. 양쪽.",
+  "Two seals. Both sides.",
+  "내가 왼쪽.",
+  "I take left.",
+  "오른쪽 해제.",
+  "Right seal off.",
+  "열림!",
+  "Open!",
+  "저 표식… SPECTER 라인.",
+  "That mark… SPECTER line.",
+  "흔적만 잡아. 깊게 들어가지 마.",
+  "Only trace it. Don’t go deep.",
+  "\"공백을 즐겨. 우리는 이미 다음을 만들었어.\"",
+  "“Enjoy the vacuum. We already built the next.”",
+  "다음? 뭔데.",
+  "Next? What is it.",
+  "좌표가 남았어요. M22로 이어져요.",
+  "Coordinates left behind. Leads to M22.",
+  "M22. 문을 닫는다.",
+  "M22. We close the door.  ------------------------------ M21 — Cutscene B (DEBRIEF) [8+] ------------------------------ 1) KADE KO: 증폭기 파편 확보. 잔재 승계에 필요한 ‘키 조각’이에요. EN: Amplifier shards secured. Key fragments for inheritance.",
+  "SPECTER가 원하는 것.",
+  "What SPECTER wants.",
+  "그가 얻으면, 전쟁을 조절할 수 있어.",
+  "If he gets it, he can control war.",
+  "그럼 못 얻게 하면 된다.",
+  "Then we stop him.",
+  "SHADE의 '거점' 좌표. 폐지하 교차로.",
+  "SHADE hub coordinates. Abandoned underground junction.",
+  "M22. 끝까지 간다.",
+  "M22. We go all the way.",
+  "\"Raven, 너는 결말을 좋아하지?\"",
+  "“Raven, you like endings, right?”",
+  "끝내준다.",
+  "I end things.",
+  "증폭기 파편 확보. 잔재 승계에 필요한 '키 조각'이에요.",
+  "Amplifier shards secured. Key fragments for inheritance.",
+  "여기서 잔재 인계가 이뤄져요. '승계' 현장.",
+  "Residue handover happens here. Inheritance site.",
+  "SHADE를 잡는다. 혹은 최소한 끊는다.",
+  "We catch SHADE. Or at least cut the line.",
+  "쉽지 않을 거다.",
+  "Won’t be easy.",
+  "SPECTER는 직접 안 나와. 대신 '결과'로 말해.",
+  "SPECTER won’t show. He speaks through results.",
+  "목표는 인계 파괴.",
+  "Objective: disrupt the handover.",
+  "인계 장치가 작동하면, 잔재가 '활성' 상태로 넘어가요.",
+  "If the rig runs, residue transfers active.",
+  "장치부터. 그리고 SHADE 흔적 확보.",
+  "Rig first. Then SHADE trace.",
+  "좋아. 끝내자.",
+  "Good. Let’s finish it.",
+  "\"주인은 바뀌었다.\"",
+  "“The owner changed.”",
+  "…방금 그 음성.",
+  "…That voice.  ------------------------------ M22 — Objectives (3~5) ------------------------------ O1. 교차로 잠입(감시 회피) O2. 인계 장치(리그) 위치 확인 O3. 리그 비활성화/파괴(핵심) O4. SHADE 추적(도주 루트 차단) O5. 이탈(붕괴/추격)  ------------------------------",
+  "조명 적어요. 소리 더 크게 들려요.",
+  "Low light. Sound carries.",
+  "그럼 더 조용히 죽이면 되지.",
+  "Then we kill quieter.",
+  "리그 시야.",
+  "Visual on rig.",
+  "저게 승계 장치다. 끊어.",
+  "That’s the inheritance rig. Cut it.",
+  "\"인계 진행. 방해자 제거.\"",
+  "“Proceed handover. Remove interference.”",
+  "이 전술… AEGIS랑 달라.",
+  "This tactic… not AEGIS.",
+  "리그에는 우리 코어 서명과 비슷한 파형. 위험해요.",
+  "Rig matches our core signature. Dangerous.",
+  "비활성화.",
+  "Disabling.",
+  "늦었어. 이미 시작됐어.",
+  "Too late. It already started.",
+  "아직 안 끝났다.",
+  "Not finished.",
+  "리그 출력 70… 60… 떨어져요!",
+  "Rig output 70… 60… dropping!",
+  "리그 파괴.",
+  "Rig destroyed.",
+  "…근데 '한 줄'이 남았어요. 백업 라인.",
+  "…There’s one line left. Backup line.",
+  "백업?",
+  "Backup?",
+  "\"준비는 끝났다.\"",
+  "“Preparation is complete.”",
+  "…그는 '우회로'를 가지고 있어.",
+  "…He has a detour.",
+  "SHADE 잡아!",
+  "Get SHADE!",
+  "다음엔 '이유'도 알려주지.",
+  "Next time, I’ll tell you the reason.",
+  "터널 붕괴! 이탈!",
+  "Tunnel collapse! Exfil!  ------------------------------ M22 — Cutscene B (DEBRIEF) [8+] ------------------------------ 1) WARDEN KO: 리그는 부쉈다. 하지만 SHADE는 놓쳤다. EN: Rig destroyed. SHADE escaped.",
+  "백업 라인… SPECTER가 대비했어요.",
+  "Backup line… SPECTER planned for it.",
+  "그럼 승계는 '부분 성공'?",
+  "So inheritance is partially successful?",
+  "네. 그래서 더 위험해.",
+  "Yes. That makes it worse.",
+  "SPECTER는 이제 전면에 나온다.",
+  "SPECTER comes forward now.",
+  "HAVELOCK은 끝났다. 하지만 전쟁은 '주인'을 바꿨다.",
+  "Havelock is gone. But war changed owners.",
+  "다음은 SPECTER 라인의 거점. 그리고… 그가 원하는 '나머지 조각'.",
+  "Next: SPECTER hubs. And… the remaining fragments he wants.",
+  "좋아. 그럼 우리가 먼저 간다.",
+  "Good. Then we move first.",
+  "\"Raven. 넌 이미 늦었어.\"",
+  "“Raven. You’re already late.”",
+  "Chapter 3 종료. 다음은… 더 큰 전쟁이다.",
+  "Chapter 3 ends. Next… bigger war.",
+  "리그는 부쉈다. 하지만 SHADE는 놓쳤다.",
+  "Rig destroyed. SHADE escaped."
+];
 
-export const KO_EN_GLOBAL = {
-  "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '중계기 차단(해킹/파괴)'까지.": "[radio] This is DUSTLINE. Kicking off OP DUSTLINE. Objective is relay disable—hack or destroy.",
-  "저시야 구간이다. 집결 지점 도달까지는 발자국도 줄여.": "[radio] Low-vis sector. Until you reach the rendezvous—keep your footprint light.",
-  "눈에 띄면 봉쇄가 떨어진다. 조용히.": "[radio] If you get spotted, lockdown drops. Stay quiet.",
-  "카피.": "[radio] Copy.",
-  "RAVEN, 웨이포인트는 믿되 맹신하지 마. 길이 '속일' 수 있어.": "[whisper] Raven—use the waypoint, don’t worship it. Routes can lie.",
-  "기억해. 우리가 찾는 건 사람보다 '증거'다.": "[radio] Remember—people are secondary. We’re here for evidence.",
-  "그리고… 방금 잡음. 채널에 낯선 손이 닿았다.": "[radio] And… jamming just hit. Someone unknown touched our net.",
-  "…계속해.": "[noise] …Continue.",
-  "방금 그거, 우리 채널 아니지?": "[radio] That wasn’t our net. Say again?",
-  "맞아. 적 무전에서 'RAVEN' 호출부호가 먼저 언급된다 — 누군가 네 존재를 이미 알고 있다.": "[radio] Yeah. Enemy comms mention “RAVEN” first—someone already knows you’re here.",
-  "집결 지점 도달. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-  "잠깐, 소리 난다. 멈춰.": "Secure the north exfil point. Good. Done.",
-  "잠깐, 저 소리… 우리 쪽 암호랑 비슷해.": "Hold—those tones match our crypto.",
-  "아니야. 반대편이다.": "Negative. Other side.",
-  "집결 지점 도달 클린하게 끝냈다.": "We’re made! Smoke out—break contact!",
-  "발각! 연막 던지고 각 잡아!": "Buying time. Move!",
-  "중계기 차단(해킹/파괴). 웨이포인트 확인해, RAVEN.": "Something’s off. Enemy comms lead with the callsign 'RAVEN.' Someone already knows you’re here.",
-  "왼쪽 시야, 움직임. 조심.": "Check complete. Keep moving.",
-  "시간 끈다. 움직여.": "[radio] Reset. Catch your breath—then we move.",
-  "이상해. 적 무전에서 'RAVEN' 호출부호가 먼저 언급된다 — 누군가 네 존재를 이미 알고 있다.": "[radio] I scrubbed our trail, but… enemy comms still lead with “RAVEN.” Someone knows you.",
-  "중계기 차단(해킹/파괴) 좋아, 됐다.": "[radio] You sure?",
-  "확인 끝. 계속 간다.": "[radio] Objective’s clear. Hesitate and you die.",
-  "적 순찰 최소화하며 통로 확보. 웨이포인트 확인해, RAVEN.": "[noise] Deletion authorized.",
-  "지금은 숨고, 지나가면 간다.": "[radio] That channel again. Someone’s on our tail.",
-  "적 순찰 최소화하며 통로 확보 완료. 다음으로.": "[radio] All the way.",
-  "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '시설 내부 진입'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Enter the facility interior' until then.",
-  "저시야 구간이다. 외곽 감시 회피까지는 발자국도 줄여.": "[radio] Low-vis sector. Bypass outer surveillance until keep your footprint light.",
-  "이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Move fast in this sector. linger and you’ll get boxed in.",
-  "확인.": "[radio] Confirmed.",
-  "…확인했다.": "[noise] …Confirmed.",
-  "맞아. 서버 로그에 '승인자: NEMESIS' 서명이 찍혀 있다 — '적'이 아니라 내부 결재다.": "[radio] Yeah. Server logs show “Approver: NEMESIS”—not enemy. Internal sign-off.",
-  "외곽 감시 회피. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-  "그림자 봤어. 너무 빨리 가지 마.": "Bag the evidence and exfil—now. Good. Done.",
-  "그쪽 아냐, 다시 표식 봐.": "Negative. Check the marker again.",
-  "잡음 커졌다. 추적 온다!": "Jamming just spiked—trackers inbound!",
-  "외곽 감시 회피 완료. 다음으로.": "If you stop, you're done.",
-  "지금 멈추면 끝이야.": "Hold—those tones match our crypto.",
-  "시설 내부 진입. 웨이포인트 확인해, RAVEN.": "Something’s off. Server logs show 'Approver: NEMESIS'—not enemy. Internal sign-off.",
-  "이상해. 서버 로그에 '승인자: NEMESIS' 서명이 찍혀 있다 — '적'이 아니라 내부 결재다.": "[radio] I scrubbed our trail, but… Server logs show 'Approver: NEMESIS'—not enemy. Internal sign-off.",
-  "시설 내부 진입 클린하게 끝냈다.": "[radio] …That’s not right.",
-  "서버룸에서 로그/사진 확보. 웨이포인트 확인해, RAVEN.": "[noise] Target moving.",
-  "서버룸에서 로그/사진 확보 성공적이다.": "[radio] All the way.",
-  "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '후미 트럭에서 케이스 회수'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Recover the case from the rear truck' until then.",
-  "저시야 구간이다. 매복 포지션 확보까지는 발자국도 줄여.": "[radio] Low-vis sector. Secure an ambush position until keep your footprint light.",
-  "들었다.": "[radio] Heard it.",
-  "맞아. 케이스 봉인 라벨이 '우리 쪽 규격'이다. 내용물보다 '누가 보냈는지'가 이상하다.": "[radio] Yeah. Case seal label is our spec. Not what’s inside—who sent it is the problem.",
-  "매복 포지션 확보. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-  "빨리, 창구가 닫힌다.": "Move—window’s closing.",
-  "매복 포지션 확보 클린하게 끝냈다.": "Jamming just spiked—trackers inbound!",
-  "후미 트럭에서 케이스 회수. 웨이포인트 확인해, RAVEN.": "Something’s off. Case seal label is our spec. Not what’s inside—who sent it is the problem.",
-  "멈춰. 그 길은 막혔다.": "[radio] Reset. Catch your breath—then we move.",
-  "이상해. 케이스 봉인 라벨이 '우리 쪽 규격'이다. 내용물보다 '누가 보냈는지'가 이상하다.": "[radio] I scrubbed our trail, but… Case seal label is our spec. Not what’s inside—who sent it is the problem.",
-  "후미 트럭에서 케이스 회수 완료. 다음으로.": "[radio] …That’s not right.",
-  "추격 분대 저지(필요 최소). 웨이포인트 확인해, RAVEN.": "[noise] Deletion authorized.",
-  "추격 분대 저지(필요 최소) 좋아, 됐다.": "[radio] All the way.",
-  "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '연막으로 시선 차단하며 전진'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Advance under smoke, break their sightline' until then.",
-  "저시야 구간이다. 교량 진입까지는 발자국도 줄여.": "[radio] Low-vis sector. Enter the bridge until keep your footprint light.",
-  "…기록 시작.": "[noise] …Recording.",
-  "맞아. 적이 쓰는 암호 문구가 우리 쪽 '브리핑 문장'과 같다. 누가 흘렸나?": "[radio] Yeah. Their crypto phrase matches our briefing line. Somebody leaked it.",
-  "교량 진입. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-  "교량 진입 좋아, 됐다.": "Secure the city approach complete. Push on.",
-  "그쪽은 위험해. 돌아.": "If you stop, you're done.",
-  "연막으로 시선 차단하며 전진. 웨이포인트 확인해, RAVEN.": "We’re made! Smoke out—break contact!",
-  "이상해. 적이 쓰는 암호 문구가 우리 쪽 '브리핑 문장'과 같다. 누가 흘렸나?": "Something’s off. Their crypto phrase matches our own briefing line. Somebody leaked it.",
-  "연막으로 시선 차단하며 전진 완료. 다음으로.": "Check complete. Keep moving.",
-  "고정 화점(저격/기관총) 무력화. 웨이포인트 확인해, RAVEN.": "[radio] I scrubbed our trail, but… Their crypto phrase matches our own briefing line. Somebody leaked it.",
-  "고정 화점(저격/기관총) 무력화 클린하게 끝냈다.": "[radio] That channel again. Someone’s on our tail.",
-  "교량 끝 확보. 웨이포인트 확인해, RAVEN.": "[radio] Moving.",
-  "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '고지(옥상) 확보'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Secure the high ground (rooftop)' until then.",
-  "저시야 구간이다. 골목 진입까지는 발자국도 줄여.": "[radio] Low-vis sector. Enter the alley until keep your footprint light.",
-  "맞아. 카메라 허브에 'DUSTLINE' 움직임이 실시간으로 찍혀 있다. 우리가 먼저 노출됐다.": "[radio] Yeah. Camera hub shows DUSTLINE movement on a live feed. We were exposed first.",
-  "골목 진입. 웨이포인트 확인해, RAVEN.": "Stay low. Let them pass.",
-  "들켰다. 시선 끊어!": "We're made—break line of sight!",
-  "골목 진입 좋아, 됐다.": "Hold—those tones match our crypto.",
-  "고지(옥상) 확보. 웨이포인트 확인해, RAVEN.": "Something’s off. Camera hub shows DUSTLINE movement on a live feed. We were exposed first.",
-  "이상해. 카메라 허브에 'DUSTLINE' 움직임이 실시간으로 찍혀 있다. 우리가 먼저 노출됐다.": "[radio] I scrubbed our trail, but… Camera hub shows DUSTLINE movement on a live feed. We were exposed first.",
-  "고지(옥상) 확보 완료. 다음으로.": "[radio] …That’s not right.",
-  "감시 카메라 허브 찾기. 웨이포인트 확인해, RAVEN.": "[noise] Pursuit resumed.",
-  "감시 카메라 허브 찾기 완료. 다음으로.": "[radio] All the way.",
-  "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '2차 참호선 확보'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Secure the second trenchline' until then.",
-  "저시야 구간이다. 1차 참호선 확보까지는 발자국도 줄여.": "[radio] Low-vis sector. Secure the first trenchline until keep your footprint light.",
-  "총성은 마지막 수단이다. 길만 열어.": "[radio] Gunfire is last resort. just clear the route.",
-  "맞아. 표식은 '우리 부대 코드'다. '이전 팀'이 여기서 사라졌다.": "[radio] Yeah. The marker is our unit code. The previous team vanished here.",
-  "1차 참호선 확보. 웨이포인트 확인해, RAVEN.": "Stay low. Let them pass.",
-  "1차 참호선 확보 클린하게 끝냈다.": "Move—window’s closing.",
-  "2차 참호선 확보. 웨이포인트 확인해, RAVEN.": "Something’s off. The marker is our unit code. The previous team vanished here.",
-  "이상해. 표식은 '우리 부대 코드'다. '이전 팀'이 여기서 사라졌다.": "[radio] I scrubbed our trail, but… The marker is our unit code. The previous team vanished here.",
-  "2차 참호선 확보 완료. 다음으로.": "[radio] Just heard it.",
-  "3차 참호선 확보. 웨이포인트 확인해, RAVEN.": "[noise] Target moving.",
-  "3차 참호선 확보 성공적이다.": "[radio] All the way.",
-  "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '중계장치에 폭약 설치'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Plant explosives on the relay unit' until then.",
-  "저시야 구간이다. 야적장 진입까지는 발자국도 줄여.": "[radio] Low-vis sector. Enter the yard until keep your footprint light.",
-  "교전은 최소. 목적만 하고 빠져.": "[radio] Minimize contact. hit the objective and get out.",
-  "맞아. 정체불명 채널이 '폭약을 해제하라'고 지시한다. 임무와 정반대다.": "[radio] Yeah. Unknown net orders “disarm the explosives.” That’s the opposite of the mission.",
-  "야적장 진입. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-  "야적장 진입 클린하게 끝냈다.": "Hold—those tones match our crypto.",
-  "중계장치에 폭약 설치. 웨이포인트 확인해, RAVEN.": "Something’s off. Unknown net orders: 'Disarm the explosives.' That’s the opposite of the mission.",
-  "경보 올라간다. 빨리!": "[radio] Reset. Catch your breath—then we move.",
-  "이상해. 정체불명 채널이 '폭약을 해제하라'고 지시한다. 임무와 정반대다.": "[radio] I scrubbed our trail, but… Unknown net orders: 'Disarm the explosives.' That’s the opposite of the mission.",
-  "중계장치에 폭약 설치 좋아, 됐다.": "[radio] …That’s not right.",
-  "기폭 후 교란 시간 버티기. 웨이포인트 확인해, RAVEN.": "[noise] Pursuit resumed.",
-  "기폭 후 교란 시간 버티기 클린하게 끝냈다.": "[radio] All the way.",
-  "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '전환기 조작'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Operate the switch' until then.",
-  "저시야 구간이다. 플랫폼 접근까지는 발자국도 줄여.": "[radio] Low-vis sector. Approach the platform until keep your footprint light.",
-  "맞아. 경보 방송에 '블랙 타이드 프로토콜'이란 단어가 나온다. 작전명이 챕터2와 겹친다.": "[radio] Yeah. Emergency broadcast said “Black Tide Protocol.” Same op name as Chapter 2.",
-  "플랫폼 접근. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-  "플랫폼 접근 클린하게 끝냈다.": "Hold—those tones match our crypto.",
-  "전환기 조작. 웨이포인트 확인해, RAVEN.": "Something’s off. Emergency broadcast just said “Black Tide Protocol.” Same name as our Chapter 2 op.",
-  "이상해. 경보 방송에 '블랙 타이드 프로토콜'이란 단어가 나온다. 작전명이 챕터2와 겹친다.": "[radio] I scrubbed our trail, but… Emergency broadcast just said “Black Tide Protocol.” Same name as our Chapter 2 op.",
-  "전환기 조작 좋아, 됐다.": "[radio] Just heard it.",
-  "경보/추격 20초 버티기. 웨이포인트 확인해, RAVEN.": "[noise] Pursuit resumed.",
-  "경보/추격 20초 버티기 완료. 다음으로.": "[radio] All the way.",
-  "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '내부 전원 차단(감시 끊기)'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Cut internal power (break surveillance)' until then.",
-  "저시야 구간이다. 정문 접근까지는 발자국도 줄여.": "[radio] Low-vis sector. Approach the front gate until keep your footprint light.",
-  "맞아. VIP가 말한다: 'BLACK TIDE는 적이 아니라 너희 결재라인이다.'": "[radio] Yeah. VIP says: “BLACK TIDE isn’t the enemy—it’s your approval chain.”",
-  "정문 접근. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-  "정문 접근 성공적이다.": "Break pursuit (seal doors/smoke). Good work.",
-  "내부 전원 차단(감시 끊기). 웨이포인트 확인해, RAVEN.": "Hold—those tones match our crypto.",
-  "이상해. VIP가 말한다: 'BLACK TIDE는 적이 아니라 너희 결재라인이다.'": "Something’s off. VIP: 'BLACK TIDE isn’t the enemy. It’s your approval chain.'",
-  "내부 전원 차단(감시 끊기) 성공적이다.": "Check complete. Keep moving.",
-  "VIP 확보. 웨이포인트 확인해, RAVEN.": "[radio] I scrubbed our trail, but… VIP: 'BLACK TIDE isn’t the enemy. It’s your approval chain.'",
-  "VIP 확보 클린하게 끝냈다.": "[radio] That channel again. Someone’s on our tail.",
-  "VIP 호위 탈출. 웨이포인트 확인해, RAVEN.": "[radio] Moving.",
-  "여긴 DUSTLINE. OP DUSTLINE 시작한다. 목표는 '착륙지점 방어(시간 벌기)'까지.": "[radio] This is DUSTLINE. OP DUSTLINE kicking off. Objective is 'Defend the landing zone (buy time)' until then.",
-  "저시야 구간이다. LZ로 전진까지는 발자국도 줄여.": "[radio] Low-vis sector. Move to the LZ until keep your footprint light.",
-  "맞아. 구조 헬기 교신이 '우리'가 아니라 '그들'이다. 구출이 아니라 회수/삭제다.": "[radio] Yeah. Rescue helo comms aren’t ours—they’re theirs. Not rescue. Retrieval and delete.",
-  "LZ로 전진. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-  "LZ로 전진 좋아, 됐다.": "Buying time. Move!",
-  "착륙지점 방어(시간 벌기). 웨이포인트 확인해, RAVEN.": "Something’s off. Rescue helo comms aren’t ours—they’re theirs. Not a rescue. A retrieval and delete.",
-  "이상해. 구조 헬기 교신이 '우리'가 아니라 '그들'이다. 구출이 아니라 회수/삭제다.": "[radio] I scrubbed our trail, but… Rescue helo comms aren’t ours—they’re theirs. Not a rescue. A retrieval and delete.",
-  "착륙지점 방어(시간 벌기) 좋아, 됐다.": "[radio] …That’s not right.",
-  "VIP 탑승 지원. 웨이포인트 확인해, RAVEN.": "[noise] Pursuit resumed.",
-  "VIP 탑승 지원 성공적이다.": "[radio] All the way.",
-  "BLACK TIDE 업데이트. 항만 야간. 유령 회사 명의 선적. 실마리는 종이 한 장.": "[radio] BLACK TIDE Update: Night port. Cargo under shell companies—your lead is one sheet of paper.",
-  "목표는 '항만 진입'부터 '선적 서류 회수'까지. 총성은 마지막 수단이다. 길만 열어.": "[radio] Objectives: Enter the port through Recover the shipping documents. Gunfire is last resort. Just clear the route.",
-  "오버워치 띄웠다. 너희 움직임, 위에서 찍는다.": "[radio] Overwatch is up. I’ve got your movement from above.",
-  "컨테이너 구역 확보에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Secure the container yard, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "탄/연막 체크. 뒤는 내가 본다.": "[radio] Ammo and smoke check. I’ve got your six.",
-  "RAVEN, 첫 코너에서 멈춰. 왼쪽 시야, 움직임. 조심.": "[radio] Raven, hold at the first corner. Movement left—stay sharp.",
-  "그리고 기억해. 서류의 발신인이 '너희 지원사(스폰서)'와 겹친다. 내부자 냄새.": "[radio] And remember: The sender on the paperwork matches your sponsor. Smells like an insider.",
-  "명령이… 이상하게 꼬인다.": "[radio] Orders… are getting tangled.",
-  "가자. 항만 진입로.": "[radio] Move. Enter the port.",
-  "항만 진입. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-  "상공 시야 확보. 오른쪽에 열상 하나.": "Exfil. Check your waypoint, Raven.",
-  "항만 진입 클린하게 끝냈다.": "Exfil. Good work.",
-  "컨테이너 구역 확보. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-  "컨테이너 구역 확보 좋아, 됐다.": "Something’s off. The sender on the paperwork matches your sponsor. Smells like an insider.",
-  "이상해. 서류의 발신인이 '너희 지원사(스폰서)'와 겹친다. 내부자 냄새.": "Alarm's up—move!",
-  "선적 서류 회수. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "잠금 장치 뜬다. 5초만 벌어줘.": "[radio] Copy. Paperwork points to the next location: Drydock vessel registry.",
-  "선적 서류 회수 성공적이다.": "[radio] Just pulled a weird pattern from the data. The sender on the paperwork matches your sponsor. Smells like an insider.",
-  "내가 막는다. 너희는 전진.": "[noise] Command routing.",
-  "게이트/CCTV 로그 복제. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "게이트/CCTV 로그 복제 성공적이다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 거대한 드라이독. 배의 이름이 바뀌면, 죄도 바뀐다.": "[radio] BLACK TIDE Update: Massive drydock. Change the ship’s name—change the crime.",
-  "목표는 '드라이독 잠입'부터 '하역 스케줄/거래 장부 확보'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Infil the drydock through Secure the offload schedule / transaction ledger. Move fast in this sector. Linger and you’ll get boxed in.",
-  "선박 식별번호 확인에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Confirm the vessel ID number, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 장부의 결재란에 또 'NEMESIS'가 있다. 한 번이 아니다 — 시스템이다.": "[radio] And remember: The ledger’s approval block has 'NEMESIS' again. Not once—systemic.",
-  "이상해. 누가 우릴 보고 있어.": "[radio] Something’s off. Someone’s watching us.",
-  "가자. 드라이독 잠입로.": "[radio] Move. Infil the drydock.",
-  "드라이독 잠입. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-  "드라이독 잠입 성공적이다.": "Exfil. Good. Done.",
-  "이상해. 장부의 결재란에 또 'NEMESIS'가 있다. 한 번이 아니다 — 시스템이다.": "Move—window’s closing.",
-  "선박 식별번호 확인. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-  "선박 식별번호 확인 좋아, 됐다.": "Negative. Check the marker again.",
-  "하역 스케줄/거래 장부 확보. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "하역 스케줄/거래 장부 확보 완료. 다음으로.": "[radio] Just pulled a weird pattern from the data. The ledger’s approval block has 'NEMESIS' again. Not once—systemic.",
-  "추적 태그 심기. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "추적 태그 심기 성공적이다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 사막의 환적 지점. 바람이 흔적을 지운다. 그래서 더 무섭다.": "[radio] BLACK TIDE Update: Desert transfer point. Wind wipes tracks—makes it worse.",
-  "목표는 '관측점 확보'부터 '환적 트럭에서 장비 회수'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Secure the lookout point through Recover gear from the transfer truck. Move fast in this sector. Linger and you’ll get boxed in.",
-  "이동 신호기/트랜스폰더 추적에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Track the beacon/transponder, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "RAVEN, 첫 코너에서 멈춰. 지금은 숨고, 지나가면 간다.": "[radio] Raven, hold at the first corner. Stay low—let them pass.",
-  "그리고 기억해. 트랜스폰더에 '자산: RAVEN' 표기가 있다. 네가 물건 취급이다.": "[radio] And remember: Transponder reads 'Asset: RAVEN.' You’re being treated like property.",
-  "우리 쪽 채널이 새는 것 같다.": "[radio] Looks like our net is leaking.",
-  "가자. 관측점 확보로.": "[radio] Move. Secure the lookout point.",
-  "관측점 확보. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-  "이상해. 트랜스폰더에 '자산: RAVEN' 표기가 있다. 네가 물건 취급이다.": "Something’s off. Transponder reads 'Asset: RAVEN.' You’re being treated like property.",
-  "관측점 확보 완료. 다음으로.": "Hold—those tones match our crypto.",
-  "이동 신호기/트랜스폰더 추적. 웨이포인트 확인해, RAVEN.": "We're made—break line of sight!",
-  "이동 신호기/트랜스폰더 추적 완료. 다음으로.": "I’ll hold them. You push.",
-  "환적 트럭에서 장비 회수. 웨이포인트 확인해, RAVEN.": "[radio] Copy. Coordinates lead to a contact in Wadi canyon.",
-  "환적 트럭에서 장비 회수 성공적이다.": "[radio] Voices can be spoofed. Trust words and you die.",
-  "모래폭풍 속 이탈. 웨이포인트 확인해, RAVEN.": "[radio] Trust actions. Move.",
-  "BLACK TIDE 업데이트. 와디 협곡. 위에서 아래를 잡는 지형. 함정 같은 길.": "[radio] BLACK TIDE Update: Wadi canyon. High ground owns the low—roads are traps.",
-  "목표는 '협곡 진입'부터 '연락책/장비 확보'까지. 총성은 마지막 수단이다. 길만 열어.": "[radio] Objectives: Enter the canyon through Secure the contact and gear. Gunfire is last resort. Just clear the route.",
-  "매복 구역 돌파에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Push through the ambush zone, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "RAVEN, 첫 코너에서 멈춰. 잠깐, 소리 난다. 멈춰.": "[radio] Raven, hold at the first corner. Hold—noise. Freeze.",
-  "진입한다.": "[radio] Breach. Moving in.",
-  "그리고 기억해. 연락책의 마지막 말: '너희는 청소부야. 진짜 놈은 위에 있어.'": "[radio] And remember: The contact’s last words: 'You’re the cleanup crew. The real one is upstairs.'",
-  "이건 '작전'이 아니라 '정리' 같아.": "[radio] This doesn’t feel like an op. Feels like a cleanup.",
-  "가자. 협곡 진입로.": "[radio] Move. Enter the canyon.",
-  "협곡 진입. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-  "협곡 진입 완료. 다음으로.": "Exfil complete. Push on.",
-  "매복 구역 돌파. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-  "매복 구역 돌파 완료. 다음으로.": "Eyes up. One thermal contact, right side.",
-  "연락책/장비 확보. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "이상해. 연락책의 마지막 말: '너희는 청소부야. 진짜 놈은 위에 있어.'": "[radio] Good. You're still breathing.",
-  "연락책/장비 확보 클린하게 끝냈다.": "[radio] Just pulled a weird pattern from the data. The contact’s last words: 'You’re the cleanup crew. The real one is upstairs.'",
-  "드론 시선 차단. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "드론 시선 차단 좋아, 됐다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 숲의 안전회랑. '그린라인'은 탈출로이자 함정.": "[radio] BLACK TIDE Update: Forest safe corridor. The “Greenline” is an escape route—and a trap.",
-  "목표는 '그린라인 표식 따라 전진'부터 '은닉 창고 개방'까지. 교전은 최소. 목적만 하고 빠져.": "[radio] Objectives: Advance along the Greenline markers through Open the hidden warehouse. Minimize contact. Hit the objective and get out.",
-  "통신탑에서 접근 코드 획득에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Get the access code from the comms tower, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "RAVEN, 첫 코너에서 멈춰. 그림자 봤어. 너무 빨리 가지 마.": "[radio] Raven, hold at the first corner. Saw movement—don’t rush it.",
-  "그리고 기억해. 창고 음성메시지에 'SHADE' 목소리로 '증거를 태워'가 나온다. 하지만 SHADE는 옆에 있다 — 목소리 위조.": "[radio] And remember: Warehouse voicemail: 'Burn the evidence'—in SHADE’s voice. But SHADE’s right next to me. Voice spoof.",
-  "가자. 그린라인 표식 따라 전진로.": "[radio] Move. Advance along the Greenline markers.",
-  "그린라인 표식 따라 전진. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-  "그린라인 표식 따라 전진 클린하게 끝냈다.": "Escape before the fire spreads. Good. Done.",
-  "통신탑에서 접근 코드 획득. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-  "통신탑에서 접근 코드 획득 완료. 다음으로.": "Pick up the pace. Lockdown’s coming.",
-  "속도 올려. 봉쇄 온다.": "Something’s off. Warehouse voicemail: 'Burn the evidence'—in SHADE’s voice. But SHADE’s right next to me. Voice spoof.",
-  "은닉 창고 개방. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "이상해. 창고 음성메시지에 'SHADE' 목소리로 '증거를 태워'가 나온다. 하지만 SHADE는 옆에 있다 — 목소리 위조.": "[radio] Good. You're still breathing.",
-  "은닉 창고 개방 클린하게 끝냈다.": "[radio] Just pulled a weird pattern from the data. Warehouse voicemail: 'Burn the evidence'—in SHADE’s voice. But SHADE’s right next to me. Voice spoof.",
-  "추적 신호 차단. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "추적 신호 차단 완료. 다음으로.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 연기와 불. 적은 증거를 태우고, 우리는 길을 뚫는다.": "[radio] BLACK TIDE Update: Smoke and fire. They burn the evidence—we cut a path.",
-  "목표는 '연기 속 전진'부터 '흩어진 팀원 합류'까지. 눈에 띄면 봉쇄가 떨어진다. 조용히.": "[radio] Objectives: Push through the smoke through Rally with scattered teammates. If you get spotted, lockdown drops. Stay quiet.",
-  "교차로 방어(40초)에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Hold the intersection (40 sec), if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 불길 속에서 구조요청 채널이 잡히는데, 신호 발신지가 '우리 HQ'다. 누가 누구를 구하는 거지?": "[radio] And remember: In the fire we catch a distress net, but the transmitter is labeled 'our HQ.' Who’s rescuing who?",
-  "가자. 연기 속 전진로.": "[radio] Move. Push through the smoke.",
-  "연기 속 전진. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-  "이상해. 불길 속에서 구조요청 채널이 잡히는데, 신호 발신지가 '우리 HQ'다. 누가 누구를 구하는 거지?": "Something’s off. In the fire we catch a distress net, but the transmitter is labeled 'our HQ.' Who’s rescuing who?",
-  "연기 속 전진 성공적이다.": "Hold—those tones match our crypto.",
-  "교차로 방어(40초). 웨이포인트 확인해, RAVEN.": "Alarm's up—move!",
-  "교차로 방어(40초) 성공적이다.": "I’ll hold them. You push.",
-  "흩어진 팀원 합류. 웨이포인트 확인해, RAVEN.": "[radio] Copy. Next lead is Glasshouse—the city’s glass tower. We hit corporate servers.",
-  "흩어진 팀원 합류 클린하게 끝냈다.": "[radio] Voices can be spoofed. Trust words and you die.",
-  "탈출 지점 확보. 웨이포인트 확인해, RAVEN.": "[radio] Trust actions. Move.",
-  "BLACK TIDE 업데이트. 기업 타워. 깨끗한 로비, 더러운 서버실.": "[radio] BLACK TIDE Update: Corporate tower. Clean lobby—dirty server rooms.",
-  "목표는 '외곽 진입'부터 '서버실 접근'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Enter the perimeter through Approach the server vault. Move fast in this sector. Linger and you’ll get boxed in.",
-  "로비 확보에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Secure the lobby, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 서버 로그에 'DUSTLINE 모든 미션 타임라인'이 있다. 누가 처음부터 우리를 기록했나.": "[radio] And remember: Server logs include a full DUSTLINE mission timeline. Someone’s been recording us from day one.",
-  "가자. 외곽 진입로.": "[radio] Move. Enter the perimeter.",
-  "외곽 진입. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-  "외곽 진입 완료. 다음으로.": "Escape underground. Good. Done.",
-  "이상해. 서버 로그에 'DUSTLINE 모든 미션 타임라인'이 있다. 누가 처음부터 우리를 기록했나.": "Move—window’s closing.",
-  "로비 확보. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-  "로비 확보 성공적이다.": "Eyes up. One thermal contact, right side.",
-  "서버실 접근. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "서버실 접근 성공적이다.": "[radio] Just pulled a weird pattern from the data. Server logs include a full DUSTLINE mission timeline. Someone’s been recording us from day one.",
-  "데이터 추출. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "데이터 추출 좋아, 됐다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 엘리베이터는 블라인드. 문이 열릴 때마다 다른 전장.": "[radio] BLACK TIDE Update: Elevator’s a blind box. Every door opens to a different fight.",
-  "목표는 '전원 복구'부터 '층별 차단(3개 체크포인트)'까지. 교전은 최소. 목적만 하고 빠져.": "[radio] Objectives: Restore power through Floor-by-floor lockout (3 checkpoints). Minimize contact. Hit the objective and get out.",
-  "엘리베이터 탑승에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Ride the elevator, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 상층 스피커에서 'NEMESIS' 음성이 직접 나온다. 그리고 그 목소리는… HART와 비슷하다.": "[radio] And remember: Upper-level speakers—NEMESIS, live. And that voice… sounds like HART.",
-  "명령은 단순해.": "[noise] Orders are simple.",
-  "가자. 전원 복구로.": "[radio] Move. Restore power.",
-  "전원 복구. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-  "전원 복구 클린하게 끝냈다.": "Cut the relay signal. Good. Done.",
-  "엘리베이터 탑승. 웨이포인트 확인해, RAVEN.": "Hold—those tones match our crypto.",
-  "엘리베이터 탑승 성공적이다.": "Something’s off. Upper-level speakers—NEMESIS, live. And that voice… sounds like HART.",
-  "이상해. 상층 스피커에서 'NEMESIS' 음성이 직접 나온다. 그리고 그 목소리는… HART와 비슷하다.": "Pick up the pace. Lockdown’s coming.",
-  "층별 차단(3개 체크포인트). 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "층별 차단(3개 체크포인트) 성공적이다.": "[radio] Just pulled a weird pattern from the data. Upper-level speakers—NEMESIS, live. And that voice… sounds like HART.",
-  "상층 제어실 장악. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "상층 제어실 장악 좋아, 됐다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 설원 기지. 소리가 먹히고, 숨이 보인다. 흔적이 남는다.": "[radio] BLACK TIDE Update: Snowfield base. Sound dies, breath shows—every trace sticks.",
-  "목표는 '설원 전진'부터 '냉동 저장고에서 드라이브 확보'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Push through the snowfield through Recover the drive from cold storage. Move fast in this sector. Linger and you’ll get boxed in.",
-  "관측소 접근에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Approach the observation post, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 드라이브 파일명: 'BT_SCORE_v3'. 타깃을 점수로 매기는 시스템이다.": "[radio] And remember: Drive filename: 'BT_SCORE_v3.' Targets get scored—someone’s ranking people like data.",
-  "가자. 설원 전진로.": "[radio] Move. Push through the snowfield.",
-  "설원 전진. 웨이포인트 확인해, RAVEN.": "Stay low. Let them pass.",
-  "이상해. 드라이브 파일명: 'BT_SCORE_v3'. 타깃을 점수로 매기는 시스템이다.": "Movement left. Stay sharp.",
-  "설원 전진 성공적이다.": "Exfil. Good. Done.",
-  "관측소 접근. 웨이포인트 확인해, RAVEN.": "Something’s off. Drive filename: 'BT_SCORE_v3.' Targets get scored—someone’s ranking people like data.",
-  "관측소 접근 완료. 다음으로.": "We're made—break line of sight!",
-  "냉동 저장고에서 드라이브 확보. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "냉동 저장고에서 드라이브 확보 성공적이다.": "[radio] Just pulled a weird pattern from the data. Drive filename: 'BT_SCORE_v3.' Targets get scored—someone’s ranking people like data.",
-  "백색지대에서 추적 회피. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "백색지대에서 추적 회피 성공적이다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 눈보라 추격전. 방향도, 적도, 아군도 흐려진다.": "[radio] BLACK TIDE Update: Whiteout chase. Direction, friend, foe—everything blurs.",
-  "목표는 '화이트아웃 속 경로 찾기'부터 '추격 분대/드론 따돌리기'까지. 총성은 마지막 수단이다. 길만 열어.": "[radio] Objectives: Find the route in the whiteout through Lose the pursuit squad / drones. Gunfire is last resort. Just clear the route.",
-  "임시 이동수단 확보에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Secure a temporary ride, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 추격 드론의 등록번호가 '우리 조달 코드'다. 우리 장비가 우리를 쫓는다.": "[radio] And remember: The pursuit drone’s registration ties back to our procurement code. Our gear is hunting us.",
-  "가자. 화이트아웃 속 경로 찾기로.": "[radio] Move. Find the route in the whiteout.",
-  "화이트아웃 속 경로 찾기. 웨이포인트 확인해, RAVEN.": "Stay low. Let them pass.",
-  "화이트아웃 속 경로 찾기 완료. 다음으로.": "Enter the lodge (safe room). Clean. Move.",
-  "임시 이동수단 확보. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-  "임시 이동수단 확보 클린하게 끝냈다.": "If you stop, you're done.",
-  "추격 분대/드론 따돌리기. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "이상해. 추격 드론의 등록번호가 '우리 조달 코드'다. 우리 장비가 우리를 쫓는다.": "[radio] Good. You're still breathing.",
-  "추격 분대/드론 따돌리기 성공적이다.": "[radio] Just pulled a weird pattern from the data. The pursuit drone’s registration ties back to our procurement code. Our gear is hunting us.",
-  "절벽 통로 확보. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "절벽 통로 확보 완료. 다음으로.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 철도 공장. 쇠 냄새와 오일. 생산 라인이 '전쟁'을 뽑는다.": "[radio] BLACK TIDE Update: Rail factory. Steel and oil. The line manufactures war.",
-  "목표는 '공장 외곽 잠입'부터 '생산 라인에서 부품/서류 회수'까지. 교전은 최소. 목적만 하고 빠져.": "[radio] Objectives: Infil the factory perimeter through Recover parts/docs from the production line. Minimize contact. Hit the objective and get out.",
-  "전력실 차단에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Cut power at the power room, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 송장에 우리 조직명과 동일한 약자가 찍혀 있다. '공급자=우리'.": "[radio] And remember: Invoice carries our org’s exact initials. 'Supplier = us.'",
-  "가자. 공장 외곽 잠입로.": "[radio] Move. Infil the factory perimeter.",
-  "공장 외곽 잠입. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-  "공장 외곽 잠입 완료. 다음으로.": "Move to the rail yard. Clean. Move.",
-  "전력실 차단. 웨이포인트 확인해, RAVEN.": "Eyes up. One thermal contact, right side.",
-  "이상해. 송장에 우리 조직명과 동일한 약자가 찍혀 있다. '공급자=우리'.": "Something’s off. Invoice carries our org’s exact initials. 'Supplier = us.'",
-  "전력실 차단 완료. 다음으로.": "Hold—those tones match our crypto.",
-  "생산 라인에서 부품/서류 회수. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "생산 라인에서 부품/서류 회수 좋아, 됐다.": "[radio] Just pulled a weird pattern from the data. Invoice carries our org’s exact initials. 'Supplier = us.'",
-  "경보 차단. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "경보 차단 좋아, 됐다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 전환기, 선로, 그리고 한 대의 화물차. 방향을 바꾸면 역사가 바뀐다.": "[radio] BLACK TIDE Update: A switch, rail line, and one freight truck. Change the route—change history.",
-  "목표는 '플랫폼 접근'부터 '블랙박스 화물차 연결'까지. 눈에 띄면 봉쇄가 떨어진다. 조용히.": "[radio] Objectives: Approach the platform through Link up the black-box truck. If you get spotted, lockdown drops. Stay quiet.",
-  "전환기 조작에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Operate the switch, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 본부가 '열차를 폭파하라'고 지시한다. 하지만 화물차엔 작업자 태그가 찍혀 있다. 명령이 틀렸다.": "[radio] And remember: HQ orders: 'Blow the train.' But the truck’s tagged with worker IDs. That order’s wrong.",
-  "가자. 플랫폼 접근로.": "[radio] Move. Approach the platform.",
-  "이상해. 본부가 '열차를 폭파하라'고 지시한다. 하지만 화물차엔 작업자 태그가 찍혀 있다. 명령이 틀렸다.": "Enter the tunnel. Check your waypoint, Raven.",
-  "플랫폼 접근 완료. 다음으로.": "Enter the tunnel. Clean. Move.",
-  "블랙박스 화물차 연결. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "블랙박스 화물차 연결 완료. 다음으로.": "[radio] Just pulled a weird pattern from the data. HQ orders: 'Blow the train.' But the truck’s tagged with worker IDs. That order’s wrong.",
-  "이동 구간 방어. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "이동 구간 방어 클린하게 끝냈다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 붉은 노을 능선. 여기서 보면, 거짓이 더 잘 보인다.": "[radio] BLACK TIDE Update: Red-sunset ridgeline. Up here, lies stand out.",
-  "목표는 '능선 따라 전진'부터 '적 통신중계 파괴'까지. 총성은 마지막 수단이다. 길만 열어.": "[radio] Objectives: Advance along the ridgeline through Destroy the enemy comms relay. Gunfire is last resort. Just clear the route.",
-  "관측 지점 확보에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Secure the observation point, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 적 무전: 'HART 제거 명령 확인.' — 표적이 네 상관으로 바뀐다.": "[radio] And remember: Enemy comms: 'Confirm the order—remove HART.' Target just switched to your handler.",
-  "가자. 능선 따라 전진로.": "[radio] Move. Advance along the ridgeline.",
-  "능선 따라 전진. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-  "이상해. 적 무전: 'HART 제거 명령 확인.' — 표적이 네 상관으로 바뀐다.": "Exfil the camp. Check your waypoint, Raven.",
-  "능선 따라 전진 완료. 다음으로.": "Exfil the camp. Clean. Move.",
-  "관측 지점 확보. 웨이포인트 확인해, RAVEN.": "Pick up the pace. Lockdown’s coming.",
-  "관측 지점 확보 완료. 다음으로.": "We're made—break line of sight!",
-  "적 통신중계 파괴. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "적 통신중계 파괴 클린하게 끝냈다.": "[radio] Just pulled a weird pattern from the data. Enemy comms: 'Confirm the order—remove HART.' Target just switched to your handler.",
-  "협곡 다리 건너기. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "협곡 다리 건너기 클린하게 끝냈다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 빛나는 돔. 센서와 레이저. 한 번만 삐끗하면 전부 켜진다.": "[radio] BLACK TIDE Update: The shining dome. Sensors and lasers—one slip and it all lights up.",
-  "목표는 '레이더 돔 접근'부터 '업링크 장치 확보/해킹'까지. 교전은 최소. 목적만 하고 빠져.": "[radio] Objectives: Approach the radar dome through Secure/hack the uplink device. Minimize contact. Hit the objective and get out.",
-  "센서 구간 무사 통과에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Clear the sensor zone, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 업링크 로그에 'NEMESIS=음성 합성/명령 라우터' 설명이 있다. '사람'이 아니라 '시스템'이다.": "[radio] And remember: Uplink logs describe 'NEMESIS = voice synthesis / command router.' Not a person—a system.",
-  "가자. 레이더 돔 접근로.": "[radio] Move. Approach the radar dome.",
-  "레이더 돔 접근. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-  "이상해. 업링크 로그에 'NEMESIS=음성 합성/명령 라우터' 설명이 있다. '사람'이 아니라 '시스템'이다.": "Movement left. Stay sharp.",
-  "레이더 돔 접근 좋아, 됐다.": "Break pursuit and escape. Clean. Move.",
-  "센서 구간 무사 통과. 웨이포인트 확인해, RAVEN.": "Something’s off. Uplink logs describe 'NEMESIS = voice synthesis / command router.' Not a person—a system.",
-  "센서 구간 무사 통과 완료. 다음으로.": "Check complete. Keep moving.",
-  "업링크 장치 확보/해킹. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "업링크 장치 확보/해킹 클린하게 끝냈다.": "[radio] Just pulled a weird pattern from the data. Uplink logs describe 'NEMESIS = voice synthesis / command router.' Not a person—a system.",
-  "증거 패킷 송출(부분). 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "증거 패킷 송출(부분) 클린하게 끝냈다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 정유시설. 냄새, 열기, 경보. 잘못 건드리면 끝.": "[radio] BLACK TIDE Update: Refinery. Stench, heat, alarms—one mistake and it’s over.",
-  "목표는 '외곽 침투'부터 '연료 기록/서버 백업 회수'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Infiltrate the perimeter through Recover fuel records / server backup. Move fast in this sector. Linger and you’ll get boxed in.",
-  "밸브/펌프 차단에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Shut down the valves/pumps, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 차단 순간 NEMESIS가 말한다: '그건 네 임무가 아니야.' — 누가 임무를 정하나?": "[radio] And remember: The moment you cut the signal, NEMESIS says: 'That’s not your mission.' So who sets the mission?",
-  "너희는 선택하지 않아.": "[noise] You don’t get to choose.",
-  "가자. 외곽 침투로.": "[radio] Move. Infiltrate the perimeter.",
-  "외곽 침투. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-  "외곽 침투 좋아, 됐다.": "Eyes up. One thermal contact, right side.",
-  "밸브/펌프 차단. 웨이포인트 확인해, RAVEN.": "Move—window’s closing.",
-  "밸브/펌프 차단 좋아, 됐다.": "I’ll hold them. You push.",
-  "이상해. 차단 순간 NEMESIS가 말한다: '그건 네 임무가 아니야.' — 누가 임무를 정하나?": "[radio] Good. You're still breathing.",
-  "연료 기록/서버 백업 회수. 웨이포인트 확인해, RAVEN.": "[radio] Copy. Chokepoint to the sea. Secure the gear at Breakwater—coastal ruins.",
-  "연료 기록/서버 백업 회수 클린하게 끝냈다.": "[radio] Voices can be spoofed. Trust words and you die.",
-  "비상 통로로 탈출. 웨이포인트 확인해, RAVEN.": "[radio] Trust actions. Move.",
-  "BLACK TIDE 업데이트. 전쟁이 지나간 해안 폐허. 방파제는 마지막 관문.": "[radio] BLACK TIDE Update: War-torn coastal ruins. The breakwater is the last gate.",
-  "목표는 '해안 폐허 진입'부터 '대공/레이더 장비 확보'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Enter the coastal ruins through Secure AA/radar gear. Move fast in this sector. Linger and you’ll get boxed in.",
-  "방파제 상부 확보에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Secure the top of the breakwater, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 장비 시리얼이 '드라이독 장부'와 일치한다. 모든 길이 하나로 이어진다.": "[radio] And remember: Gear serial matches the drydock ledger. Every road leads to the same place.",
-  "가자. 해안 폐허 진입로.": "[radio] Move. Enter the coastal ruins.",
-  "해안 폐허 진입. 웨이포인트 확인해, RAVEN.": "Movement left. Stay sharp.",
-  "해안 폐허 진입 클린하게 끝냈다.": "Board the boat complete. Push on.",
-  "방파제 상부 확보. 웨이포인트 확인해, RAVEN.": "Jamming just spiked—trackers inbound!",
-  "방파제 상부 확보 완료. 다음으로.": "Something’s off. Gear serial matches the drydock ledger. Every road leads to the same place.",
-  "이상해. 장비 시리얼이 '드라이독 장부'와 일치한다. 모든 길이 하나로 이어진다.": "Eyes up. One thermal contact, right side.",
-  "대공/레이더 장비 확보. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "대공/레이더 장비 확보 클린하게 끝냈다.": "[radio] Just pulled a weird pattern from the data. Gear serial matches the drydock ledger. Every road leads to the same place.",
-  "구조 신호 발신. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "구조 신호 발신 좋아, 됐다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 해상 플랫폼 침투. 바람, 금속, 끝없는 바다. 도망칠 곳이 없다.": "[radio] BLACK TIDE Update: Offshore platform infil. Wind, steel, endless sea—nowhere to run.",
-  "목표는 '플랫폼 접근'부터 '제어실 점거'까지. 총성은 마지막 수단이다. 길만 열어.": "[radio] Objectives: Approach the platform through Seize the control room. Gunfire is last resort. Just clear the route.",
-  "갑판 정리에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Clear the deck, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 제어실 화면에 우리 작전이 '실시간 방송'으로 표시된다. 누군가 보고 있다.": "[radio] And remember: In the control room, our op is on a live feed. Someone’s watching.",
-  "플랫폼 접근 성공적이다.": "Secure the helipad / exfil route complete. Push on.",
-  "갑판 정리. 웨이포인트 확인해, RAVEN.": "Check complete. Keep moving.",
-  "갑판 정리 클린하게 끝냈다.": "Something’s off. In the control room, our op is on a live feed. Someone’s watching.",
-  "이상해. 제어실 화면에 우리 작전이 '실시간 방송'으로 표시된다. 누군가 보고 있다.": "That route's hot. Reroute.",
-  "제어실 점거. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "제어실 점거 완료. 다음으로.": "[radio] Just pulled a weird pattern from the data. In the control room, our op is on a live feed. Someone’s watching.",
-  "서버 모듈 위치 파악. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "서버 모듈 위치 파악 좋아, 됐다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 블랙박스 인양. 데이터는 금고처럼 잠겨 있고, 누군가는 태우려 한다.": "[radio] BLACK TIDE Update: Black box recovery. Data’s locked like a vault—and someone wants it burned.",
-  "목표는 '정유시설 재진입'부터 '잠금 해제 키 적용'까지. 이번 구역은 빠르게. 오래 있으면 포위다.": "[radio] Objectives: Re-enter the refinery through Apply the unlock key. Move fast in this sector. Linger and you’ll get boxed in.",
-  "블랙박스 컨테이너 확보에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Secure the black box container, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. 블랙박스에 '원격 삭제 스위치'가 달려 있다. 시간 싸움이다.": "[radio] And remember: The black box has a 'remote wipe switch.' It’s a race.",
-  "가자. 정유시설 재진입로.": "[radio] Move. Re-enter the refinery.",
-  "정유시설 재진입. 웨이포인트 확인해, RAVEN.": "Saw movement. Don't rush it.",
-  "이상해. 블랙박스에 '원격 삭제 스위치'가 달려 있다. 시간 싸움이다.": "Stop the counterattack, then exfil. Check your waypoint, Raven.",
-  "정유시설 재진입 좋아, 됐다.": "Stop the counterattack, then exfil. Clean. Move.",
-  "블랙박스 컨테이너 확보. 웨이포인트 확인해, RAVEN.": "Eyes up. One thermal contact, right side.",
-  "블랙박스 컨테이너 확보 완료. 다음으로.": "Negative. Other side.",
-  "잠금 해제 키 적용. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "잠금 해제 키 적용 성공적이다.": "[radio] Just pulled a weird pattern from the data. The black box has a 'remote wipe switch.' It’s a race.",
-  "데이터 복제. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "데이터 복제 성공적이다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 산의 흉터 같은 협곡. 여기서 업로드하면, 세상이 바뀐다. 그래서 다들 막는다.": "[radio] BLACK TIDE Update: Canyon like a scar. Upload from here and the world shifts—so they’ll stop you.",
-  "목표는 '협곡 통과'부터 '업로드 송신기 설치'까지. 눈에 띄면 봉쇄가 떨어진다. 조용히.": "[radio] Objectives: Push through the canyon through Plant the upload transmitter. If you get spotted, lockdown drops. Stay quiet.",
-  "매복 돌파에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Break the ambush, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. RUNE가 말한다: 'NEMESIS는 사람도, AI도 아니다. '명령' 그 자체다.'": "[radio] And remember: RUNE: 'NEMESIS isn’t human or AI. It’s the command itself.'",
-  "가자. 협곡 통과로.": "[radio] Move. Push through the canyon.",
-  "협곡 통과. 웨이포인트 확인해, RAVEN.": "Stay low. Let them pass.",
-  "협곡 통과 좋아, 됐다.": "Open the final exfil route. Good work.",
-  "이상해. RUNE가 말한다: 'NEMESIS는 사람도, AI도 아니다. '명령' 그 자체다.'": "Eyes up. One thermal contact, right side.",
-  "매복 돌파. 웨이포인트 확인해, RAVEN.": "Negative. Other side.",
-  "매복 돌파 성공적이다.": "Hold—those tones match our crypto.",
-  "업로드 송신기 설치. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "업로드 송신기 설치 좋아, 됐다.": "[radio] Just pulled a weird pattern from the data. RUNE: 'NEMESIS isn’t human or AI. It’s the command itself.'",
-  "업로드 시간 벌기. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "업로드 시간 벌기 좋아, 됐다.": "[radio] Next sector’s a short window. Move.",
-  "BLACK TIDE 업데이트. 네메시스. 모든 채널의 목소리. 누구의 명령도 아닌, 진실의 끝.": "[radio] BLACK TIDE Update: NEMESIS. A voice on every channel. Nobody’s orders—just the end of the truth.",
-  "목표는 '플랫폼 최종 진입'부터 '블랙타이드 핵심 서버 장악'까지. 총성은 마지막 수단이다. 길만 열어.": "[radio] Objectives: Final breach onto the platform through Seize the BLACK TIDE core server. Gunfire is last resort. Just clear the route.",
-  "NEMESIS 중계 코어 접근에 전자 잠금 있으면 내가 연다. 타이밍 맞춰.": "[radio] At Approach the NEMESIS relay core, if there’s an electronic lock, I’ll pop it. On my mark.",
-  "그리고 기억해. NEMESIS가 마지막으로 말한다: '너희가 선택해도 결과는 같다.' — 그래서 '선택'이 중요해진다.": "[radio] And remember: NEMESIS: 'No matter what you choose, the outcome’s the same.' That’s why the choice matters now.",
-  "가자. 플랫폼 최종 진입로.": "[radio] Move. Final breach onto the platform.",
-  "플랫폼 최종 진입. 웨이포인트 확인해, RAVEN.": "Hold. I hear something. Freeze.",
-  "플랫폼 최종 진입 클린하게 끝냈다.": "Exfil—or hold the line complete. Push on.",
-  "이상해. NEMESIS가 마지막으로 말한다: '너희가 선택해도 결과는 같다.' — 그래서 '선택'이 중요해진다.": "Check complete. Keep moving.",
-  "NEMESIS 중계 코어 접근. 웨이포인트 확인해, RAVEN.": "If you stop, you're done.",
-  "NEMESIS 중계 코어 접근 클린하게 끝냈다.": "Eyes up. One thermal contact, right side.",
-  "블랙타이드 핵심 서버 장악. 웨이포인트 확인해, RAVEN.": "Lock just popped. Buy me five seconds.",
-  "블랙타이드 핵심 서버 장악 좋아, 됐다.": "[radio] Just pulled a weird pattern from the data. NEMESIS: 'No matter what you choose, the outcome’s the same.' That’s why the choice matters now.",
-  "증거 최종 업로드/삭제 선택. 웨이포인트 확인해, RAVEN.": "[radio] Someone’s on our net. For real.",
-  "증거 최종 업로드/삭제 선택 클린하게 끝냈다.": "[radio] Next sector’s a short window. Move."
+// missionId -> [ko, en, ko, en, ...] as indices into S
+const BY_MISSION = {
+  "c1_m1_insertion": [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99],
+  "c1_m2_blacksite": [100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,91,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216],
+  "c1_m3_convoy": [217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,98,99],
+  "c1_m4_bridge": [315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,98,99],
+  "c1_m5_city": [427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,349,350,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,191,192,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,529,530,531,532],
+  "c1_m6_trench": [533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,205,607,608,609,610,611,98,612,613,614,615,616],
+  "c1_m7_ridge": [617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,421,697,698,699,700,701],
+  "c1_m8_counter": [702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,521,772,773,774,775,776,777,778,779,780,781,782,98,699],
+  "c1_m9_lab": [783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,98,699,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,521,772,698,699,875,876],
+  "c1_m10_exodus": [877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,521,772,947,948,949,950,951,952,953,954,955,956,613,614,98,612],
+  "c2_m1_blacktide": [957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,712,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989],
+  "c2_m2_drydock": [990,981,991,992,993,985,994,995,996,997],
+  "c2_m3_sandglass": [998,999,1000,977,1001,1002],
+  "c2_m4_wadi": [1003,987,1004,979,1005,1002,1006,997,1007,997],
+  "c2_m5_greenline": [1008,995,1009,987,1010,981,1011,1012,1013,985],
+  "c2_m6_ember": [1014,985,1015,992,1016,979,1017,985,1018,997,1019,1012,1020,985,1021,1002,1022,1002],
+  "c2_m7_glasshouse": [1023,985,1024,989,1025,987,1026,1002,1027,981,1028,1012,1029,1030,1031,1002,98,985],
+  "c2_m8_elevator": [1032,1002,1033,1030,1034,1030,1035,1002,1036,1012,1037,1012],
+  "c2_m9_frostline": [1038,1012,1039,979,1040,987,1041,1002,1042,1012,1043,1002],
+  "c2_m10_whiteout": [1044,992,1045,1012,1046,985,1047,1002,1048,1012,1049,1002,1050,981],
+  "c2_m11_ironweave": [1051,981,1052,985,1053,985,1054,1055,1056,1055,1057,985,1058,985],
+  "c2_m12_switchyard": [1059,977,1060,979,1053,985,1061,1062,1063,985,1064,1002,1065,981,1066,981],
+  "c2_m13_redhorizon": [1067,977,1068,985,1069,1062,1070,1002,1071,1002,1053,985,1072,979,1073,997],
+  "c2_m14_radiant": [1074,985,1075,1002,1053,985,1076,997,1077,979,1078,997],
+  "c2_m15_refinery": [1079,999,1080,1055,1081,1002,1053,985,1082,997],
+  "c2_m16_breakwater": [1083,981,1084,985,1085,1002,1086,1087,1088,1002,1053,985],
+  "c2_m17_offshore": [1089,981,1090,981,1053,985,1091,985,1092,979,1093,1002],
+  "c2_m18_blackbox": [1094,981,1095,1002,1053,985,1096,997,1097,997],
+  "c2_m19_scar": [1098,989,1053,985,1099,997,1100,997],
+  "c2_m20_nemesis": [1101,981,1102,1002,1079,999,1103,981,1104,1002,1053,985,1105,977,1106,979,1107,997],
+  "c3_m1_ghostsignal": [1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191],
+  "c3_m2_brokenchain": [1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1211,1212,1213,1214,1215,1216,1217,1218,1219,1220,1221,1222,1223,1224,1225,1226,1227,1228,1229,1230,1231,1232,1233,1234,1235,1236,1237,1238,1239,1240,1241,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275],
+  "c3_m3_falseorders": [1276,1277,1278,1279,1280,1281,1282,1283,1284,1285,1286,1287,1288,1289,1290,1291,1292,1293,1294,1295,1296,1297,1298,1299,1300,1301,1302,1303,1304,1305,1306,1307,1308,1309,1310,1311,1312,1313,1314,1315,1316,1317,1318,1319,1320,1321,1322,1323,1324,1325,517,1326,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1357,1358,1359,1360,1361,1362,1363,1364,1365,1366,1367,1368],
+  "c3_m4_redacted": [1369,1370,1371,1372,1373,1374,1375,1376,1377,1378,1379,1380,1381,1382,1383,1384,1385,1386,1387,1388,1389,1390,1391,1392,1393,1394,1395,1396,1397,1398,1399,1400,1401,1402,1403,1404,1405,1406,1407,1408,1409,1410,1411,1412,1413,1414,1415,1416,1417,1418,1419,1420,1421,1422,1423,1424,1425,1426,1427,1428,1429,1430,1431,1432,1433,1434,1435,1436,1437,1438,1439,1440,1441,1442,1443,1444,1445,1446,1447,1448,1449,1450,1451,1452,1453,1454,1455,1456,1457,1458,1459,1460],
+  "c3_m5_noturningback": [1461,1462,1463,1464,1465,1466,1467,1468,1451,1452,1469,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1482,1483,1484,1485,1486,1487,1488,1489,1490,1491,1492,1493,1494,1495,1496,1497,1498,1499,1500,1501,1502,1503,1504,1505,1506,1507,1508,1509,1510,1511,1512,1513,1514,1515,1516,1517,1518,1519,1520,1521,1522,1523,1524,1525,1526,1527,1528,1529,1530,1531,1532,517,1326,1533,1534],
+  "c3_m6_blacklist": [1535,1536,1537,1538,1539,1540,1541,1542,1543,1544,1545,1546,1547,1548,1549,1550,1551,1552,1553,1554,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1570,1571,1572,1573,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1590,1591,1592,191,192,1593,1594,1595,1596,1597,1598,1355,1599,1600,1601,1602,1603,1604,1605,1606,1607,1608,1609,1610,1611],
+  "c3_m7_pilotdown": [1612,1613,1614,1615,1616,1617,1618,1619,1620,1621,1622,1623,1624,1625,1626,1627,1628,1629,1630,1631,1632,1633,1634,1635,1636,1637,1638,1639,1640,1641,1642,1643,1644,1645,1646,1647,1648,1649,1650,1651,1652,1653,1654,1655,1656,1657,1658,1659,1660,1661,1662,1663,1664,1665,1666,1667,1668,1669,1670,1671,1672,1673,1674,1675,1676,1677,1678,1679,1680,1681,1682,1683,1684,1685,1686,1687,1688,1689,1690,1691,1692,1693,1694,1695,1696,1697,1698,1699,1700,1701,1702,1703,1704,1705,1706,1707,1708,1709],
+  "c3_m8_darkmarket": [1710,1711,1712,1713,1714,1715,1716,1717,1718,1719,1720,1721,1722,1723,1724,1725,1726,1727,1728,1729,1730,1731,1732,1733,1734,1735,1736,1737,1738,1739,1740,1741,1742,1743,1744,1745,1746,1747,1748,1749,1750,1751,1752,1753,1754,1755,1756,1757,1758,1759,1760,1761,1762,1763,1764,1765,1766,1767,1768,1769,1770,1771,1772,1773,1774,1775,1776,1777,1778,1779,1780,1781,1782,1783,1784,1785,1786,1787],
+  "c3_m9_glassroute": [1788,1789,1790,1791,1792,1793,1794,1795,1796,1797,1798,1799,1800,1801,1802,1803,1804,1805,1806,1807,1808,1809,1810,1811,1812,1813,1814,1815,1816,1817,1818,1819,1820,1820,1821,1822,1823,1824,1825,1826,1827,1828,1829,1830,1831,1832,1833,1834,1835,1836,1837,1838,1839,1840,1841,1842,1843,1844,191,192,1845,1846,1847,1848,1849,1850,1851,1852,1853,1854,1855,1856,1857,1858,1859,1860,1861,1862,1863,1864],
+  "c3_m10_echochamber": [1865,1866,1867,1868,1869,1870,1871,1872,1873,1874,1875,1876,1877,1878,1879,1880,1881,1882,1883,1884,1885,1886,1887,1888,1889,1890,1891,1892,1893,1894,1895,1896,1897,1898,1899,1900,1901,1902,1903,1904,1905,1906,1907,1908,1909,1910,1911,1912,1913,1914,1915,1916,613,614,1917,1918,1919,1920,1921,1922,1923,1924,1925,1926,1927,1928,1766,1767,1929,1930,1931,1932,1933,1934,1935,1936,1937,1938,1939,1940,1941,1942,1943,1944,1945,1946,1947,1948,1949,1950,1951,1952,1953,1954,1955,1956],
+  "c3_m11_cutthehand": [1957,1958,1959,1960,1961,1962,1963,1964,1965,1966,1967,1968,1969,1970,1971,1972,1973,1974,1975,1976,1977,1978,98,612,1979,1980,1981,1982,1983,1984,1985,1986,1642,1643,1987,1988,1579,1580,1989,1990,1991,1992,1993,1994,1995,1996,1997,1998,1999,2000,2001,2002,191,192,2003,2004,2005,2006,2007,2008,2009,2010,2011,2012,2013,2014,2015,2016,2017,2018,2019,2020,2021,2022,2023,2024,2025,2026,2027,2028],
+  "c3_m12_firstshadow": [2029,2030,2031,2032,2033,2034,2035,2036,2037,2038,2039,2040,2041,2042,2043,2044,2045,2046,2047,699,2048,2049,2050,2051,1642,1643,2052,2053,2054,2055,2056,2057,2058,2059,2060,2061,2062,2063,2064,2065,2066,2067,2068,2069,2070,2071,2072,2073,2074,2075,2076,2077,2078,2079,2080,2081,2082,2083,2084,2085,2086,2087,2088,2089,2090,2091,2092,2093,2094,2095,2096,2097,1579,1580,2098,2099,2100,2101,2102,2103,2104,2105,2106,2107,2108,2109,2110,2111,2112,2113,2114,2115,2116,2117,2118,2119],
+  "c3_m13_papertrail": [2120,2121,2122,2123,2124,2125,2126,2127,1547,1548,2128,2129,2130,2131,2132,2133,2134,2135,2136,2137,1642,1643,2138,2139,2140,2141,2142,2143,2144,2145,2146,2147,2148,2149,2150,2151,2152,2153,2154,2155,2156,2157,2158,2159,2160,2161,2162,2163,2164,2165,1766,1767,2166,2167,2168,2169,2170,2171,2172,2173,2174,2175,2176,2177,2178,2179,2180,2181,2182,2183],
+  "c3_m14_finaldelete": [2184,2185,2186,2187,2188,2189,2190,2191,2192,2193,2194,2195,2196,2197,2198,2199,2200,2201,2202,2203,2204,2205,2206,2207,2208,2209,2210,2211,2212,2213,2214,2215,2216,2217,2218,2219,2220,2221,2222,2223,2224,2225,2226,2227,2228,2229,1820,1820,2230,2231,2232,2233,2234,2235,2236,2237,2238,2239,2240,2241,2242,2243,2244,2245,2246,2247,2248,2249,1993,1994,1999,2250,2251,2252,2253,2254,2255,2256,2257,2258,2259,2260,2261,2262,2263,2264,2265,2266,2267,2268],
+  "c3_m15_auditline": [2269,2270,2271,2272,2273,2274,2275,2276,2277,2278,2279,2280,2281,2282,2283,2284,2285,2286,2287,2288,2289,2290,2291,2292,2293,2294,2295,2296,2297,2298,2299,2300,2301,2302,2303,2304,2305,2306,2307,2308,2309,2310,2311,2312,2313,2314,2315,2316,2317,2318,1766,1767,2319,2320,2321,2322,2323,2324,2325,2326,2327,2328,1602,2329,2330,2331,2332,2333,2334,2335],
+  "c3_m16_deadair": [2336,2337,2338,2339,2340,2341,2342,2343,2344,2345,2346,2347,2348,2349,2350,2351,2352,2353,2354,2355,2356,2357,2358,2359,2360,2361,2362,2363,2364,2365,2366,2367,2368,2369,2370,2371,2372,2373,2374,2375,2376,2377,2378,2379,2380,2381,1820,1820,2382,2383,2384,2385,2386,2387,2388,2389,2390,2391,2392,2393,2394,2395,1355,1599,2396,2397,2398,2399,1766,1767,2400,2401,2402,2403,2404,2405,2406,2407,2408,2409,2410,2411,2412,2413,2414,2415,2416,2417,2418,2419],
+  "c3_m17_exitdenied": [2420,2421,2422,2423,2424,2425,2426,2427,2428,2429,2430,2431,2432,2433,2434,2435,2436,2437,2438,2439,2440,2441,2442,2443,2444,2445,2446,2447,2303,2304,1820,1820,2448,2449,2450,2451,2452,2453,2454,2455,2456,2457,2458,2459,2460,2461,2462,2463,2464,2465,2466,2467,2468,2469,2470,2471,2472,2473,2474,2475,2476,2477,2478,2479,2480,2481,2482,2483,2484,2485],
+  "c3_m18_canyonrun": [2486,2487,2488,2489,2490,2491,2492,2493,1790,1791,2494,2495,2496,2497,2498,2499,2500,2501,2502,2503,2504,2505,969,2506,2507,2508,2509,2510,2511,2512,2513,2514,2515,2516,2517,2518,2519,2520,2521,2522,2523,2524,2525,2526,2527,2528,2529,2530,2531,2532,2533,2534,1642,2535,2536,2537,2538,2539,2540,2541,2542,2542,2543,2544],
+  "c3_m19_bunkerlights": [2545,2546,2547,2548,2549,2550,2551,2552,2553,2554,2555,2556,2557,2558,2559,2560,2561,2562,2563,2564,2565,2566,2567,2568,2569,2570,1820,1820,2571,2572,2573,2574,2575,2576,2577,2578,2579,2580,2581,2582,2583,2584,2585,2586,2587,2588,2589,2590,2591,2592,2593,2594,2595,2596,2597,2598,2599,2600,2601,2602,2603,2604,2605,2606,2607,2608,2609,2610,1642,2611,1602,2329,2612,2613,2614,2615,2616,2617,2618,2619,2620,2621,2622,2623],
+  "c3_m20_underthedam": [2624,2625,2626,2627,2628,2629,2630,2631,2632,2633,2634,2635,2636,2637,2638,2639,2640,2641,2642,2643,2644,2645,2646,2647,2648,2649,2650,2651,2652,2653,2654,2655,2303,2304,2656,2657,2658,2659,2660,2661,2662,2663,2664,2665,2666,2667,2668,2669,2670,2671,2672,2673,2674,2675,2676,2677,2678,2679,2680,2681,2682,2683,2684,2685,2686,2687,2688,2689,2690,2691,2692,2693,2694,2695],
+  "c3_m21_vacuum": [2696,2697,2698,2699,2700,2701,2702,2703,2704,2705,2706,2707,2708,2709,2710,2711,2712,2713,2714,2715,2716,2717,2718,2719,2720,2721,2722,2723,2724,2725,2726,2727,2728,2729,2730,2731,2732,2733,2734,2735,2736,2737,2738,2739,2740,2741,1766,1767,2742,2743,2744,2745,2746,2747,2748,2749,1355,1599,2750,2751,2752,2753,2754,2755,2756,2757,2758,2759],
+  "c3_m22_handover": [2760,2761,2762,2763,2764,2765,2766,2767,2768,2769,2770,2771,2772,2773,2774,2775,2776,2777,2778,2779,2780,2781,2782,2783,2784,2785,2786,2787,2788,2789,2790,2791,2792,2793,2794,2795,1820,1820,2796,2797,2798,2799,2800,2801,2802,2803,2804,2805,2806,2807,2808,2809,2810,2811,2812,2813,2303,2304,2814,2815,2816,2817,2818,2819,2820,2821,2822,2823,2824,2825,2826,2827,2828,2829,2830,2831,2832,2833,2834,2835,2836,2837]
 };
 
-function stripLeadingBracketTag(s){
-  const m = String(s||'').trim().match(/^\[[^\]]+\]\s*(.*)$/);
-  return (m ? m[1] : String(s||'')).trim();
-}
+const GLOBAL = [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,91,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,608,609,610,611,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,981,991,992,993,985,994,995,996,997,998,999,1000,977,1001,1002,1003,987,1004,979,1005,1002,1006,997,1007,997,1008,995,1009,987,1010,981,1011,1012,1013,985,1014,985,1015,992,1016,979,1017,985,1018,997,1019,1012,1020,985,1021,1002,1022,1002,1023,985,1024,989,1025,987,1026,1002,1027,981,1028,1012,1029,1030,1031,1002,1032,1002,1033,1030,1034,1030,1035,1002,1036,1012,1037,1012,1038,1012,1039,979,1040,987,1041,1002,1042,1012,1043,1002,1044,992,1045,1012,1046,985,1047,1002,1048,1012,1049,1002,1050,981,1051,981,1052,985,1053,985,1054,1055,1056,1055,1057,985,1058,985,1059,977,1060,979,1061,1062,1063,985,1064,1002,1065,981,1066,981,1067,977,1068,985,1069,1062,1070,1002,1071,1002,1072,979,1073,997,1074,985,1075,1002,1076,997,1077,979,1078,997,1079,999,1080,1055,1081,1002,1082,997,1083,981,1084,985,1085,1002,1086,1087,1088,1002,1089,981,1090,981,1091,985,1092,979,1093,1002,1094,981,1095,1002,1096,997,1097,997,1098,989,1099,997,1100,997,1101,981,1102,1002,1103,981,1104,1002,1105,977,1106,979,1107,997,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1169,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1211,1212,1213,1214,1215,1216,1217,1218,1219,1220,1221,1222,1223,1224,1225,1226,1227,1228,1229,1230,1231,1232,1233,1234,1235,1236,1237,1238,1239,1240,1241,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1278,1279,1280,1281,1282,1283,1284,1285,1286,1287,1288,1289,1290,1291,1292,1293,1294,1295,1296,1297,1298,1299,1300,1301,1302,1303,1304,1305,1306,1307,1308,1309,1310,1311,1312,1313,1314,1315,1316,1317,1318,1319,1320,1321,1322,1323,1324,1325,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1357,1358,1359,1360,1361,1362,1363,1364,1365,1366,1367,1368,1369,1370,1371,1372,1373,1374,1375,1376,1377,1378,1379,1380,1381,1382,1383,1384,1385,1386,1387,1388,1389,1390,1391,1392,1393,1394,1395,1396,1397,1398,1399,1400,1401,1402,1403,1404,1405,1406,1407,1408,1409,1410,1411,1412,1413,1414,1415,1416,1417,1418,1419,1420,1421,1422,1423,1424,1425,1426,1427,1428,1429,1430,1431,1432,1433,1434,1435,1436,1437,1438,1439,1440,1441,1442,1443,1444,1445,1446,1447,1448,1449,1450,1451,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1466,1467,1468,1469,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1482,1483,1484,1485,1486,1487,1488,1489,1490,1491,1492,1493,1494,1495,1496,1497,1498,1499,1500,1501,1502,1503,1504,1505,1506,1507,1508,1509,1510,1511,1512,1513,1514,1515,1516,1517,1518,1519,1520,1521,1522,1523,1524,1525,1526,1527,1528,1529,1530,1531,1532,1533,1534,1535,1536,1537,1538,1539,1540,1541,1542,1543,1544,1545,1546,1547,1548,1549,1550,1551,1552,1553,1554,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1570,1571,1572,1573,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1590,1591,1592,1593,1594,1595,1596,1597,1598,1600,1601,1602,1603,1604,1605,1606,1607,1608,1609,1610,1611,1612,1613,1614,1615,1616,1617,1618,1619,1620,1621,1622,1623,1624,1625,1626,1627,1628,1629,1630,1631,1632,1633,1634,1635,1636,1637,1638,1639,1640,1641,1642,1643,1644,1645,1646,1647,1648,1649,1650,1651,1652,1653,1654,1655,1656,1657,1658,1659,1660,1661,1662,1663,1664,1665,1666,1667,1668,1669,1670,1671,1672,1673,1674,1675,1676,1677,1678,1679,1680,1681,1682,1683,1684,1685,1686,1687,1688,1689,1690,1691,1692,1693,1694,1695,1696,1697,1698,1699,1700,1701,1702,1703,1704,1705,1706,1707,1708,1709,1710,1711,1712,1713,1714,1715,1716,1717,1718,1719,1720,1721,1722,1723,1724,1725,1726,1727,1728,1729,1730,1731,1732,1733,1734,1735,1736,1737,1738,1739,1740,1741,1742,1743,1744,1745,1746,1747,1748,1749,1750,1751,1752,1753,1754,1755,1756,1757,1758,1759,1760,1761,1762,1763,1764,1765,1766,1767,1768,1769,1770,1771,1772,1773,1774,1775,1776,1777,1778,1779,1780,1781,1782,1783,1784,1785,1786,1787,1788,1789,1790,1791,1792,1793,1794,1795,1796,1797,1798,1799,1800,1801,1802,1803,1804,1805,1806,1807,1808,1809,1810,1811,1812,1813,1814,1815,1816,1817,1818,1819,1820,1820,1821,1822,1823,1824,1825,1826,1827,1828,1829,1830,1831,1832,1833,1834,1835,1836,1837,1838,1839,1840,1841,1842,1843,1844,1845,1846,1847,1848,1849,1850,1851,1852,1853,1854,1855,1856,1857,1858,1859,1860,1861,1862,1863,1864,1865,1866,1867,1868,1869,1870,1871,1872,1873,1874,1875,1876,1877,1878,1879,1880,1881,1882,1883,1884,1885,1886,1887,1888,1889,1890,1891,1892,1893,1894,1895,1896,1897,1898,1899,1900,1901,1902,1903,1904,1905,1906,1907,1908,1909,1910,1911,1912,1913,1914,1915,1916,1917,1918,1919,1920,1921,1922,1923,1924,1925,1926,1927,1928,1929,1930,1931,1932,1933,1934,1935,1936,1937,1938,1939,1940,1941,1942,1943,1944,1945,1946,1947,1948,1949,1950,1951,1952,1953,1954,1955,1956,1957,1958,1959,1960,1961,1962,1963,1964,1965,1966,1967,1968,1969,1970,1971,1972,1973,1974,1975,1976,1977,1978,1979,1980,1981,1982,1983,1984,1985,1986,1987,1988,1989,1990,1991,1992,1993,1994,1995,1996,1997,1998,1999,2000,2001,2002,2003,2004,2005,2006,2007,2008,2009,2010,2011,2012,2013,2014,2015,2016,2017,2018,2019,2020,2021,2022,2023,2024,2025,2026,2027,2028,2029,2030,2031,2032,2033,2034,2035,2036,2037,2038,2039,2040,2041,2042,2043,2044,2045,2046,2047,699,2048,2049,2050,2051,2052,2053,2054,2055,2056,2057,2058,2059,2060,2061,2062,2063,2064,2065,2066,2067,2068,2069,2070,2071,2072,2073,2074,2075,2076,2077,2078,2079,2080,2081,2082,2083,2084,2085,2086,2087,2088,2089,2090,2091,2092,2093,2094,2095,2096,2097,2098,2099,2100,2101,2102,2103,2104,2105,2106,2107,2108,2109,2110,2111,2112,2113,2114,2115,2116,2117,2118,2119,2120,2121,2122,2123,2124,2125,2126,2127,2128,2129,2130,2131,2132,2133,2134,2135,2136,2137,2138,2139,2140,2141,2142,2143,2144,2145,2146,2147,2148,2149,2150,2151,2152,2153,2154,2155,2156,2157,2158,2159,2160,2161,2162,2163,2164,2165,2166,2167,2168,2169,2170,2171,2172,2173,2174,2175,2176,2177,2178,2179,2180,2181,2182,2183,2184,2185,2186,2187,2188,2189,2190,2191,2192,2193,2194,2195,2196,2197,2198,2199,2200,2201,2202,2203,2204,2205,2206,2207,2208,2209,2210,2211,2212,2213,2214,2215,2216,2217,2218,2219,2220,2221,2222,2223,2224,2225,2226,2227,2228,2229,2230,2231,2232,2233,2234,2235,2236,2237,2238,2239,2240,2241,2242,2243,2244,2245,2246,2247,2248,2249,2251,2252,2253,2254,2255,2256,2257,2258,2259,2260,2261,2262,2263,2264,2265,2266,2267,2268,2269,2270,2271,2272,2273,2274,2275,2276,2277,2278,2279,2280,2281,2282,2283,2284,2285,2286,2287,2288,2289,2290,2291,2292,2293,2294,2295,2296,2297,2298,2299,2300,2301,2302,2303,2304,2305,2306,2307,2308,2309,2310,2311,2312,2313,2314,2315,2316,2317,2318,2319,2320,2321,2322,2323,2324,2325,2326,2327,2328,2330,2331,2332,2333,2334,2335,2336,2337,2338,2339,2340,2341,2342,2343,2344,2345,2346,2347,2348,2349,2350,2351,2352,2353,2354,2355,2356,2357,2358,2359,2360,2361,2362,2363,2364,2365,2366,2367,2368,2369,2370,2371,2372,2373,2374,2375,2376,2377,2378,2379,2380,2381,2382,2383,2384,2385,2386,2387,2388,2389,2390,2391,2392,2393,2394,2395,2396,2397,2398,2399,2400,2401,2402,2403,2404,2405,2406,2407,2408,2409,2410,2411,2412,2413,2414,2415,2416,2417,2418,2419,2420,2421,2422,2423,2424,2425,2426,2427,2428,2429,2430,2431,2432,2433,2434,2435,2436,2437,2438,2439,2440,2441,2442,2443,2444,2445,2446,2447,2448,2449,2450,2451,2452,2453,2454,2455,2456,2457,2458,2459,2460,2461,2462,2463,2464,2465,2466,2467,2468,2469,2470,2471,2472,2473,2474,2475,2476,2477,2478,2479,2480,2481,2482,2483,2484,2485,2486,2487,2488,2489,2490,2491,2492,2493,2494,2495,2496,2497,2498,2499,2500,2501,2502,2503,2504,2505,2507,2508,2509,2510,2511,2512,2513,2514,2515,2516,2517,2518,2519,2520,2521,2522,2523,2524,2525,2526,2527,2528,2529,2530,2531,2532,2533,2534,2536,2537,2538,2539,2540,2541,2542,2542,2543,2544,2545,2546,2547,2548,2549,2550,2551,2552,2553,2554,2555,2556,2557,2558,2559,2560,2561,2562,2563,2564,2565,2566,2567,2568,2569,2570,2571,2572,2573,2574,2575,2576,2577,2578,2579,2580,2581,2582,2583,2584,2585,2586,2587,2588,2589,2590,2591,2592,2593,2594,2595,2596,2597,2598,2599,2600,2601,2602,2603,2604,2605,2606,2607,2608,2609,2610,2612,2613,2614,2615,2616,2617,2618,2619,2620,2621,2622,2623,2624,2625,2626,2627,2628,2629,2630,2631,2632,2633,2634,2635,2636,2637,2638,2639,2640,2641,2642,2643,2644,2645,2646,2647,2648,2649,2650,2651,2652,2653,2654,2655,2656,2657,2658,2659,2660,2661,2662,2663,2664,2665,2666,2667,2668,2669,2670,2671,2672,2673,2674,2675,2676,2677,2678,2679,2680,2681,2682,2683,2684,2685,2686,2687,2688,2689,2690,2691,2692,2693,2694,2695,2696,2697,2698,2699,2700,2701,2702,2703,2704,2705,2706,2707,2708,2709,2710,2711,2712,2713,2714,2715,2716,2717,2718,2719,2720,2721,2722,2723,2724,2725,2726,2727,2728,2729,2730,2731,2732,2733,2734,2735,2736,2737,2738,2739,2740,2741,2742,2743,2744,2745,2746,2747,2748,2749,2750,2751,2752,2753,2754,2755,2756,2757,2758,2759,2760,2761,2762,2763,2764,2765,2766,2767,2768,2769,2770,2771,2772,2773,2774,2775,2776,2777,2778,2779,2780,2781,2782,2783,2784,2785,2786,2787,2788,2789,2790,2791,2792,2793,2794,2795,2796,2797,2798,2799,2800,2801,2802,2803,2804,2805,2806,2807,2808,2809,2810,2811,2812,2813,2814,2815,2816,2817,2818,2819,2820,2821,2822,2823,2824,2825,2826,2827,2828,2829,2830,2831,2832,2833,2834,2835,2836,2837];
 
-function normalizeKey(s){
-  return stripLeadingBracketTag(s)
-    .replace(/\s+/g,' ')
-    .replace(/[“”]/g,'\"')
-    .replace(/[‘’]/g,"'")
-    .trim();
+function table(idx){
+  const t = {};
+  for(let i = 0; i < idx.length; i += 2) t[S[idx[i]]] = S[idx[i + 1]];
+  return t;
 }
 
-function hasHangul(s){
-  return /[가-힣]/.test(String(s||''));
+// { missionId: { normalizedKo: en } }; a mission table is built on first access
+export const KO_EN_BY_MISSION = {};
+for(const [id, idx] of Object.entries(BY_MISSION)){
+  Object.defineProperty(KO_EN_BY_MISSION, id, {
+    enumerable: true,
+    configurable: true,
+    get(){
+      const t = table(idx);
+      Object.defineProperty(KO_EN_BY_MISSION, id, { value: t, enumerable: true });
+      return t;
+    },
+  });
 }
 
-// very small fallback for unmapped short lines
-function phraseFallback(ko){
-  let out = String(ko||'');
-  out = out.split("웨이포인트").join("waypoint");
-  out = out.split("확인.").join("Copy.");
-  out = out.split("확인").join("Copy");
-  out = out.split("좋아.").join("Good.");
-  out = out.split("좋아").join("Good");
-  out = out.split("계속 간다.").join("Keep moving.");
-  out = out.split("계속 간다").join("Keep moving");
-  out = out.split("조심.").join("Stay sharp.");
-  out = out.split("조심").join("Stay sharp");
-  return out;
-}
+export const KO_EN_GLOBAL = table(GLOBAL);
 
 export function translateKOtoEN(raw, missionId=''){
-  const full = String(raw||'').trim();
-  if(!full) return full;
-
-  // Preserve leading [채널] 태그는 그대로 두고 본문만 변환
-  let tag = '';
-  let body = full;
-  const m = full.match(/^(\[[^\]]+\])\s*(.*)$/);
-  if(m){
-    tag = m[1];
-    body = (m[2]||'').trim();
-  }
-
-  // 이미 영문이면 그대로
-  if(!hasHangul(body)) return full;
-
-  const key = normalizeKey(body);
-  const mid = String(missionId||'');
-
-  let en = (KO_EN_BY_MISSION?.[mid]?.[key]) || (KO_EN_GLOBAL?.[key]) || '';
-  if(!en){
-    // try mapping using full key as well
-    const k2 = normalizeKey(full);
-    en = (KO_EN_BY_MISSION?.[mid]?.[k2]) || (KO_EN_GLOBAL?.[k2]) || '';
-  }
-  if(!en){
-    en = phraseFallback(body);
-    // if nothing changed, bail
-    if(en === body) return full;
-  }
-
-  // If mapping already includes a bracket tag, prefer it; else preserve original tag
-  const hasTag = /^\[[^\]]+\]/.test(en);
-  if(tag && !hasTag) return (tag + ' ' + en).trim();
-  return en;
+  return translateWith(raw, KO_EN_BY_MISSION?.[String(missionId||'')], KO_EN_GLOBAL);
 }
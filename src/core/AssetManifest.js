@@ -0,0 +1,49 @@
+// src/core/AssetManifest.js
+// Logical asset path -> content-hashed URL, from the asset-manifest.json
+// written by `python -m tools.build_static`. Built pages carry
+// <meta name="strikegy-assets" content="asset-manifest.json">; without it
+// (the source tree, tools.watch) every path resolves to itself.
+// Hashed files never change, so they are fetched with the normal HTTP cache;
+// anything else keeps the caller's revalidating cache mode.
+
+const META = 'strikegy-assets';
+let _manifest = null; // Promise<{ root: URL, files: {logical: hashed} } | null>
+
+export function loadAssetManifest(){
+  if(!_manifest){
+    const href = document.querySelector(`meta[name="${META}"]`)?.getAttribute('content');
+    if(!href){
+      _manifest = Promise.resolve(null);
+    }else{
+      const url = new URL(href, document.baseURI);
+      _manifest = fetch(url, { cache: 'no-cache' })
+        .then((res)=> res.ok ? res.json() : null)
+        .then((m)=> m?.files ? { root: new URL('./', url), files: m.files } : null)
+        .catch((e)=>{ console.warn('[assets] manifest unavailable', e); return null; });
+    }
+  }
+  return _manifest;
+}
+
+// path: relative to the page or absolute (query/hash are dropped for the
+// lookup). Resolves to { url, hashed }.
+export async function resolveAsset(path){
+  const m = await loadAssetManifest();
+  const url = new URL(path, document.baseURI);
+  if(m){
+    const bare = new URL(url);
+    bare.search = '';
+    bare.hash = '';
+    if(bare.href.startsWith(m.root.href)){
+      const name = m.files[decodeURI(bare.href.slice(m.root.href.length))];
+      if(name) return { url: new URL(name, m.root), hashed: true };
+    }
+  }
+  return { url, hashed: false };
+}
+
+// fetch() through the manifest; `cache` applies to unhashed paths only.
+export async function fetchAsset(path, cache = 'no-cache'){
+  const { url, hashed } = await resolveAsset(path);
+  return fetch(url, hashed ? undefined : { cache });
+}
@@ -0,0 +1,38 @@
+// src/core/LiveReload.js
+// Dev only: reload the page when `python -m tools.watch --serve` rebuilds
+// something it uses. Off unless the page was opened with ?watch=1 (the flag
+// sticks for the tab, so lobby -> campaign -> game navigation keeps it).
+
+const FLAG = 'strikegy_watch';
+const ENDPOINT = '/__watch';
+
+function enabled(){
+  try{
+    const q = new URL(window.location.href).searchParams.get('watch');
+    if(q === '1') sessionStorage.setItem(FLAG, '1');
+    if(q === '0') sessionStorage.removeItem(FLAG);
+    return sessionStorage.getItem(FLAG) === '1';
+  }catch{ return false; }
+}
+
+// relevant(event) -> bool decides whether this page reloads; events look like
+//   { kind: 'campaign', missions: [...], files: [...] }
+//   { kind: 'map', maps: ['maps/zone_5_v1.json'], files: [...] }
+//   { kind: 'error', message }
+export function startLiveReload(relevant = () => true){
+  if(!enabled() || typeof EventSource === 'undefined') return null;
+  const es = new EventSource(ENDPOINT);
+  es.onmessage = (msg)=>{
+    let ev = null;
+    try{ ev = JSON.parse(msg.data); }catch{ return; }
+    if(ev?.kind === 'error'){
+      console.warn('[watch]', ev.message);
+      return;
+    }
+    let hit = false;
+    try{ hit = !!relevant(ev); }catch(e){ console.warn('[watch] relevant() failed', e); }
+    console.info('[watch]', ev?.kind, hit ? 'reloading' : 'ignored', ev);
+    if(hit) window.location.reload();
+  };
+  return es;
+}
@@ -579,7 +579,9 @@ export class ClassItemSystem {
 
   _removeLadderColliders(){
     const cw = this.collisionWorld;
-    if(!cw || !Array.isArray(cw.boxes)) return;
+    if(!cw) return;
+    if(typeof cw.removeTypes === 'function'){ cw.removeTypes('ladder', 'ladder_cap'); return; }
+    if(!Array.isArray(cw.boxes)) return;
     cw.boxes = cw.boxes.filter(b => (b.type !== 'ladder' && b.type !== 'ladder_cap'));
   }
 
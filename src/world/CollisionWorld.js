@@ -3,13 +3,166 @@ import * as THREE from "https://unpkg.com/three@0.160.0/build/three.module.js";
 const _closest = new THREE.Vector3();
 const _delta = new THREE.Vector3();
 
+// Boxes are stored packed: STRIDE floats per box (min xyz, max xyz).
+export const STRIDE = 6;
+
+// Broadphase: uniform XZ grid, CSR layout (cellStart/items), same as the
+// index tools/compile_maps.py bakes into .smap files.
+export const GRID_CELL = 16;
+// capsule may drift this far from where candidates were gathered before a re-query
+const QUERY_MARGIN = 2;
+
+// FNV-1a over the packed float32 boxes (tools/compile_maps.py box_hash)
+export function hashBoxes(collisionWorld){
+  const cw = collisionWorld;
+  if(!cw?.minmax) return 0;
+  const bytes = new Uint8Array(cw.minmax.buffer, cw.minmax.byteOffset, (cw.count || 0) * STRIDE * 4);
+  let h = 0x811c9dc5;
+  for(let i=0; i<bytes.length; i++){
+    h ^= bytes[i];
+    h = Math.imul(h, 0x01000193);
+  }
+  return h >>> 0;
+}
+
+/**
+ * @param {Float32Array} minmax
+ * @param {number} count
+ * @returns {{originX:number,originZ:number,cellSize:number,cols:number,rows:number,
+ *   cellStart:Uint32Array|Uint16Array,items:Uint32Array|Uint16Array}|null}
+ */
+export function buildGridIndex(minmax, count, cellSize=GRID_CELL){
+  if(count <= 0) return null;
+  let x0 = Infinity, z0 = Infinity, x1 = -Infinity, z1 = -Infinity;
+  for(let i=0, o=0; i<count; i++, o+=STRIDE){
+    x0 = Math.min(x0, minmax[o]); z0 = Math.min(z0, minmax[o+2]);
+    x1 = Math.max(x1, minmax[o+3]); z1 = Math.max(z1, minmax[o+5]);
+  }
+  const cols = Math.max(1, Math.ceil((x1 - x0) / cellSize));
+  const rows = Math.max(1, Math.ceil((z1 - z0) / cellSize));
+  const cell = (v, origin, n)=> Math.min(n - 1, Math.max(0, Math.floor((v - origin) / cellSize)));
+
+  const cellStart = new Uint32Array(cols * rows + 1);
+  const span = (o)=> [cell(minmax[o], x0, cols), cell(minmax[o+3], x0, cols), cell(minmax[o+2], z0, rows), cell(minmax[o+5], z0, rows)];
+  for(let i=0, o=0; i<count; i++, o+=STRIDE){
+    const [ca, cb, ra, rb] = span(o);
+    for(let r=ra; r<=rb; r++) for(let c=ca; c<=cb; c++) cellStart[r*cols + c + 1]++;
+  }
+  for(let k=0; k<cols*rows; k++) cellStart[k+1] += cellStart[k];
+  const items = new Uint32Array(cellStart[cols*rows]);
+  const fill = cellStart.slice(0, cols*rows);
+  for(let i=0, o=0; i<count; i++, o+=STRIDE){
+    const [ca, cb, ra, rb] = span(o);
+    for(let r=ra; r<=rb; r++) for(let c=ca; c<=cb; c++) items[fill[r*cols + c]++] = i;
+  }
+  return { originX: x0, originZ: z0, cellSize, cols, rows, cellStart, items };
+}
+
 export default class CollisionWorld {
   constructor(){
-    /** @type {{min:THREE.Vector3,max:THREE.Vector3,type?:string}[]} */
-    this.boxes = [];
+    /** @type {Float32Array} packed AABBs, `count` boxes of STRIDE floats */
+    this.minmax = new Float32Array(64 * STRIDE);
+    /** @type {(string|undefined)[]} type per box */
+    this.types = [];
+    this.count = 0;
+    /** @type {{min:THREE.Vector3,max:THREE.Vector3,type?:string}[]|null} */
+    this._boxes = null;
+
+    /** broadphase grid (see buildGridIndex); rebuilt lazily after changes */
+    this.index = null;
+    this.useIndex = true;
+    this._cand = new Uint32Array(64);
+    this._stamp = new Uint32Array(0);
+    this._stampGen = 0;
+  }
+
+  _changed(){
+    this._boxes = null;
+    this.index = null;
+  }
+
+  clear(){
+    this.count = 0;
+    this.types.length = 0;
+    this._changed();
+  }
+
+  /**
+   * Use a pre-baked grid (`map.packed.index` from a compiled .smap) if it was
+   * built for exactly the boxes currently in the world.
+   * @returns {boolean} true if attached
+   */
+  attachIndex(index){
+    if(!index || index.hash !== hashBoxes(this)) return false;
+    this.index = index;
+    return true;
+  }
+
+  _ensureIndex(){
+    if(!this.index) this.index = buildGridIndex(this.minmax, this.count);
+    if(this._stamp.length < this.count){
+      this._stamp = new Uint32Array(this.count);
+      this._stampGen = 0;
+    }
+    return this.index;
   }
 
-  clear(){ this.boxes.length = 0; }
+  /**
+   * Box indices whose grid cells overlap [minX,maxX] x [minZ,maxZ], ascending,
+   * only those >= `from`. Written to this._cand; returns the count.
+   */
+  queryXZ(minX, minZ, maxX, maxZ, from=0){
+    const g = this._ensureIndex();
+    if(!g) return 0;
+    const cs = g.cellSize;
+    const c0 = Math.max(0, Math.floor((minX - g.originX) / cs));
+    const c1 = Math.min(g.cols - 1, Math.floor((maxX - g.originX) / cs));
+    const r0 = Math.max(0, Math.floor((minZ - g.originZ) / cs));
+    const r1 = Math.min(g.rows - 1, Math.floor((maxZ - g.originZ) / cs));
+    if(c0 > c1 || r0 > r1) return 0;
+
+    if(++this._stampGen === 0xffffffff){ this._stamp.fill(0); this._stampGen = 1; }
+    const gen = this._stampGen, stamp = this._stamp;
+    let cand = this._cand, n = 0;
+    for(let r=r0; r<=r1; r++){
+      for(let c=c0; c<=c1; c++){
+        const cell = r*g.cols + c;
+        for(let k=g.cellStart[cell], e=g.cellStart[cell+1]; k<e; k++){
+          const i = g.items[k];
+          if(i < from || stamp[i] === gen) continue;
+          stamp[i] = gen;
+          if(n === cand.length){
+            const next = new Uint32Array(cand.length * 2);
+            next.set(cand);
+            cand = this._cand = next;
+          }
+          cand[n++] = i;
+        }
+      }
+    }
+    if(n > 1) cand.subarray(0, n).sort();
+    return n;
+  }
+
+  _reserve(n){
+    const need = (this.count + n) * STRIDE;
+    if(need <= this.minmax.length) return;
+    let cap = this.minmax.length || STRIDE;
+    while(cap < need) cap *= 2;
+    const next = new Float32Array(cap);
+    next.set(this.minmax.subarray(0, this.count * STRIDE));
+    this.minmax = next;
+  }
+
+  addBox(type, minX, minY, minZ, maxX, maxY, maxZ){
+    this._reserve(1);
+    const f = this.minmax, o = this.count * STRIDE;
+    f[o] = minX; f[o+1] = minY; f[o+2] = minZ;
+    f[o+3] = maxX; f[o+4] = maxY; f[o+5] = maxZ;
+    this.types.push(type);
+    this.count++;
+    this._changed();
+  }
 
   /**
    * Add AABB from centered box (size, pos) like our map objects.
@@ -20,9 +173,80 @@ export default class CollisionWorld {
   addCenteredBox(type, size, pos){
     const [sx, sy, sz] = size;
     const [px, py, pz] = pos;
-    const min = new THREE.Vector3(px - sx/2, py - sy/2, pz - sz/2);
-    const max = new THREE.Vector3(px + sx/2, py + sy/2, pz + sz/2);
-    this.boxes.push({ min, max, type });
+    this.addBox(type, px - sx/2, py - sy/2, pz - sz/2, px + sx/2, py + sy/2, pz + sz/2);
+  }
+
+  /**
+   * Bulk-add packed boxes (e.g. `map.packed` from a compiled .smap).
+   * @param {Float32Array} minmax STRIDE floats per box
+   * @param {Uint8Array} typeIds index into `typeTable` per box
+   * @param {string[]} typeTable
+   * @param {Uint8Array|null} keep optional per-box mask (0 = skip)
+   */
+  addBoxArray(minmax, typeIds, typeTable, keep=null){
+    const n = typeIds.length;
+    this._reserve(n);
+    if(!keep){
+      this.minmax.set(minmax.subarray(0, n * STRIDE), this.count * STRIDE);
+      for(let i=0; i<n; i++) this.types.push(typeTable[typeIds[i]]);
+      this.count += n;
+    }else{
+      const f = this.minmax;
+      let o = this.count * STRIDE;
+      for(let i=0; i<n; i++){
+        if(!keep[i]) continue;
+        f.set(minmax.subarray(i * STRIDE, (i + 1) * STRIDE), o);
+        o += STRIDE;
+        this.types.push(typeTable[typeIds[i]]);
+        this.count++;
+      }
+    }
+    this._changed();
+  }
+
+  /** Drop every box whose type is in `types`. */
+  removeTypes(...types){
+    const drop = new Set(types);
+    const f = this.minmax;
+    let w = 0;
+    for(let r=0; r<this.count; r++){
+      if(drop.has(this.types[r])) continue;
+      if(w !== r){
+        f.copyWithin(w * STRIDE, r * STRIDE, (r + 1) * STRIDE);
+        this.types[w] = this.types[r];
+      }
+      w++;
+    }
+    this.count = w;
+    this.types.length = w;
+    this._changed();
+  }
+
+  /**
+   * Legacy object view ({min, max, type} with Vector3s), built on first use
+   * after a change. Prefer reading `minmax`/`types`/`count` directly.
+   */
+  get boxes(){
+    if(!this._boxes){
+      const f = this.minmax;
+      const out = new Array(this.count);
+      for(let i=0, o=0; i<this.count; i++, o+=STRIDE){
+        out[i] = {
+          min: new THREE.Vector3(f[o], f[o+1], f[o+2]),
+          max: new THREE.Vector3(f[o+3], f[o+4], f[o+5]),
+          type: this.types[i],
+        };
+      }
+      this._boxes = out;
+    }
+    return this._boxes;
+  }
+
+  set boxes(list){
+    this.clear();
+    for(const b of list || []){
+      this.addBox(b.type, b.min.x, b.min.y, b.min.z, b.max.x, b.max.y, b.max.z);
+    }
   }
 
   /**
@@ -40,67 +264,32 @@ export default class CollisionWorld {
     // capsule vertical segment range
     const yMin = pos.y - halfHeight;
     const yMax = pos.y + halfHeight;
+    const grid = this.useIndex ? this._ensureIndex() : null;
+    const reach = radius + QUERY_MARGIN;
 
     // a few iterations helps sliding along corners
     for(let iter=0; iter<3; iter++){
       let movedThisIter = false;
 
-      for(const b of this.boxes){
-        // vertical overlap check
-        if (yMax < b.min.y || yMin > b.max.y) continue;
-
-        // Patch 7-4I: if the capsule is entirely above the top face (standing on the box),
-        // we do NOT resolve XZ against it. This lets players stand/walk on top of inner walls
-        // without being shoved sideways by the XZ-only solver.
-        if (yMin >= b.max.y - 1e-3) continue;
-
-// closest point on AABB to capsule center in XZ
-        const clx = Math.max(b.min.x, Math.min(pos.x, b.max.x));
-        const clz = Math.max(b.min.z, Math.min(pos.z, b.max.z));
-
-        const dx = pos.x - clx;
-        const dz = pos.z - clz;
-        const d2 = dx*dx + dz*dz;
-
-        // If center is inside the box in XZ, dx=dz=0 and we need a fallback push direction.
-        const insideXZ = (pos.x > b.min.x && pos.x < b.max.x && pos.z > b.min.z && pos.z < b.max.z);
-
-        if (insideXZ){
-          // push out to the nearest face, plus capsule radius
-          const penLeft  = pos.x - b.min.x;
-          const penRight = b.max.x - pos.x;
-          const penBack  = pos.z - b.min.z;
-          const penFront = b.max.z - pos.z;
-
-          const minPen = Math.min(penLeft, penRight, penBack, penFront);
-
-          if (minPen === penLeft){
-            pos.x = b.min.x - radius;
-          } else if (minPen === penRight){
-            pos.x = b.max.x + radius;
-          } else if (minPen === penBack){
-            pos.z = b.min.z - radius;
-          } else {
-            pos.z = b.max.z + radius;
-          }
-
-          hit = true;
-          movedThisIter = true;
-          continue;
+      if(!grid){
+        for(let i=0; i<this.count; i++){
+          if(this._pushOut(i*STRIDE, pos, radius, yMin, yMax)){ hit = true; movedThisIter = true; }
         }
-
-        if (d2 < radius*radius - 1e-9){
-          const d = Math.sqrt(Math.max(d2, 1e-12));
-          const push = radius - d;
-
-          const nx = dx / d;
-          const nz = dz / d;
-
-          pos.x += nx * push;
-          pos.z += nz * push;
-
+      }else{
+        // Only boxes near the capsule, in the same (ascending) order as the full scan.
+        // Re-query the rest if a push carries the capsule past the query margin.
+        let gx = pos.x, gz = pos.z;
+        let n = this.queryXZ(gx - reach, gz - reach, gx + reach, gz + reach);
+        for(let k=0; k<n; k++){
+          const i = this._cand[k];
+          if(!this._pushOut(i*STRIDE, pos, radius, yMin, yMax)) continue;
           hit = true;
           movedThisIter = true;
+          if(Math.abs(pos.x - gx) > QUERY_MARGIN || Math.abs(pos.z - gz) > QUERY_MARGIN){
+            gx = pos.x; gz = pos.z;
+            n = this.queryXZ(gx - reach, gz - reach, gx + reach, gz + reach, i + 1);
+            k = -1;
+          }
         }
       }
 
@@ -109,4 +298,60 @@ export default class CollisionWorld {
 
     return hit;
   }
-}
\ No newline at end of file
+
+  // Push the capsule out of box at float offset `o`; true if it moved.
+  _pushOut(o, pos, radius, yMin, yMax){
+    const f = this.minmax;
+    const bminX = f[o], bminY = f[o+1], bminZ = f[o+2];
+    const bmaxX = f[o+3], bmaxY = f[o+4], bmaxZ = f[o+5];
+    // vertical overlap check
+    if (yMax < bminY || yMin > bmaxY) return false;
+
+    // Patch 7-4I: if the capsule is entirely above the top face (standing on the box),
+    // we do NOT resolve XZ against it. This lets players stand/walk on top of inner walls
+    // without being shoved sideways by the XZ-only solver.
+    if (yMin >= bmaxY - 1e-3) return false;
+
+    // closest point on AABB to capsule center in XZ
+    const clx = Math.max(bminX, Math.min(pos.x, bmaxX));
+    const clz = Math.max(bminZ, Math.min(pos.z, bmaxZ));
+
+    const dx = pos.x - clx;
+    const dz = pos.z - clz;
+    const d2 = dx*dx + dz*dz;
+
+    // If center is inside the box in XZ, dx=dz=0 and we need a fallback push direction.
+    const insideXZ = (pos.x > bminX && pos.x < bmaxX && pos.z > bminZ && pos.z < bmaxZ);
+
+    if (insideXZ){
+      // push out to the nearest face, plus capsule radius
+      const penLeft  = pos.x - bminX;
+      const penRight = bmaxX - pos.x;
+      const penBack  = pos.z - bminZ;
+      const penFront = bmaxZ - pos.z;
+
+      const minPen = Math.min(penLeft, penRight, penBack, penFront);
+
+      if (minPen === penLeft){
+        pos.x = bminX - radius;
+      } else if (minPen === penRight){
+        pos.x = bmaxX + radius;
+      } else if (minPen === penBack){
+        pos.z = bminZ - radius;
+      } else {
+        pos.z = bmaxZ + radius;
+      }
+      return true;
+    }
+
+    if (d2 < radius*radius - 1e-9){
+      const d = Math.sqrt(Math.max(d2, 1e-12));
+      const push = radius - d;
+
+      pos.x += (dx / d) * push;
+      pos.z += (dz / d) * push;
+      return true;
+    }
+    return false;
+  }
+}
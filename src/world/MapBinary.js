@@ -0,0 +1,99 @@
+// src/world/MapBinary.js
+// Decoder for packed maps (.smap) written by tools/compile_maps.py.
+// The box arrays are typed-array views over the fetched buffer (no per-object
+// parsing); `map.objects` is only materialised when something reads it
+// (scene building, decals, minimap).
+
+const MAGIC = 0x50414d53; // 'SMAP' little-endian
+const VERSION = 5; // the only layout tools/compile_maps.py writes
+const HEADER_BYTES = 20;
+
+export function isMapBinary(buffer){
+  return buffer instanceof ArrayBuffer && buffer.byteLength >= HEADER_BYTES
+    && new DataView(buffer).getUint32(0, true) === MAGIC;
+}
+
+/**
+ * @param {ArrayBuffer} buffer
+ * @returns {object} map JSON shape plus
+ *   `packed: { count, minmax: Float32Array(count*6), typeIds: Uint8Array,
+ *              collision: Uint8Array (0 unset, 1 true, 2 false), types: string[],
+ *              other: object[], index: grid for CollisionWorld.attachIndex() | null }`
+ */
+export function decodeMapBinary(buffer){
+  const dv = new DataView(buffer);
+  if(dv.getUint32(0, true) !== MAGIC) throw new Error('Invalid map: bad magic');
+  const version = dv.getUint16(4, true);
+  if(version !== VERSION) throw new Error(`Invalid map: unsupported version ${version}`);
+  const count = dv.getUint32(8, true);
+  const metaLen = dv.getUint32(12, true);
+
+  const meta = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, HEADER_BYTES, metaLen)));
+  let off = HEADER_BYTES + metaLen;
+  off += (4 - (off % 4)) % 4;
+  const minmax = new Float32Array(buffer, off, count * 6);
+  off += count * 24;
+  const typeIds = new Uint8Array(buffer, off, count);
+  const collision = new Uint8Array(buffer, off + count, count);
+  off += count * 2;
+  off += (4 - (off % 4)) % 4;
+
+  // broadphase grid over the solid boxes (CSR; see tools/compile_maps.py)
+  let index = null;
+  if(off + 44 <= buffer.byteLength){
+    const cols = dv.getUint32(off + 28, true);
+    const rows = dv.getUint32(off + 32, true);
+    const nItems = dv.getUint32(off + 36, true);
+    const Arr = dv.getUint32(off + 40, true) === 16 ? Uint16Array : Uint32Array;
+    const nStart = cols * rows + 1;
+    index = {
+      hash: dv.getUint32(off, true),
+      originX: dv.getFloat64(off + 4, true),
+      originZ: dv.getFloat64(off + 12, true),
+      cellSize: dv.getFloat64(off + 20, true),
+      cols, rows,
+      cellStart: new Arr(buffer, off + 44, nStart),
+      items: new Arr(buffer, off + 44 + nStart * Arr.BYTES_PER_ELEMENT, nItems),
+    };
+  }
+
+  const map = meta.map || {};
+  const types = meta.types || [];
+  const other = meta.other || [];
+  // `other`: objects that were kept verbatim (not in the packed arrays)
+  map.packed = { count, minmax, typeIds, collision, types, other: other.map((e)=> e[1]), index };
+
+  let objects = null;
+  Object.defineProperty(map, 'objects', {
+    enumerable: true,
+    configurable: true,
+    get(){
+      if(!objects) objects = unpackObjects(map.packed, other);
+      return objects;
+    },
+    set(v){ objects = v; },
+  });
+  return map;
+}
+
+function unpackObjects({ count, minmax, typeIds, collision, types }, other){
+  const out = [];
+  let k = 0;
+  const pushOther = ()=>{
+    while(k < other.length && other[k][0] === out.length) out.push(other[k++][1]);
+  };
+  for(let i = 0, o = 0; i < count; i++, o += 6){
+    pushOther();
+    const obj = {
+      type: types[typeIds[i]],
+      shape: 'box',
+      pos: [(minmax[o] + minmax[o+3]) / 2, (minmax[o+1] + minmax[o+4]) / 2, (minmax[o+2] + minmax[o+5]) / 2],
+      size: [minmax[o+3] - minmax[o], minmax[o+4] - minmax[o+1], minmax[o+5] - minmax[o+2]],
+    };
+    if(collision[i]) obj.collision = collision[i] === 1;
+    out.push(obj);
+  }
+  pushOther();
+  while(k < other.length) out.push(other[k++][1]);
+  return out;
+}
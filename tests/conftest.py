@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# the tools run as `python -m tools.X` from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,17 @@
+from tools import p45_ultra_fix_en as p45
+from tools.bench_ko_to_en import bodies, ch2_lines, legacy_rule, rule_table
+from tools.campaigndoc import CAMPAIGN_JS, CampaignDoc
+
+
+def test_rule_table_matches_the_old_cascade_on_every_ch2_line():
+    # golden: every CH2 M1-20 line translates exactly as the hand-written cascade did
+    items = bodies(ch2_lines(CampaignDoc.load(CAMPAIGN_JS)))
+    assert len(items) >= 600
+    bad = [(b, legacy_rule(b), rule_table(b)) for b in items if legacy_rule(b) != rule_table(b)]
+    assert bad == []
+
+
+def test_ko_to_en_keeps_tags_and_english():
+    assert p45.ko_to_en('[무전] 확인.') == '[RADIO] Confirm.'
+    assert p45.ko_to_en('**Move.**') == 'Move.'
+    assert p45.ko_to_en('20초 버텨!') == 'Hold for 20 seconds.'
@@ -0,0 +1,33 @@
+import re
+
+from tools.campaigndoc import CAMPAIGN_JS
+from tools.missionpool import patch_section
+from tools.p45_ultra_fix_en import patch_mission
+from tools.pipeline import run
+
+# every `text:` value in the file, including the ones a run-on string swallowed
+TEXT_RE = re.compile(r"""\btext\s*:\s*(['"`])(.*?)\1""")
+LINE_RE = re.compile(r"""\{\s*t\s*:[^,]*,\s*speaker\s*:""")
+
+SECTION = """c2_m1_test: {
+    script: [
+      { id: 'a', type: 'say', speaker: CAST.HART, text: '계속 간다.' },
+      { id: 'b', type: 'say', speaker: CAST.HART, text: '가자.', lines: [{ t: 10, speaker: CAST.HART, text: '가자.' , en: `Affirm." }, { t: 22, speaker: CAST.NOVA, text: '좋아.' , en: "Copy.` }] },
+    ],
+  }"""
+
+
+def test_run_on_line_keeps_the_line_it_swallowed():
+    out = patch_section(patch_mission, 'c2_m1_test', SECTION)
+    lines = SECTION[SECTION.index('lines: ['):]
+    assert lines in out
+    assert out.count('speaker:') == SECTION.count('speaker:')
+    # the well-formed steps still get their en
+    assert out.count("en: '") == 2
+
+
+def test_no_dialogue_line_disappears_from_campaign_data():
+    text = CAMPAIGN_JS.read_text(encoding='utf-8')
+    out = run(text, ['p45_ultra_fix_en'], None, log=lambda *a: None)
+    assert len(LINE_RE.findall(out)) == len(LINE_RE.findall(text))
+    assert [m[1] for m in TEXT_RE.findall(out)] == [m[1] for m in TEXT_RE.findall(text)]
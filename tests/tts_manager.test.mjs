@@ -0,0 +1,112 @@
+// node --test tests/: TTSManager voice packs, decode LRU and prefetch budget
+// against a local stub server (voice pack files + a /tts endpoint).
+
+import { after, before, test } from "node:test";
+import assert from "node:assert/strict";
+import http from "node:http";
+import { TTSManager, ttsCacheKey } from "../src/audio/TTSManager.js";
+
+const LINE = { text: "Copy. Moving.", lang: "en-GB", voice: "hart" };
+const CLIP = Buffer.from("PACKCLIP".repeat(8));
+
+let server, base;
+const hits = { manifest: 0, pack: 0, tts: 0 };
+
+function voicePack(clips){
+  // tools/tts_prerender.py layout: 'SVPK', u16 version, u16 0, u32 J, index JSON, pad to 4, clips
+  const index = {};
+  let off = 0;
+  for(const [key, bytes] of Object.entries(clips)){ index[key] = [off, bytes.length]; off += bytes.length; }
+  const meta = Buffer.from(JSON.stringify(index));
+  const head = Buffer.alloc(12);
+  head.write("SVPK", 0, "latin1");
+  head.writeUInt16LE(1, 4);
+  head.writeUInt32LE(meta.length, 8);
+  const pad = Buffer.alloc((4 - ((12 + meta.length) % 4)) % 4);
+  return Buffer.concat([head, meta, pad, ...Object.values(clips)]);
+}
+
+const PACK = voicePack({ [ttsCacheKey(LINE.lang, LINE.voice, "", LINE.text)]: CLIP });
+
+before(async () => {
+  server = http.createServer((req, res) => {
+    if(req.url === "/voice/manifest.json"){
+      hits.manifest++;
+      res.setHeader("Content-Type", "application/json");
+      res.end(JSON.stringify({ version: 1, missions: { m1: "m1.aa.vpk", m2: "m1.aa.vpk", m3: "m1.aa.vpk" } }));
+    }else if(req.url === "/voice/m1.aa.vpk"){
+      hits.pack++;
+      res.end(PACK);
+    }else if(req.url === "/tts" && req.method === "POST"){
+      hits.tts++;
+      req.resume();
+      req.on("end", () => res.end(Buffer.alloc(64, 7)));
+    }else{
+      res.statusCode = 404;
+      res.end();
+    }
+  });
+  await new Promise((resolve) => server.listen(0, "127.0.0.1", resolve));
+  base = `http://127.0.0.1:${server.address().port}`;
+});
+
+after(() => server.close());
+
+function manager(opts = {}){
+  // decodeAudioData stub: the "AudioBuffer" is the clip's bytes
+  const ctx = { state: "running", decodeAudioData: (arr, ok) => ok({ bytes: Buffer.from(arr) }) };
+  const tts = new TTSManager({ soundSystem: { ctx, master: {} } });
+  tts.endpoint = `${base}/tts`;
+  tts.packDir = new URL("/voice/", base);
+  return Object.assign(tts, opts);
+}
+
+test("voice packs are off by default and make no request", async () => {
+  const n = hits.manifest;
+  const tts = manager();
+  assert.equal(tts.packsEnabled, false);
+  assert.equal(await tts.loadVoicePack("m1"), false);
+  assert.equal(hits.manifest, n);
+});
+
+test("a line in a loaded pack is warmed without calling the endpoint", async () => {
+  const tts = manager({ packsEnabled: true });
+  assert.equal(await tts.loadVoicePack("m1"), true);
+  const calls = hits.tts;
+  assert.equal(await tts.prefetch(LINE), true);
+  assert.equal(hits.tts, calls);
+  const key = ttsCacheKey(LINE.lang, LINE.voice, "", LINE.text);
+  assert.deepEqual(tts._cacheGet(key).bytes, CLIP);
+
+  assert.equal(await tts.prefetch({ ...LINE, text: "Not in the pack." }), true);
+  assert.equal(hits.tts, calls + 1);
+});
+
+test("missions without a pack resolve false; only MAX_PACKS packs are kept", async () => {
+  const tts = manager({ packsEnabled: true });
+  assert.equal(await tts.loadVoicePack("c9_nope"), false);
+  for(const id of ["m1", "m2", "m3"]) assert.equal(await tts.loadVoicePack(id), true);
+  assert.deepEqual([...tts._packs.keys()], ["m2", "m3"]);
+  await tts.loadVoicePack("m2"); // most recently used again
+  await tts.loadVoicePack("m1");
+  assert.deepEqual([...tts._packs.keys()], ["m2", "m1"]);
+});
+
+test("the decode cache drops the least recently used buffer", () => {
+  const tts = manager({ cacheMax: 2 });
+  tts._cacheSet("a", 1);
+  tts._cacheSet("b", 2);
+  tts._warm.set("b", 0);
+  assert.equal(tts._cacheGet("a"), 1);
+  tts._cacheSet("c", 3);
+  assert.deepEqual([...tts._cache.keys()], ["a", "c"]);
+  assert.equal(tts._warm.has("b"), false); // evicted before it was spoken
+});
+
+test("prefetch stops at prefetchMax until clearPrefetch()", async () => {
+  const tts = manager({ prefetchMax: 1 });
+  assert.equal(await tts.prefetch({ ...LINE, text: "one" }), true);
+  assert.equal(await tts.prefetch({ ...LINE, text: "two" }), false);
+  tts.clearPrefetch();
+  assert.equal(await tts.prefetch({ ...LINE, text: "two" }), true);
+});
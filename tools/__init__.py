@@ -0,0 +1 @@
+"""Offline content tooling for Strikegy (campaign data, maps, TTS)."""
@@ -0,0 +1,475 @@
+"""Align English draft lines to the Korean CampaignData.js lines, per mission.
+
+    python -m tools.align_koen draft.md --pairs aligned.json   # then: node tools/gen_trans.mjs --pairs aligned.json
+    python -m tools.align_koen en.json --report                # en.json from `tools.dialoguemd --en-json`
+    python -m tools.align_koen --eval                          # accuracy on the en already in CampaignData.js
+    python -m tools.align_koen --from-campaign --pairs aligned.json   # table from the en in CampaignData.js
+                                                               # (minus run-on strings and pass filler)
+
+gen_trans.mjs used to pair the i-th English line with the i-th Korean one, so
+one missing or extra line shifted the rest of the mission. Here both sides
+are featurized and every (ko, en) pair of a mission is scored at once with
+NumPy:
+
+    names    hashed character trigrams of the Latin tokens (RAVEN, BLACKSITE,
+             GPS, AO-7); the Korean side only has proper nouns in Latin script
+    numbers  digit runs on both sides
+    tag      comms tag, `[무전] ...` vs `[radio] ...` (dialoguemd.bracket_tag)
+    speaker  CAST ref vs the markdown speaker label (drafts only; en.json has none)
+    length   English/Korean length ratio against the mission's overall ratio
+    shape    ? ! … — punctuation
+    position relative position in the mission, a weak tie-breaker
+
+A monotonic DP (Needleman-Wunsch with free skips on either side) then picks
+the highest-scoring order-preserving set of pairs whose score clears
+--min-score. Each pair's confidence is how far it beats the best competing
+cell in its row and column: 0.5 for a coin flip, near 1 for a clear match.
+"""
+import argparse
+import json
+import math
+import random
+import re
+import sys
+import time
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+from tools.campaigndoc import CAMPAIGN_JS, ROOT, CampaignDoc
+from tools.dialoguemd import DialogueLine, MissionHeader, bracket_tag, parse_file
+from tools.profiling import PROF, add_arguments, session
+
+DIM = 512                    # hashed trigram buckets
+LEAD_TAG_RE = re.compile(r"^\s*\[([^\]]+)\]\s*")
+LATIN_RE = re.compile(r"[A-Za-z][A-Za-z0-9'’-]*[A-Za-z0-9]")
+NUMBER_RE = re.compile(r"\d+")
+# sentence-initial capitals and common words are not names
+STOP = frozenset("""
+A AN AND ARE AS AT BE BUT BY DO FOR FROM GO GOT HE HER HERE HIS I IF IN IS IT ITS
+ME MY NO NOT NOW OF OFF OK ON OR OUR OUT SO THAT THE THEN THERE THEY THIS TO UP
+US WE WHAT WHEN WHO WITH YOU YOUR COPY HOLD MOVE STAY KEEP GET LET DON'T WE'RE
+IT'S THAT'S YOU'RE
+""".split())
+
+# feature weights (sum to 1); names dominate because they rarely collide
+WEIGHTS = {'names': 0.34, 'numbers': 0.10, 'tag': 0.16, 'speaker': 0.16,
+           'length': 0.12, 'shape': 0.04, 'position': 0.08}
+
+
+class Line:
+    __slots__ = ('text', 'speaker', 'tag')
+
+    def __init__(self, text: str, speaker: str = '', tag: str = ''):
+        self.text = text
+        self.speaker = speaker
+        self.tag = tag
+
+    def __repr__(self):
+        return f'Line({self.text!r}, {self.speaker!r}, {self.tag!r})'
+
+
+def split_tag(text: str) -> tuple[str, str]:
+    """(bracket tag such as '[radio]' or '', text without a leading tag)."""
+    m = LEAD_TAG_RE.match(text)
+    if not m:
+        return '', text.strip()
+    return bracket_tag(m.group(1)), text[m.end():].strip()
+
+
+# -------- inputs --------
+
+def korean_lines(doc: CampaignDoc, mid: str) -> list[Line]:
+    """Korean lines of a mission in script order (cutscene/act lines, say text)."""
+    out = []
+    for step in doc.missions[mid].steps:
+        for e in ([step] if step.type == 'say' else []) + step.lines:
+            text = e.get_str('text')
+            if text:
+                tag, _ = split_tag(text)
+                out.append(Line(text.strip(), (e.get_ref('speaker') or '').removeprefix('CAST.'), tag))
+    return out
+
+
+def draft_lines(path, level: int = 3) -> dict[str, list[Line]]:
+    """mission id -> EN lines from a dialogue draft, keeping speaker labels.
+    Texts match dialoguemd.en_dialogue (`[radio] ...` prefixes included)."""
+    out = {}
+    cur = None
+    for ev in parse_file(path):
+        if isinstance(ev, MissionHeader):
+            if ev.level == level:
+                cur = out[ev.mission_id] = []
+        elif isinstance(ev, DialogueLine) and cur is not None:
+            text = ev.text
+            br = bracket_tag(ev.comms or ev.tag.strip('[]')) if (ev.comms or ev.tag) else ''
+            if br and ev.comms:
+                text = f'{br} {text}'
+            cur.append(Line(text, ev.speaker, br))
+    return out
+
+
+def json_lines(path) -> dict[str, list[Line]]:
+    """mission id -> EN lines from `python -m tools.dialoguemd --en-json` output."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return {mid: [Line(t, '', split_tag(t)[0]) for t in texts] for mid, texts in data.items()}
+
+
+def speaker_aliases(cast: dict[str, str]) -> dict[str, str]:
+    """Upper-cased draft label -> CAST key ('CAPTAIN HART', 'HART' -> 'HART')."""
+    alias, seen = {}, {}
+    for ref, name in cast.items():
+        key = ref.removeprefix('CAST.')
+        alias[key.upper()] = key
+        alias[name.upper()] = key
+        for word in name.upper().split():
+            seen.setdefault(word, set()).add(key)
+    for word, keys in seen.items():
+        if len(keys) == 1:
+            alias.setdefault(word, next(iter(keys)))
+    return alias
+
+
+# -------- features --------
+
+def _bucket(s: str) -> int:
+    return zlib.crc32(s.encode('utf-8')) % DIM
+
+
+def _names(text: str, english: bool) -> list[str]:
+    toks = []
+    for t in LATIN_RE.findall(text):
+        u = t.upper().replace('’', "'")
+        if u in STOP or len(u) < 2:
+            continue
+        # English prose: only capitalised words can be names
+        if english and not t[0].isupper():
+            continue
+        toks.append(u.removesuffix("'S"))
+    return toks
+
+
+def _grams(tokens) -> list[int]:
+    out = []
+    for t in tokens:
+        p = f'^{t}$'
+        out.extend(_bucket(p[i:i + 3]) for i in range(len(p) - 2))
+    return out
+
+
+def featurize(lines: list[Line], english: bool, ids: dict) -> dict:
+    """Per-line feature arrays; `ids` numbers tags and speakers and is shared
+    by both sides of a comparison."""
+    n = len(lines)
+    names = np.zeros((n, DIM), np.float32)
+    nums = np.zeros((n, DIM), np.float32)
+    tag = np.full(n, -1, np.int32)
+    spk = np.full(n, -1, np.int32)
+    length = np.zeros(n, np.float32)
+    shape = np.zeros((n, 3), np.float32)
+    for i, ln in enumerate(lines):
+        t, body = split_tag(ln.text)
+        t = ln.tag or t
+        np.add.at(names[i], _grams(_names(body, english)), 1.0)
+        np.add.at(nums[i], [_bucket(d.lstrip('0') or '0') for d in NUMBER_RE.findall(body)], 1.0)
+        if t:
+            tag[i] = ids.setdefault(('tag', t), len(ids))
+        if ln.speaker:
+            spk[i] = ids.setdefault(('speaker', ln.speaker), len(ids))
+        length[i] = max(len(body), 1)
+        shape[i] = ('?' in body, '!' in body, '…' in body or '...' in body or '—' in body)
+    for m in (names, nums):
+        norm = np.linalg.norm(m, axis=1, keepdims=True)
+        np.divide(m, norm, out=m, where=norm > 0)
+    return {'names': names, 'nums': nums, 'tag': tag, 'speaker': spk, 'length': length, 'shape': shape, 'n': n}
+
+
+def _pair_flags(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """1 both set and equal, 0 both set and different, 0.5 otherwise."""
+    both = (a[:, None] >= 0) & (b[None, :] >= 0)
+    eq = a[:, None] == b[None, :]
+    return np.where(both, eq.astype(np.float32), np.float32(0.5))
+
+
+def similarity(ko: dict, en: dict) -> np.ndarray:
+    """n_ko x n_en scores in [0, 1]."""
+    n, m = ko['n'], en['n']
+    w = WEIGHTS
+
+    has_k = ko['names'].any(1)[:, None]
+    has_e = en['names'].any(1)[None, :]
+    names = ko['names'] @ en['names'].T
+    # no names on either side says little; a name on only one side is evidence against
+    names = np.where(has_k & has_e, names, np.where(has_k, 0.0, np.where(has_e, 0.3, 0.5)))
+
+    nk = ko['nums'].any(1)[:, None]
+    ne = en['nums'].any(1)[None, :]
+    nums = np.where(nk & ne, ko['nums'] @ en['nums'].T, np.where(nk | ne, 0.0, 0.5))
+
+    ratio = np.log(en['length'][None, :] / ko['length'][:, None])
+    expect = math.log(en['length'].sum() / ko['length'].sum())
+    length = np.exp(-2.0 * np.abs(ratio - expect))
+
+    shape = 1.0 - np.abs(ko['shape'][:, None, :] - en['shape'][None, :, :]).mean(2)
+
+    pk = (np.arange(n) + 0.5) / n
+    pe = (np.arange(m) + 0.5) / m
+    position = np.exp(-8.0 * np.abs(pk[:, None] - pe[None, :]))
+
+    s = (w['names'] * names + w['numbers'] * nums + w['tag'] * _pair_flags(ko['tag'], en['tag'])
+         + w['speaker'] * _pair_flags(ko['speaker'], en['speaker'])
+         + w['length'] * length + w['shape'] * shape + w['position'] * position)
+    return s.astype(np.float32)
+
+
+# -------- alignment --------
+
+DIAG, UP, LEFT = 0, 1, 2
+
+
+def align(sim: np.ndarray, min_score: float, gap: float = 0.0) -> list[tuple[int, int]]:
+    """Order-preserving (ko, en) index pairs maximising sum(score - min_score).
+
+    Skipping a line on either side costs `gap`. Rows are filled with array
+    ops: the left-move recurrence M[i, j] = max(c[j], M[i, j-1] - gap) is a
+    running maximum of c[j] + gap * j.
+    """
+    n, m = sim.shape
+    gain = sim - min_score
+    M = np.zeros((n + 1, m + 1), np.float32)
+    M[0] = -gap * np.arange(m + 1)
+    M[:, 0] = -gap * np.arange(n + 1)
+    ptr = np.full((n + 1, m + 1), LEFT, np.int8)
+    ptr[1:, 0] = UP
+    ramp = gap * np.arange(1, m + 1, dtype=np.float32)
+    for i in range(1, n + 1):
+        diag = M[i - 1, :-1] + gain[i - 1]
+        up = M[i - 1, 1:] - gap
+        c = np.maximum(diag, up)
+        best = np.maximum(np.maximum.accumulate(c + ramp) - ramp, M[i, 0] - ramp)
+        M[i, 1:] = best
+        ptr[i, 1:] = np.where(best > c, LEFT, np.where(diag >= up, DIAG, UP))
+    pairs = []
+    i, j = n, m
+    while i > 0 and j > 0:
+        p = ptr[i, j]
+        if p == DIAG:
+            i, j = i - 1, j - 1
+            if gain[i, j] > 0:
+                pairs.append((i, j))
+        elif p == UP:
+            i -= 1
+        else:
+            j -= 1
+    pairs.reverse()
+    return pairs
+
+
+def confidence(sim: np.ndarray, pairs, min_score: float, sharp: float = 12.0) -> list[float]:
+    out = []
+    for i, j in pairs:
+        row = np.delete(sim[i], j)
+        col = np.delete(sim[:, j], i)
+        rival = max(min_score, row.max(initial=0.0), col.max(initial=0.0))
+        out.append(float(1.0 / (1.0 + math.exp(-sharp * (sim[i, j] - rival)))))
+    return out
+
+
+def align_mission(ko: list[Line], en: list[Line], ids: dict, min_score: float, gap: float = 0.0) -> list[tuple]:
+    """[(ko index, en index, score, confidence)] for one mission."""
+    if not ko or not en:
+        return []
+    sim = similarity(featurize(ko, False, ids), featurize(en, True, ids))
+    pairs = align(sim, min_score, gap)
+    conf = confidence(sim, pairs, min_score)
+    return [(i, j, float(sim[i, j]), c) for (i, j), c in zip(pairs, conf)]
+
+
+def align_all(doc: CampaignDoc, drafts: dict[str, list[Line]], min_score: float, gap: float = 0.0,
+              ko_lines=korean_lines) -> dict[str, list[tuple]]:
+    """mission id -> align_mission() result, for missions in both inputs."""
+    aliases = speaker_aliases(doc.cast())
+    ids = {}
+    out = {}
+    for mid, en in drafts.items():
+        if mid not in doc.missions:
+            continue
+        with PROF.stage('align', mid):
+            ko = ko_lines(doc, mid)
+            for ln in en:
+                if ln.speaker:
+                    ln.speaker = aliases.get(ln.speaker.upper(), ln.speaker.upper())
+            out[mid] = (ko, en, align_mission(ko, en, ids, min_score, gap))
+    return out
+
+
+# -------- evaluation on the shipped en fields --------
+
+def filler_lines() -> frozenset:
+    """The generic lines the patch passes write when they have no translation
+    (p45_ultra_fix_en FALLBACKS, the add_en_say / apply_pro_beta2 pools)."""
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))  # the root-level patch scripts
+    from add_en_say import PHRASES
+    from apply_pro_beta2 import EN_POOL
+    from tools.p45_ultra_fix_en import FALLBACKS
+    return frozenset([*FALLBACKS, *PHRASES, *EN_POOL])
+
+
+def usable_en(s: str, filler: frozenset) -> bool:
+    """False for en values that would only copy junk into the table: strings
+    that ran on into the next field, and pass filler (tag ignored)."""
+    from tools.p45_ultra_fix_en import SPILL_RE
+    from tools.validate_campaign import MERGED_FIELD_RE
+    if SPILL_RE.search(s) or MERGED_FIELD_RE.search(s):
+        return False
+    return split_tag(s)[1] not in filler
+
+
+def eval_drafts(doc: CampaignDoc, rng: random.Random, drop: float, extra: float, keep=None):
+    """Drafts built from the en already in CampaignData.js, with lines dropped
+    and foreign lines inserted: (drafts, truth {mid: {ko index: en index}}, ko lines).
+    `keep(en)`: en values failing it are left out (as if missing)."""
+    pool = []
+    kos, drafts, truth = {}, {}, {}
+    for mid, mission in doc.missions.items():
+        ko, en = [], []
+        for step in mission.steps:
+            for e in ([step] if step.type == 'say' else []) + step.lines:
+                text = e.get_str('text')
+                if not text:
+                    continue
+                tag, _ = split_tag(text)
+                ko.append(Line(text.strip(), (e.get_ref('speaker') or '').removeprefix('CAST.'), tag))
+                s = e.get_str('en')
+                en.append(s if s and (keep is None or keep(s)) else None)
+        kos[mid] = ko
+        pool += [(s, ln) for s, ln in zip(en, ko) if s]
+        drafts[mid] = en
+    out = {}
+    for mid, en in drafts.items():
+        if not any(en):
+            continue
+        lines, t = [], {}
+        for i, s in enumerate(en):
+            if rng.random() < extra:
+                s2, ln = rng.choice(pool)
+                lines.append(Line(s2, ln.speaker, split_tag(s2)[0]))
+            if not s or rng.random() < drop:
+                continue
+            t[i] = len(lines)
+            lines.append(Line(s, kos[mid][i].speaker, split_tag(s)[0]))
+        out[mid], truth[mid] = lines, t
+    return out, truth, kos
+
+
+def score_eval(result: dict, truth: dict, min_conf: float) -> dict:
+    tp = fp = 0
+    pos_tp = 0
+    total = sum(len(t) for t in truth.values())
+    for mid, (ko, en, pairs) in result.items():
+        t = truth[mid]
+        for i, j, _, c in pairs:
+            if c < min_conf:
+                continue
+            if t.get(i) == j:
+                tp += 1
+            else:
+                fp += 1
+        # the old positional pairing
+        pos_tp += sum(t.get(i) == i for i in range(min(len(ko), len(en))))
+    return {'pairs': tp + fp, 'precision': tp / max(tp + fp, 1), 'recall': tp / max(total, 1),
+            'positional': pos_tp / max(total, 1), 'truth': total}
+
+
+# -------- output --------
+
+def to_pairs(result: dict, min_conf: float) -> dict[str, list]:
+    """{mid: [[ko, en, confidence], ...]} for gen_trans.mjs --pairs."""
+    return {mid: [[ko[i].text, en[j].text, round(c, 3)] for i, j, _, c in pairs if c >= min_conf]
+            for mid, (ko, en, pairs) in result.items()}
+
+
+def report(result: dict, min_conf: float, out=sys.stdout):
+    for mid, (ko, en, pairs) in result.items():
+        kept = [p for p in pairs if p[3] >= min_conf]
+        print(f'{mid}: {len(ko)} ko, {len(en)} en, {len(kept)} pair(s)', file=out)
+        for i, j, s, c in pairs:
+            mark = ' ' if c >= min_conf else '?'
+            print(f'  {mark} {i:3d} {j:3d} {s:.2f} {c:.2f}  {ko[i].text[:40]}  ->  {en[j].text[:60]}', file=out)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Align English draft lines to the Korean campaign lines.')
+    ap.add_argument('draft', nargs='?', help='dialogue markdown draft, or en.json from tools.dialoguemd --en-json')
+    ap.add_argument('--campaign', default=str(CAMPAIGN_JS))
+    ap.add_argument('--level', type=int, default=3, help='markdown heading level of the mission headers')
+    ap.add_argument('--pairs', help='write {missionId: [[ko, en, confidence], ...]} for gen_trans.mjs --pairs')
+    ap.add_argument('--report', action='store_true', help='print every pair with score and confidence')
+    ap.add_argument('--min-score', type=float, default=0.3, help='pairs scoring below this are left unmatched')
+    ap.add_argument('--min-conf', type=float, default=0.3, help='pairs below this confidence are not written')
+    ap.add_argument('--gap', type=float, default=0.0, help='cost of skipping a line on either side')
+    ap.add_argument('--eval', action='store_true',
+                    help='score against the en in CampaignData.js, with lines dropped/inserted')
+    ap.add_argument('--from-campaign', action='store_true',
+                    help='use the en in CampaignData.js as the draft (all of it, in script order)')
+    ap.add_argument('--drop', type=float, default=0.1, help='--eval: fraction of en lines removed')
+    ap.add_argument('--extra', type=float, default=0.05, help='--eval: fraction of foreign lines inserted')
+    ap.add_argument('--seed', type=int, default=0)
+    add_arguments(ap)
+    args = ap.parse_args(argv)
+    if not args.draft and not args.eval and not args.from_campaign:
+        ap.error('give a draft (markdown or en.json), --from-campaign or --eval')
+
+    with session(args):
+        doc = CampaignDoc.load(args.campaign)
+        t = time.perf_counter()
+        if args.eval or args.from_campaign:
+            if args.eval:
+                drafts, truth, kos = eval_drafts(doc, random.Random(args.seed), args.drop, args.extra)
+            else:
+                filler = filler_lines()
+                skipped = []
+
+                def keep(s):
+                    ok = usable_en(s, filler)
+                    if not ok:
+                        skipped.append(s)
+                    return ok
+                drafts, truth, kos = eval_drafts(doc, random.Random(args.seed), 0.0, 0.0, keep=keep)
+            if args.from_campaign:
+                # each en sits on its own ko line already: no alignment to guess
+                result = {mid: (kos[mid], en, [(i, j, 1.0, 1.0) for i, j in truth[mid].items()])
+                          for mid, en in drafts.items()}
+            else:
+                result = align_all(doc, drafts, args.min_score, args.gap, ko_lines=lambda d, mid: kos[mid])
+        else:
+            path = Path(args.draft)
+            drafts = json_lines(path) if path.suffix == '.json' else draft_lines(path, args.level)
+            result = align_all(doc, drafts, args.min_score, args.gap)
+        ms = (time.perf_counter() - t) * 1000
+        if args.report:
+            report(result, args.min_conf)
+        n_pairs = sum(len(p) for _, _, p in result.values())
+        print(f'aligned {len(result)} mission(s), {n_pairs} pair(s) in {ms:.0f} ms', file=sys.stderr)
+        if args.from_campaign:
+            print(f'from-campaign: left out {len(skipped)} en value(s) (run-on strings, pass filler)')
+        if args.eval:
+            r = score_eval(result, truth, args.min_conf)
+            print(f'eval: {r["truth"]} true pairs; precision {r["precision"]:.3f}, recall {r["recall"]:.3f} '
+                  f'(positional pairing: {r["positional"]:.3f})')
+        if args.pairs:
+            data = to_pairs(result, args.min_conf)
+            if args.from_campaign:
+                data['_source'] = 'the en fields of CampaignData.js (tools/align_koen.py --from-campaign)'
+            with open(args.pairs, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            n = sum(len(v) for k, v in data.items() if k != '_source')
+            print(f'Wrote {args.pairs}: {n} pairs', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
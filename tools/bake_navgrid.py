@@ -0,0 +1,120 @@
+"""Bake bot NavGrids for maps/**/*.json into <name>.snav next to the map.
+
+    python -m tools.bake_navgrid              # all maps
+    python -m tools.bake_navgrid maps/frontline_6_lane_v1.json
+    python -m tools.bake_navgrid --check      # exit 1 if any .snav is stale
+
+Requires numpy. Reproduces NavGrid.rebuild() (src/bots/nav/NavGrid.js)
+cell for cell: same grid extent, cell bounds, agentRadius expansion,
+yMin/yMax slice and 8-neighbour open counts, with all boxes rasterised
+in one matrix product instead of cells x boxes tests.
+
+File: gzip of
+    4s magic b'SNAV', u16 version, u16 grid count, then per grid
+    6 f64  cellSize, agentRadius, yMin, yMax, groundW, groundD
+    3 u32  cols, rows, box hash
+    u8[cols*rows] blocked, u8[cols*rows] open
+
+The box hash is FNV-1a over the float32 min/max bytes of the solid boxes
+in CollisionWorld order; NavGrid only uses a grid whose hash and params
+match its live collision world, otherwise it rebuilds as before.
+"""
+import argparse
+import gzip
+import json
+import math
+import struct
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from tools.compile_maps import box_hash, map_sources, solid_boxes
+
+MAGIC = b'SNAV'
+VERSION = 1
+FILE_HEADER = struct.Struct('<4sHH')
+GRID_HEADER = struct.Struct('<6d3I')
+
+# (cellSize, agentRadius, yMin, yMax) as BotManager builds its BotNavigator
+# (cellSize 1.3, agentRadius max(0.55, bot radius 0.42 + 0.14), NavGrid y slice)
+VARIANTS = [
+    (1.3, max(0.55, 0.42 + 0.14), 0.0, 1.85),
+]
+
+
+def bake(boxes: np.ndarray, ground_size, cell_size, agent_radius, y_min, y_max):
+    """(cols, rows, blocked, open) exactly as NavGrid.rebuild() computes them."""
+    W, D = ground_size
+    cols = max(1, math.ceil(W / cell_size))
+    rows = max(1, math.ceil(D / cell_size))
+    min_x, min_z = -W / 2, -D / 2
+
+    b = boxes.astype(np.float64)
+    b = b[~((y_max < b[:, 1]) | (y_min > b[:, 4]))]
+    bmin_x, bmin_z = b[:, 0] - agent_radius, b[:, 2] - agent_radius
+    bmax_x, bmax_z = b[:, 3] + agent_radius, b[:, 5] + agent_radius
+
+    x0 = min_x + np.arange(cols) * cell_size
+    z0 = min_z + np.arange(rows) * cell_size
+    x1, z1 = x0 + cell_size, z0 + cell_size
+    # box k covers column ix / row iz (same comparisons as aabbOverlapsXZ)
+    in_x = (bmax_x[:, None] >= x0[None, :]) & (bmin_x[:, None] <= x1[None, :])
+    in_z = (bmax_z[:, None] >= z0[None, :]) & (bmin_z[:, None] <= z1[None, :])
+    blocked = (in_z.T.astype(np.float32) @ in_x.astype(np.float32)) > 0
+
+    walk = np.pad(~blocked, 1, constant_values=False).astype(np.uint8)
+    open_ = sum(walk[1 + dz:1 + dz + rows, 1 + dx:1 + dx + cols]
+                for dz in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dz)
+    open_ = np.where(blocked, 0, open_).astype(np.uint8)
+    return cols, rows, blocked.astype(np.uint8), open_
+
+
+def bake_map(src: bytes, variants=VARIANTS) -> bytes:
+    data = json.loads(src)
+    ground = data.get('world', {}).get('groundSize') or [200, 200]
+    flat = solid_boxes(data)
+    h = box_hash(flat)
+    boxes = np.array(flat, dtype=np.float32).reshape(-1, 6)
+    parts = [FILE_HEADER.pack(MAGIC, VERSION, len(variants))]
+    for cell, radius, y_min, y_max in variants:
+        cols, rows, blocked, open_ = bake(boxes, ground, cell, radius, y_min, y_max)
+        parts.append(GRID_HEADER.pack(cell, radius, y_min, y_max, ground[0], ground[1], cols, rows, h))
+        parts.append(blocked.tobytes())
+        parts.append(open_.tobytes())
+    return gzip.compress(b''.join(parts), mtime=0)
+
+
+def snav_path(path: Path) -> Path:
+    return path.with_suffix('.snav')
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Bake NavGrid blocked/open grids next to each map.')
+    ap.add_argument('maps', nargs='*', help='map JSON files (default: maps/**/*.json)')
+    ap.add_argument('--check', action='store_true', help='exit 1 if any .snav is missing or stale')
+    args = ap.parse_args(argv)
+
+    stale = []
+    total = 0
+    for path in map_sources(args.maps):
+        blob = bake_map(path.read_bytes())
+        out = snav_path(path)
+        if out.exists() and out.read_bytes() == blob:
+            total += len(blob)
+            continue
+        if args.check:
+            stale.append(path)
+            continue
+        out.write_bytes(blob)
+        total += len(blob)
+
+    if args.check:
+        for path in stale:
+            print(f'stale: {path}')
+        sys.exit(1 if stale else 0)
+    print(f'OK: baked {len(VARIANTS)} grid(s) per map, {total} B total')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+// tools/bench_collision.mjs
+// CollisionWorld.resolveCapsuleXZ: linear scan vs. broadphase grid.
+//
+//   node tools/bench_collision.mjs                       # default maps
+//   node tools/bench_collision.mjs maps/zone_5_v1.smap --agents 64 --frames 2000
+//
+// Loads the compiled .smap (run `python -m tools.compile_maps` first), fills a
+// CollisionWorld the way game.html buildScene() does, then steps N agents on
+// a seeded random walk with both modes. Positions must match exactly; exits 1
+// if they don't.
+import { register } from "node:module";
+import { readFileSync } from "node:fs";
+import { performance } from "node:perf_hooks";
+
+// CollisionWorld imports three.js from a CDN URL; only Vector3 is used here.
+const THREE_URL = "https://unpkg.com/three@0.160.0/build/three.module.js";
+const THREE_STUB = "export class Vector3{constructor(x=0,y=0,z=0){this.x=x;this.y=y;this.z=z;}}";
+const HOOKS = `export async function resolve(spec, ctx, next){
+  if(spec === ${JSON.stringify(THREE_URL)}) return { url: "data:text/javascript," + encodeURIComponent(${JSON.stringify(THREE_STUB)}), shortCircuit: true };
+  return next(spec, ctx);
+}`;
+register("data:text/javascript," + encodeURIComponent(HOOKS));
+
+const { default: CollisionWorld } = await import("../src/world/CollisionWorld.js");
+const { decodeMapBinary } = await import("../src/world/MapBinary.js");
+
+const NON_SOLID = new Set(["floor", "ground", "deco", "decor", "sky"]); // game.html isSolid()
+const DEFAULT_MAPS = ["maps/frontline_6_lane_v1.smap", "maps/conquest_5_v1.smap", "maps/campaign/ch2_m20_blacktide.smap"];
+
+function parseArgs(argv){
+  const opts = { maps: [], agents: 33, frames: 1000, seed: 1 };
+  for(let i=0; i<argv.length; i++){
+    const a = argv[i];
+    if(a === "--agents") opts.agents = Number(argv[++i]);
+    else if(a === "--frames") opts.frames = Number(argv[++i]);
+    else if(a === "--seed") opts.seed = Number(argv[++i]);
+    else opts.maps.push(a);
+  }
+  if(!opts.maps.length) opts.maps = DEFAULT_MAPS;
+  return opts;
+}
+
+function mulberry32(seed){
+  return ()=>{
+    seed = (seed + 0x6d2b79f5) | 0;
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+function loadWorld(path){
+  const buf = readFileSync(path);
+  const map = decodeMapBinary(buf.buffer.slice(buf.byteOffset, buf.byteOffset + buf.byteLength));
+  const p = map.packed;
+  const cw = new CollisionWorld();
+  const keep = new Uint8Array(p.count);
+  for(let i=0; i<p.count; i++){
+    keep[i] = p.collision[i] !== 2 && !NON_SOLID.has(String(p.types[p.typeIds[i]] || "").toLowerCase()) ? 1 : 0;
+  }
+  cw.addBoxArray(p.minmax, p.typeIds, p.types, keep);
+  for(const o of p.other){
+    if(o?.shape !== "box" || o.collision === false || NON_SOLID.has(String(o.type || "").toLowerCase())) continue;
+    cw.addCenteredBox(o.type, o.size, o.pos);
+  }
+  const attached = cw.attachIndex(p.index);
+  return { cw, ground: map.world?.groundSize || [200, 200], attached };
+}
+
+// Same seeded walk for both modes; returns [ms, final positions].
+function run(cw, ground, { agents, frames, seed }){
+  const rnd = mulberry32(seed);
+  const [W, D] = ground;
+  const pos = [], vel = [];
+  for(let a=0; a<agents; a++){
+    pos.push({ x: (rnd() - 0.5) * W * 0.9, y: 0.9, z: (rnd() - 0.5) * D * 0.9 });
+    vel.push({ x: 0, z: 0 });
+  }
+  const dt = 1 / 60, speed = 6;
+  let t = 0;
+  for(let f=0; f<frames; f++){
+    for(let a=0; a<agents; a++){
+      const v = vel[a], p = pos[a];
+      if(rnd() < 0.02){
+        const ang = rnd() * Math.PI * 2;
+        v.x = Math.cos(ang) * speed; v.z = Math.sin(ang) * speed;
+      }
+      p.x = Math.max(-W/2, Math.min(W/2, p.x + v.x * dt));
+      p.z = Math.max(-D/2, Math.min(D/2, p.z + v.z * dt));
+    }
+    const t0 = performance.now();
+    for(let a=0; a<agents; a++) cw.resolveCapsuleXZ(pos[a], 0.42, 0.9);
+    t += performance.now() - t0;
+  }
+  return [t, pos];
+}
+
+const opts = parseArgs(process.argv.slice(2));
+let mismatch = 0;
+for(const path of opts.maps){
+  const { cw, ground, attached } = loadWorld(path);
+  cw.useIndex = false;
+  run(cw, ground, { ...opts, frames: Math.min(100, opts.frames) }); // warm-up
+  const [linMs, linPos] = run(cw, ground, opts);
+  cw.useIndex = true;
+  run(cw, ground, { ...opts, frames: Math.min(100, opts.frames) });
+  const [idxMs, idxPos] = run(cw, ground, opts);
+
+  const same = linPos.every((p, i)=> p.x === idxPos[i].x && p.z === idxPos[i].z);
+  if(!same) mismatch++;
+  const perFrame = (ms)=> (ms / opts.frames * 1000).toFixed(1);
+  console.log(`${path}: ${cw.count} boxes, ${opts.agents} agents, index ${attached ? "baked" : "built"}`
+    + ` | linear ${perFrame(linMs)} us/frame, grid ${perFrame(idxMs)} us/frame`
+    + ` (x${(linMs / idxMs).toFixed(2)})${same ? "" : "  MISMATCH"}`);
+}
+process.exit(mismatch ? 1 : 0);
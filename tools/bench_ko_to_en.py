@@ -0,0 +1,199 @@
+"""Benchmark: ko_en_rules.json vs the old if/elif cascade.
+
+    python -m tools.bench_ko_to_en [--repeat N] [--campaign PATH]
+
+Times every Korean line of CH2 M1-20 (step text and lines[i].text) end to
+end (rules + fallback), the rule stage alone, and the rule stage as the
+table grows. That both give identical output is tests/test_ko_to_en.py.
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from tools.campaigndoc import CAMPAIGN_JS, CampaignDoc
+from tools import p45_ultra_fix_en as p45
+from tools.kwmatch import RuleSet
+
+RULES_JSON = Path(p45.__file__).with_name('ko_en_rules.json')
+
+
+def legacy_rule(b: str) -> str:
+  # verbatim body of the pre-rule-table ko_to_en cascade
+  if 'BLACK TIDE' in b and ('업데이트' in b or 'Update' in b):
+    out = 'Update: BLACK TIDE. Night shipment at the port under a shell company. Paperwork is the lead.'
+  elif '오늘은' in b and ('이기러' in b or '이기' in b) and ('들어가서' in b or '가져오고' in b):
+    out = "We're not here to win. In, grab it, out."
+  elif '상공' in b and '열상' in b:
+    out = 'Overwatch is up. Thermals look clean... too clean.'
+  elif '전자' in b and ('잠금' in b or '락' in b):
+    out = "If an electronic lock trips, I'll crack it. One-shot timing."
+  elif ('연막' in b or 'smoke' in b) and ('섬광' in b or 'flash' in b):
+    out = "Smoke/flash check. I'll cover the rear. Eyes forward."
+  elif '첫 코너' in b and '멈춰' in b:
+    out = 'RAVEN, stop at the first corner. Three contacts—watch your feet.'
+  elif b.strip() in ('확인.', '확인', '확인!'):
+    out = 'Confirm.'
+  elif '서류' in b and ('스폰서' in b or '지원사' in b or '발신인' in b):
+    out = "The sender overlaps our sponsor. This isn't enemy—it's a line."
+  elif '발자국' in b and ('기록' in b or '끝' in b):
+    out = "Go quieter. If our footsteps get logged, we're done."
+  elif '승인' in b and '대기' in b:
+    out = 'Approval pending.'
+  elif any(k in b for k in ['왼쪽', '좌측']):
+    out = 'Left.'
+  elif any(k in b for k in ['오른쪽', '우측']):
+    out = 'Right.'
+  elif '뒤' in b and ('접는다' in b or '커버' in b or '막' in b):
+    out = 'I\'ll cover the rear.'
+  elif '연막' in b:
+    out = 'Smoke out. Break line of sight.'
+  elif '섬광' in b:
+    out = 'Flash out. Blind them.'
+  elif '수류탄' in b:
+    out = 'Frag out.'
+  elif '조용히' in b or '소리' in b and ('내지' in b or '죽여' in b or '숨' in b):
+    out = 'Stay quiet. Hold your noise.'
+  elif any(k in b for k in ['진입', '잠입', '들어가']):
+    out = 'Move in. Stay low.'
+  elif any(k in b for k in ['이동', '전진', '가자', '가.']):
+    out = 'Move. Now.'
+  elif any(k in b for k in ['확보', '클리어', '장악']):
+    out = 'Area secure.'
+  elif any(k in b for k in ['탈출', '이탈', '철수']):
+    out = 'Exfil. Move now.'
+  elif any(k in b for k in ['버텨', '버티', '방어']):
+    msec = re.search(r"(\d+)\s*초", b)
+    if msec:
+      out = f'Hold for {msec.group(1)} seconds.'
+    else:
+      out = 'Hold. Keep them off us.'
+  elif '타이머' in b or '카운트다운' in b:
+    out = 'Timer is live.'
+  elif '경보' in b:
+    out = 'Alarm is up. Stay sharp.'
+  elif '추적' in b or '추격' in b:
+    out = 'We\'re being tailed. Keep moving.'
+  elif '승인' in b:
+    out = 'Approval received.'
+  elif '대기' in b:
+    out = 'Stand by.'
+  else:
+    out = p45.pick_fallback(b)
+  return out
+
+
+def rule_table(b: str) -> str:
+  out = p45.RULES.apply(b)
+  return out if out is not None else p45.pick_fallback(b)
+
+
+def sequential(spec):
+  # the cascade shape (every rule in order, substring checks) for any table
+  rules = sorted(enumerate(spec['rules']), key=lambda ir: (-ir[1].get('priority', 0), ir[0]))
+  rules = [r for _, r in rules]
+  caps = [re.compile(r['capture']) if r.get('capture') else None for r in rules]
+
+  def run(b):
+    for r, cap in zip(rules, caps):
+      if 'exact' in r:
+        ok = b.strip() in r['exact']
+      else:
+        ok = all(any(k in b for k in g) for g in r['all'])
+      if ok:
+        if cap is None:
+          return r['out']
+        m = cap.search(b)
+        if m:
+          return r['out'].format(None, *m.groups())
+    return None
+  return run
+
+
+def padded(extra: int) -> dict:
+  # append never-matching rules (distinct Hangul keywords) to grow the table
+  spec = json.loads(RULES_JSON.read_text(encoding='utf-8'))
+  for i in range(extra):
+    kw = chr(0xAC00 + 7000 + i % 3000) + chr(0xAC00 + 10000 + i // 3000) + '뷁'
+    spec['rules'].append({'priority': -1 - i, 'all': [[kw], [kw + '!']], 'out': 'x'})
+  return spec
+
+
+def ch2_lines(doc: CampaignDoc) -> list[str]:
+  out = []
+  for mid, mission in doc.missions.items():
+    if not p45.is_target(mid):
+      continue
+    for step in mission.steps:
+      for e in [step] + step.lines:
+        t = e.get_str('text')
+        if t:
+          out.append(t)
+  return out
+
+
+def bodies(lines):
+  # the part ko_to_en hands to the rules: cleaned, tag stripped, Hangul only
+  out = []
+  for raw in lines:
+    s = p45.clean_md(raw)
+    m = re.match(r"^(\[[^\]]+\])\s*(.*)$", s)
+    b = m.group(2).strip() if m else s
+    if p45.HANGUL.search(b):
+      out.append(b)
+  return out
+
+
+def timeit(fn, items, repeat):
+  best = float('inf')
+  for _ in range(repeat):
+    t = time.perf_counter()
+    for s in items:
+      fn(s)
+    best = min(best, time.perf_counter() - t)
+  return best
+
+
+def main(argv=None):
+  ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  ap.add_argument('--campaign', default=str(CAMPAIGN_JS))
+  ap.add_argument('--repeat', type=int, default=20)
+  ap.add_argument('--scale', default='0,100,1000', help='extra rule counts for the scaling table')
+  args = ap.parse_args(argv)
+
+  lines = ch2_lines(CampaignDoc.load(args.campaign))
+  items = bodies(lines)
+  print(f'{len(items)} CH2 M1-20 lines')
+
+  t_old = timeit(legacy_rule, items, args.repeat)
+  t_new = timeit(rule_table, items, args.repeat)
+  per = 1e6 / max(1, len(items))
+  print(f'end to end  cascade: {t_old * 1e3:6.2f} ms  ({t_old * per:.2f} us/line)')
+  print(f'            rules:   {t_new * 1e3:6.2f} ms  ({t_new * per:.2f} us/line)  x{t_old / t_new:.2f}')
+
+  # the cascade with its fallback call stubbed out vs RuleSet.apply
+  fallback = p45.pick_fallback
+  p45.pick_fallback = lambda b: None
+  try:
+    t_old = timeit(legacy_rule, items, args.repeat)
+  finally:
+    p45.pick_fallback = fallback
+  t_new = timeit(p45.RULES.apply, items, args.repeat)
+  print(f'rule stage  cascade: {t_old * 1e3:6.2f} ms  ({t_old * per:.2f} us/line)')
+  print(f'            rules:   {t_new * 1e3:6.2f} ms  ({t_new * per:.2f} us/line)  x{t_old / t_new:.2f}')
+
+  print('\nrule stage by table size (generic in-order interpreter of the same table):')
+  for extra in [int(x) for x in args.scale.split(',') if x]:
+    spec = padded(extra)
+    seq, rs = sequential(spec), RuleSet(spec)
+    t_seq = timeit(seq, items, args.repeat)
+    t_rs = timeit(rs.apply, items, args.repeat)
+    print(f'  {len(spec["rules"]):5d} rules: sequential {t_seq * per:8.2f} us/line  '
+          f'rules {t_rs * per:6.2f} us/line  x{t_seq / t_rs:.1f}')
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,235 @@
+"""Benchmark the content-patching scripts on synthetic campaigns.
+
+    python -m tools.bench_patch_tools                      # 1x, 10x, 100x
+    python -m tools.bench_patch_tools --scales 1,10 --repeat 5
+    python -m tools.bench_patch_tools --tools add_en_say,p45_ultra_fix_en
+    python -m tools.bench_patch_tools --no-record          # don't append history
+
+Each scale generates a CampaignData.js (tools.synthcampaign) with that many
+times the real mission count and runs add_en_say, fix_en_quotes,
+apply_pro_beta2 and p45_ultra_fix_en over every synthetic mission, timing
+each stage (read / parse_md / parse / patch / apply / write, or convert for
+the streaming fixer). Stage times are the best of --repeat runs, with the
+content cache off so the real work is measured.
+
+Runs are appended to a JSON history (--history). A stage regresses when it
+is more than --threshold times the median of the last --window runs on the
+same machine and at least --min-ms slower; any regression exits 1. Output
+hashes are kept too, so a changed result for an unchanged input is reported.
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from tools.campaigndoc import CAMPAIGN_JS, ROOT, CampaignDoc
+from tools.missionpool import patch_sections
+from tools.synthcampaign import Corpus, generate
+
+sys.path.insert(0, str(ROOT))  # the root-level patch scripts
+import add_en_say  # noqa: E402
+import apply_pro_beta2  # noqa: E402
+import fix_en_quotes  # noqa: E402
+from tools import p45_ultra_fix_en as p45  # noqa: E402
+
+HISTORY = ROOT / '.cache' / 'bench' / 'patch_tools.json'
+TOOLS = ['add_en_say', 'fix_en_quotes', 'apply_pro_beta2', 'p45_ultra_fix_en']
+
+
+class Timer:
+    def __init__(self):
+        self.stages = {}
+
+    def __call__(self, name, fn, *args):
+        t = time.perf_counter()
+        out = fn(*args)
+        self.stages[name] = (time.perf_counter() - t) * 1000
+        return out
+
+
+def _sections(tool: str, mission_patch, ids, jobs: int, args=None):
+    def run(doc):
+        batch = doc.edit()
+        patch_sections(doc, batch, tool, 'bench', mission_patch, ids, args=args, jobs=jobs)
+        return batch
+    return run
+
+
+def run_add_en_say(t: Timer, js: Path, out: Path, md: Path, ids, jobs: int):
+    text = t('read', js.read_text, 'utf-8')
+    doc = t('parse', CampaignDoc, text)
+    batch = t('patch', _sections('add_en_say', add_en_say.patch_mission, ids, jobs), doc)
+    result = t('apply', batch.apply)
+    t('write', out.write_text, result, 'utf-8')
+
+
+def run_fix_en_quotes(t: Timer, js: Path, out: Path, md: Path, ids, jobs: int):
+    def convert():
+        with open(js, encoding='utf-8', newline='') as src, open(out, 'w', encoding='utf-8', newline='') as dst:
+            return fix_en_quotes.convert(src, dst)
+    t('convert', convert)
+
+
+def run_apply_pro_beta2(t: Timer, js: Path, out: Path, md: Path, ids, jobs: int):
+    def parse_md():
+        with md.open(encoding='utf-8') as f:
+            return apply_pro_beta2.parse_md(f)
+    data = t('parse_md', parse_md)
+    text = t('read', js.read_text, 'utf-8')
+    doc = t('parse', CampaignDoc, text)
+    run = _sections('apply_pro_beta2', apply_pro_beta2.patch_mission, ids, jobs, args=lambda mid: (data.get(mid),))
+    batch = t('patch', run, doc)
+    result = t('apply', batch.apply)
+    t('write', out.write_text, result, 'utf-8')
+
+
+def run_p45_ultra_fix_en(t: Timer, js: Path, out: Path, md: Path, ids, jobs: int):
+    text = t('read', js.read_text, 'utf-8')
+    doc = t('parse', CampaignDoc, text)
+    batch = t('patch', _sections('p45_ultra_fix_en', p45.patch_mission, ids, jobs), doc)
+    result = t('apply', batch.apply)
+    t('write', out.write_text, result, 'utf-8')
+
+
+RUNNERS = {
+    'add_en_say': run_add_en_say,
+    'fix_en_quotes': run_fix_en_quotes,
+    'apply_pro_beta2': run_apply_pro_beta2,
+    'p45_ultra_fix_en': run_p45_ultra_fix_en,
+}
+
+
+def sha(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def machine() -> str:
+    # runs are only compared against runs from the same kind of box
+    return hashlib.sha256(json.dumps([platform.machine(), platform.processor(), platform.system(),
+                                      platform.python_version(), os.cpu_count()]).encode()).hexdigest()[:12]
+
+
+def git_rev() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def bench_scale(scale: float, tools, corpus: Corpus, seed: int, repeat: int, jobs: int, tmp: Path) -> dict:
+    js_text, md_text, ids = generate(scale, seed, corpus)
+    js, md = tmp / f'synth-{scale:g}x.js', tmp / f'synth-{scale:g}x.md'
+    js.write_text(js_text, encoding='utf-8')
+    md.write_text(md_text, encoding='utf-8')
+    out = tmp / 'out.js'
+    res = {'missions': len(ids), 'bytes': js.stat().st_size, 'input': sha(js), 'tools': {}}
+    for tool in tools:
+        best = {}
+        for _ in range(repeat):
+            t = Timer()
+            RUNNERS[tool](t, js, out, md, ids, jobs)
+            for k, v in t.stages.items():
+                best[k] = min(best.get(k, v), v)
+        res['tools'][tool] = {'stages': {k: round(v, 2) for k, v in best.items()},
+                              'total': round(sum(best.values()), 2), 'output': sha(out)}
+    return res
+
+
+def load_history(path: Path) -> list:
+    try:
+        return json.loads(path.read_text(encoding='utf-8')).get('runs', [])
+    except (OSError, ValueError):
+        return []
+
+
+def compare(run: dict, history: list, window: int, threshold: float, min_ms: float):
+    """(regressions, changed outputs) of `run` against earlier runs on this machine."""
+    prior = [r for r in history if r.get('machine') == run['machine'] and r.get('jobs') == run['jobs']]
+    regressions, changed = [], []
+    for scale, res in run['scales'].items():
+        for tool, cur in res['tools'].items():
+            past = [r['scales'][scale]['tools'][tool] for r in prior
+                    if tool in r.get('scales', {}).get(scale, {}).get('tools', {})][-window:]
+            if not past:
+                continue
+            for stage, ms in list(cur['stages'].items()) + [('total', cur['total'])]:
+                vals = [p['total'] if stage == 'total' else p['stages'].get(stage) for p in past]
+                vals = [v for v in vals if v is not None]
+                if not vals:
+                    continue
+                base = statistics.median(vals)
+                if ms > base * threshold and ms - base >= min_ms:
+                    regressions.append((scale, tool, stage, base, ms))
+            same_input = [r for r in prior if r['scales'].get(scale, {}).get('input') == res['input']
+                          and tool in r['scales'][scale]['tools']]
+            if same_input and same_input[-1]['scales'][scale]['tools'][tool]['output'] != cur['output']:
+                changed.append((scale, tool))
+    return regressions, changed
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Benchmark the content-patching scripts on synthetic campaigns.')
+    ap.add_argument('--scales', default='1,10,100', help='comma-separated multiples of the real mission count')
+    ap.add_argument('--tools', default=','.join(TOOLS))
+    ap.add_argument('--repeat', type=int, default=3, help='runs per tool and scale (best is kept)')
+    ap.add_argument('--jobs', '-j', type=int, default=1)
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--campaign', default=str(CAMPAIGN_JS), help='source of the sampled text')
+    ap.add_argument('--history', default=str(HISTORY))
+    ap.add_argument('--no-record', action='store_true', help='compare only; do not append to the history')
+    ap.add_argument('--window', type=int, default=5, help='earlier runs the median is taken over')
+    ap.add_argument('--threshold', type=float, default=1.25, help='slowdown factor that counts as a regression')
+    ap.add_argument('--min-ms', type=float, default=5.0, help='ignore regressions smaller than this')
+    args = ap.parse_args(argv)
+
+    tools = [t for t in args.tools.split(',') if t]
+    unknown = [t for t in tools if t not in RUNNERS]
+    if unknown:
+        ap.error(f'unknown tool(s): {", ".join(unknown)}')
+    scales = [float(s) for s in args.scales.split(',') if s]
+
+    corpus = Corpus.load(args.campaign)
+    run = {
+        'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'git': git_rev(),
+        'machine': machine(),
+        'python': platform.python_version(),
+        'jobs': args.jobs,
+        'repeat': args.repeat,
+        'scales': {},
+    }
+    with tempfile.TemporaryDirectory(prefix='bench-patch-') as tmp:
+        for scale in scales:
+            res = bench_scale(scale, tools, corpus, args.seed, args.repeat, args.jobs, Path(tmp))
+            run['scales'][f'{scale:g}x'] = res
+            print(f'{scale:g}x: {res["missions"]} missions, {res["bytes"] / 1024:.0f} KB')
+            for tool, r in res['tools'].items():
+                stages = '  '.join(f'{k} {v:.1f}' for k, v in r['stages'].items())
+                print(f'  {tool:18s} {r["total"]:9.1f} ms   {stages}')
+
+    path = Path(args.history)
+    history = load_history(path)
+    regressions, changed = compare(run, history, args.window, args.threshold, args.min_ms)
+    for scale, tool in changed:
+        print(f'NOTE: {tool} output changed at {scale} for the same input')
+    for scale, tool, stage, base, ms in regressions:
+        print(f'REGRESSION: {tool} {stage} at {scale}: {ms:.1f} ms vs median {base:.1f} ms (x{ms / base:.2f})')
+    if not args.no_record:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'runs': history + [run]}, indent=1), encoding='utf-8')
+    print(f'{"FAIL" if regressions else "OK"}: {len(regressions)} regression(s) against '
+          f'{sum(r.get("machine") == run["machine"] for r in history)} earlier run(s) on this machine')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
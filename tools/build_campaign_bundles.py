@@ -0,0 +1,200 @@
+"""Split CampaignData.js into a startup index plus per-mission bundles.
+
+    python -m tools.build_campaign_bundles          # rebuild
+    python -m tools.build_campaign_bundles --check  # exit 1 if stale
+
+Outputs (CampaignData.js stays the source of truth; re-run after editing it):
+
+- src/campaign/CampaignIndex.js: `CAMPAIGN_KEY` and a `CampaignDB` with
+  `order` and, per mission, everything except the bundled fields (id,
+  title, chapter, briefing, map, nextMissionId, bots, rules, loadout, ...) plus
+  `bundle`, the bundle file name with a content-hash query.
+- src/campaign/bundles/<id>.json: minified script, CAST refs
+  resolved, and `translations` = that mission's KO_EN_BY_MISSION table and
+  the KO_EN_GLOBAL entries its strings can hit, and `prefetch`, the voice
+  line / next-map warm-up schedule from tools/mission_timeline.py.
+
+CampaignBundles.js fetches a bundle on demand and merges it over the index
+entry.
+"""
+import argparse
+import hashlib
+import json
+import re
+import sys
+
+from tools.campaigndoc import CAMPAIGN_JS, ROOT, CampaignDoc, to_python
+from tools.jslex import decode_string, match_string
+
+CAMPAIGN_DIR = ROOT / 'src' / 'campaign'
+INDEX_JS = CAMPAIGN_DIR / 'CampaignIndex.js'
+BUNDLE_DIR = CAMPAIGN_DIR / 'bundles'
+KOEN_JS = CAMPAIGN_DIR / 'CampaignTranslationKOEN.js'
+
+# briefing stays in the index: campaign.html shows it without loading bundles
+BUNDLE_FIELDS = ('script',)
+
+CAMPAIGN_KEY_RE = re.compile(r"export\s+const\s+CAMPAIGN_KEY\s*=\s*")
+POOL_RE = r"(?m)^const\s+{}\s*=\s*"
+TAG_RE = re.compile(r"^\[[^\]]+\]\s*(.*)$", re.S)
+QUOTE_MAP = str.maketrans({'“': '"', '”': '"', '‘': "'", '’': "'"})
+
+
+def normalize_key(s: str) -> str:
+    # mirrors normalizeKey() in src/campaign/CampaignTranslate.js
+    s = s.strip()
+    m = TAG_RE.match(s)
+    s = (m.group(1) if m else s).strip()
+    return re.sub(r"\s+", ' ', s).translate(QUOTE_MAP).strip()
+
+
+def load_koen(path=KOEN_JS) -> tuple[dict, dict]:
+    """(KO_EN_BY_MISSION, KO_EN_GLOBAL) from gen_trans.mjs output: a string
+    pool `S` plus [ko, en, ...] index arrays (all JSON literals)."""
+    if not path.exists():
+        return {}, {}
+    text = path.read_text(encoding='utf-8')
+    dec = json.JSONDecoder()
+    found = {}
+    for name in ('S', 'BY_MISSION', 'GLOBAL'):
+        m = re.search(POOL_RE.format(name), text)
+        found[name] = dec.raw_decode(text, m.end())[0] if m else None
+    pool = found['S']
+    if pool is None:
+        return {}, {}
+
+    def table(idx):
+        return {pool[idx[i]]: pool[idx[i + 1]] for i in range(0, len(idx), 2)}
+    by_mission = {mid: table(idx) for mid, idx in (found['BY_MISSION'] or {}).items()}
+    return by_mission, table(found['GLOBAL'] or [])
+
+
+def _strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _strings(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from _strings(v)
+
+
+def lookup_keys(mission: dict) -> set[str]:
+    """Every key translateWith() can look up for a string of this mission."""
+    keys = set()
+    for s in _strings(mission):
+        full = s.strip()
+        m = re.match(r"^(\[[^\]]+\])\s*(.*)$", full, re.S)
+        keys.add(normalize_key(m.group(2) if m else full))
+        keys.add(normalize_key(full))
+    return keys
+
+
+def campaign_key(text: str) -> str:
+    m = CAMPAIGN_KEY_RE.search(text)
+    if not m:
+        raise ValueError('CAMPAIGN_KEY not found')
+    return decode_string(match_string(text, m.end()).group(0))
+
+
+def dumps_min(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def build_mission(doc: CampaignDoc, mid: str, koen=None, refs=None) -> tuple[dict, str]:
+    """(index entry, bundle file body) for one mission."""
+    by_mission, global_map = koen if koen is not None else ({}, {})
+    data = to_python(doc.missions[mid].node, refs if refs is not None else doc.cast())
+    entry = {k: v for k, v in data.items() if k not in BUNDLE_FIELDS}
+    bundle = {k: data[k] for k in BUNDLE_FIELDS if k in data}
+    keys = lookup_keys(data)
+    table = by_mission.get(mid, {})
+    # translateWith() only falls back to global for keys the mission lacks
+    bundle['translations'] = {
+        'mission': table,
+        'global': {k: v for k, v in global_map.items() if k in keys and not table.get(k)},
+    }
+    # mission_timeline imports this module
+    from tools.mission_timeline import prefetch, simulate
+    bundle['prefetch'] = prefetch(simulate(mid, data, {'mission': table, 'global': global_map}))
+    body = dumps_min(bundle)
+    digest = hashlib.sha256(body.encode('utf-8')).hexdigest()[:10]
+    entry['bundle'] = f'{mid}.json?v={digest}'
+    return entry, body + '\n'
+
+
+def index_js(doc: CampaignDoc, index: dict) -> str:
+    lines = [
+        '// src/campaign/CampaignIndex.js',
+        '// Auto-generated by tools/build_campaign_bundles.py from CampaignData.js — do not edit.',
+        '// Mission script/translations: ./bundles/<id>.json (loaded by CampaignBundles.js).',
+        '',
+        f'export const CAMPAIGN_KEY = {json.dumps(campaign_key(doc.text))};',
+        '',
+        'export const CampaignDB = {',
+        f'  order: {dumps_min(list(index))},',
+        '  missions: {',
+    ]
+    lines += [f'    {json.dumps(mid)}: {dumps_min(entry)},' for mid, entry in index.items()]
+    lines += ['  },', '};', '']
+    return '\n'.join(lines)
+
+
+def build(doc: CampaignDoc, koen=None) -> dict[str, str]:
+    """Relative path -> file contents for the index and every bundle."""
+    refs = doc.cast()
+    files = {}
+    index = {}
+    for mid in doc.missions:
+        index[mid], files[f'bundles/{mid}.json'] = build_mission(doc, mid, koen, refs)
+    files['CampaignIndex.js'] = index_js(doc, index)
+    return files
+
+
+def write(files: dict[str, str], root=CAMPAIGN_DIR) -> list[str]:
+    """Write changed files, drop stale bundles; returns changed paths."""
+    changed = []
+    (root / 'bundles').mkdir(exist_ok=True)
+    for rel, body in files.items():
+        path = root / rel
+        if not path.exists() or path.read_text(encoding='utf-8') != body:
+            path.write_text(body, encoding='utf-8')
+            changed.append(rel)
+    for path in (root / 'bundles').glob('*.json'):
+        rel = f'bundles/{path.name}'
+        if rel not in files:
+            path.unlink()
+            changed.append(rel)
+    return changed
+
+
+def stale(files: dict[str, str], root=CAMPAIGN_DIR) -> list[str]:
+    out = [rel for rel, body in files.items()
+           if not (root / rel).exists() or (root / rel).read_text(encoding='utf-8') != body]
+    out += [f'bundles/{p.name}' for p in (root / 'bundles').glob('*.json') if f'bundles/{p.name}' not in files]
+    return out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Build CampaignIndex.js and per-mission JSON bundles.')
+    ap.add_argument('--campaign', default=str(CAMPAIGN_JS))
+    ap.add_argument('--check', action='store_true', help='exit 1 if the outputs are out of date')
+    args = ap.parse_args(argv)
+
+    doc = CampaignDoc.load(args.campaign)
+    files = build(doc, load_koen())
+    if args.check:
+        out = stale(files)
+        for rel in out:
+            print(f'stale: {rel}')
+        sys.exit(1 if out else 0)
+
+    changed = write(files)
+    total = sum(len(b.encode('utf-8')) for rel, b in files.items() if rel.startswith('bundles/'))
+    print(f'OK: {len(doc.missions)} missions, index {len(files["CampaignIndex.js"].encode("utf-8"))} B, '
+          f'bundles {total} B, {len(changed)} file(s) changed')
+
+
+if __name__ == '__main__':
+    main()
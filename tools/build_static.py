@@ -0,0 +1,349 @@
+"""Build the deployable site into dist/ with content-hashed, precompressed assets.
+
+    python -m tools.build_static              # incremental build into dist/
+    python -m tools.build_static --clean      # drop dist/ first
+    python -m tools.build_static --out /tmp/site --list
+
+The site is the files git knows about (tracked, or new and not ignored)
+under WEB_ROOTS: the root pages, CNAME, favicon.ico, src/, maps/ and
+assets/. Anything else (tools, notes, patches, backlogs) is never
+published; outside a git checkout the web roots are walked instead. Every
+site file is copied under its own name. On top of that:
+
+- maps/**/*.json|.smap|.snav and src/**/*.js|.json get a content-hashed
+  sibling (`zone_5_v1.3f9a0c12be.smap`); its contents never change, so it can
+  be cached forever (the generated `_headers` says so for Netlify/Cloudflare
+  Pages style hosts);
+- `asset-manifest.json` maps logical paths to the hashed ones. The pages get
+  a `<meta name="strikegy-assets">` pointing at it; src/core/AssetManifest.js
+  resolves map/nav/bundle fetches through it;
+- the hashed modules are also listed in each page's import map
+  (`"./src/bots/BotManager.js": "./src/bots/BotManager.<hash>.js"`), so static
+  imports, including the ones between modules, load the hashed file. Hashed
+  files sit next to the original, so their relative imports still resolve;
+- compressible files get `.gz` (level 9) and `.br` (quality 11, needs the
+  `brotli` package; skipped with a note without it) siblings when that is
+  smaller, for `gzip_static` / `brotli_static` style serving. The hashed
+  name is the one compressed, the plain copy of a hashed file is a fallback.
+
+A .smap whose header crc does not match its map JSON (edited without
+re-running tools.compile_maps) fails the build: the game loads the .smap
+without fetching the JSON, so a stale one would ship stale geometry.
+
+Incremental: dist/.build-state.json remembers each source's size, mtime and
+content hash. Unchanged stat -> hash reused; unchanged hash with every output
+present -> nothing written. Outputs of changed or deleted sources (old
+hashed names included) are removed.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+import zlib
+from fnmatch import fnmatch
+from pathlib import Path
+
+from tools.campaigndoc import ROOT
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DIST = ROOT / 'dist'
+STATE = '.build-state.json'
+MANIFEST = 'asset-manifest.json'
+META_NAME = 'strikegy-assets'
+VERSION = 1
+
+# what the site serves: top-level files matching a pattern, or anything under a directory
+WEB_ROOTS = ('*.html', 'CNAME', 'favicon.ico', 'src/', 'maps/', 'assets/')
+COMPRESS = {'.html', '.js', '.json', '.css', '.svg', '.txt', '.smap', '.wav', '.ico'}
+TEXT = {'.html', '.js', '.json', '.css', '.svg', '.txt'}
+MIN_COMPRESS = 256
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+_IMPORTMAP_RE = re.compile(r'(<script type="importmap">)(.*?)(</script>)', re.S)
+
+
+def is_hashed(rel: str) -> bool:
+    suffix = Path(rel).suffix
+    if rel.startswith('maps/'):
+        return suffix in ('.json', '.smap', '.snav')
+    return rel.startswith('src/') and suffix in ('.js', '.json')
+
+
+def hashed_name(rel: str, digest: str) -> str:
+    p = Path(rel)
+    return p.with_name(f'{p.stem}.{digest[:10]}{p.suffix}').as_posix()
+
+
+def is_web_file(rel: str) -> bool:
+    return any(rel.startswith(pat) if pat.endswith('/') else ('/' not in rel and fnmatch(rel, pat))
+               for pat in WEB_ROOTS)
+
+
+def _git_files(root: Path) -> list[str] | None:
+    """Tracked plus untracked-but-not-ignored files, or None outside git."""
+    try:
+        res = subprocess.run(['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard'],
+                             cwd=root, capture_output=True)
+    except OSError:
+        return None
+    if res.returncode:
+        return None
+    return res.stdout.decode('utf-8').split('\0')
+
+
+def _walk_files(root: Path) -> list[str]:
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        here = Path(dirpath)
+        rel_dir = here.relative_to(root).as_posix()
+        dirnames[:] = [d for d in dirnames if here != root or f'{d}/' in WEB_ROOTS]
+        files += [name if rel_dir == '.' else f'{rel_dir}/{name}' for name in filenames]
+    return files
+
+
+def site_files(root: Path = ROOT, out: Path = DIST) -> list[str]:
+    """Repo-relative POSIX paths of the files the site serves."""
+    out = out.resolve()
+    listed = _git_files(root)
+    files = set()
+    for rel in listed if listed is not None else _walk_files(root):
+        path = root / rel
+        if rel and is_web_file(rel) and path.is_file() and out not in path.resolve().parents:
+            files.add(rel)
+    return sorted(files)
+
+
+def stale_maps(root: Path, files) -> list[str]:
+    """Site .smap files that were not compiled from their map JSON as it is now."""
+    from tools.compile_maps import source_crc
+    present = set(files)
+    out = []
+    for rel in files:
+        if rel.startswith('maps/') and rel.endswith('.smap'):
+            src = rel[:-len('.smap')] + '.json'
+            if src in present and source_crc((root / rel).read_bytes()) != zlib.crc32((root / src).read_bytes()):
+                out.append(rel)
+    return out
+
+
+def compressed(rel: str, data: bytes) -> dict:
+    """{'.gz': bytes, '.br': bytes} for the encodings that shrink `data`."""
+    if Path(rel).suffix not in COMPRESS or len(data) < MIN_COMPRESS:
+        return {}
+    out = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        mode = brotli.MODE_TEXT if Path(rel).suffix in TEXT else brotli.MODE_GENERIC
+        out['.br'] = brotli.compress(data, quality=11, mode=mode)
+    return {ext: blob for ext, blob in out.items() if len(blob) < len(data)}
+
+
+def _write(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + f'.{os.getpid()}.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _indent(spec: dict, pad: str) -> str:
+    return ''.join('\n' + pad + line for line in json.dumps(spec, indent=2, ensure_ascii=False).splitlines())
+
+
+def _first_script(html: str) -> int:
+    at = html.find('<script')
+    return at if at >= 0 else html.find('</head>')
+
+
+class Build:
+    """One build of `root` into `out`; `stats` counts what was (not) written."""
+
+    def __init__(self, root: Path = ROOT, out: Path = DIST):
+        self.root = root
+        self.out = out
+        self.state = self._load_state()
+        self.next = {}
+        self.manifest = {}
+        self.stats = {'files': 0, 'written': 0, 'unchanged': 0, 'removed': 0, 'hashed': 0,
+                      'bytes': 0, 'gz': 0, 'br': 0}
+
+    def _load_state(self) -> dict:
+        try:
+            state = json.loads((self.out / STATE).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if state.get('version') != VERSION or state.get('brotli') != (brotli is not None):
+            return {}
+        return state.get('files', {})
+
+    def _digest(self, rel: str, st) -> str:
+        old = self.state.get(rel)
+        if old and old['size'] == st.st_size and old['mtime_ns'] == st.st_mtime_ns:
+            return old['sha']
+        return hashlib.sha256((self.root / rel).read_bytes()).hexdigest()
+
+    def _emit(self, key: str, digest: str, outputs: dict, st=None):
+        """Write `outputs` ({dist rel: bytes or callable -> bytes}) unless the
+        recorded hash matches and they all exist."""
+        old = self.state.get(key)
+        names = sorted(outputs)
+        if old and old['sha'] == digest and old['outputs'] == names \
+                and all((self.out / n).exists() for n in names):
+            self.stats['unchanged'] += 1
+        else:
+            for name, data in outputs.items():
+                _write(self.out / name, data() if callable(data) else data)
+            self.stats['written'] += 1
+        self.next[key] = {'sha': digest, 'outputs': names,
+                          'size': st.st_size if st else 0, 'mtime_ns': st.st_mtime_ns if st else 0}
+
+    def _outputs(self, rel: str, digest: str, read) -> tuple[dict, str]:
+        """Lazily-read outputs for a source file (plain copy, hashed copy,
+        compressed siblings of the served name)."""
+        cache = {}
+
+        def data():
+            if 'raw' not in cache:
+                cache['raw'] = read()
+            return cache['raw']
+
+        def packed():
+            if 'packed' not in cache:
+                cache['packed'] = compressed(rel, data())
+            return cache['packed']
+
+        served = hashed_name(rel, digest) if is_hashed(rel) else rel
+        outputs = {rel: data}
+        if served != rel:
+            outputs[served] = data
+        # which siblings exist depends on the bytes; decide from the previous
+        # build when the hash is unchanged so unchanged files are not re-read
+        old = self.state.get(rel)
+        if old and old['sha'] == digest:
+            exts = [n[len(served):] for n in old['outputs'] if n.startswith(served + '.')]
+        else:
+            exts = list(packed())
+        for ext in exts:
+            outputs[served + ext] = lambda e=ext: packed()[e]
+        return outputs, served
+
+    def run(self, files=None):
+        files = files if files is not None else site_files(self.root, self.out)
+        pages = []
+        for rel in files:
+            self.stats['files'] += 1
+            if rel.endswith('.html') and '/' not in rel:
+                pages.append(rel)
+                continue
+            st = (self.root / rel).stat()
+            digest = self._digest(rel, st)
+            outputs, served = self._outputs(rel, digest, lambda r=rel: (self.root / r).read_bytes())
+            if served != rel:
+                self.manifest[rel] = served
+                self.stats['hashed'] += 1
+            self._emit(rel, digest, outputs, st)
+
+        manifest = json.dumps({'version': VERSION, 'files': dict(sorted(self.manifest.items()))},
+                              indent=1, ensure_ascii=False).encode('utf-8') + b'\n'
+        self._generated(MANIFEST, manifest)
+        self._generated('_headers', self.headers().encode('utf-8'))
+        for rel in pages:
+            self._generated(rel, self.page((self.root / rel).read_text(encoding='utf-8')).encode('utf-8'))
+
+        keep = {name for entry in self.next.values() for name in entry['outputs']}
+        for old in self.state.values():
+            for name in old['outputs']:
+                if name not in keep:
+                    try:
+                        (self.out / name).unlink()
+                        self.stats['removed'] += 1
+                    except FileNotFoundError:
+                        pass
+        _write(self.out / STATE, json.dumps({'version': VERSION, 'brotli': brotli is not None,
+                                             'files': self.next}, indent=1).encode('utf-8'))
+        for entry in self.next.values():
+            for name in entry['outputs']:
+                size = (self.out / name).stat().st_size
+                kind = Path(name).suffix
+                if kind in ('.gz', '.br'):
+                    self.stats[kind[1:]] += size
+                else:
+                    self.stats['bytes'] += size
+        return self.stats
+
+    def _generated(self, rel: str, data: bytes):
+        digest = hashlib.sha256(data).hexdigest()
+        outputs = {rel: data}
+        for ext, blob in compressed(rel, data).items():
+            outputs[rel + ext] = blob
+        self._emit(rel, digest, outputs)
+
+    def import_map(self) -> dict:
+        return {f'./{rel}': f'./{name}' for rel, name in sorted(self.manifest.items()) if rel.endswith('.js')}
+
+    def page(self, html: str) -> str:
+        """`html` with the hashed modules in its import map and the manifest
+        meta ahead of the first script."""
+        modules = self.import_map()
+        m = _IMPORTMAP_RE.search(html)
+        if m:
+            spec = json.loads(m.group(2))
+            spec.setdefault('imports', {}).update(modules)
+            html = html[:m.start(2)] + _indent(spec, '    ') + '\n  ' + html[m.end(2):]
+        elif modules:
+            at = _first_script(html)
+            html = (html[:at] + '<script type="importmap">' + _indent({'imports': modules}, '    ')
+                    + '\n  </script>\n  ' + html[at:])
+        at = _first_script(html)
+        return html[:at] + f'<meta name="{META_NAME}" content="{MANIFEST}" />\n  ' + html[at:]
+
+    def headers(self) -> str:
+        lines = [f'/{MANIFEST}', '  Cache-Control: no-cache']
+        for name in sorted(self.manifest.values()):
+            lines += [f'/{name}', f'  Cache-Control: {IMMUTABLE}']
+        return '\n'.join(lines) + '\n'
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Build dist/ with content-hashed, precompressed assets.')
+    ap.add_argument('--out', default=str(DIST), help='output directory (default: dist/)')
+    ap.add_argument('--clean', action='store_true', help='remove the output directory first')
+    ap.add_argument('--list', action='store_true', help='print the logical -> hashed manifest')
+    args = ap.parse_args(argv)
+
+    out = Path(args.out)
+    if args.clean and out.exists():
+        shutil.rmtree(out)
+    if brotli is None:
+        print('note: brotli is not installed (pip install brotli); writing .gz siblings only')
+    t0 = time.perf_counter()
+    files = site_files(ROOT, out)
+    stale = stale_maps(ROOT, files)
+    if stale:
+        for rel in stale:
+            print(f'stale: {rel}', file=sys.stderr)
+        print('error: .smap older than its map JSON; run python -m tools.compile_maps', file=sys.stderr)
+        return 1
+    build = Build(ROOT, out)
+    st = build.run(files)
+    if args.list:
+        for rel, name in sorted(build.manifest.items()):
+            print(f'{rel} -> {name}')
+    print(f'{out}: {st["files"]} file(s), {st["hashed"]} hashed, {st["written"]} written, '
+          f'{st["unchanged"]} unchanged, {st["removed"]} stale output(s) removed '
+          f'({time.perf_counter() - t0:.2f}s)')
+    print(f'  {st["bytes"] / 1e6:.2f} MB plain, {st["gz"] / 1e6:.2f} MB .gz'
+          + (f', {st["br"] / 1e6:.2f} MB .br' if brotli is not None else ''))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
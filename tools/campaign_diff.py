@@ -0,0 +1,339 @@
+"""Semantic diff of two CampaignData.js revisions, per node and field.
+
+    python -m tools.campaign_diff                       # HEAD vs the working file
+    python -m tools.campaign_diff HEAD~3 HEAD           # two git revisions
+    python -m tools.campaign_diff old.js new.js --mission c2_m14_radiant
+    python -m tools.campaign_diff HEAD --brief          # one line per change
+    python -m tools.campaign_diff HEAD --json
+
+A revision is a file path or a git revision (`git show REV:src/campaign/CampaignData.js`).
+
+Missions are matched by id and steps by `id` (the journal's addresses,
+Mission.nodes(): `#index` when the id is missing or repeated), each in one
+pass over dicts; a mission whose section text is identical is not parsed
+at all. Fields are compared by their JS source. Only `lines[]`, which has
+no keys, is aligned with a Myers diff over the entries' source; a
+replaced run pairs old and new entries in order and diffs their fields.
+
+    c2_m14_radiant say_o3_2.en changed
+      - "Copy. Moving."
+      + "Affirm. Keep moving."
+    c2_m14_radiant cs_a.lines[3] added
+      + {"t": 4.2, "speaker": "RAVEN", "text": "...", ...}
+    c2_m14_radiant act_o4 moved 22 -> 19
+
+Old addresses use the old indexes, added/changed ones the new. A section
+that changed only in comments or whitespace reports `formatting`; text
+outside the missions reports CAST entries or `head`/`tail`.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import NamedTuple
+
+from tools.campaigndoc import CAMPAIGN_JS, ROOT, CampaignDoc, Entry, JSSyntaxError, to_python
+
+
+class Change(NamedTuple):
+    mission: str      # '' for text outside the missions
+    node: str | None  # Mission.nodes() address; None for the mission itself
+    field: str | None
+    kind: str         # changed, added, removed, moved, formatting
+    old: object = None
+    new: object = None
+
+    def where(self) -> str:
+        path = self.node or ''
+        if self.field:
+            path = f'{path}.{self.field}' if path else self.field
+        return ' '.join(p for p in (self.mission, path) if p)
+
+
+def read_revision(rev: str, path: Path = CAMPAIGN_JS) -> str:
+    """Contents of `rev`: a file, else `git show rev:<path>`."""
+    p = Path(rev)
+    if p.is_file():
+        return p.read_text(encoding='utf-8')
+    rel = Path(path).resolve().relative_to(ROOT).as_posix()
+    res = subprocess.run(['git', 'show', f'{rev}:{rel}'], cwd=ROOT, capture_output=True)
+    if res.returncode:
+        raise FileNotFoundError(f'{rev}: neither a file nor a git revision '
+                                f'({res.stderr.decode("utf-8", "replace").strip()})')
+    return res.stdout.decode('utf-8')
+
+
+# -------- Myers --------
+
+def myers(a: list, b: list) -> list[tuple]:
+    """Edit script turning `a` into `b`: ('=', i, j), ('-', i, None),
+    ('+', None, j), in order (Myers' O((N+M)D) greedy diff)."""
+    n, m = len(a), len(b)
+    v = {1: 0}
+    trace = []
+    for d in range(n + m + 1):
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return _backtrack(trace, a, b, n, m)
+    return []
+
+
+def _backtrack(trace, a, b, x, y) -> list[tuple]:
+    out = []
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1] < v[k + 1]):
+            pk = k + 1
+        else:
+            pk = k - 1
+        px = v[pk]
+        py = px - pk
+        while x > px and y > py:
+            x -= 1
+            y -= 1
+            out.append(('=', x, y))
+        if d:
+            if x == px:
+                y -= 1
+                out.append(('+', None, y))
+            else:
+                x -= 1
+                out.append(('-', x, None))
+    out.reverse()
+    return out
+
+
+# -------- node diff --------
+
+class _Side:
+    __slots__ = ('doc', 'refs')
+
+    def __init__(self, doc: CampaignDoc):
+        self.doc = doc
+        self.refs = None
+
+    def src(self, node) -> str:
+        return self.doc.text[node.start:node.end]
+
+    def value(self, node):
+        if self.refs is None:
+            try:
+                self.refs = self.doc.cast()
+            except JSSyntaxError:
+                self.refs = {}
+        return to_python(node, self.refs)
+
+
+def _fields(entry: Entry, skip=()) -> dict:
+    return {k: p.value for k, p in entry.node.value.items() if k not in skip}
+
+
+def diff_fields(mid: str, addr: str | None, oe: Entry, ne: Entry, os_: _Side, ns: _Side,
+                skip=()) -> list[Change]:
+    out = []
+    of, nf = _fields(oe, skip), _fields(ne, skip)
+    for name, ov in of.items():
+        nv = nf.get(name)
+        if nv is None:
+            out.append(Change(mid, addr, name, 'removed', os_.value(ov)))
+        elif os_.src(ov) != ns.src(nv):
+            out.append(Change(mid, addr, name, 'changed', os_.value(ov), ns.value(nv)))
+    for name, nv in nf.items():
+        if name not in of:
+            out.append(Change(mid, addr, name, 'added', None, ns.value(nv)))
+    return out
+
+
+def diff_lines(mid: str, addr: str, olines: list, nlines: list, os_: _Side, ns: _Side) -> list[Change]:
+    a = [os_.src(e.node) for e in olines]
+    b = [ns.src(e.node) for e in nlines]
+    if a == b:
+        return []
+    out = []
+    removed, added = [], []
+
+    def flush():
+        # a replaced run: pair entries in order, diff their fields
+        for i, j in zip(removed, added):
+            out.extend(diff_fields(mid, f'{addr}.lines[{j}]', olines[i], nlines[j], os_, ns))
+        for i in removed[len(added):]:
+            out.append(Change(mid, f'{addr}.lines[{i}]', None, 'removed', os_.value(olines[i].node)))
+        for j in added[len(removed):]:
+            out.append(Change(mid, f'{addr}.lines[{j}]', None, 'added', None, ns.value(nlines[j].node)))
+        removed.clear()
+        added.clear()
+
+    for op, i, j in myers(a, b):
+        if op == '=':
+            flush()
+        elif op == '-':
+            removed.append(i)
+        else:
+            added.append(j)
+    flush()
+    return out
+
+
+def _keyed(mission) -> dict:
+    return {addr: e for addr, e in mission.nodes().items() if addr and '.lines[' not in addr}
+
+
+def diff_mission(mid: str, om, nm, os_: _Side, ns: _Side) -> list[Change]:
+    out = diff_fields(mid, None, om, nm, os_, ns, skip=('script',))
+    osteps, nsteps = _keyed(om), _keyed(nm)
+    for addr, oe in osteps.items():
+        ne = nsteps.get(addr)
+        if ne is None:
+            out.append(Change(mid, addr, None, 'removed', os_.value(oe.node)))
+            continue
+        if os_.src(oe.node) == ns.src(ne.node):
+            continue
+        out += diff_fields(mid, addr, oe, ne, os_, ns, skip=('lines',))
+        out += diff_lines(mid, addr, oe.lines, ne.lines, os_, ns)
+        if ('lines' in oe) != ('lines' in ne):
+            out.append(Change(mid, addr, 'lines', 'added' if 'lines' in ne else 'removed'))
+    for addr, ne in nsteps.items():
+        if addr not in osteps:
+            out.append(Change(mid, addr, None, 'added', None, ns.value(ne.node)))
+    out += _moves(mid, list(osteps), list(nsteps))
+    if not out:
+        out.append(Change(mid, None, None, 'formatting'))
+    return out
+
+
+def _moves(mid: str, old: list, new: list) -> list[Change]:
+    """Common keys outside a longest increasing run of old positions moved."""
+    pos = {k: i for i, k in enumerate(old)}
+    seq = [(pos[k], k) for k in new if k in pos]
+    # patience LIS, O(n log n)
+    tails, tail_idx, prev = [], [], [-1] * len(seq)
+    for n, (p, _) in enumerate(seq):
+        i = bisect_left(tails, p)
+        if i == len(tails):
+            tails.append(p)
+            tail_idx.append(n)
+        else:
+            tails[i] = p
+            tail_idx[i] = n
+        prev[n] = tail_idx[i - 1] if i else -1
+    keep = set()
+    n = tail_idx[-1] if tail_idx else -1
+    while n >= 0:
+        keep.add(seq[n][1])
+        n = prev[n]
+    newpos = {k: i for i, k in enumerate(new)}
+    return [Change(mid, k, None, 'moved', p, newpos[k]) for p, k in seq if k not in keep]
+
+
+def diff_docs(old: CampaignDoc, new: CampaignDoc, missions=None) -> list[Change]:
+    os_, ns = _Side(old), _Side(new)
+    out = []
+    if not missions:
+        out += _outside(os_, ns)
+    for mid, om in old.missions.items():
+        if missions and mid not in missions:
+            continue
+        nm = new.missions.get(mid)
+        if nm is None:
+            out.append(Change(mid, None, None, 'removed'))
+        elif old.section_text(mid) != new.section_text(mid):
+            out += diff_mission(mid, om, nm, os_, ns)
+    for mid in new.missions:
+        if mid not in old.missions and (not missions or mid in missions):
+            out.append(Change(mid, None, None, 'added'))
+    if not missions:
+        out += _moves('', list(old.missions), list(new.missions))
+    return out
+
+
+def _outside(os_: _Side, ns: _Side) -> list[Change]:
+    """CAST entries, else raw head/tail text outside the mission sections."""
+    old, new = os_.doc, ns.doc
+    out = []
+    ohead, nhead = (d.text[:min((m.section[0] for m in d.missions.values()), default=len(d.text))]
+                    for d in (old, new))
+    otail, ntail = (d.text[max((m.section[1] for m in d.missions.values()), default=0):] for d in (old, new))
+    if ohead != nhead:
+        try:
+            oc, nc = old.cast(), new.cast()
+        except JSSyntaxError:
+            oc = nc = {}
+        for key in sorted(set(oc) | set(nc)):
+            if oc.get(key) != nc.get(key):
+                kind = 'changed' if key in oc and key in nc else ('added' if key in nc else 'removed')
+                out.append(Change('', key, None, kind, oc.get(key), nc.get(key)))
+        if not out:
+            out.append(Change('', 'head', None, 'changed'))
+    if otail != ntail:
+        out.append(Change('', 'tail', None, 'changed'))
+    return out
+
+
+def _show(v) -> str:
+    return json.dumps(v, ensure_ascii=False)
+
+
+def report(changes: list[Change], brief: bool = False) -> str:
+    lines = []
+    for c in changes:
+        if c.kind == 'moved':
+            lines.append(f'{c.where()} moved {c.old} -> {c.new}')
+            continue
+        lines.append(f'{c.where()} {c.kind}')
+        if brief:
+            continue
+        if c.kind in ('changed', 'removed') and c.old is not None:
+            lines.append(f'  - {_show(c.old)}')
+        if c.kind in ('changed', 'added') and c.new is not None:
+            lines.append(f'  + {_show(c.new)}')
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Node/field-level diff of two CampaignData.js revisions.')
+    ap.add_argument('old', nargs='?', default='HEAD', help='file or git revision (default: HEAD)')
+    ap.add_argument('new', nargs='?', help='file or git revision (default: the working file)')
+    ap.add_argument('--campaign', default=str(CAMPAIGN_JS), help='file used for git revisions / the default new')
+    ap.add_argument('--mission', nargs='*', help='only these mission ids')
+    ap.add_argument('--brief', action='store_true', help='one line per change, no values')
+    ap.add_argument('--json', action='store_true', help='changes as JSON lines')
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    try:
+        old_text = read_revision(args.old, Path(args.campaign))
+        new_text = (read_revision(args.new, Path(args.campaign)) if args.new
+                    else Path(args.campaign).read_text(encoding='utf-8'))
+    except (OSError, FileNotFoundError) as e:
+        ap.error(str(e))
+    try:
+        changes = diff_docs(CampaignDoc(old_text), CampaignDoc(new_text), set(args.mission or ()))
+    except JSSyntaxError as e:
+        print(f'E parse: {e}')
+        return 1
+    if args.json:
+        for c in changes:
+            print(json.dumps(c._asdict(), ensure_ascii=False))
+    elif changes:
+        print(report(changes, args.brief))
+    missions = len({c.mission for c in changes if c.mission})
+    print(f'{len(changes)} change(s) in {missions} mission(s) ({time.perf_counter() - t0:.2f}s)', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
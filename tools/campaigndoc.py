@@ -0,0 +1,541 @@
+"""Indexed view of src/campaign/CampaignData.js.
+
+The file is parsed once into spans (mission -> step -> field, including
+`lines[i]` of cutscene/act nodes). Patch scripts look nodes up by id and
+queue edits on an `EditBatch`, which splices every change in a single pass
+instead of re-slicing and re-scanning the file per edit. Mission bodies
+are only span-scanned up front and parsed on first access, so tools that
+touch a few missions don't pay for the rest.
+
+    doc = CampaignDoc.load(CAMPAIGN_JS)
+    batch = doc.edit()
+    step = doc.missions['c2_m14_radiant'].step('say_o3_2')
+    batch.set_string(step, 'en', 'Move now.')
+    CAMPAIGN_JS.write_text(batch.apply(), encoding='utf-8')
+"""
+import re
+from pathlib import Path
+
+from tools.jslex import (
+    IDENT_RE, NUMBER_RE, QUOTES, JSSyntaxError,
+    decode_string, iter_tokens, js_quote, match_string, skip,
+)
+from tools.profiling import PROF
+
+ROOT = Path(__file__).resolve().parent.parent
+CAMPAIGN_JS = ROOT / 'src' / 'campaign' / 'CampaignData.js'
+
+CAMPAIGN_DB_RE = re.compile(r"export\s+const\s+CampaignDB\s*=\s*")
+CAST_RE = re.compile(r"export\s+const\s+CAST\s*=\s*")
+
+MEMBER_RE = re.compile(r"\s*\.\s*([A-Za-z_$][\w$]*)")
+
+LITERALS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+
+class JSValue:
+    """A parsed literal with its [start, end) span in the source.
+
+    kind is one of object, array, string, number, literal, ref, expr.
+    `value` holds a dict of Prop (object), a list of JSValue (array), the
+    decoded str/number/bool, or the dotted name for refs (`CAST.HART`).
+    """
+    __slots__ = ('kind', 'start', 'end', 'value')
+
+    def __init__(self, kind, start, end, value=None):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.value = value
+
+    def __repr__(self):
+        return f"JSValue({self.kind}, {self.start}:{self.end})"
+
+
+class Prop:
+    __slots__ = ('key', 'key_start', 'value')
+
+    def __init__(self, key, key_start, value):
+        self.key = key
+        self.key_start = key_start
+        self.value = value
+
+
+# -------- literal parser --------
+
+def _scan_expr(text: str, pos: int) -> int:
+    # Skip an arbitrary expression up to the next `,` / `}` / `]` at depth 0.
+    depth = 0
+    for kind, s, e in iter_tokens(text, pos):
+        if kind == 'punct':
+            c = text[s]
+            if c in '([{':
+                depth += 1
+            elif c in ')]}':
+                if depth == 0:
+                    return s
+                depth -= 1
+            elif c == ',' and depth == 0:
+                return s
+        pos = e
+    return pos
+
+
+def parse_value(text: str, pos: int) -> JSValue:
+    pos = skip(text, pos)
+    c = text[pos:pos + 1]
+    if c == '{':
+        return _parse_object(text, pos)
+    if c == '[':
+        return _parse_array(text, pos)
+    if c and c in QUOTES:
+        m = match_string(text, pos)
+        return JSValue('string', pos, m.end(), decode_string(m.group()))
+    m = NUMBER_RE.match(text, pos + 1 if c == '-' else pos)
+    if m:
+        raw = text[pos:m.end()]
+        try:
+            num = int(raw, 0) if raw.lstrip('-').isdigit() or 'x' in raw.lower() else float(raw)
+        except ValueError:
+            num = float(raw)
+        return JSValue('number', pos, m.end(), num)
+    m = IDENT_RE.match(text, pos)
+    if m:
+        name = m.group()
+        if name in LITERALS:
+            return JSValue('literal', pos, m.end(), LITERALS[name])
+        end = m.end()
+        while True:
+            m = MEMBER_RE.match(text, end)
+            if not m:
+                break
+            name += '.' + m.group(1)
+            end = m.end()
+        return JSValue('ref', pos, end, name)
+    end = _scan_expr(text, pos)
+    if end == pos:
+        raise JSSyntaxError('expected a value', pos)
+    return JSValue('expr', pos, end, text[pos:end].rstrip())
+
+
+SKIP_RE = re.compile(
+    r"'[^'\\\n]*(?:\\[\s\S][^'\\\n]*)*'"
+    r'|"[^"\\\n]*(?:\\[\s\S][^"\\\n]*)*"'
+    r"|`[^`\\]*(?:\\[\s\S][^`\\]*)*`"
+    r"|//[^\n]*|/\*[\s\S]*?\*/|[{}\[\]]"
+)
+
+
+def skip_value(text: str, pos: int) -> JSValue:
+    """Span of an object/array literal at `pos` without building its tree
+    (`value` stays None). Much cheaper than parse_value for large literals."""
+    pos = skip(text, pos)
+    kind = {'{': 'object', '[': 'array'}.get(text[pos:pos + 1])
+    if kind is None:
+        return parse_value(text, pos)
+    depth = 0
+    for m in SKIP_RE.finditer(text, pos):
+        c = text[m.start()]
+        if c in '{[':
+            depth += 1
+        elif c in '}]':
+            depth -= 1
+            if depth == 0:
+                return JSValue(kind, pos, m.end())
+    raise JSSyntaxError(f'unterminated {kind} literal', pos)
+
+
+def _finish(text: str, node: JSValue) -> tuple[JSValue, int]:
+    # Values followed by an operator (`'a' + b`) degrade to an opaque expr.
+    pos = skip(text, node.end)
+    if pos < len(text) and text[pos] not in ',}]':
+        end = _scan_expr(text, node.start)
+        node = JSValue('expr', node.start, end, text[node.start:end].rstrip())
+        node.end = node.start + len(node.value)
+        pos = skip(text, end)
+    return node, pos
+
+
+def _parse_object(text: str, pos: int, shallow: bool = False) -> JSValue:
+    start = pos
+    props = {}
+    pos = skip(text, pos + 1)
+    while True:
+        if pos >= len(text):
+            raise JSSyntaxError('unterminated object literal', start)
+        c = text[pos]
+        if c == '}':
+            return JSValue('object', start, pos + 1, props)
+        key_start = pos
+        if c in QUOTES:
+            m = match_string(text, pos)
+            key = decode_string(m.group())
+        else:
+            m = IDENT_RE.match(text, pos) or NUMBER_RE.match(text, pos)
+            if not m:
+                raise JSSyntaxError('expected a property key', pos)
+            key = m.group()
+        pos = skip(text, m.end())
+        if text.startswith(':', pos):
+            value = (skip_value if shallow else parse_value)(text, pos + 1)
+        elif text[pos:pos + 1] in (',', '}'):
+            value = JSValue('ref', key_start, m.end(), key)  # shorthand `{ a }`
+        else:
+            raise JSSyntaxError("expected ':'", pos)
+        value, pos = _finish(text, value)
+        props[key] = Prop(key, key_start, value)
+        if text.startswith(',', pos):
+            pos = skip(text, pos + 1)
+        elif not text.startswith('}', pos):
+            raise JSSyntaxError("expected ',' or '}'", pos)
+
+
+def _parse_array(text: str, pos: int) -> JSValue:
+    start = pos
+    items = []
+    pos = skip(text, pos + 1)
+    while True:
+        if pos >= len(text):
+            raise JSSyntaxError('unterminated array literal', start)
+        if text[pos] == ']':
+            return JSValue('array', start, pos + 1, items)
+        value, pos = _finish(text, parse_value(text, pos))
+        items.append(value)
+        if text.startswith(',', pos):
+            pos = skip(text, pos + 1)
+        elif not text.startswith(']', pos):
+            raise JSSyntaxError("expected ',' or ']'", pos)
+
+
+def to_python(node: JSValue, refs: dict | None = None):
+    """Plain Python value for a parsed literal; refs resolve through `refs`."""
+    if node.kind == 'object':
+        return {k: to_python(p.value, refs) for k, p in node.value.items()}
+    if node.kind == 'array':
+        return [to_python(v, refs) for v in node.value]
+    if node.kind == 'ref' and refs is not None:
+        return refs.get(node.value, node.value)
+    return node.value
+
+
+# -------- campaign index --------
+
+class Entry:
+    """Object node (script step or `lines[i]`) with field lookups."""
+    __slots__ = ('node',)
+
+    def __init__(self, node: JSValue):
+        self.node = node
+
+    @property
+    def start(self):
+        return self.node.start
+
+    @property
+    def end(self):
+        return self.node.end
+
+    def __contains__(self, name):
+        return name in self.node.value
+
+    def get(self, name) -> JSValue | None:
+        p = self.node.value.get(name)
+        return p.value if p else None
+
+    def get_str(self, name) -> str | None:
+        v = self.get(name)
+        return v.value if v is not None and v.kind == 'string' else None
+
+    def get_ref(self, name) -> str | None:
+        v = self.get(name)
+        return v.value if v is not None and v.kind == 'ref' else None
+
+    def fields(self):
+        return self.node.value.keys()
+
+
+class Step(Entry):
+    __slots__ = ('index', 'lines')
+
+    def __init__(self, node: JSValue, index: int):
+        super().__init__(node)
+        self.index = index
+        arr = self.get('lines')
+        self.lines = [Entry(v) for v in arr.value if v.kind == 'object'] if arr is not None and arr.kind == 'array' else []
+
+    @property
+    def id(self):
+        return self.get_str('id')
+
+    @property
+    def type(self):
+        return self.get_str('type')
+
+    def __repr__(self):
+        return f"Step({self.id!r}, {self.type!r})"
+
+
+class Mission(Entry):
+    """One `CampaignDB.missions` entry.
+
+    `section` is the [start, end) span from the start of the key line to the
+    start of the next mission's key line, matching the old get_section()
+    slicing (comments between missions belong to the mission above).
+    """
+    __slots__ = ('id', 'key_start', 'section', '_text', '_span', '_node', '_steps', '_by_id')
+
+    def __init__(self, mid: str, key_start: int, text: str, span: JSValue):
+        self.id = mid
+        self.key_start = key_start
+        self.section = (key_start, key_start)
+        # the object literal is only parsed on first access
+        self._text = text
+        self._span = span
+        self._node = None
+        self._steps = None
+
+    @property
+    def node(self) -> JSValue:
+        if self._node is None:
+            self._node = parse_value(self._text, self._span.start)
+        return self._node
+
+    @property
+    def start(self):
+        return self._span.start
+
+    @property
+    def end(self):
+        return self._span.end
+
+    @property
+    def steps(self) -> list[Step]:
+        if self._steps is None:
+            script = self.get('script')
+            items = script.value if script is not None and script.kind == 'array' else []
+            self._steps = [Step(v, i) for i, v in enumerate(items) if v.kind == 'object']
+            self._by_id = {}
+            for s in self._steps:
+                if s.id is not None:
+                    self._by_id.setdefault(s.id, s)
+        return self._steps
+
+    def step(self, step_id: str) -> Step | None:
+        self.steps
+        return self._by_id.get(step_id)
+
+    def nodes(self) -> dict[str, Entry]:
+        """Address -> Entry for the mission (''), its steps (the step id, or
+        `#index` when missing or repeated) and their `lines[i]`
+        (`<step>.lines[i]`)."""
+        out = {'': self}
+        counts = {}
+        for step in self.steps:
+            counts[step.id] = counts.get(step.id, 0) + 1
+        for step in self.steps:
+            addr = step.id if step.id is not None and counts[step.id] == 1 else f'#{step.index}'
+            out[addr] = step
+            for i, line in enumerate(step.lines):
+                out[f'{addr}.lines[{i}]'] = line
+        return out
+
+    def __repr__(self):
+        return f"Mission({self.id!r}, {len(self.steps)} steps)"
+
+
+class CampaignDoc:
+    def __init__(self, text: str):
+        self.text = text
+        if PROF.on:
+            PROF.count('bytes.parsed', len(text))
+        with PROF.stage('parse'):
+            self._index(text)
+
+    def _index(self, text: str):
+        m = CAMPAIGN_DB_RE.search(text)
+        if not m:
+            raise JSSyntaxError('CampaignDB not found', 0)
+        pos = skip(text, m.end())
+        if not text.startswith('{', pos):
+            raise JSSyntaxError('CampaignDB is not an object literal', pos)
+        self.db = _parse_object(text, pos, shallow=True)
+        missions = self.db.value.get('missions')
+        if missions is None or missions.value.kind != 'object':
+            raise JSSyntaxError('CampaignDB.missions is not an object literal', self.db.start)
+        # mission bodies are only span-scanned here; see Mission.node
+        self.missions_node = _parse_object(text, missions.value.start, shallow=True)
+        self.missions: dict[str, Mission] = {}
+        for key, p in self.missions_node.value.items():
+            if p.value.kind == 'object':
+                self.missions[key] = Mission(key, _line_start(text, p.key_start), text, p.value)
+        ms = list(self.missions.values())
+        tail = _line_start(text, self.missions_node.end - 1)
+        for cur, nxt in zip(ms, ms[1:] + [None]):
+            cur.section = (cur.key_start, nxt.key_start if nxt else tail)
+
+    @classmethod
+    def load(cls, path=CAMPAIGN_JS):
+        return cls(Path(path).read_text(encoding='utf-8'))
+
+    def rebase(self, batch: 'EditBatch') -> tuple['CampaignDoc', list[str]]:
+        """(doc for batch.apply(), ids of the missions it touched).
+
+        Only the touched mission sections are re-scanned; the others keep
+        their spans, shifted. Edits outside the mission sections (or across
+        two of them) fall back to a full re-index.
+        """
+        text = batch.apply()
+        ms = list(self.missions.values())
+        edits = sorted((s, e, len(new) - (e - s)) for s, e, _, new in batch._edits)
+        if not ms or len(ms) != len(self.missions_node.value):
+            return CampaignDoc(text), list(self.missions)
+        lo, hi = ms[0].section[0], ms[-1].section[1]
+        if any(s < lo or e > hi for s, e, _ in edits):
+            return CampaignDoc(text), list(self.missions)
+
+        with PROF.stage('rebase'):
+            doc = CampaignDoc.__new__(CampaignDoc)
+            doc.text = text
+            doc.missions = {}
+            props = {}
+            dirty = []
+            shift = 0
+            i = 0
+            for m in ms:
+                s0, e0 = m.section
+                delta = 0
+                touched = False
+                while i < len(edits) and edits[i][0] < e0:
+                    s, e, d = edits[i]
+                    if e > e0:
+                        return CampaignDoc(text), list(self.missions)
+                    delta += d
+                    touched = True
+                    i += 1
+                start = s0 + shift
+                if touched:
+                    dirty.append(m.id)
+                    pos = skip(text, start)
+                    km = match_string(text, pos) if text[pos:pos + 1] in QUOTES else IDENT_RE.match(text, pos)
+                    colon = skip(text, km.end()) if km else pos
+                    if km is None or not text.startswith(':', colon):
+                        raise JSSyntaxError('expected a mission key', pos)
+                    key_pos = pos
+                    span = skip_value(text, colon + 1)
+                else:
+                    key_pos = self.missions_node.value[m.id].key_start + shift
+                    span = JSValue('object', m.start + shift, m.end + shift)
+                nm = Mission(m.id, start, text, span)
+                nm.section = (start, e0 + shift + delta)
+                doc.missions[m.id] = nm
+                props[m.id] = Prop(m.id, key_pos, span)
+                shift += delta
+            if i < len(edits):
+                # an insert right at the end of the last section
+                return CampaignDoc(text), list(self.missions)
+
+            old = self.missions_node
+            doc.missions_node = JSValue('object', old.start, old.end + shift, props)
+            db = {}
+            for key, p in self.db.value.items():
+                v = p.value
+                if key == 'missions':
+                    db[key] = Prop(key, p.key_start, JSValue(v.kind, v.start, v.end + shift, v.value))
+                elif v.start >= old.end:
+                    db[key] = Prop(key, p.key_start + shift, JSValue(v.kind, v.start + shift, v.end + shift, v.value))
+                else:
+                    db[key] = p
+            doc.db = JSValue('object', self.db.start, self.db.end + shift, db)
+        return doc, dirty
+
+    def cast(self) -> dict[str, str]:
+        """`CAST.X` -> display name, for resolving speaker refs."""
+        m = CAST_RE.search(self.text)
+        if not m:
+            return {}
+        node = parse_value(self.text, m.end())
+        return {f'CAST.{k}': p.value.value for k, p in node.value.items() if p.value.kind == 'string'}
+
+    def section_text(self, mid: str) -> str:
+        s, e = self.missions[mid].section
+        return self.text[s:e]
+
+    def edit(self) -> 'EditBatch':
+        return EditBatch(self.text)
+
+
+def _line_start(text: str, pos: int) -> int:
+    return text.rfind('\n', 0, pos) + 1
+
+
+# -------- batched edits --------
+
+class EditBatch:
+    """Collects span replacements and applies them in one splice pass."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._edits = []  # (start, end, seq, replacement)
+        self.scope = None  # mission ids a scoped run may edit (None = all)
+
+    def __len__(self):
+        return len(self._edits)
+
+    def replace(self, start: int, end: int, new: str):
+        if self.text[start:end] != new:
+            self._edits.append((start, end, len(self._edits), new))
+
+    def insert(self, pos: int, new: str):
+        self._edits.append((pos, pos, len(self._edits), new))
+
+    def replace_value(self, node: JSValue, src: str):
+        self.replace(node.start, node.end, src)
+
+    def set_raw(self, entry: Entry, name: str, src: str, after: str = 'text'):
+        """Set `name` to the JS source `src`, inserting `, name: src` after
+        the `after` field when the field is missing."""
+        cur = entry.get(name)
+        if cur is not None:
+            self.replace_value(cur, src)
+            return
+        anchor = entry.get(after)
+        if anchor is None:
+            raise KeyError(f"cannot insert {name!r}: no {after!r} field")
+        self.insert(anchor.end, f", {name}: {src}")
+
+    def set_string(self, entry: Entry, name: str, s: str, after: str = 'text', quote: str | None = None):
+        """Set a string field; keeps the existing quote style unless `quote`
+        is given (new fields default to single quotes)."""
+        cur = entry.get(name)
+        if quote is None:
+            quote = self.text[cur.start] if cur is not None and cur.kind == 'string' else "'"
+        self.set_raw(entry, name, js_quote(s, quote), after)
+
+    def restrict(self, spans) -> int:
+        """Drop the edits not inside one of `spans` ([start, end) pairs);
+        returns how many were dropped."""
+        spans = sorted(spans)
+        keep = [ed for ed in self._edits
+                if any(s <= ed[0] and ed[1] <= e for s, e in spans)]
+        dropped = len(self._edits) - len(keep)
+        self._edits = keep
+        return dropped
+
+    def apply(self) -> str:
+        with PROF.stage('apply'):
+            return self.apply_range(0, len(self.text))
+
+    def apply_range(self, start: int, end: int) -> str:
+        """Patched text of [start, end); every edit must lie inside it."""
+        if PROF.on:
+            PROF.count('edits.applied', len(self._edits))
+        out = []
+        pos = start
+        for s, e, _, new in sorted(self._edits):
+            if s < pos or e > end:
+                raise ValueError(f"edit at offset {s} overlaps another edit or leaves the range")
+            out.append(self.text[pos:s])
+            out.append(new)
+            pos = e
+        out.append(self.text[pos:end])
+        return ''.join(out)
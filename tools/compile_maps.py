@@ -0,0 +1,241 @@
+"""Compile maps/**/*.json into packed binary maps (.smap) next to the source.
+
+    python -m tools.compile_maps              # all maps
+    python -m tools.compile_maps maps/zone_5_v1.json
+    python -m tools.compile_maps --check      # exit 1 if any .smap is stale
+
+Layout (little-endian; decoded by src/world/MapBinary.js):
+
+    0   4s  magic b'SMAP'
+    4   u16 version
+    6   u16 type count
+    8   u32 box count (N)
+    12  u32 header JSON byte length (J)
+    16  u32 crc32 of the source JSON bytes
+    20  J   UTF-8 JSON: {"map": <map minus objects>, "types": [...],
+                         "other": [[index, object], ...]}
+        ..  zero padding to a 4-byte boundary
+        N*6 f32  box min xyz, max xyz
+        N   u8   type id (index into "types")
+        N   u8   collision flag: 0 unset, 1 true, 2 false
+        ..  zero padding to a 4-byte boundary
+    broadphase grid over the solid boxes (the packed ones, then those in
+    "other", in CollisionWorld order; absent when the map has none):
+        u32 box hash, 3 f64 originX/originZ/cellSize, u32 cols, rows, M, W
+        uW[cols*rows+1] cellStart, uW[M] items (box indices, CSR);
+        W = 16 when everything fits in 16 bits, else 32
+
+Version 5 is the only one the game reads; an older .smap reads as stale
+(`--check`) and is rebuilt.
+
+Plain boxes ({type, shape: 'box', pos, size[, collision]}) go into the
+arrays; anything else is kept verbatim in "other" at its original index.
+"""
+import argparse
+import json
+import math
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+
+from tools.campaigndoc import ROOT
+
+MAPS_DIR = ROOT / 'maps'
+MAGIC = b'SMAP'
+VERSION = 5
+HEADER = struct.Struct('<4sHHIII')
+INDEX_HEADER = struct.Struct('<I3d4I')
+BOX_KEYS = {'type', 'shape', 'pos', 'size', 'collision'}
+COLLISION_FLAG = {None: 0, True: 1, False: 2}
+NON_SOLID = {'floor', 'ground', 'deco', 'decor', 'sky'}
+GRID_CELL = 16.0  # CollisionWorld.js GRID_CELL
+
+
+def _is_vec3(v) -> bool:
+    return isinstance(v, list) and len(v) == 3 and all(
+        isinstance(x, (int, float)) and not isinstance(x, bool) for x in v)
+
+
+def is_packable(obj) -> bool:
+    return (isinstance(obj, dict) and obj.get('shape') == 'box'
+            and set(obj) <= BOX_KEYS and isinstance(obj.get('type'), str)
+            and _is_vec3(obj.get('pos')) and _is_vec3(obj.get('size'))
+            and obj.get('collision', None) in COLLISION_FLAG)
+
+
+def is_solid(obj) -> bool:
+    # game.html buildScene(): collision === false or floor-like types opt out
+    return obj.get('collision') is not False and str(obj.get('type') or '').lower() not in NON_SOLID
+
+
+def solid_boxes(data: dict) -> array:
+    """Flat float32 min/max of the boxes game.html puts in CollisionWorld, in
+    its order (packed boxes first, then boxes kept verbatim in "other")."""
+    objects = data.get('objects') or []
+    packed = [o for o in objects if is_packable(o)]
+    other = [o for o in objects if not is_packable(o) and isinstance(o, dict) and o.get('shape') == 'box']
+    out = array('f')
+    for obj in packed + other:
+        if is_solid(obj):
+            (px, py, pz), (sx, sy, sz) = obj['pos'], obj['size']
+            out.extend((px - sx / 2, py - sy / 2, pz - sz / 2, px + sx / 2, py + sy / 2, pz + sz / 2))
+    return out
+
+
+def _le_bytes(a: array) -> bytes:
+    if sys.byteorder != 'little':
+        a = array(a.typecode, a)
+        a.byteswap()
+    return a.tobytes()
+
+
+def box_hash(boxes: array) -> int:
+    # FNV-1a 32-bit over the float32 bytes; hashBoxes() in CollisionWorld.js
+    h = 0x811c9dc5
+    for b in _le_bytes(boxes):
+        h = ((h ^ b) * 0x01000193) & 0xffffffff
+    return h
+
+
+def build_grid_index(boxes: array, cell_size: float = GRID_CELL):
+    """(originX, originZ, cols, rows, cellStart, items); buildGridIndex() in JS."""
+    n = len(boxes) // 6
+    x0 = min(boxes[o] for o in range(0, n * 6, 6))
+    z0 = min(boxes[o + 2] for o in range(0, n * 6, 6))
+    x1 = max(boxes[o + 3] for o in range(0, n * 6, 6))
+    z1 = max(boxes[o + 5] for o in range(0, n * 6, 6))
+    cols = max(1, math.ceil((x1 - x0) / cell_size))
+    rows = max(1, math.ceil((z1 - z0) / cell_size))
+
+    def cell(v, origin, count):
+        return min(count - 1, max(0, math.floor((v - origin) / cell_size)))
+
+    cells = [[] for _ in range(cols * rows)]
+    for i in range(n):
+        o = i * 6
+        for r in range(cell(boxes[o + 2], z0, rows), cell(boxes[o + 5], z0, rows) + 1):
+            for c in range(cell(boxes[o], x0, cols), cell(boxes[o + 3], x0, cols) + 1):
+                cells[r * cols + c].append(i)
+    start = array('I', [0])
+    items = array('I')
+    for lst in cells:
+        items.extend(lst)
+        start.append(len(items))
+    return x0, z0, cols, rows, start, items
+
+
+def grid_query(grid):
+    """queryXZ() over a build_grid_index() grid: the box indices whose cells
+    overlap the rectangle, ascending, >= `from_`."""
+    x0, z0, cols, rows, start, items = grid
+
+    def query(min_x, min_z, max_x, max_z, from_=0):
+        c0 = max(0, math.floor((min_x - x0) / GRID_CELL))
+        c1 = min(cols - 1, math.floor((max_x - x0) / GRID_CELL))
+        r0 = max(0, math.floor((min_z - z0) / GRID_CELL))
+        r1 = min(rows - 1, math.floor((max_z - z0) / GRID_CELL))
+        out = set()
+        for r in range(r0, r1 + 1):
+            for c in range(c0, c1 + 1):
+                for k in range(start[r * cols + c], start[r * cols + c + 1]):
+                    if items[k] >= from_:
+                        out.add(items[k])
+        return sorted(out)
+    return query
+
+
+def compile_map(src: bytes) -> bytes:
+    data = json.loads(src)
+    objects = data.get('objects') or []
+    head = {k: v for k, v in data.items() if k != 'objects'}
+
+    types, type_ids = [], {}
+    minmax = array('f')
+    tids = bytearray()
+    flags = bytearray()
+    other = []
+    for i, obj in enumerate(objects):
+        if not is_packable(obj):
+            other.append([i, obj])
+            continue
+        t = obj['type']
+        if t not in type_ids:
+            if len(types) == 255:
+                raise ValueError('more than 255 object types')
+            type_ids[t] = len(types)
+            types.append(t)
+        (px, py, pz), (sx, sy, sz) = obj['pos'], obj['size']
+        minmax.extend((px - sx / 2, py - sy / 2, pz - sz / 2, px + sx / 2, py + sy / 2, pz + sz / 2))
+        tids.append(type_ids[t])
+        flags.append(COLLISION_FLAG[obj.get('collision')])
+
+    meta = json.dumps({'map': head, 'types': types, 'other': other},
+                      ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    pad = -(HEADER.size + len(meta)) % 4
+    header = HEADER.pack(MAGIC, VERSION, len(types), len(tids), len(meta), zlib.crc32(src))
+    parts = [header, meta, b'\0' * pad, _le_bytes(minmax), bytes(tids), bytes(flags),
+             b'\0' * (-(2 * len(tids)) % 4)]
+
+    solid = solid_boxes(data)
+    if solid:
+        x0, z0, cols, rows, start, items = build_grid_index(solid)
+        width = 16 if len(items) < 1 << 16 else 32
+        if width == 16:
+            start, items = array('H', start), array('H', items)
+        parts += [INDEX_HEADER.pack(box_hash(solid), x0, z0, GRID_CELL, cols, rows, len(items), width),
+                  _le_bytes(start), _le_bytes(items)]
+    return b''.join(parts)
+
+
+def source_crc(blob: bytes) -> int | None:
+    """crc32 of the JSON a compiled map was built from (None if not a .smap)."""
+    if len(blob) < HEADER.size:
+        return None
+    magic, version, _, _, _, crc = HEADER.unpack_from(blob)
+    return crc if magic == MAGIC and version == VERSION else None
+
+
+def smap_path(path: Path) -> Path:
+    return path.with_suffix('.smap')
+
+
+def map_sources(paths=None) -> list[Path]:
+    if paths:
+        return [Path(p) for p in paths]
+    return sorted(MAPS_DIR.rglob('*.json'))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Compile map JSON into packed .smap files.')
+    ap.add_argument('maps', nargs='*', help='map JSON files (default: maps/**/*.json)')
+    ap.add_argument('--check', action='store_true', help='exit 1 if any .smap is missing or stale')
+    args = ap.parse_args(argv)
+
+    stale = []
+    src_total = out_total = 0
+    for path in map_sources(args.maps):
+        src = path.read_bytes()
+        out_path = smap_path(path)
+        old = out_path.read_bytes() if out_path.exists() else b''
+        if args.check:
+            if source_crc(old) != zlib.crc32(src):
+                stale.append(path)
+            continue
+        blob = compile_map(src)
+        if blob != old:
+            out_path.write_bytes(blob)
+        src_total += len(src)
+        out_total += len(blob)
+
+    if args.check:
+        for path in stale:
+            print(f'stale: {path}')
+        sys.exit(1 if stale else 0)
+    if src_total:
+        print(f'OK: {src_total} B json -> {out_total} B smap ({out_total / src_total:.0%})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+"""On-disk cache for the EN regeneration tools.
+
+Two stores under one size-bounded LRU directory (default `.cache/campaign`):
+
+- section outputs, keyed by a hash of (pass name, rule-set fingerprint,
+  mission section source, extra inputs). A hit copies the patched section
+  through without re-running the pass.
+- memo tables for pure string functions (`ko_to_en`, `pick_en`), one JSON
+  file per (name, fingerprint), reused across runs.
+
+Pass `enabled=False` (the tools' `--no-cache`) to bypass both.
+"""
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from tools.campaigndoc import ROOT
+from tools.profiling import MEMO_HIT, PROF
+
+CACHE_DIR = ROOT / '.cache' / 'campaign'
+MAX_BYTES = 64 << 20
+MAX_MEMO = 50_000
+
+
+def fingerprint(*parts) -> str:
+    """Short stable hash of rule tables / constants (JSON-serialisable)."""
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=repr)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def _atomic_write(path: Path, data: str):
+    tmp = path.with_name(path.name + f'.{os.getpid()}.tmp')
+    tmp.write_text(data, encoding='utf-8')
+    os.replace(tmp, path)
+
+
+class Memo:
+    """Persistent str -> str table with LRU trimming on save.
+
+    Under `--profile` a hit is recorded in the PROF hit table called `name`
+    as one `MEMO_HIT` row, since the wrapped rule never runs to say which
+    branch it would have taken.
+    """
+
+    def __init__(self, path: Path | None, max_entries: int = MAX_MEMO, name: str = 'memo'):
+        self.path = path
+        self.name = name
+        self.max_entries = max_entries
+        self.data = OrderedDict()
+        self.dirty = False
+        self.hits = self.misses = 0
+        if path is not None and path.exists():
+            try:
+                self.data.update(json.loads(path.read_text(encoding='utf-8')))
+            except (OSError, ValueError):
+                self.data.clear()
+
+    def wrap(self, fn):
+        data = self.data
+
+        def cached(s):
+            out = data.get(s)
+            if out is None:
+                self.misses += 1
+                out = data[s] = fn(s)
+                self.dirty = True
+            else:
+                self.hits += 1
+                data.move_to_end(s)
+                if PROF.on:
+                    PROF.hit(self.name, MEMO_HIT)
+            return out
+        cached.__wrapped__ = fn
+        return cached
+
+    def save(self):
+        if self.path is None or not self.dirty:
+            return
+        while len(self.data) > self.max_entries:
+            self.data.popitem(last=False)
+        _atomic_write(self.path, json.dumps(self.data, ensure_ascii=False))
+        self.dirty = False
+
+
+class ContentCache:
+    def __init__(self, root: Path = CACHE_DIR, max_bytes: int = MAX_BYTES, enabled: bool = True):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = self.misses = 0
+        self._memos = []
+        self._index = OrderedDict()  # key -> [size, last_used]; oldest first
+        self._index_path = self.root / 'index.json'
+        if enabled:
+            (self.root / 'sections').mkdir(parents=True, exist_ok=True)
+            (self.root / 'memo').mkdir(parents=True, exist_ok=True)
+            try:
+                entries = json.loads(self._index_path.read_text(encoding='utf-8'))
+                for k, v in sorted(entries.items(), key=lambda kv: kv[1][1]):
+                    self._index[k] = v
+            except (OSError, ValueError):
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        h = hashlib.sha256()
+        for p in parts:
+            b = p.encode('utf-8')
+            h.update(len(b).to_bytes(8, 'little'))
+            h.update(b)
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / 'sections' / key[:2] / key
+
+    def get(self, key: str) -> str | None:
+        if not self.enabled:
+            return None
+        if key in self._index:
+            try:
+                text = self._path(key).read_text(encoding='utf-8')
+            except OSError:
+                del self._index[key]
+            else:
+                self.hits += 1
+                self._index[key][1] = time.time()
+                self._index.move_to_end(key)
+                return text
+        self.misses += 1
+        return None
+
+    def put(self, key: str, text: str):
+        if not self.enabled:
+            return
+        p = self._path(key)
+        p.parent.mkdir(exist_ok=True)
+        _atomic_write(p, text)
+        self._index[key] = [len(text.encode('utf-8')), time.time()]
+        self._index.move_to_end(key)
+
+    def memo(self, name: str, version: str) -> Memo:
+        m = Memo(self.root / 'memo' / f'{name}-{version}.json' if self.enabled else None, name=name)
+        self._memos.append(m)
+        return m
+
+    def evict(self):
+        total = sum(v[0] for v in self._index.values())
+        while total > self.max_bytes and self._index:
+            key, (size, _) = self._index.popitem(last=False)
+            total -= size
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+    def close(self):
+        if not self.enabled:
+            return
+        for m in self._memos:
+            m.save()
+        self.evict()
+        _atomic_write(self._index_path, json.dumps(self._index))
+
+    def stats(self) -> str:
+        memo = ', '.join(f'{Path(m.path).stem}: {m.hits} hit/{m.misses} miss' for m in self._memos if m.path)
+        s = f'cache: {self.hits} section hit(s), {self.misses} miss(es)'
+        return s + (f'; {memo}' if memo else '') if self.enabled else 'cache: disabled'
+
@@ -0,0 +1,445 @@
+"""Inverted index over the campaign's dialogue and text fields, with a query CLI.
+
+    python -m tools.dialogue_index 'speaker:shade tag:무전 chapter:2'
+    python -m tools.dialogue_index '="목표 확인."' --by mission     # who reuses this line
+    python -m tools.dialogue_index 'field:en is:fallback' --count
+    python -m tools.dialogue_index 'extract* OR exfil* -type:say' --limit 20
+    python -m tools.dialogue_index --stats
+
+Every string field of every mission (title, ...), script step (text, en,
+label, hint, toast, ...) and `lines[i]` entry is one document, addressed
+like the journal: mission id, node (`Mission.nodes()`: step id, `#index`,
+`<step>.lines[i]`, '' for the mission) and field.
+
+Query terms (AND by default; `OR`, `NOT`/`-term` and parentheses):
+
+    word  wor*         token / token prefix (case-insensitive; Korean
+                       words keep their particles, so prefix them: 무전*)
+    "two words"        those tokens, in that order (substring of the value)
+    ="exact value"     the whole value (tag and surrounding space included)
+    mission:c2_m1*     mission id          chapter:2   `chapter` field
+    type:cutscene      step type (lines inherit their step's)
+    step:say_o3_2      step id             field:en    field name
+    speaker:shade      CAST key or the spoken name tag (CAST.SHADE -> ECLIPSE)
+    tag:무전           leading [comms tag] of the value, as written
+    channel:radio      that tag normalized like the runtime (무전/radio -> radio)
+    is:fallback        value is a p45_ultra_fix_en FALLBACKS template
+    is:hangul          value contains Hangul
+
+Facet values take a trailing `*` too. The index lives in .cache/campaign
+(`dialogue-index.json`), one segment per mission keyed by the section's
+hash; opening it re-indexes only missions whose source changed (or all of
+them when CAST, the FALLBACKS list or the format changed).
+
+From code (patch scripts, the validator):
+
+    idx = DialogueIndex.open(doc)
+    for hit in idx.search('field:en is:fallback mission:c2_*'):
+        entry = idx.entry(doc, hit)        # campaigndoc Entry, for EditBatch
+    idx.missions('speaker:nova')           # mission ids with any hit
+
+tools.validate_campaign and tools.pipeline take `--where QUERY` to check /
+patch only the missions it matches.
+"""
+import argparse
+import bisect
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from tools.campaigndoc import CAMPAIGN_JS, CampaignDoc, Entry
+from tools.contentcache import CACHE_DIR, fingerprint
+from tools.mission_timeline import channel_label
+from tools.tts_prerender import CHANNEL_RE, HANGUL_RE, speaker_tag
+
+FORMAT = 1
+INDEX_NAME = 'dialogue-index.json'
+# identifiers and references, not text
+SKIP_FIELDS = {'id', 'type', 'trigger', 'checkpointId', 'objectiveKey', 'key', 'team', 'map', 'nextMissionId'}
+TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]+(?:['’][A-Za-z]+)?")
+FACETS = ('mission', 'chapter', 'type', 'step', 'field', 'speaker', 'tag', 'channel', 'is')
+QUERY_RE = re.compile(r'''\s*(?:
+    (?P<paren>[()])
+  | (?P<eq>="(?:[^"\\]|\\.)*")
+  | (?P<neg>-)(?=\S)
+  | (?P<facet>[a-z]+):(?P<fval>"(?:[^"\\]|\\.)*"|[^\s()]+)
+  | (?P<phrase>"(?:[^"\\]|\\.)*")
+  | (?P<word>[^\s()"]+)
+)''', re.X)
+
+
+class QueryError(ValueError):
+    pass
+
+
+class Hit(NamedTuple):
+    mission: str
+    node: str       # Mission.nodes() address
+    field: str
+    type: str       # step type ('' for mission fields)
+    speaker: str    # CAST key ('' if none)
+    value: str
+
+
+def tokens(s: str) -> list[str]:
+    return [t.lower() for t in TOKEN_RE.findall(s)]
+
+
+def _fallbacks() -> frozenset:
+    from tools.p45_ultra_fix_en import FALLBACKS
+    return frozenset(FALLBACKS)
+
+
+def _unquote(s: str) -> str:
+    return json.loads(s)
+
+
+def _cast_key(ref: str | None) -> str:
+    return ref.split('.', 1)[1] if ref and ref.startswith('CAST.') else ''
+
+
+class Segment(NamedTuple):
+    """One mission's documents and postings (local document ids)."""
+    sha: str
+    docs: list        # [node, field, type, speaker, value]
+    terms: dict       # term -> [doc ids]
+
+
+def index_mission(doc: CampaignDoc, mid: str, cast: dict, fallbacks=frozenset()) -> Segment:
+    mission = doc.missions[mid]
+    chapter = mission.get('chapter')
+    chapter = str(chapter.value) if chapter is not None and chapter.kind == 'number' else ''
+    docs, terms = [], {}
+    nodes = mission.nodes()
+    types = {}
+    for addr, entry in nodes.items():
+        if addr == '':
+            continue
+        step = addr.split('.lines[', 1)[0]
+        if step == addr:
+            types[step] = (entry.get_str('type') or '', entry.get_str('id') or '')
+    for addr, entry in nodes.items():
+        stype, sid = types.get(addr.split('.lines[', 1)[0], ('', ''))
+        names = [n for n in entry.fields() if n not in SKIP_FIELDS]
+        if addr == '':
+            names = [n for n in names if n != 'script']
+        spk = _cast_key(entry.get_ref('speaker'))
+        for name in names:
+            value = entry.get_str(name)
+            if value is None or name == 'speaker':
+                continue
+            i = len(docs)
+            docs.append([addr, name, stype, spk, value])
+            keys = set(tokens(value))
+            keys |= {f'mission:{mid.lower()}', f'field:{name.lower()}'}
+            if chapter:
+                keys.add(f'chapter:{chapter}')
+            if stype:
+                keys.add(f'type:{stype.lower()}')
+            if sid:
+                keys.add(f'step:{sid.lower()}')
+            if spk:
+                keys.add(f'speaker:{spk.lower()}')
+                keys.add(f'speaker:{speaker_tag(cast.get(f"CAST.{spk}", spk)).lower()}')
+            m = CHANNEL_RE.search(value)
+            ch = entry.get_str('channel')
+            if m:
+                keys.add(f'tag:{m.group(1).strip().lower()}')
+            if m or ch:
+                keys.add(f'channel:{channel_label(ch if ch is not None else m.group(1).strip(), "").lower()}')
+            if value.strip() in fallbacks:
+                keys.add('is:fallback')
+            if HANGUL_RE.search(value):
+                keys.add('is:hangul')
+            for k in keys:
+                terms.setdefault(k, []).append(i)
+    sha = hashlib.sha256(doc.section_text(mid).encode('utf-8')).hexdigest()[:16]
+    return Segment(sha, docs, terms)
+
+
+class DialogueIndex:
+    """Segments per mission plus the merged postings used by queries."""
+
+    def __init__(self, path: Path | None = CACHE_DIR / INDEX_NAME):
+        self.path = Path(path) if path is not None else None
+        self.stamp = ''
+        self.segments: dict[str, Segment] = {}
+        self.dirty = False
+        self._merged = None
+
+    @classmethod
+    def open(cls, doc: CampaignDoc, path: Path | None = CACHE_DIR / INDEX_NAME, save: bool = True):
+        """Load the on-disk index, bring it up to date with `doc`, save it."""
+        idx = cls(path)
+        idx.load()
+        idx.update(doc)
+        if save:
+            idx.save()
+        return idx
+
+    def load(self):
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get('format') != FORMAT:
+            return
+        self.stamp = data.get('stamp', '')
+        self.segments = {mid: Segment(*seg) for mid, seg in data.get('missions', {}).items()}
+
+    def save(self):
+        if self.path is None or not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + f'.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps({'format': FORMAT, 'stamp': self.stamp, 'missions': {
+            mid: list(seg) for mid, seg in self.segments.items()}}, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+    def update(self, doc: CampaignDoc) -> list[str]:
+        """Re-index the missions whose section changed; returns their ids."""
+        cast = doc.cast()
+        fallbacks = _fallbacks()
+        stamp = fingerprint(FORMAT, sorted(cast.items()), sorted(fallbacks), sorted(SKIP_FIELDS))
+        if stamp != self.stamp:
+            self.segments = {}
+            self.stamp = stamp
+        old = self.segments
+        self.segments = {}
+        changed = []
+        for mid in doc.missions:
+            seg = old.get(mid)
+            if seg is None or seg.sha != hashlib.sha256(doc.section_text(mid).encode('utf-8')).hexdigest()[:16]:
+                seg = index_mission(doc, mid, cast, fallbacks)
+                changed.append(mid)
+            self.segments[mid] = seg
+        if changed or set(old) != set(self.segments):
+            self.dirty = True
+            self._merged = None
+        return changed
+
+    # -------- queries --------
+
+    def _merge(self):
+        """Global doc ids: each segment's local ids shifted by its offset."""
+        if self._merged is None:
+            owner, postings = [], {}
+            for mid, seg in self.segments.items():
+                base = len(owner)
+                owner.extend((mid, i) for i in range(len(seg.docs)))
+                for term, ids in seg.terms.items():
+                    lst = postings.get(term)
+                    if lst is None:
+                        lst = postings[term] = []
+                    lst.extend(base + i for i in ids)
+            self._merged = (owner, postings, sorted(postings))
+        return self._merged
+
+    def _doc(self, gid: int) -> list:
+        mid, i = self._merge()[0][gid]
+        return self.segments[mid].docs[i]
+
+    def _term(self, term: str) -> set:
+        _, postings, vocab = self._merge()
+        if term.endswith('*') and len(term) > 1:
+            prefix = term[:-1]
+            out = set()
+            for k in vocab[bisect.bisect_left(vocab, prefix):]:
+                if not k.startswith(prefix):
+                    break
+                out.update(postings[k])
+            return out
+        return set(postings.get(term, ()))
+
+    def _words(self, s: str, exact: bool) -> set:
+        """Docs holding the tokens of `s`, checked for the phrase / whole value."""
+        words = tokens(s)
+        ids = None
+        for w in words:
+            ids = self._term(w) if ids is None else ids & self._term(w)
+            if not ids:
+                return set()
+        if ids is None:
+            ids = set(range(len(self._merge()[0])))
+        if exact:
+            return {g for g in ids if self._doc(g)[4] == s}
+        needle = ' '.join(words)
+        return {g for g in ids if needle in ' '.join(tokens(self._doc(g)[4]))}
+
+    def _eval(self, toks: list, pos: int, depth: int = 0) -> tuple[set, int]:
+        """OR of ANDs from toks[pos:]; returns (ids, next position)."""
+        groups = []
+        cur = None
+        negate = False
+        while pos < len(toks):
+            kind, val = toks[pos]
+            pos += 1
+            if kind == 'paren' and val == ')':
+                if not depth:
+                    raise QueryError('unbalanced )')
+                break
+            if kind == 'word' and val == 'OR':
+                if cur is None or negate:
+                    raise QueryError('OR needs a term on each side')
+                groups.append(cur)
+                cur = None
+                continue
+            if kind == 'word' and val == 'AND':
+                continue
+            if kind == 'neg' or (kind == 'word' and val == 'NOT'):
+                negate = not negate
+                continue
+            if kind == 'paren':
+                ids, pos = self._eval(toks, pos, depth + 1)
+            elif kind == 'facet':
+                ids = self._term(f'{val[0]}:{val[1]}')
+            elif kind == 'phrase':
+                ids = self._words(val, exact=False)
+            elif kind == 'eq':
+                ids = self._words(val, exact=True)
+            elif val.endswith('*'):
+                ids = self._term(val.lower())
+            else:
+                words = tokens(val)
+                ids = self._term(words[0]) if len(words) == 1 else self._words(val, exact=False)
+            if negate:
+                ids = set(range(len(self._merge()[0]))) - ids
+                negate = False
+            cur = ids if cur is None else cur & ids
+        else:
+            if depth:
+                raise QueryError('unbalanced (')
+        if negate or (cur is None and groups):
+            raise QueryError('query ends with an operator')
+        if cur is not None:
+            groups.append(cur)
+        out = set()
+        for g in groups:
+            out |= g
+        return out, pos
+
+    def search(self, query: str) -> list[Hit]:
+        """Hits in file order (mission order, then field order)."""
+        ids, _ = self._eval(parse_query(query), 0)
+        owner = self._merge()[0]
+        out = []
+        for g in sorted(ids):
+            mid = owner[g][0]
+            node, field, stype, spk, value = self._doc(g)
+            out.append(Hit(mid, node, field, stype, spk, value))
+        return out
+
+    def missions(self, query: str) -> list[str]:
+        """Mission ids with at least one hit, in file order."""
+        seen = dict.fromkeys(h.mission for h in self.search(query))
+        return list(seen)
+
+    @staticmethod
+    def entry(doc: CampaignDoc, hit: Hit) -> Entry | None:
+        """The campaigndoc Entry a hit points at (None if it moved since)."""
+        mission = doc.missions.get(hit.mission)
+        return mission.nodes().get(hit.node) if mission is not None else None
+
+    def stats(self) -> dict:
+        owner, postings, _ = self._merge()
+        facets = {f: sum(1 for t in postings if t.startswith(f + ':')) for f in FACETS}
+        return {'missions': len(self.segments), 'docs': len(owner),
+                'tokens': sum(1 for t in postings if ':' not in t), 'facets': facets}
+
+
+def parse_query(query: str) -> list[tuple]:
+    toks = []
+    pos = 0
+    query = query.strip()
+    while pos < len(query):
+        m = QUERY_RE.match(query, pos)
+        if not m or m.end() == pos:
+            raise QueryError(f'cannot parse query at {query[pos:]!r}')
+        pos = m.end()
+        if m.group('paren'):
+            toks.append(('paren', m.group('paren')))
+        elif m.group('eq'):
+            toks.append(('eq', _unquote(m.group('eq')[1:])))
+        elif m.group('neg'):
+            toks.append(('neg', '-'))
+        elif m.group('facet'):
+            name, val = m.group('facet'), m.group('fval')
+            if name not in FACETS:
+                raise QueryError(f'unknown field {name!r} (one of: {", ".join(FACETS)})')
+            val = _unquote(val) if val.startswith('"') else val
+            toks.append(('facet', (name, val.strip().lower())))
+        elif m.group('phrase'):
+            toks.append(('phrase', _unquote(m.group('phrase'))))
+        elif m.group('word'):
+            toks.append(('word', m.group('word')))
+    return toks
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Search campaign dialogue through a persistent inverted index.')
+    ap.add_argument('query', nargs='?', help='see the module docstring for the syntax')
+    ap.add_argument('--campaign', default=str(CAMPAIGN_JS))
+    ap.add_argument('--index', default=str(CACHE_DIR / INDEX_NAME), help='index file (default: .cache/campaign)')
+    ap.add_argument('--rebuild', action='store_true', help='re-index every mission')
+    ap.add_argument('--by', choices=('mission', 'speaker', 'field', 'type'), help='count hits per group')
+    ap.add_argument('--count', action='store_true', help='print only the number of hits')
+    ap.add_argument('--limit', type=int, default=0, help='print at most N hits')
+    ap.add_argument('--json', action='store_true', help='hits as JSON lines')
+    ap.add_argument('--stats', action='store_true', help='index size')
+    args = ap.parse_args(argv)
+    if not args.query and not args.stats:
+        ap.error('a query (or --stats) is required')
+
+    t0 = time.perf_counter()
+    doc = CampaignDoc.load(args.campaign)
+    idx = DialogueIndex(Path(args.index))
+    if not args.rebuild:
+        idx.load()
+    changed = idx.update(doc)
+    idx.save()
+    t1 = time.perf_counter()
+    note = f'{len(changed)} mission(s) re-indexed in {(t1 - t0) * 1000:.0f} ms'
+
+    if args.stats:
+        st = idx.stats()
+        print(f'{args.index}: {st["missions"]} missions, {st["docs"]} fields, {st["tokens"]} tokens; '
+              + ', '.join(f'{k} {v}' for k, v in st['facets'].items()))
+        print(note)
+        if not args.query:
+            return 0
+    try:
+        hits = idx.search(args.query)
+    except QueryError as e:
+        ap.error(str(e))
+    ms = (time.perf_counter() - t1) * 1000
+
+    if args.count:
+        print(len(hits))
+    elif args.by:
+        counts = {}
+        for h in hits:
+            key = getattr(h, args.by) or '-'
+            counts[key] = counts.get(key, 0) + 1
+        for key, n in counts.items():
+            print(f'{n:6d}  {key}')
+    else:
+        for h in hits[:args.limit or None]:
+            if args.json:
+                print(json.dumps(h._asdict(), ensure_ascii=False))
+            else:
+                where = f'{h.mission} {h.node}.{h.field}' if h.node else f'{h.mission} {h.field}'
+                print(f'{where:44s} {h.speaker or "-":8s} {h.value}')
+    print(f'{len(hits)} hit(s) in {ms:.1f} ms ({note})', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
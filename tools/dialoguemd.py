@@ -0,0 +1,210 @@
+"""Streaming parser for the writers' dialogue markdown drafts.
+
+Reads line by line and yields typed events; no whole-document regex passes,
+so multi-MB drafts parse in linear time with one line held in memory.
+
+    # CH2 M11 — Ironweave (`c2_m11_ironweave`)     -> MissionHeader
+    ## CUTSCENE A — ...                              -> Section('cutscene', 'A')
+    1. **NOVA [무전]**: ...                          -> DialogueLine (tag '[무전]')
+    ## OBJECTIVES                                    -> Section('objectives')
+    ### O1 — ...                                     -> Section('objective', 1)
+    - **HART** *[무전]*: ...                          -> DialogueLine (comms '무전')
+    ---                                              -> Separator
+
+Consumers: `pro_mission_data` (apply_pro_beta2.py) and `en_dialogue`
+(EN alignment; `python -m tools.dialoguemd draft.md --en-json out.json`
+produces what tools/gen_trans.mjs reads; tools/align_koen.py reads the
+events directly to keep speaker labels).
+"""
+import argparse
+import json
+import re
+import sys
+from typing import NamedTuple
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+MISSION_ID_RE = re.compile(r"\(`([^`]+)`\)\s*$")
+CUTSCENE_RE = re.compile(r"^CUTSCENE\s+([AB])\b")
+OBJECTIVE_RE = re.compile(r"^O(\d+)\s+—")
+DIALOGUE_RE = re.compile(r"^\s*(?:(\d+)\.|-)\s+(.*?)\*\*([^*]+)\*\*(.*?):\s*(.*?)\s*$")
+TAG_RE = re.compile(r"\[([^\]]+)\]")
+EM_TAG_RE = re.compile(r"\*\[([^\]]+)\]\*")
+SEPARATOR_RE = re.compile(r"^\s*---\s*$")
+
+
+class MissionHeader(NamedTuple):
+    mission_id: str
+    title: str
+    level: int
+    line_no: int
+
+
+class Section(NamedTuple):
+    kind: str          # cutscene | objectives | objective | other
+    key: object        # 'A'/'B' for cutscenes, objective number, else None
+    title: str
+    level: int
+    line_no: int
+
+
+class DialogueLine(NamedTuple):
+    number: int | None  # numbered list index, None for bullets
+    who: str            # bold label as written ("NOVA [무전]")
+    speaker: str        # label without the bracket tag ("NOVA")
+    tag: str            # bracket tag inside the label ("[무전]"), or ''
+    comms: str          # `*[무전]*` annotation on the line ("무전"), or ''
+    text: str
+    exact: bool         # plain `N. **WHO**: text` / `- **WHO**: text` form
+    line_no: int
+
+
+class Separator(NamedTuple):
+    line_no: int
+
+
+def iter_events(lines):
+    """Yield events from an iterable of lines (e.g. an open file)."""
+    for no, line in enumerate(lines, 1):
+        h = HEADING_RE.match(line)
+        if h:
+            level, title = len(h.group(1)), h.group(2)
+            m = MISSION_ID_RE.search(title)
+            if m:
+                yield MissionHeader(m.group(1).strip(), title[:m.start()].strip(), level, no)
+                continue
+            m = CUTSCENE_RE.match(title)
+            if m:
+                yield Section('cutscene', m.group(1), title, level, no)
+            elif title.startswith('OBJECTIVES'):
+                yield Section('objectives', None, title, level, no)
+            else:
+                m = OBJECTIVE_RE.match(title)
+                yield Section('objective', int(m.group(1)), title, level, no) if m else Section('other', None, title, level, no)
+            continue
+        if '**' in line:
+            m = DIALOGUE_RE.match(line)
+            if m and m.group(5):
+                num, prefix, who, between, text = m.groups()
+                who = who.strip()
+                t = TAG_RE.search(who)
+                c = EM_TAG_RE.search(line)
+                yield DialogueLine(
+                    int(num) if num else None, who, who.split('[')[0].strip(),
+                    t.group(0) if t else '', c.group(1) if c else '', text,
+                    not prefix.strip() and not between, no,
+                )
+            continue
+        if SEPARATOR_RE.match(line):
+            yield Separator(no)
+
+
+def parse_file(path):
+    with open(path, encoding='utf-8') as f:
+        yield from iter_events(f)
+
+
+# -------- consumers --------
+
+def pro_mission_data(events, level: int = 1) -> dict:
+    """mission id -> {'cs_a': [(who, text)], 'cs_b': [...], 'obj': {n: [(who, text)]}}
+
+    Same shape and block rules as apply_pro_beta2's regex parser: cutscene
+    blocks take numbered lines (speaker without tag), objective blocks take
+    bullets (label as written); blocks end at the next cutscene/objective
+    heading, `---` or mission header (at `level`).
+    """
+    out = {}
+    data = None
+    block = None   # ('cs', 'A') | ('obj', n) | None
+    buf = []
+
+    def flush():
+        if data is None or block is None:
+            return
+        if block[0] == 'cs':
+            data['cs_a' if block[1] == 'A' else 'cs_b'] = list(buf)
+        elif buf:
+            data['obj'][block[1]] = list(buf)
+
+    for ev in events:
+        if isinstance(ev, MissionHeader):
+            if ev.level != level:
+                continue
+            flush()
+            block, buf = None, []
+            data = out[ev.mission_id] = {'cs_a': [], 'cs_b': [], 'obj': {}}
+        elif isinstance(ev, Section):
+            if ev.kind == 'other':
+                continue
+            flush()
+            buf = []
+            block = ('cs', ev.key) if ev.kind == 'cutscene' else ('obj', ev.key) if ev.kind == 'objective' else None
+        elif isinstance(ev, Separator):
+            flush()
+            block, buf = None, []
+        elif block is not None and ev.exact:
+            if block[0] == 'cs' and ev.number is not None:
+                buf.append((ev.speaker, ev.text))
+            elif block[0] == 'obj' and ev.number is None:
+                buf.append((ev.who, ev.text))
+    flush()
+    return out
+
+
+def bracket_tag(tag: str) -> str:
+    # mirrors mapTagToBracket() in tools/gen_trans.mjs
+    t = tag.lower()
+    if '무전' in t or t == 'radio':
+        return '[radio]'
+    if '속삭' in t or t == 'whisper':
+        return '[whisper]'
+    if '잡음' in t or 'static' in t or t == 'noise':
+        return '[noise]'
+    if 'hq' in t or '본부' in t or 'analysis' in t:
+        return '[hq]'
+    if '오버워치' in t or 'overwatch' in t:
+        return '[overwatch]'
+    if '인터콤' in t or 'intercom' in t or '내부' in t:
+        return '[intercom]'
+    return ''
+
+
+def en_dialogue(events, level: int = 3) -> dict:
+    """mission id -> ordered EN dialogue texts with the comms annotation
+    prefixed as `[radio] ...`; same lines gen_trans.mjs extracts from the
+    HF EN draft (mission headers at `level`, other headers ignored)."""
+    out = {}
+    cur = None
+    for ev in events:
+        if isinstance(ev, MissionHeader):
+            if ev.level == level:
+                cur = out[ev.mission_id] = []
+        elif isinstance(ev, DialogueLine) and cur is not None:
+            text = ev.text
+            if ev.comms:
+                br = bracket_tag(ev.comms)
+                if br:
+                    text = f'{br} {text}'
+            cur.append(text)
+    return out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Parse a dialogue markdown draft.')
+    ap.add_argument('md')
+    ap.add_argument('--en-json', help='write {missionId: [lines]} for gen_trans.mjs')
+    ap.add_argument('--events', action='store_true', help='print events as JSON lines')
+    args = ap.parse_args(argv)
+
+    if args.events:
+        for ev in parse_file(args.md):
+            print(json.dumps({'event': type(ev).__name__, **ev._asdict()}, ensure_ascii=False))
+    if args.en_json:
+        data = en_dialogue(parse_file(args.md))
+        with open(args.en_json, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        print(f'Wrote {args.en_json}: {len(data)} missions, {sum(map(len, data.values()))} lines', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
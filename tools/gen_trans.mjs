@@ -1,8 +1,21 @@
 import fs from 'fs';
+import path from 'path';
+import zlib from 'zlib';
 import { CampaignDB } from '../src/campaign/CampaignData.js';
 
 const mdPath = '/mnt/data/Strikegy_Campaign_Chapter2_HF9A_EN_dialogue.md';
-const md = fs.readFileSync(mdPath, 'utf8');
+// Optional: pre-extracted lines from the streaming parser
+//   python -m tools.dialoguemd <draft.md> --en-json en.json
+//   node tools/gen_trans.mjs en.json
+// Re-emit the current tables in the pooled layout without the markdown:
+//   node tools/gen_trans.mjs --repack
+// Pairs from the aligner instead of pairing by position:
+//   python -m tools.align_koen <draft.md> --pairs aligned.json
+//   node tools/gen_trans.mjs --pairs aligned.json
+const repack = process.argv[2] === '--repack';
+const pairsPath = process.argv[2] === '--pairs' ? (process.argv[3] || '') : '';
+const enJsonPath = repack || pairsPath ? '' : (process.argv[2] || '');
+const outPath = new URL('../src/campaign/CampaignTranslationKOEN.js', import.meta.url).pathname;
 
 function mapTagToBracket(tag){
   const t = String(tag||'').toLowerCase();
@@ -88,50 +101,149 @@ function normalizeKey(s){
     .trim();
 }
 
-const mdByMission = parseMdByMission(md);
-
-const missionStates = {}; // missionId -> { koKey: en }
-const globalMap = {}; // koKey -> en
-
-for(const [mid, m] of Object.entries(CampaignDB?.missions || {})){
-  const enLines = mdByMission[mid];
-  if(!enLines || !enLines.length) continue;
-  const koLines = extractKoreanLinesFromCampaign(m);
-  if(!koLines.length) continue;
-
-  const n = Math.min(koLines.length, enLines.length);
-  const dict = {};
-  for(let i=0;i<n;i++){
-    const ko = String(koLines[i]||'').trim();
-    const en = String(enLines[i]||'').trim();
-    if(!ko || !en) continue;
-    const key = normalizeKey(ko);
-    if(!key) continue;
-    if(!dict[key]) dict[key] = en;
-    if(!globalMap[key]) globalMap[key] = en;
+function buildTables(mdByMission){
+  const missionStates = {}; // missionId -> { koKey: en }
+  const globalMap = {}; // koKey -> en
+
+  for(const [mid, m] of Object.entries(CampaignDB?.missions || {})){
+    const enLines = mdByMission[mid];
+    if(!enLines || !enLines.length) continue;
+    const koLines = extractKoreanLinesFromCampaign(m);
+    if(!koLines.length) continue;
+
+    const n = Math.min(koLines.length, enLines.length);
+    const dict = {};
+    for(let i=0;i<n;i++){
+      const ko = String(koLines[i]||'').trim();
+      const en = String(enLines[i]||'').trim();
+      if(!ko || !en) continue;
+      const key = normalizeKey(ko);
+      if(!key) continue;
+      if(!dict[key]) dict[key] = en;
+      if(!globalMap[key]) globalMap[key] = en;
+    }
+    missionStates[mid] = dict;
   }
-  missionStates[mid] = dict;
+  return { missionStates, globalMap };
 }
 
-const fallbackPairs = [
-  ['웨이포인트', 'waypoint'],
-  ['확인.', 'Copy.'],
-  ['확인', 'Copy'],
-  ['좋아.', 'Good.'],
-  ['좋아', 'Good'],
-  ['계속 간다.', 'Keep moving.'],
-  ['계속 간다', 'Keep moving'],
-  ['조심.', 'Stay sharp.'],
-  ['조심', 'Stay sharp'],
-];
-
-function dumpObj(obj, indent='  '){
-  return JSON.stringify(obj, null, 2).replace(/^/gm, indent).trimStart();
+// { missionId: [[ko, en, confidence], ...] } from tools/align_koen.py;
+// low-confidence pairs were already dropped there.
+function buildTablesFromPairs(pairsByMission){
+  const missionStates = {};
+  const globalMap = {};
+  for(const [mid, pairs] of Object.entries(pairsByMission)){
+    if(!CampaignDB?.missions?.[mid]) continue; // also skips the optional "_source" note
+    const dict = {};
+    for(const [ko, en] of pairs){
+      const key = normalizeKey(String(ko||'').trim());
+      const val = String(en||'').trim();
+      if(!key || !val) continue;
+      if(!dict[key]) dict[key] = val;
+      if(!globalMap[key]) globalMap[key] = val;
+    }
+    missionStates[mid] = dict;
+  }
+  return { missionStates, globalMap };
 }
 
-const outPath = new URL('../src/campaign/CampaignTranslationKOEN.js', import.meta.url).pathname;
+// Pooled layout: every distinct string once in S, tables as flat
+// [ko, en, ko, en, ...] index arrays. Generic lines ("확인.", templated
+// objective phrases) repeat across missions; here each is one literal.
+function emitPooled(missionStates, globalMap, source){
+  const S = [];
+  const ids = new Map();
+  const intern = (s) => {
+    let i = ids.get(s);
+    if(i === undefined){ i = S.length; ids.set(s, i); S.push(s); }
+    return i;
+  };
+  const pack = (dict) => Object.entries(dict).flatMap(([ko, en]) => [intern(ko), intern(en)]);
+  const byMission = {};
+  for(const [mid, dict] of Object.entries(missionStates)) byMission[mid] = pack(dict);
+  const global = pack(globalMap);
+
+  const lines = [
+    '// src/campaign/CampaignTranslationKOEN.js',
+    `// Auto-generated by tools/gen_trans.mjs from ${source}`,
+    '// 목적: 영어 자막/TTS를 위해 한국어 대사를 (best-effort) 오프라인 매핑으로 변환',
+    '',
+    "import { translateWith } from './CampaignTranslate.js';",
+    '',
+    '// String pool: every distinct Korean key / English line once.',
+    // (JSON literals, no trailing commas: tools/build_campaign_bundles.py reads them)
+    `const S = [\n${S.map((str) => `  ${JSON.stringify(str)}`).join(',\n')}\n];`,
+    '',
+    '// missionId -> [ko, en, ko, en, ...] as indices into S',
+    `const BY_MISSION = {\n${Object.entries(byMission).map(([mid, idx]) => `  ${JSON.stringify(mid)}: ${JSON.stringify(idx)}`).join(',\n')}\n};`,
+    '',
+    `const GLOBAL = ${JSON.stringify(global)};`,
+    '',
+    'function table(idx){',
+    '  const t = {};',
+    '  for(let i = 0; i < idx.length; i += 2) t[S[idx[i]]] = S[idx[i + 1]];',
+    '  return t;',
+    '}',
+    '',
+    '// { missionId: { normalizedKo: en } }; a mission table is built on first access',
+    'export const KO_EN_BY_MISSION = {};',
+    'for(const [id, idx] of Object.entries(BY_MISSION)){',
+    '  Object.defineProperty(KO_EN_BY_MISSION, id, {',
+    '    enumerable: true,',
+    '    configurable: true,',
+    '    get(){',
+    '      const t = table(idx);',
+    '      Object.defineProperty(KO_EN_BY_MISSION, id, { value: t, enumerable: true });',
+    '      return t;',
+    '    },',
+    '  });',
+    '}',
+    '',
+    'export const KO_EN_GLOBAL = table(GLOBAL);',
+    '',
+    "export function translateKOtoEN(raw, missionId=''){",
+    "  return translateWith(raw, KO_EN_BY_MISSION?.[String(missionId||'')], KO_EN_GLOBAL);",
+    '}',
+    '',
+  ];
+  const pairs = Object.values(byMission).reduce((n, idx) => n + idx.length / 2, 0) + global.length / 2;
+  return { js: lines.join('\n'), pool: S.length, pairs, missions: Object.keys(byMission).length };
+}
+
+// Old layout (one object literal per mission), kept for the size report.
+function emitNested(missionStates, globalMap){
+  return `export const KO_EN_BY_MISSION = ${JSON.stringify(missionStates, null, 2)};\n\nexport const KO_EN_GLOBAL = ${JSON.stringify(globalMap, null, 2)};\n`;
+}
+
+function sizes(text){
+  const buf = Buffer.from(text, 'utf8');
+  return `${(buf.length / 1024).toFixed(1)} KB (gzip ${(zlib.gzipSync(buf, { level: 9 }).length / 1024).toFixed(1)} KB)`;
+}
+
+let missionStates, globalMap, source;
+if(repack){
+  const mod = await import(outPath + '?repack');
+  missionStates = Object.fromEntries(Object.entries(mod.KO_EN_BY_MISSION));
+  globalMap = mod.KO_EN_GLOBAL;
+  // keep the provenance of the table being repacked
+  source = fs.readFileSync(outPath, 'utf8').match(/^\/\/ Auto-generated by tools\/gen_trans\.mjs from (.*)$/m)?.[1] || 'the previous table';
+}else if(pairsPath){
+  const pairs = JSON.parse(fs.readFileSync(pairsPath, 'utf8'));
+  ({ missionStates, globalMap } = buildTablesFromPairs(pairs));
+  source = pairs._source || `${path.basename(pairsPath)} (tools/align_koen.py pairs) + CampaignData.js`;
+}else{
+  const mdByMission = enJsonPath
+    ? JSON.parse(fs.readFileSync(enJsonPath, 'utf8'))
+    : parseMdByMission(fs.readFileSync(mdPath, 'utf8'));
+  ({ missionStates, globalMap } = buildTables(mdByMission));
+  source = `${path.basename(enJsonPath || mdPath)} + CampaignData.js`;
+}
 
-const js = `// src/campaign/CampaignTranslationKOEN.js\n// Auto-generated from Strikegy_Campaign_Chapter2_HF9A_EN_dialogue.md + CampaignData.js\n// 목적: 영어 자막/TTS를 위해 한국어 대사를 (best-effort) 오프라인 매핑으로 변환\n\nexport const KO_EN_BY_MISSION = ${JSON.stringify(missionStates, null, 2)};\n\nexport const KO_EN_GLOBAL = ${JSON.stringify(globalMap, null, 2)};\n\nfunction stripLeadingBracketTag(s){\n  const m = String(s||'').trim().match(/^\\[[^\\]]+\\]\\s*(.*)$/);\n  return (m ? m[1] : String(s||'')).trim();\n}\n\nfunction normalizeKey(s){\n  return stripLeadingBracketTag(s)\n    .replace(/\\s+/g,' ')\n    .replace(/[“”]/g,'\\"')\n    .replace(/[‘’]/g,"'")\n    .trim();\n}\n\nfunction hasHangul(s){\n  return /[가-힣]/.test(String(s||''));\n}\n\n// very small fallback for unmapped short lines\nfunction phraseFallback(ko){\n  let out = String(ko||'');\n${fallbackPairs.map(([a,b])=>`  out = out.split(${JSON.stringify(a)}).join(${JSON.stringify(b)});`).join('\n')}\n  return out;\n}\n\nexport function translateKOtoEN(raw, missionId=''){\n  const full = String(raw||'').trim();\n  if(!full) return full;\n\n  // Preserve leading [채널] 태그는 그대로 두고 본문만 변환\n  let tag = '';\n  let body = full;\n  const m = full.match(/^(\\[[^\\]]+\\])\\s*(.*)$/);\n  if(m){\n    tag = m[1];\n    body = (m[2]||'').trim();\n  }\n\n  // 이미 영문이면 그대로\n  if(!hasHangul(body)) return full;\n\n  const key = normalizeKey(body);\n  const mid = String(missionId||'');\n\n  let en = (KO_EN_BY_MISSION?.[mid]?.[key]) || (KO_EN_GLOBAL?.[key]) || '';\n  if(!en){\n    // try mapping using full key as well\n    const k2 = normalizeKey(full);\n    en = (KO_EN_BY_MISSION?.[mid]?.[k2]) || (KO_EN_GLOBAL?.[k2]) || '';\n  }\n  if(!en){\n    en = phraseFallback(body);\n    // if nothing changed, bail\n    if(en === body) return full;\n  }\n\n  // If mapping already includes a bracket tag, prefer it; else preserve original tag\n  const hasTag = /^\\[[^\\]]+\\]/.test(en);\n  if(tag && !hasTag) return (tag + ' ' + en).trim();\n  return en;\n}\n`;
+const out = emitPooled(missionStates, globalMap, source);
+fs.writeFileSync(outPath, out.js, 'utf8');
 
-fs.writeFileSync(outPath, js, 'utf8');
-console.log('Wrote', outPath, 'missions:', Object.keys(missionStates).length, 'global:', Object.keys(globalMap).length);
+// Literal strings / object literals the module creates, old layout vs pooled
+const nMissionObjs = Object.keys(missionStates).length;
+console.log('Wrote', outPath, 'missions:', out.missions, 'global:', Object.keys(globalMap).length);
+console.log(`  nested: ${sizes(emitNested(missionStates, globalMap))}, ${out.pairs * 2} string literals, ${nMissionObjs + 2} objects at load`);
+console.log(`  pooled: ${sizes(out.js)}, ${out.pool} string literals, ${out.missions + 2} arrays + 3 objects at load (mission tables built on first use)`);
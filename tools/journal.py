@@ -0,0 +1,370 @@
+"""Edit journal for CampaignData.js: what each patch run changed, field by field.
+
+    python -m tools.journal log [--mission c2_m14_radiant]
+    python -m tools.journal show RUN [--mission MID]
+    python -m tools.journal undo RUN [RUN...] [--mission MID] [--dry-run]
+    python -m tools.journal undo --mission MID [--since RUN]   # every run touching it
+    python -m tools.journal replay RUN [--mission MID]
+
+tools.pipeline (and tools.watch) append one JSON line per pass that changed
+something to `<campaign>.journal.jsonl` next to the file:
+
+    {"run": "20261017-231502481.add_en_say", "time": ..., "pass": "add_en_say",
+     "rules": "<RULESET fingerprint>", "sha": "<sha256 of the result, 16>",
+     "edits": [{"mission": "c2_m14_radiant", "node": "say_o3_2",
+                "field": "en", "old": "'Copy that.'", "new": "'Move now.'"}, ...]}
+
+Only the missions the pass touched are compared. `node` is the step id
+(`#<index>` when the id is missing or repeated), `<node>.lines[i]` for
+cutscene/act lines and "" for mission-level fields. old/new are JS source;
+null means the field is absent on that side (`after` names the field it
+follows). When the field edits don't reproduce the section exactly both
+ways (steps added, reordered, comments changed) the edit falls back to the
+whole mission section (`node`/`field` null) and, for text outside the
+missions, to `region` "head"/"tail"; a changed mission list records the
+whole file.
+
+Undo applies a run's edits backwards, replay forwards, each only where the
+file still holds the expected value; a mismatch is reported and nothing is
+written. Undo/replay are journaled runs themselves ("pass": "undo").
+The journal replaces keeping full .bak copies of the file.
+"""
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+from tools.campaigndoc import CAMPAIGN_JS, CampaignDoc, Entry
+from tools.profiling import PROF
+
+
+class Conflict(Exception):
+    """The file does not hold the value an edit expects."""
+
+
+def journal_path(campaign: Path) -> Path:
+    campaign = Path(campaign)
+    return campaign.with_name(campaign.name + '.journal.jsonl')
+
+
+def text_sha(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+# -------- addressing --------
+
+def _fields(entry: Entry, addr: str) -> list[str]:
+    names = list(entry.fields())
+    if addr == '':
+        names = [n for n in names if n != 'script']
+    return names
+
+
+def _src(text: str, v) -> str | None:
+    return None if v is None else text[v.start:v.end]
+
+
+def _prev_field(names: list[str], name: str) -> str | None:
+    i = names.index(name)
+    return names[i - 1] if i else None
+
+
+def diff_mission(old: CampaignDoc, new: CampaignDoc, mid: str) -> list[dict]:
+    """Field-level edits turning mission `mid` of `old` into that of `new`."""
+    om, nm = old.missions[mid], new.missions[mid]
+    on, nn = om.nodes(), nm.nodes()
+    edits = []
+    if list(on) == list(nn):
+        for addr, oe in on.items():
+            ne = nn[addr]
+            of, nf = _fields(oe, addr), _fields(ne, addr)
+            for name in of + [n for n in nf if n not in of]:
+                ov, nv = oe.get(name), ne.get(name)
+                if name == 'lines' and f'{addr}.lines[0]' in on:
+                    # compared per line under their own addresses; anything
+                    # else in the array shows up in _reproduces()
+                    continue
+                os_, ns = _src(old.text, ov), _src(new.text, nv)
+                if os_ == ns:
+                    continue
+                edit = {'mission': mid, 'node': addr, 'field': name, 'old': os_, 'new': ns}
+                if os_ is None or ns is None:
+                    edit['after'] = _prev_field(nf if os_ is None else of, name)
+                edits.append(edit)
+    if edits and _reproduces(old, new, mid, edits):
+        return edits
+    s, e = om.section
+    ns, ne = nm.section
+    return [{'mission': mid, 'node': None, 'field': None,
+             'old': old.text[s:e], 'new': new.text[ns:ne]}]
+
+
+def _reproduces(old: CampaignDoc, new: CampaignDoc, mid: str, edits: list[dict]) -> bool:
+    for a, b, forward in ((old, new, True), (new, old, False)):
+        batch = a.edit()
+        nodes = {}
+        try:
+            for edit in edits:
+                queue(a, batch, edit, forward, nodes)
+            s, e = a.missions[mid].section
+            got = batch.apply_range(s, e)
+        except (Conflict, KeyError, ValueError):
+            return False
+        s, e = b.missions[mid].section
+        if got != b.text[s:e]:
+            return False
+    return True
+
+
+def _regions(doc: CampaignDoc) -> tuple[tuple[int, int], tuple[int, int]]:
+    ms = list(doc.missions.values())
+    if not ms:
+        return (0, len(doc.text)), (len(doc.text), len(doc.text))
+    return (0, ms[0].section[0]), (ms[-1].section[1], len(doc.text))
+
+
+def diff_docs(old: CampaignDoc, new: CampaignDoc, missions=None) -> list[dict]:
+    """Edits from `old` to `new`, comparing only `missions` (default: all)."""
+    if list(old.missions) != list(new.missions):
+        return [{'mission': None, 'region': 'file', 'old': old.text, 'new': new.text}]
+    edits = []
+    for name, (os_, oe), (ns, ne) in zip(('head', 'tail'), _regions(old), _regions(new)):
+        if old.text[os_:oe] != new.text[ns:ne]:
+            edits.append({'mission': None, 'region': name, 'old': old.text[os_:oe], 'new': new.text[ns:ne]})
+    for mid in (missions if missions is not None else old.missions):
+        s, e = old.missions[mid].section
+        ns, ne = new.missions[mid].section
+        if old.text[s:e] != new.text[ns:ne]:
+            edits.extend(diff_mission(old, new, mid))
+    return edits
+
+
+# -------- applying --------
+
+def queue(doc: CampaignDoc, batch, edit: dict, forward: bool = True, nodes: dict | None = None):
+    """Queue `edit` (or its reverse) on `batch`; Conflict unless `doc` holds
+    the value the edit starts from. `nodes` caches per-mission addresses
+    across the edits of one batch."""
+    want, put = (edit['old'], edit['new']) if forward else (edit['new'], edit['old'])
+    mid = edit.get('mission')
+    where = f'{mid or edit.get("region")} {edit.get("node") or ""}.{edit.get("field") or ""}'.strip(' .')
+    if mid is None:
+        region = edit['region']
+        if region == 'file':
+            s, e = 0, len(doc.text)
+        else:
+            s, e = _regions(doc)[0 if region == 'head' else 1]
+    elif edit.get('node') is None:
+        if mid not in doc.missions:
+            raise Conflict(f'{mid}: mission not found')
+        s, e = doc.missions[mid].section
+    else:
+        if mid not in doc.missions:
+            raise Conflict(f'{mid}: mission not found')
+        if nodes is None:
+            nodes = {}
+        if mid not in nodes:
+            nodes[mid] = doc.missions[mid].nodes()
+        entry = nodes[mid].get(edit['node'])
+        if entry is None:
+            raise Conflict(f'{where}: node not found')
+        name = edit['field']
+        cur = entry.get(name)
+        if _src(doc.text, cur) != want:
+            raise Conflict(f'{where}: expected {_short(want)}, found {_short(_src(doc.text, cur))}')
+        if put is None:
+            names = list(entry.fields())
+            props = entry.node.value
+            i = names.index(name)
+            if i:
+                s, e = props[names[i - 1]].value.end, cur.end
+            elif len(names) > 1:
+                s, e = props[name].key_start, props[names[1]].key_start
+            else:
+                raise Conflict(f'{where}: cannot remove the only field')
+            batch.replace(s, e, '')
+        elif cur is None:
+            batch.set_raw(entry, name, put, after=edit.get('after') or 'text')
+        else:
+            batch.replace_value(cur, put)
+        return
+    if doc.text[s:e] != want:
+        raise Conflict(f'{where}: text differs from the journal')
+    batch.replace(s, e, put)
+
+
+def _short(s: str | None, n: int = 60) -> str:
+    if s is None:
+        return '(absent)'
+    s = s.replace('\n', '\\n')
+    return s if len(s) <= n else s[:n - 3] + '...'
+
+
+def apply_edits(doc: CampaignDoc, runs: list[tuple[dict, list[dict]]], forward: bool):
+    """Apply each (entry, edits) in order; returns the new doc and the net
+    edits from `doc` to it (one per field, for the journal)."""
+    start = doc
+    touched = set()
+    for entry, edits in runs:
+        batch = doc.edit()
+        nodes = {}
+        for edit in (edits if forward else reversed(edits)):
+            try:
+                queue(doc, batch, edit, forward, nodes)
+            except Conflict as e:
+                raise Conflict(f'{entry["run"]}: {e}') from None
+        if len(batch):
+            doc, dirty = doc.rebase(batch)
+            touched.update(dirty)
+    missions = [m for m in start.missions if m in touched and m in doc.missions]
+    return doc, diff_docs(start, doc, missions)
+
+
+# -------- the journal file --------
+
+class Journal:
+    """Append-only JSON lines; one entry per pass run."""
+
+    def __init__(self, campaign: Path = CAMPAIGN_JS, path: Path | None = None):
+        self.campaign = Path(campaign)
+        self.path = Path(path) if path else journal_path(self.campaign)
+        self.pending = []
+
+    def record(self, pass_name: str, rules: str | None, old: CampaignDoc, new: CampaignDoc,
+               dirty, **extra) -> dict | None:
+        """Queue an entry for one pass (written by `flush`, after the file)."""
+        with PROF.stage('journal'):
+            edits = diff_docs(old, new, [m for m in dirty if m in old.missions and m in new.missions])
+        return self.add(pass_name, rules, new.text, edits, **extra) if edits else None
+
+    def add(self, pass_name: str, rules: str | None, text: str, edits: list[dict], **extra) -> dict:
+        now = time.time()
+        base = f'{time.strftime("%Y%m%d-%H%M%S", time.localtime(now))}{int(now % 1 * 1000):03d}.{pass_name}'
+        taken = {e['run'] for e in self.pending}
+        run, n = base, 1
+        while run in taken:
+            n += 1
+            run = f'{base}.{n}'
+        entry = {'run': run, 'time': time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(now)),
+                 'pass': pass_name, 'rules': rules, **extra, 'sha': text_sha(text), 'edits': edits}
+        self.pending.append(entry)
+        return entry
+
+    def discard(self):
+        self.pending.clear()
+
+    def flush(self):
+        if not self.pending:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8', newline='\n') as f:
+            for entry in self.pending:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self.pending.clear()
+
+    def entries(self) -> list[dict]:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+
+def _select(entries: list[dict], runs, mission: str | None, since: str | None):
+    """[(entry, edits)] in journal order."""
+    by_run = {e['run']: e for e in entries}
+    if runs:
+        missing = [r for r in runs if r not in by_run]
+        if missing:
+            raise KeyError(f'no such run: {", ".join(missing)}')
+        picked = [e for e in entries if e['run'] in set(runs)]
+    elif since:
+        if since not in by_run:
+            raise KeyError(f'no such run: {since}')
+        picked = entries[[e['run'] for e in entries].index(since):]
+    else:
+        picked = list(entries)
+    out = []
+    for e in picked:
+        edits = [x for x in e['edits'] if mission is None or x.get('mission') == mission]
+        if edits:
+            out.append((e, edits))
+    return out
+
+
+def main(argv=None):
+    from tools.pipeline import write_atomic
+
+    ap = argparse.ArgumentParser(description='Inspect, undo and replay CampaignData.js patch runs.')
+    ap.add_argument('--campaign', default=str(CAMPAIGN_JS))
+    ap.add_argument('--journal', help='journal file (default: <campaign>.journal.jsonl)')
+    sub = ap.add_subparsers(dest='cmd', required=True)
+    p = sub.add_parser('log', help='list runs')
+    p.add_argument('--mission')
+    p = sub.add_parser('show', help="print a run's edits")
+    p.add_argument('run')
+    p.add_argument('--mission')
+    for name, what in (('undo', 'apply runs backwards (newest first)'), ('replay', 'apply runs forwards')):
+        p = sub.add_parser(name, help=what)
+        p.add_argument('runs', nargs='*', metavar='RUN')
+        p.add_argument('--mission', help='only this mission')
+        p.add_argument('--since', metavar='RUN', help='this run and every later one')
+        p.add_argument('--dry-run', action='store_true')
+    args = ap.parse_args(argv)
+
+    journal = Journal(args.campaign, args.journal)
+    entries = journal.entries()
+    if args.cmd == 'log':
+        for e in entries:
+            missions = sorted({x.get('mission') or x.get('region') for x in e['edits']
+                               if args.mission is None or x.get('mission') == args.mission})
+            if missions:
+                print(f'{e["run"]:40s} {e["pass"]:18s} {len(e["edits"]):5d} edit(s)  {", ".join(missions)}')
+        return 0
+    if args.cmd == 'show':
+        sel = _select(entries, [args.run], args.mission, None)
+        for e, edits in sel:
+            print(f'{e["run"]}  pass={e["pass"]} rules={e.get("rules")} sha={e.get("sha")}')
+            for x in edits:
+                if x.get('field'):
+                    print(f'  {x["mission"]} {x["node"] or "(mission)"}.{x["field"]}: '
+                          f'{_short(x["old"])} -> {_short(x["new"])}')
+                else:
+                    print(f'  {x.get("mission") or x.get("region")}: whole section '
+                          f'({len(x["old"] or "")} -> {len(x["new"] or "")} chars)')
+        return 0
+
+    if not args.runs and not args.since and not args.mission:
+        ap.error(f'{args.cmd} needs RUN, --since or --mission')
+    try:
+        sel = _select(entries, args.runs, args.mission, args.since)
+    except KeyError as e:
+        ap.error(e.args[0])
+    if not sel:
+        print('nothing to do')
+        return 0
+    forward = args.cmd == 'replay'
+    path = Path(args.campaign)
+    doc = CampaignDoc.load(path)
+    try:
+        new, made = apply_edits(doc, sel if forward else sel[::-1], forward)
+    except Conflict as e:
+        print(f'CONFLICT: {e}; nothing written', file=sys.stderr)
+        return 1
+    n = sum(len(edits) for _, edits in sel)
+    print(f'{args.cmd}: {n} edit(s) from {len(sel)} run(s)')
+    if args.dry_run or new.text == doc.text:
+        print('DRY RUN: not written' if args.dry_run else 'OK: no changes')
+        return 0
+    write_atomic(path, new.text)
+    if made:
+        journal.add(args.cmd, None, new.text, made, of=[e['run'] for e, _ in sel])
+        journal.flush()
+    print(f'OK: wrote {path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""Small JavaScript lexer for the campaign data modules.
+
+Only covers what the data files actually use: comments, the three string
+quote styles, numbers, identifiers and punctuation. Good enough to walk
+object/array literals without executing anything.
+"""
+import re
+
+SKIP_RE = re.compile(r"(?:\s+|//[^\n]*|/\*[\s\S]*?\*/)*")
+
+STRING_RE = {
+    "'": re.compile(r"'(?:[^'\\\n]|\\[\s\S])*'"),
+    '"': re.compile(r'"(?:[^"\\\n]|\\[\s\S])*"'),
+    '`': re.compile(r"`(?:[^`\\]|\\[\s\S])*`"),
+}
+NUMBER_RE = re.compile(r"(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)")
+IDENT_RE = re.compile(r"[A-Za-z_$][\w$]*")
+PUNCT_RE = re.compile(r"\.\.\.|=>|[{}\[\]():,;.=+\-*/<>!?&|%~^]")
+
+QUOTES = "'\"`"
+
+_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+}
+_ESCAPE_RE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|[\s\S])")
+
+
+class JSSyntaxError(ValueError):
+    def __init__(self, msg: str, pos: int):
+        super().__init__(f"{msg} at offset {pos}")
+        self.pos = pos
+
+
+def _unescape(m) -> str:
+    e = m.group(1)
+    if e[0] == 'u' and len(e) > 1:
+        return chr(int(e[2:-1] if e[1] == '{' else e[1:], 16))
+    if e[0] == 'x' and len(e) == 3:
+        return chr(int(e[1:], 16))
+    if e in ('\n', '\r\n', '\u2028', '\u2029'):
+        return ''  # line continuation
+    return _ESCAPES.get(e, e)
+
+
+def decode_string(raw: str) -> str:
+    """Value of a quoted JS string literal (quotes included in `raw`)."""
+    body = raw[1:-1]
+    if '\\' not in body:
+        return body
+    return _ESCAPE_RE.sub(_unescape, body)
+
+
+def js_quote(s: str, quote: str = "'") -> str:
+    """Quote `s` as a JS string literal using `quote` (' " or `)."""
+    s = s.replace('\\', '\\\\').replace(quote, '\\' + quote)
+    if quote == '`':
+        s = s.replace('${', '\\${')
+    else:
+        s = s.replace('\r', '\\r').replace('\n', '\\n')
+    return quote + s + quote
+
+
+def skip(text: str, pos: int) -> int:
+    """Skip whitespace and comments."""
+    return SKIP_RE.match(text, pos).end()
+
+
+def match_string(text: str, pos: int):
+    """Match a string literal starting at `pos` (which must be a quote)."""
+    m = STRING_RE[text[pos]].match(text, pos)
+    if not m:
+        raise JSSyntaxError('unterminated string literal', pos)
+    return m
+
+
+def iter_tokens(text: str, pos: int = 0, end: int | None = None):
+    """Yield (kind, start, end) tokens; kinds: str, num, ident, punct."""
+    end = len(text) if end is None else end
+    while True:
+        pos = skip(text, pos)
+        if pos >= end:
+            return
+        c = text[pos]
+        if c in QUOTES:
+            m = match_string(text, pos)
+            kind = 'str'
+        elif c.isdigit() or (c == '.' and text[pos + 1:pos + 2].isdigit()):
+            m = NUMBER_RE.match(text, pos)
+            kind = 'num'
+        else:
+            m = IDENT_RE.match(text, pos)
+            kind = 'ident'
+            if not m:
+                m = PUNCT_RE.match(text, pos)
+                kind = 'punct'
+            if not m:
+                raise JSSyntaxError(f'unexpected character {c!r}', pos)
+        yield kind, m.start(), m.end()
+        pos = m.end()
+
+
+# -------- streaming --------
+
+CODE, LINE_COMMENT, BLOCK_COMMENT = 'code', '//', '/*'
+
+_CODE_STOP_RE = re.compile(r"['\"`/]")
+_BODY_RE = {q: re.compile(r"[^\\{0}]*(?:\\[\s\S][^\\{0}]*)*".format(q)) for q in QUOTES}
+
+
+class StringScanner:
+    """Incremental splitter of JS source into code, comments and strings.
+
+    feed() takes arbitrary chunks and yields (kind, text) pieces with kind
+    in: code, comment, open (opening quote), body, close (closing quote).
+    At most one character is held back between chunks (a trailing `/`,
+    `*` or backslash), so escape pairs and comment markers are never split
+    across pieces. Regex literals are not recognised; the data modules
+    don't use them.
+    """
+
+    def __init__(self):
+        self.state = CODE
+        self._hold = ''
+
+    def feed(self, chunk: str):
+        text = self._hold + chunk
+        self._hold = ''
+        yield from self._scan(text, final=False)
+
+    def close(self):
+        text, self._hold = self._hold, ''
+        yield from self._scan(text, final=True)
+
+    def _scan(self, text: str, final: bool):
+        pos = 0
+        n = len(text)
+        while pos < n:
+            st = self.state
+            if st == CODE:
+                m = _CODE_STOP_RE.search(text, pos)
+                if not m:
+                    yield CODE, text[pos:]
+                    return
+                i = m.start()
+                if i > pos:
+                    yield CODE, text[pos:i]
+                c = text[i]
+                if c == '/':
+                    if i + 1 >= n and not final:
+                        self._hold = '/'
+                        return
+                    nxt = text[i + 1:i + 2]
+                    if nxt == '/' or nxt == '*':
+                        self.state = LINE_COMMENT if nxt == '/' else BLOCK_COMMENT
+                        yield 'comment', text[i:i + 2]
+                        pos = i + 2
+                    else:
+                        yield CODE, '/'
+                        pos = i + 1
+                    continue
+                self.state = c
+                yield 'open', c
+                pos = i + 1
+            elif st == LINE_COMMENT:
+                i = text.find('\n', pos)
+                if i < 0:
+                    yield 'comment', text[pos:]
+                    return
+                yield 'comment', text[pos:i]
+                self.state = CODE
+                pos = i
+            elif st == BLOCK_COMMENT:
+                i = text.find('*/', pos)
+                if i < 0:
+                    if text.endswith('*') and not final:
+                        self._hold = '*'
+                        text = text[:-1]
+                    if pos < len(text):
+                        yield 'comment', text[pos:]
+                    return
+                yield 'comment', text[pos:i + 2]
+                self.state = CODE
+                pos = i + 2
+            else:
+                # escape pairs are consumed whole, so pieces never split one
+                end = _BODY_RE[st].match(text, pos).end()
+                if end > pos:
+                    yield 'body', text[pos:end]
+                if end >= n:
+                    return
+                if text[end] == '\\':
+                    if final:
+                        yield 'body', '\\'
+                    else:
+                        self._hold = '\\'
+                    return
+                yield 'close', st
+                self.state = CODE
+                pos = end + 1
@@ -0,0 +1,124 @@
+"""Multi-keyword matching and keyword rule tables.
+
+`KeywordMatcher` reports every keyword occurring in a string in one pass,
+including overlapping ones. It is Aho-Corasick in spirit, but the scan runs
+inside the `re` engine: all keywords are compiled into one alternation
+(longest first) whose first-character set lets `search` skip ahead in C.
+Each hit resumes one character past its start, and keywords that are
+prefixes of a longer hit at the same offset come from a precomputed table
+(the analogue of AC output links). A pure Python goto/fail walk would be
+slower than the substring checks it replaces.
+
+`RuleSet` evaluates a data-driven rule table (see tools/ko_en_rules.json)
+on top of it: only rules reachable from a hit keyword are tested, and the
+highest-priority match wins.
+"""
+import json
+import re
+from pathlib import Path
+
+from tools.profiling import PROF
+
+
+class KeywordMatcher:
+    def __init__(self, keywords):
+        self.keywords = sorted(set(keywords), key=lambda k: (-len(k), k))
+        self.index = {k: i for i, k in enumerate(self.keywords)}
+        alt = '|'.join(re.escape(k) for k in self.keywords)
+        self._re = re.compile(alt) if self.keywords else None
+        # keyword id -> ids of all keywords that are a prefix of it (itself included)
+        self._prefixes = [
+            frozenset(self.index[p] for p in self.keywords if k.startswith(p))
+            for k in self.keywords
+        ]
+
+    def find(self, text: str) -> set[int]:
+        """Ids of every keyword present in `text`."""
+        hits = set()
+        if self._re is None:
+            return hits
+        search = self._re.search
+        index = self.index
+        prefixes = self._prefixes
+        pos = 0
+        n = 1
+        while True:
+            m = search(text, pos)
+            if m is None:
+                if PROF.on:
+                    PROF.count('regex.evals', n)
+                    PROF.count('kwmatch.chars', len(text))
+                return hits
+            hits |= prefixes[index[m.group()]]
+            pos = m.start() + 1
+            n += 1
+
+    def find_words(self, text: str) -> set[str]:
+        return {self.keywords[i] for i in self.find(text)}
+
+
+class Rule:
+    __slots__ = ('priority', 'order', 'groups', 'exact', 'capture', 'out')
+
+    def __init__(self, spec: dict, order: int):
+        self.priority = spec.get('priority', 0)
+        self.order = order
+        self.groups = [list(g) for g in spec.get('all', [])]
+        self.exact = spec.get('exact')
+        self.capture = re.compile(spec['capture']) if spec.get('capture') else None
+        self.out = spec['out']
+
+    def render(self, text: str) -> str | None:
+        if self.capture is None:
+            return self.out
+        m = self.capture.search(text)
+        if not m:
+            return None
+        return self.out.format(None, *m.groups())
+
+
+class RuleSet:
+    """Compiled keyword rule table; `apply()` returns None when nothing matches."""
+
+    def __init__(self, spec: dict):
+        self.version = spec.get('version', 0)
+        rules = [Rule(r, i) for i, r in enumerate(spec['rules'])]
+        # ties keep table order, like the if/elif cascade this replaced
+        rules.sort(key=lambda r: (-r.priority, r.order))
+        self.rules = rules
+        self.matcher = KeywordMatcher(k for r in rules for g in r.groups for k in g)
+        idx = self.matcher.index
+        self._groups = [[frozenset(idx[k] for k in g) for g in r.groups] for r in rules]
+        # keyword id -> rule ranks that can fire on it (via their first group)
+        self._by_kw = {}
+        self._exact = {}
+        for rank, r in enumerate(rules):
+            if r.exact is not None:
+                for s in r.exact:
+                    self._exact.setdefault(s, rank)
+            elif r.groups:
+                for k in r.groups[0]:
+                    self._by_kw.setdefault(idx[k], []).append(rank)
+
+    @classmethod
+    def load(cls, path):
+        return cls(json.loads(Path(path).read_text(encoding='utf-8')))
+
+    def match(self, text: str) -> tuple[Rule, str] | None:
+        hits = self.matcher.find(text)
+        cands = set()
+        for k in hits:
+            cands.update(self._by_kw.get(k, ()))
+        ex = self._exact.get(text.strip())
+        if ex is not None:
+            cands.add(ex)
+        for rank in sorted(cands):
+            if all(g & hits for g in self._groups[rank]):
+                out = self.rules[rank].render(text)
+                if out is not None:
+                    return self.rules[rank], out
+        return None
+
+    def apply(self, text: str) -> str | None:
+        m = self.match(text)
+        return m[1] if m else None
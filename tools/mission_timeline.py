@@ -0,0 +1,377 @@
+"""Headless mission timeline: when each voice line is first needed, and the
+prefetch schedule CampaignRuntime uses to warm TTS ahead of it.
+
+    python -m tools.mission_timeline                       # per-mission report
+    python -m tools.mission_timeline --timeline c2_m14_radiant
+    python -m tools.mission_timeline --reach 12 --interact 5 --kill 20 --lead 6 --budget 8
+    python -m tools.mission_timeline --json timeline.json
+
+Each `script` is walked the way CampaignRuntime plays it:
+
+- objective: instant (its `lines` never tick);
+- say: queued on the dialogue chain; the step ends when its line does;
+- cutscene: `lines[].t` fire on the step clock; it ends at `duration`
+  once the chain has drained;
+- reach/interact/kill: done after the configured time (--reach/--interact/
+  --kill seconds), wait/defend after `sec`; their timed lines fire while
+  the step is active and completion interrupts the chain (_interruptDialogueNow:
+  queued lines that had not started are dropped);
+- complete: end of the mission.
+
+A dialogue line occupies the chain for max(_estimateSpeechSec, minimum
+subtitle hold) + 90 ms, like _say/_showCommsLine. The spoken text, voice and
+cache key come from tools.tts_prerender, so keys match the voice packs.
+
+The schedule warms each line `--lead` seconds before it is needed, later if
+more than `--budget` clips would be warm-but-unplayed at once (TTSManager
+keeps at most that many). Warm times are stored as (step, seconds into
+step) so a player slower or faster than the simulated one still warms
+relative to where they are. build_campaign_bundles.py writes it into each
+bundle as `prefetch`:
+
+    {"warm": [[step, offset, target step, line index or -1 for a say], ...],
+     "next": [step, offset] | null}      # next mission's map assets
+
+The report's peak lines/s is the most lines started in any --window seconds,
+divided by it; peak req/s is the most warm requests in any one second (what
+the TTS endpoint sees when nothing is pre-rendered).
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+from tools.build_campaign_bundles import load_koen
+from tools.campaigndoc import CAMPAIGN_JS, CampaignDoc, to_python
+from tools.tts_prerender import (
+    CHANNEL_RE, DEFAULT_LANG, DEFAULT_VOICE, VOICE_DIR, VOICES,
+    cache_key, js_str, js_trim, speaker_tag, strip_tag, subtitle_raw, tts_text,
+)
+
+# simulated player: seconds to finish each objective step type
+TIMES = {'reach': 20.0, 'interact': 8.0, 'kill': 30.0}
+LEAD = 4.0        # warm a line this long before it is spoken
+NEXT_LEAD = 20.0  # warm the next mission's map this long before `complete`
+BUDGET = 12       # TTSManager PREFETCH_MAX
+WINDOW = 10.0
+LINE_GAP = 0.09   # hideSubtitle -> next line
+
+
+_CHANNELS = (
+    ('RADIO', ('무전',), ('radio',)),
+    ('WHISPER', ('속삭',), ('whisper',)),
+    ('NOISE', ('잡음', 'noise', 'static'), ()),
+    ('HQ', ('hq', '본부', 'analysis'), ()),
+    ('OVERWATCH', ('오버워치', 'overwatch', 'drone'), ()),
+    ('INTERCOM', ('내부', '인터콤', 'intercom'), ()),
+    ('LOCAL', ('로컬', '대화'), ('local',)),
+    ('UNKNOWN', ('미상', 'unknown'), ()),
+)
+
+
+class SimLine(NamedTuple):
+    step: int          # script index of the step whose clock fires it
+    target: int        # script index of the step that owns the line
+    line: int          # index into target's `lines`, -1 for a say step
+    fire: float        # queued at (mission seconds)
+    need: float        # starts speaking
+    dur: float
+    key: str           # TTS cache key ('' = nothing spoken)
+    text: str
+
+
+class Timeline(NamedTuple):
+    mission: str
+    steps: list        # (enter, exit) per script index
+    lines: list        # SimLine, spoken or not, in start order
+    dropped: list      # SimLine queued but interrupted before starting
+    end: float
+    warnings: list
+
+
+def channel_label(ch, tag: str) -> str:
+    """CampaignRuntime._normalizeChannelLabel()."""
+    c = js_str(ch).lower()
+    if not c:
+        return {'NOVA': 'HQ', 'KESTREL': 'OVERWATCH', '???': 'UNKNOWN', 'UNKNOWN': 'UNKNOWN'}.get(tag, 'RADIO')
+    for label, words, exact in _CHANNELS:
+        if any(w in c for w in words) or c in exact:
+            return label
+    return js_str(ch).upper()
+
+
+def estimate_speech_sec(text: str, channel: str = 'RADIO', urgent: bool = False) -> float:
+    """CampaignRuntime._estimateSpeechSec()."""
+    words = len(js_trim(text).split())
+    if not words:
+        return 0.0
+    rate = 1.08 if channel == 'WHISPER' else (1.23 if urgent else 1.15)
+    return max(0.8, (words / 2.6 + 0.45) / rate)
+
+
+def line_timing(obj: dict, translations: dict, lang: str) -> tuple[float, str, str] | None:
+    """(seconds on the chain, cache key, spoken text) or None when the line
+    is skipped (no subtitle text)."""
+    raw = subtitle_raw(obj)
+    sub = strip_tag(raw)
+    if not sub:
+        return None
+    tag = speaker_tag(obj.get('speaker'))
+    m = CHANNEL_RE.search(raw)
+    label = channel_label(obj['channel'] if obj.get('channel') is not None else (m.group(1).strip() if m else ''), tag)
+    urgent = bool(obj.get('urgent') or obj.get('priority') == 'high')
+    text = tts_text(obj, translations)
+    est = estimate_speech_sec(text or sub, label, urgent)
+    hold = obj.get('holdSec') if isinstance(obj.get('holdSec'), (int, float)) and obj.get('holdSec') else \
+        2.2 + min(3.2, len(sub) / 26)
+    dur = max(est, max(0.9, round(hold * 1000) / 1000)) + LINE_GAP
+    key = cache_key(js_str(lang) or DEFAULT_LANG, VOICES.get(tag, DEFAULT_VOICE), '', text) if text else ''
+    return dur, key, text
+
+
+def _num(v, default: float) -> float:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return default
+
+
+def simulate(mid: str, mission: dict, translations: dict, times: dict = TIMES) -> Timeline:
+    lang = mission.get('lang') or DEFAULT_LANG
+    script = mission.get('script') or []
+    steps = [(0.0, 0.0)] * len(script)
+    lines, dropped, warnings = [], [], []
+    queue = []        # SimLine not yet started when queued, by start time
+    free = 0.0        # dialogue chain idle from
+
+    def enqueue(step_i, target, idx, obj, at):
+        nonlocal free
+        timing = line_timing(obj, translations, lang)
+        if timing is None:
+            return None
+        dur, key, text = timing
+        start = max(at, free)
+        free = start + dur
+        ln = SimLine(step_i, target, idx, at, start, dur, key, text)
+        queue.append(ln)
+        return ln
+
+    def interrupt(at):
+        nonlocal free
+        for ln in queue:
+            (lines if ln.need < at else dropped).append(ln)
+        queue.clear()
+        free = min(free, at)
+
+    now = 0.0
+    end = None
+    for i, step in enumerate(script):
+        if not isinstance(step, dict):
+            steps[i] = (now, now)
+            continue
+        kind = step.get('type')
+        enter = now
+        timed = [(j, ln) for j, ln in enumerate(step.get('lines') or []) if isinstance(ln, dict)]
+        timed.sort(key=lambda p: _num(p[1].get('t', p[1].get('at')), 0.0))
+        if kind == 'say':
+            ln = enqueue(i, i, -1, step, now)
+            if ln is not None:
+                now = ln.need + ln.dur
+        elif kind == 'cutscene':
+            t_max = max(0.1, _num(step.get('duration'), 5.0) or 5.0)
+            for j, obj in timed:
+                at = _num(obj.get('t', obj.get('at')), 0.0)
+                if at > t_max + 1e-3:
+                    warnings.append(f'{step.get("id")}: line {j} at t={at:g} > duration {t_max:g}; '
+                                    'the cutscene never ends')
+                    at = t_max
+                enqueue(i, i, j, obj, enter + at)
+            now = max(enter + t_max, free)
+        elif kind in TIMES or kind in ('wait', 'defend'):
+            if kind == 'wait':
+                span = max(0.1, _num(step.get('sec'), 1.0) or 1.0)
+            elif kind == 'defend':
+                span = max(1.0, _num(step.get('sec'), 30.0) or 30.0)
+            else:
+                span = times[kind]
+            for j, obj in timed:
+                at = _num(obj.get('t', obj.get('at')), 0.0)
+                if at < span:
+                    enqueue(i, i, j, obj, enter + at)
+            now = enter + span
+            interrupt(now)
+        elif kind == 'complete':
+            steps[i] = (now, now)
+            end = now
+            break
+        steps[i] = (enter, now)
+        # lines that started before the next step keep playing into it
+        for ln in [q for q in queue if q.need + q.dur <= now]:
+            queue.remove(ln)
+            lines.append(ln)
+    interrupt(float('inf'))
+    if end is None:
+        end = max([now] + [ln.need + ln.dur for ln in lines])
+        warnings.append('no complete step reached')
+    lines.sort(key=lambda ln: (ln.need, ln.target, ln.line))
+    return Timeline(mid, steps, lines, dropped, end, warnings)
+
+
+# -------- schedule --------
+
+def warm_times(tl: Timeline, lead: float = LEAD, budget: int = BUDGET) -> list[tuple[float, SimLine]]:
+    """(warm at, line) for every spoken line: `lead` seconds early, later when
+    `budget` clips are already warm and not yet played."""
+    held = []  # (warm at, done at)
+    out = []
+    for ln in tl.lines:
+        if not ln.key:
+            continue
+        t = ln.need - lead
+        while True:
+            busy = sorted(done for start, done in held if start <= t < done)
+            if len(busy) < budget or t >= ln.need:
+                break
+            t = min(busy[len(busy) - budget], ln.need)
+        held.append((t, ln.need + ln.dur))
+        out.append((t, ln))
+    return out
+
+
+def step_at(tl: Timeline, t: float) -> tuple[int, float]:
+    """(script index, seconds into it) of the step running at mission time t."""
+    if t <= 0 or not tl.steps:
+        return 0, 0.0
+    best = 0
+    for i, (enter, leave) in enumerate(tl.steps):
+        if enter > t:
+            break
+        if leave > t or enter == leave:
+            best = i
+    return best, round(max(0.0, t - tl.steps[best][0]), 2)
+
+
+def prefetch(tl: Timeline, lead: float = LEAD, budget: int = BUDGET, next_lead: float = NEXT_LEAD) -> dict:
+    """The bundle's `prefetch` field."""
+    warm = []
+    seen = set()
+    for t, ln in warm_times(tl, lead, budget):
+        if ln.key in seen:
+            continue  # later repeats hit the decode cache
+        seen.add(ln.key)
+        step, off = step_at(tl, t)
+        warm.append([step, off, ln.target, ln.line])
+    warm.sort(key=lambda w: (w[0], w[1]))
+    nxt = list(step_at(tl, tl.end - next_lead)) if tl.steps else None
+    return {'warm': warm, 'next': nxt}
+
+
+def peak_rate(times: list[float], window: float) -> float:
+    """Most events in any `window`-second span, per second."""
+    times = sorted(times)
+    best = lo = 0
+    for hi, t in enumerate(times):
+        while times[lo] <= t - window:
+            lo += 1
+        best = max(best, hi - lo + 1)
+    return best / window if window else 0.0
+
+
+def pack_keys(voice_dir: Path = VOICE_DIR) -> set[str]:
+    """Keys pre-rendered into the voice packs (decode instead of synthesize)."""
+    from tools.tts_prerender import HEADER, MAGIC
+    try:
+        manifest = json.loads((voice_dir / 'manifest.json').read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return set()
+    keys = set()
+    for name in (manifest.get('missions') or {}).values():
+        try:
+            data = (voice_dir / name).read_bytes()
+        except OSError:
+            continue
+        magic, _, _, n = HEADER.unpack_from(data)
+        if magic == MAGIC:
+            keys.update(json.loads(data[HEADER.size:HEADER.size + n]))
+    return keys
+
+
+def simulate_all(doc: CampaignDoc, koen=None, missions=None, times: dict = TIMES) -> dict[str, Timeline]:
+    by_mission, global_map = koen if koen is not None else load_koen()
+    refs = doc.cast()
+    out = {}
+    for mid, m in doc.missions.items():
+        if missions and mid not in missions:
+            continue
+        translations = {'mission': by_mission.get(mid, {}), 'global': global_map}
+        out[mid] = simulate(mid, to_python(m.node, refs), translations, times)
+    return out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Simulate mission timelines; report voice-line prefetch needs.')
+    ap.add_argument('--campaign', default=str(CAMPAIGN_JS))
+    ap.add_argument('--missions', nargs='*', help='mission ids (default: all)')
+    for kind, t in TIMES.items():
+        ap.add_argument(f'--{kind}', type=float, default=t, help=f'seconds to finish a {kind} step (default {t:g})')
+    ap.add_argument('--lead', type=float, default=LEAD, help='seconds to warm a line before it plays')
+    ap.add_argument('--budget', type=int, default=BUDGET, help='max warm-but-unplayed clips')
+    ap.add_argument('--window', type=float, default=WINDOW, help='peak lines/s window (seconds)')
+    ap.add_argument('--timeline', metavar='MID', help='print one mission event by event')
+    ap.add_argument('--json', metavar='PATH', help='write every timeline and schedule as JSON')
+    args = ap.parse_args(argv)
+
+    times = {k: getattr(args, k) for k in TIMES}
+    doc = CampaignDoc.load(args.campaign)
+    missions = set(args.missions or ()) | ({args.timeline} if args.timeline else set())
+    tls = simulate_all(doc, missions=missions or None, times=times)
+    if args.timeline:
+        tl = tls.get(args.timeline)
+        if tl is None:
+            ap.error(f'unknown mission: {args.timeline}')
+        warm = {id(ln): t for t, ln in warm_times(tl, args.lead, args.budget)}
+        script = to_python(doc.missions[args.timeline].node, doc.cast()).get('script') or []
+        for i, (enter, leave) in enumerate(tl.steps):
+            s = script[i] if isinstance(script[i], dict) else {}
+            print(f'{enter:7.1f}-{leave:7.1f}  #{i:<3d} {js_str(s.get("type")):9s} {js_str(s.get("id"))}')
+            for ln in tl.lines:
+                if ln.step == i:
+                    w = f'warm {warm[id(ln)]:7.1f}' if id(ln) in warm else ' ' * 12
+                    print(f'{"":17s}  {ln.need:7.1f} +{ln.dur:4.1f}s {w}  {ln.text[:60] or "(no voice)"}')
+        print(f'end {tl.end:.1f}s; {len(tl.dropped)} line(s) interrupted before starting')
+        for w in tl.warnings:
+            print(f'warning: {w}')
+        return 0
+
+    packed = pack_keys()
+    print(f'{"mission":28s} {"time":>7s} {"lines":>6s} {"voice":>6s} {"synth":>6s} {"drop":>5s} '
+          f'{"lines/s":>8s} {"req/s":>6s} {"held":>5s}')
+    rows = {}
+    for mid, tl in tls.items():
+        spoken = [ln for ln in tl.lines if ln.key]
+        warm = warm_times(tl, args.lead, args.budget)
+        held = max((sum(1 for t2, l2 in warm if t2 <= t < l2.need + l2.dur) for t, _ in warm), default=0)
+        lps = peak_rate([ln.need for ln in spoken], args.window)
+        rps = peak_rate([t for t, ln in warm if ln.key not in packed], 1.0)
+        synth = len({ln.key for ln in spoken} - packed)
+        print(f'{mid:28s} {tl.end:6.0f}s {len(tl.lines):6d} {len(spoken):6d} {synth:6d} {len(tl.dropped):5d} '
+              f'{lps:8.2f} {rps:6.0f} {held:5d}')
+        for w in tl.warnings:
+            print(f'  warning: {w}')
+        rows[mid] = {'end': round(tl.end, 2), 'peak_lines_per_sec': lps, 'peak_requests_per_sec': rps,
+                     'steps': [[round(a, 2), round(b, 2)] for a, b in tl.steps],
+                     'lines': [{'step': ln.step, 'target': ln.target, 'line': ln.line, 'need': round(ln.need, 2),
+                                'dur': round(ln.dur, 2), 'key': ln.key, 'text': ln.text} for ln in tl.lines],
+                     'prefetch': prefetch(tl, args.lead, args.budget), 'warnings': tl.warnings}
+    if rows:
+        print(f'max: {max(r["peak_lines_per_sec"] for r in rows.values()):.2f} lines/s over {args.window:g}s, '
+              f'{max(r["peak_requests_per_sec"] for r in rows.values()):.0f} warm request(s) in one second')
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, ensure_ascii=False, indent=1), encoding='utf-8')
+        print(f'OK: wrote {args.json}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
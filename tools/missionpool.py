@@ -0,0 +1,99 @@
+"""Per-mission fan-out for the CampaignData patch passes.
+
+Mission sections are independent, so a pass is written as
+`fn(batch, mission, *args)` that only edits inside one mission.
+`patch_sections` runs it for each mission, serially or on a process pool
+(`jobs > 1`), consults the section cache first, and splices the results
+back in the original order. Workers get the section text and re-index it
+locally, so the output is byte-for-byte the same as a serial run.
+"""
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from tools.campaigndoc import EditBatch, Mission, skip_value
+from tools.profiling import PROF
+
+_KEY_RE = re.compile(r"\s*(?:[A-Za-z_$][\w$]*|'[^']*'|\"[^\"]*\")\s*:")
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+def patch_section(fn, mid: str, section: str, args=()) -> str:
+    """Run `fn` on a standalone mission section (as sliced by Mission.section)."""
+    m = _KEY_RE.match(section)
+    if not m:
+        raise ValueError(f'{mid}: section does not start with a mission key')
+    mission = Mission(mid, 0, section, skip_value(section, m.end()))
+    sub = EditBatch(section)
+    fn(sub, mission, *args)
+    return sub.apply()
+
+
+def _worker(job):
+    fn, mid, section, args, stage = job
+    if stage is None:
+        return patch_section(fn, mid, section, args), None
+    # profiling: record this mission here, the parent merges it
+    PROF.reset()
+    PROF.enable()
+    with PROF.stage(stage, mid):
+        out = patch_section(fn, mid, section, args)
+    return out, PROF.take()
+
+
+def patch_sections(doc, batch, pass_name: str, version: str, fn, missions=None, *,
+                   cache=None, extra=None, args=None, jobs: int = 1) -> int:
+    """Queue `fn`'s result for every mission on `batch`; returns how many
+    missions were actually (re)processed.
+
+    cache: ContentCache; keys fold in pass name, version, section source and
+    `extra(mid)` (other inputs the output depends on).
+    args: mid -> tuple of extra positional args for `fn`; must be picklable
+    when jobs > 1.
+    """
+    todo = []  # (mid, start, end, section, key)
+    for mid in (missions if missions is not None else doc.missions):
+        mission = doc.missions.get(mid)
+        if mission is None or (batch.scope is not None and mid not in batch.scope):
+            continue
+        s, e = mission.section
+        src = doc.text[s:e]
+        key = None
+        if cache is not None:
+            key = cache.key(pass_name, version, src, extra(mid) if extra else '')
+            out = cache.get(key)
+            if out is not None:
+                batch.replace(s, e, out)
+                if PROF.on:
+                    PROF.count('sections.cached')
+                continue
+        todo.append((mid, s, e, src, key))
+    if PROF.on:
+        PROF.count('sections.patched', len(todo))
+        PROF.count('bytes.scanned', sum(len(src) for _, _, _, src, _ in todo))
+
+    if jobs > 1 and len(todo) > 1:
+        stage = pass_name if PROF.on else None
+        work = [(fn, mid, src, args(mid) if args else (), stage) for mid, _, _, src, _ in todo]
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            outs = []
+            for out, snap in pool.map(_worker, work):
+                outs.append(out)
+                if snap is not None:
+                    PROF.merge(snap)
+    else:
+        outs = []
+        for mid, s, e, _, _ in todo:
+            with PROF.stage(pass_name, mid):
+                sub = doc.edit()
+                fn(sub, doc.missions[mid], *(args(mid) if args else ()))
+                outs.append(sub.apply_range(s, e))
+
+    for (mid, s, e, _, key), out in zip(todo, outs):
+        if cache is not None:
+            cache.put(key, out)
+        batch.replace(s, e, out)
+    return len(todo)
@@ -0,0 +1,292 @@
+"""Report which solid boxes of a map could be grouped into fewer AABBs.
+
+    python -m tools.optimize_collision              # report for maps/**/*.json
+    python -m tools.optimize_collision maps/zone_5_v1.json --verify 5000
+
+Maps are authored as many `box` objects, and every solid one is its own
+AABB in CollisionWorld. resolveCapsuleXZ pushes the capsule out of them one
+at a time, in order, so replacing boxes by their union moves the player
+somewhere else (two touching walls push out along x, their merged box along
+z). The collision boxes therefore stay as authored; what is merged here is
+only the broadphase. Here:
+
+1. sweep-and-prune along x (sort by min x, keep the boxes whose max x has
+   not been passed) lists every pair that overlaps or touches in 3D;
+2. exact duplicates and boxes fully inside another box of the same type
+   join that box's group;
+3. same-type boxes with the same y range and the same z (x) extent that
+   touch or overlap along x (z) are merged into one box: a collinear wall
+   run becomes one AABB covering all of its members.
+
+Steps 1-3 repeat until nothing changes; each resulting box covers exactly
+its members' region. On the shipped maps that only takes 1237 boxes to
+1230 (-1%), too few for a measurable broadphase win in
+tools/bench_collision.mjs, so compile_maps.py does not use the groups: the
+.smap grid lists the authored boxes. The report is for map authors
+(duplicates and boxes hidden inside others are usually mistakes).
+`--verify` resolves sampled capsules with a full scan and through the baked
+.smap grid and compares the positions. Values are compared as the float32
+CollisionWorld stores, so unions are exact.
+"""
+import argparse
+import json
+import math
+import random
+import sys
+from array import array
+
+from tools.compile_maps import build_grid_index, grid_query, is_packable, is_solid, map_sources, solid_boxes
+
+STAND_EPS = 1e-3   # resolveCapsuleXZ stand-on-top tolerance
+QUERY_MARGIN = 2   # CollisionWorld.js QUERY_MARGIN
+
+
+class Box:
+    __slots__ = ('mm', 'type', 'order', 'members')
+
+    def __init__(self, mm, type_, order, members=None):
+        self.mm = tuple(mm)      # float32-rounded min x, y, z, max x, y, z
+        self.type = type_
+        self.order = order       # position of the first original box it covers
+        self.members = tuple(members) if members is not None else (order,)  # all of them, ascending
+
+    def __repr__(self):
+        return f'Box({self.type!r}, {self.mm})'
+
+
+def f32(values) -> tuple:
+    return tuple(array('f', values))
+
+
+def sweep_pairs(boxes: list[Box]):
+    """(i, j) index pairs whose boxes overlap or touch (closed intervals)."""
+    order = sorted(range(len(boxes)), key=lambda i: boxes[i].mm[0])
+    active = []
+    for i in order:
+        a = boxes[i].mm
+        active = [j for j in active if boxes[j].mm[3] >= a[0]]
+        for j in active:
+            b = boxes[j].mm
+            if a[1] <= b[4] and b[1] <= a[4] and a[2] <= b[5] and b[2] <= a[5]:
+                yield (j, i) if j < i else (i, j)
+        active.append(i)
+
+
+def contains(a, b) -> bool:
+    return a[0] <= b[0] and a[1] <= b[1] and a[2] <= b[2] and a[3] >= b[3] and a[4] >= b[4] and a[5] >= b[5]
+
+
+def _merge_axis(a, b, axis: int) -> bool:
+    """Same y range and the same extent on the other horizontal axis; the
+    sweep already guarantees they touch or overlap along `axis`."""
+    other = 2 if axis == 0 else 0
+    return a[1] == b[1] and a[4] == b[4] and a[other] == b[other] and a[other + 3] == b[other + 3]
+
+
+class _Sets:
+    def __init__(self, n):
+        self.parent = list(range(n))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i, j):
+        i, j = self.find(i), self.find(j)
+        if i != j:
+            self.parent[max(i, j)] = min(i, j)
+
+
+def _round(boxes: list[Box], stats: dict) -> tuple[list[Box], bool]:
+    pairs = list(sweep_pairs(boxes))
+    drop = {}   # dropped index -> the box that covers it
+    for i, j in pairs:
+        a, b = boxes[i], boxes[j]
+        if a.type != b.type or i in drop or j in drop:
+            continue
+        if a.mm == b.mm:
+            drop[j] = i
+            stats['duplicates'] += 1
+        elif contains(a.mm, b.mm):
+            drop[j] = i
+            stats['contained'] += 1
+        elif contains(b.mm, a.mm):
+            drop[i] = j
+            stats['contained'] += 1
+    if drop:
+        members = {k: list(b.members) for k, b in enumerate(boxes) if k not in drop}
+        for k in drop:
+            keep = drop[k]
+            while keep in drop:
+                keep = drop[keep]
+            members[keep] += boxes[k].members
+        return [Box(b.mm, b.type, b.order, sorted(members[k]))
+                for k, b in enumerate(boxes) if k not in drop], True
+
+    # one axis per round: components along x share their y/z cross-section,
+    # so each one's union is a single box
+    for axis in (0, 2):
+        sets = _Sets(len(boxes))
+        for i, j in pairs:
+            if boxes[i].type == boxes[j].type and _merge_axis(boxes[i].mm, boxes[j].mm, axis):
+                sets.union(i, j)
+        groups = {}
+        for k in range(len(boxes)):
+            groups.setdefault(sets.find(k), []).append(k)
+        if len(groups) == len(boxes):
+            continue
+        out = []
+        for root in sorted(groups):
+            members = [boxes[k] for k in groups[root]]
+            first = members[0]
+            if len(members) > 1:
+                mm = list(first.mm)
+                for m in members[1:]:
+                    mm[axis] = min(mm[axis], m.mm[axis])
+                    mm[axis + 3] = max(mm[axis + 3], m.mm[axis + 3])
+                first = Box(mm, first.type, min(m.order for m in members),
+                            sorted(k for m in members for k in m.members))
+                stats['merged'] += len(members) - 1
+            out.append(first)
+        out.sort(key=lambda b: b.order)
+        return out, True
+    return boxes, False
+
+
+def optimize(boxes: list[Box]) -> tuple[list[Box], dict]:
+    """(optimized boxes, {'in', 'out', 'duplicates', 'contained', 'merged', 'rounds'})."""
+    stats = {'in': len(boxes), 'duplicates': 0, 'contained': 0, 'merged': 0, 'rounds': 0}
+    changed = True
+    while changed:
+        boxes, changed = _round(boxes, stats)
+        stats['rounds'] += 1
+    stats['out'] = len(boxes)
+    return boxes, stats
+
+
+def from_objects(objects, keep) -> list[Box]:
+    """Boxes for the map objects `keep(obj)` selects (pos/size, centred)."""
+    out = []
+    for obj in objects:
+        if keep(obj):
+            (px, py, pz), (sx, sy, sz) = obj['pos'], obj['size']
+            out.append(Box(f32((px - sx / 2, py - sy / 2, pz - sz / 2, px + sx / 2, py + sy / 2, pz + sz / 2)),
+                           obj['type'], len(out)))
+    return out
+
+
+# -------- verification --------
+
+def push_out(mm, pos: list, radius: float, y_min: float, y_max: float) -> bool:
+    """CollisionWorld._pushOut(): push pos ([x, z]) out of one box; True if it moved."""
+    if y_max < mm[1] or y_min > mm[4]:
+        return False
+    if y_min >= mm[4] - STAND_EPS:
+        return False
+    x, z = pos
+    dx = x - max(mm[0], min(x, mm[3]))
+    dz = z - max(mm[2], min(z, mm[5]))
+    d2 = dx * dx + dz * dz
+    if mm[0] < x < mm[3] and mm[2] < z < mm[5]:
+        pen = min(x - mm[0], mm[3] - x, z - mm[2], mm[5] - z)
+        if pen == x - mm[0]:
+            pos[0] = mm[0] - radius
+        elif pen == mm[3] - x:
+            pos[0] = mm[3] + radius
+        elif pen == z - mm[2]:
+            pos[1] = mm[2] - radius
+        else:
+            pos[1] = mm[5] + radius
+        return True
+    if d2 < radius * radius - 1e-9:
+        d = math.sqrt(max(d2, 1e-12))
+        push = radius - d
+        pos[0] += dx / d * push
+        pos[1] += dz / d * push
+        return True
+    return False
+
+
+def resolve(boxes: list, x: float, y: float, z: float, radius: float, half: float,
+            query=None) -> tuple[float, float]:
+    """Where CollisionWorld.resolveCapsuleXZ() leaves a capsule at (x, y, z):
+    a full scan of `boxes` (min/max tuples), or the grid path when `query`
+    (queryXZ(x0, z0, x1, z1, from) -> ascending box indices) is given."""
+    pos = [x, z]
+    y_min, y_max = y - half, y + half
+    reach = radius + QUERY_MARGIN
+    for _ in range(3):
+        moved = False
+        if query is None:
+            for mm in boxes:
+                moved |= push_out(mm, pos, radius, y_min, y_max)
+        else:
+            gx, gz = pos
+            cand = query(gx - reach, gz - reach, gx + reach, gz + reach, 0)
+            k = 0
+            while k < len(cand):
+                i = cand[k]
+                k += 1
+                if not push_out(boxes[i], pos, radius, y_min, y_max):
+                    continue
+                moved = True
+                if abs(pos[0] - gx) > QUERY_MARGIN or abs(pos[1] - gz) > QUERY_MARGIN:
+                    gx, gz = pos
+                    cand = query(gx - reach, gz - reach, gx + reach, gz + reach, i + 1)
+                    k = 0
+        if not moved:
+            break
+    return pos[0], pos[1]
+
+
+def verify(boxes: list, query, samples: int, seed: int = 0,
+           radius: float = 0.55, half: float = 0.9) -> list[tuple]:
+    """Capsule positions that `query` resolves anywhere else than a full scan
+    of `boxes` does. Samples cluster around box faces, where it matters."""
+    rng = random.Random(seed)
+    bad = []
+    for _ in range(samples):
+        b = rng.choice(boxes)
+        x = rng.uniform(b[0] - radius * 1.5, b[3] + radius * 1.5)
+        z = rng.uniform(b[2] - radius * 1.5, b[5] + radius * 1.5)
+        y = rng.choice((rng.uniform(b[1] - half, b[4] + half), b[4] + half, b[4] + half - STAND_EPS / 2))
+        if resolve(boxes, x, y, z, radius, half) != resolve(boxes, x, y, z, radius, half, query):
+            bad.append((x, y, z))
+    return bad
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Report which solid boxes per map could be grouped.')
+    ap.add_argument('maps', nargs='*', help='map JSON files (default: maps/**/*.json)')
+    ap.add_argument('--verify', type=int, default=0, metavar='N',
+                    help='also compare full-scan and grid capsule resolution at N sampled positions per map')
+    args = ap.parse_args(argv)
+
+    total_in = total_out = 0
+    failed = 0
+    print(f'{"map":40s} {"boxes":>6s} {"->":>6s} {"dup":>4s} {"in":>4s} {"merge":>6s}')
+    for path in map_sources(args.maps):
+        data = json.loads(path.read_bytes())
+        before = from_objects(data.get('objects') or [], lambda o: is_packable(o) and is_solid(o))
+        after, st = optimize(before)
+        total_in += st['in']
+        total_out += st['out']
+        drop = 1 - st['out'] / st['in'] if st['in'] else 0
+        line = (f'{path.name:40s} {st["in"]:6d} {st["out"]:6d} {st["duplicates"]:4d} '
+                f'{st["contained"]:4d} {st["merged"]:6d}  -{drop:.0%}')
+        if args.verify and before:
+            flat = solid_boxes(data)
+            boxes = [tuple(flat[o:o + 6]) for o in range(0, len(flat), 6)]
+            bad = verify(boxes, grid_query(build_grid_index(flat)), args.verify)
+            failed += bool(bad)
+            line += f'  verify: {"OK" if not bad else f"{len(bad)} mismatch(es), e.g. {bad[0]}"}'
+        print(line)
+    if total_in:
+        print(f'total: {total_in} -> {total_out} boxes (-{1 - total_out / total_in:.0%})')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
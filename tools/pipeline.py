@@ -0,0 +1,183 @@
+"""Run the CampaignData.js content passes in one read and one write.
+
+    python -m tools.pipeline                                 # every pass, in order (*)
+    python -m tools.pipeline add_en_say p45_ultra_fix_en     # some passes, in this order
+    python -m tools.pipeline apply_pro_beta2 --pro-md Patch_4.5_Pro_Alpha_Ch2_M11-20.md
+    python -m tools.pipeline --dry-run                       # unified diff, nothing written
+    python -m tools.pipeline --list
+    python -m tools.pipeline p45_ultra_fix_en --where 'is:fallback mission:c2_*'
+
+The file is read and indexed once. Each pass queues its edits on an
+EditBatch; the batch is spliced into the text and the index is rebased
+(CampaignDoc.rebase), so only the mission sections a pass touched are
+re-scanned and the next pass reuses the rest. The result is written once,
+atomically, and only when something changed. The old entry points
+(add_en_say.py, apply_pro_beta2.py, tools/p45_ultra_fix_en.py) run their
+own pass through here; `fix_en_quotes.py PATH` keeps streaming the file
+itself (constant memory, any JS file) and only joins a chain from here.
+
+Each pass that changed something gets a field-level entry in
+`<campaign>.journal.jsonl` (tools/journal.py: log, show, undo, replay),
+appended after the write; `--no-journal` skips it.
+
+`--where QUERY` (tools/dialogue_index.py syntax) scopes the run to the
+missions the query matches in the input: passes skip the other missions
+and any edit outside them is dropped.
+
+(*) apply_pro_beta2 only joins the default chain when --pro-md is given.
+"""
+import argparse
+import difflib
+import importlib
+import os
+import sys
+from pathlib import Path
+
+from tools.campaigndoc import CAMPAIGN_JS, ROOT, CampaignDoc
+from tools.contentcache import CACHE_DIR, ContentCache
+from tools.journal import Journal
+from tools.missionpool import default_jobs
+from tools.profiling import PROF, add_arguments, session
+
+
+class Pass:
+    """A registered pass: `module.patch(doc, batch, cache, jobs)` queues edits.
+
+    `setup(module, opts)` returns that callable for passes with extra inputs;
+    `needs` names the options they require.
+    """
+
+    def __init__(self, name: str, module: str, summary: str, needs: tuple = (), setup=None):
+        self.name = name
+        self.module = module
+        self.summary = summary
+        self.needs = needs
+        self.setup = setup
+
+    def bind(self, opts):
+        if str(ROOT) not in sys.path:
+            sys.path.insert(0, str(ROOT))  # the root-level patch scripts
+        mod = importlib.import_module(self.module)
+        return self.setup(mod, opts) if self.setup else mod.patch
+
+    def rules(self) -> str | None:
+        """The pass module's RULESET fingerprint, for the journal (after bind)."""
+        return getattr(importlib.import_module(self.module), 'RULESET', None)
+
+
+def _pro_md(mod, opts):
+    data = mod.load_md(opts.pro_md)
+    return lambda doc, batch, cache, jobs: mod.patch(doc, batch, data, cache, jobs)
+
+
+# run order when no passes are named
+PASSES = {p.name: p for p in [
+    Pass('add_en_say', 'add_en_say', 'generic en for CH2 M11-20 say steps missing it'),
+    Pass('fix_en_quotes', 'fix_en_quotes', "`en: '...'` -> `en: \"...\"`"),
+    Pass('apply_pro_beta2', 'apply_pro_beta2', 'Pro Alpha CH2 M11-20 dialogue from markdown',
+         needs=('pro_md',), setup=_pro_md),
+    Pass('p45_ultra_fix_en', 'tools.p45_ultra_fix_en', 'regenerate en for CH2 M1-20 from the Korean'),
+]}
+
+
+def run(text: str, passes, opts, cache=None, jobs: int = 1, log=print, journal=None, scope=None) -> str:
+    """Patched text after every pass in `passes` (names, in order); each
+    pass's edits are queued on `journal` (a tools.journal.Journal) if given.
+    `scope`: mission ids the passes may edit (None = all)."""
+    doc = CampaignDoc(text)
+    for name in passes:
+        fn = PASSES[name].bind(opts)
+        batch = doc.edit()
+        batch.scope = scope
+        with PROF.stage(f'pass {name}'):
+            fn(doc, batch, cache, jobs)
+        if scope is not None:
+            dropped = batch.restrict(doc.missions[m].section for m in scope if m in doc.missions)
+            if dropped:
+                log(f'  {name}: {dropped} edit(s) outside --where dropped')
+        if not len(batch):
+            log(f'  {name}: no changes')
+            continue
+        prev = doc
+        doc, dirty = doc.rebase(batch)
+        log(f'  {name}: {len(batch)} edit(s) in {len(dirty)} mission(s)')
+        if journal is not None:
+            journal.record(name, PASSES[name].rules(), prev, doc, dirty)
+    return doc.text
+
+
+def write_atomic(path: Path, text: str):
+    tmp = path.with_name(path.name + f'.{os.getpid()}.tmp')
+    with PROF.stage('write'):
+        with open(tmp, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Run CampaignData.js content passes in one read/write.')
+    ap.add_argument('passes', nargs='*', metavar='PASS', help=f'default: {" ".join(PASSES)}')
+    ap.add_argument('--campaign', default=str(CAMPAIGN_JS))
+    ap.add_argument('--pro-md', help='Pro Alpha markdown for apply_pro_beta2')
+    ap.add_argument('--dry-run', action='store_true', help='print a unified diff instead of writing')
+    ap.add_argument('--list', action='store_true', help='list the registered passes')
+    ap.add_argument('--no-cache', action='store_true', help='reprocess every mission; skip the on-disk cache')
+    ap.add_argument('--no-journal', action='store_true', help='do not append to <campaign>.journal.jsonl')
+    ap.add_argument('--cache-dir', default=str(CACHE_DIR))
+    ap.add_argument('--where', metavar='QUERY', help='only edit missions matching a tools.dialogue_index query')
+    ap.add_argument('--jobs', '-j', type=int, default=1, help=f'worker processes (0 = all {default_jobs()} cores)')
+    add_arguments(ap)
+    args = ap.parse_args(argv)
+
+    if args.list:
+        for p in PASSES.values():
+            print(f'{p.name:18s} {p.summary}')
+        return 0
+    passes = args.passes or [p.name for p in PASSES.values() if all(getattr(args, n) for n in p.needs)]
+    unknown = [p for p in passes if p not in PASSES]
+    if unknown:
+        ap.error(f'unknown pass(es): {", ".join(unknown)} (see --list)')
+    for name in passes:
+        missing = [n for n in PASSES[name].needs if not getattr(args, n)]
+        if missing:
+            ap.error(f'{name} needs --{missing[0].replace("_", "-")}')
+
+    path = Path(args.campaign)
+    with session(args), ContentCache(args.cache_dir, enabled=not args.no_cache) as cache:
+        with PROF.stage('read'), open(path, encoding='utf-8', newline='') as f:
+            text = f.read()
+        print(f'{path}: {", ".join(passes)}')
+        scope = None
+        if args.where:
+            from tools.dialogue_index import INDEX_NAME, DialogueIndex, QueryError
+            index = DialogueIndex.open(CampaignDoc(text), Path(args.cache_dir) / INDEX_NAME if cache.enabled else None)
+            try:
+                scope = set(index.missions(args.where))
+            except QueryError as e:
+                ap.error(str(e))
+            print(f'  --where: {len(scope)} mission(s)')
+        journal = None if args.no_journal or args.dry_run else Journal(path)
+        out = run(text, passes, args, cache, args.jobs or default_jobs(), journal=journal, scope=scope)
+        if out == text:
+            print('OK: no changes')
+        elif args.dry_run:
+            try:
+                rel = path.resolve().relative_to(ROOT).as_posix()
+            except ValueError:
+                rel = Path(os.path.relpath(path)).as_posix()
+            sys.stdout.writelines(difflib.unified_diff(
+                text.splitlines(keepends=True), out.splitlines(keepends=True), f'a/{rel}', f'b/{rel}'))
+            print(f'DRY RUN: {path} not written')
+        else:
+            write_atomic(path, out)
+            print(f'OK: wrote {path}')
+            if journal is not None and journal.pending:
+                runs = [e['run'] for e in journal.pending]
+                journal.flush()
+                print(f'journal: {", ".join(runs)} -> {journal.path}')
+        print(cache.stats())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""Opt-in stage timers and counters for the patch tools.
+
+    python add_en_say.py --profile                          # table on stderr
+    python -m tools.p45_ultra_fix_en --profile-out run.json # + Chrome trace
+    python apply_pro_beta2.py --profile-out run.prof        # + cProfile dump
+    STRIKEGY_PROFILE=1 python fix_en_quotes.py              # same as --profile
+
+Library code reports into the process-wide `PROF`:
+
+    with PROF.stage('patch', mission=mid):   # wall + CPU time
+        ...
+    if PROF.on:
+        PROF.count('regex.evals')             # plain counters
+        PROF.hit('ko_to_en', rule)            # per-table hit counts
+
+Hit tables count every call that reaches the table: rules record the branch
+they took, contentcache memo hits add one `MEMO_HIT` row (the rule is not
+re-run). Lines inside sections reused whole from the section cache never
+reach a table at all; the report says how many sections that was
+(`sections.cached`).
+
+Disabled (the default), `stage()` hands back one shared no-op context
+manager and counter calls sit behind `if PROF.on:`, so instrumented code
+pays an attribute read per call site. `.json` traces load in
+chrome://tracing or https://ui.perfetto.dev; `.prof` dumps in pstats or
+snakeviz. Worker processes (`--jobs`) send their events back to the parent,
+see missionpool.
+"""
+import cProfile
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+
+ENV = 'STRIKEGY_PROFILE'
+MEMO_HIT = '(memo hit, rule not re-run)'
+_NULL = nullcontext()
+
+
+class _Stage:
+    __slots__ = ('prof', 'name', 'mission', 't0', 'c0')
+
+    def __init__(self, prof, name, mission):
+        self.prof = prof
+        self.name = name
+        self.mission = mission
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        self.c0 = time.process_time()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self.t0
+        cpu = time.process_time() - self.c0
+        self.prof.events.append((self.name, self.mission, self.t0, wall, cpu, os.getpid()))
+        return False
+
+
+class Profiler:
+    def __init__(self):
+        self.on = False
+        self.origin = time.perf_counter()
+        self.events = []   # (name, mission, start, wall s, cpu s, pid)
+        self.counters = Counter()
+        self.hits = defaultdict(Counter)
+
+    def enable(self):
+        self.on = True
+
+    def disable(self):
+        self.on = False
+
+    def reset(self):
+        self.origin = time.perf_counter()
+        self.events = []
+        self.counters = Counter()
+        self.hits = defaultdict(Counter)
+
+    def stage(self, name: str, mission: str | None = None):
+        return _Stage(self, name, mission) if self.on else _NULL
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] += n
+
+    def hit(self, table: str, key: str):
+        self.hits[table][key] += 1
+
+    # -------- worker hand-off --------
+
+    def take(self) -> dict:
+        """Everything recorded so far (picklable), then reset."""
+        snap = {'events': self.events, 'counters': dict(self.counters),
+                'hits': {k: dict(v) for k, v in self.hits.items()}}
+        self.reset()
+        return snap
+
+    def merge(self, snap: dict):
+        # perf_counter is system-wide on Linux/macOS/Windows, so worker
+        # timestamps line up with ours
+        self.events.extend(snap['events'])
+        self.counters.update(snap['counters'])
+        for table, hits in snap['hits'].items():
+            self.hits[table].update(hits)
+
+    # -------- reports --------
+
+    def table(self, top: int = 10) -> str:
+        out = []
+        agg = {}
+        for name, _, _, wall, cpu, _ in self.events:
+            a = agg.setdefault(name, [0, 0.0, 0.0, 0.0])
+            a[0] += 1
+            a[1] += wall
+            a[2] += cpu
+            a[3] = max(a[3], wall)
+        if agg:
+            out.append(f'{"stage":24s} {"calls":>7s} {"wall ms":>10s} {"cpu ms":>10s} {"max ms":>9s}')
+            for name, (n, wall, cpu, mx) in sorted(agg.items(), key=lambda kv: -kv[1][1]):
+                out.append(f'{name:24s} {n:7d} {wall * 1e3:10.1f} {cpu * 1e3:10.1f} {mx * 1e3:9.2f}')
+        per_mission = Counter()
+        for name, mission, _, wall, _, _ in self.events:
+            if mission is not None:
+                per_mission[f'{name} {mission}'] += wall
+        if per_mission:
+            out.append('\nslowest missions (wall ms):')
+            for key, wall in per_mission.most_common(top):
+                out.append(f'  {wall * 1e3:9.2f}  {key}')
+        if self.counters:
+            out.append('\ncounters:')
+            for name in sorted(self.counters):
+                out.append(f'  {name:30s} {self.counters[name]:12,d}')
+        for table in sorted(self.hits):
+            hits = self.hits[table]
+            out.append(f'\n{table} hits ({sum(hits.values()):,d} calls, {len(hits)} distinct):')
+            for key, n in hits.most_common(top):
+                out.append(f'  {n:9,d}  {key}')
+        if self.hits and self.counters.get('sections.cached'):
+            out.append(f"\nhit tables exclude lines in the {self.counters['sections.cached']:,d} "
+                       'section(s) reused from the section cache')
+        return '\n'.join(out) if out else 'profile: nothing recorded'
+
+    def trace(self) -> dict:
+        """Chrome trace-event JSON (complete events, one lane per process)."""
+        pid = os.getpid()
+        evs = []
+        end = self.origin
+        for name, mission, start, wall, cpu, wpid in self.events:
+            args = {'cpu_ms': round(cpu * 1e3, 3)}
+            if mission is not None:
+                args['mission'] = mission
+            evs.append({'name': f'{name} {mission}' if mission else name, 'cat': name, 'ph': 'X',
+                        'ts': round((start - self.origin) * 1e6, 1), 'dur': round(wall * 1e6, 1),
+                        'pid': pid, 'tid': wpid, 'args': args})
+            end = max(end, start + wall)
+        if self.counters:
+            evs.append({'name': 'counters', 'ph': 'C', 'ts': round((end - self.origin) * 1e6, 1),
+                        'pid': pid, 'args': dict(self.counters)})
+        return {'traceEvents': evs, 'displayTimeUnit': 'ms',
+                'otherData': {'hits': {k: dict(v) for k, v in self.hits.items()}}}
+
+
+PROF = Profiler()
+
+
+def add_arguments(ap):
+    ap.add_argument('--profile', action='store_true',
+                    help=f'print stage timings and counters to stderr (or set {ENV}=1)')
+    ap.add_argument('--profile-out', metavar='PATH',
+                    help='also write a trace: *.json Chrome trace events, *.prof cProfile dump')
+
+
+@contextmanager
+def session(args=None):
+    """Profile the enclosed block if asked to by `args` or $STRIKEGY_PROFILE
+    (`1` for the table, or a trace path)."""
+    env = os.environ.get(ENV, '')
+    out = getattr(args, 'profile_out', None) or (env if env not in ('', '0', '1') else None)
+    if not (getattr(args, 'profile', False) or out or env == '1'):
+        yield PROF
+        return
+    PROF.reset()
+    PROF.enable()
+    cprof = cProfile.Profile() if out and out.endswith(('.prof', '.pstats')) else None
+    if cprof is not None:
+        cprof.enable()
+    try:
+        with PROF.stage('total'):
+            yield PROF
+    finally:
+        if cprof is not None:
+            cprof.disable()
+            cprof.dump_stats(out)
+        PROF.disable()
+        print(PROF.table(), file=sys.stderr)
+        if out and cprof is None:
+            with open(out, 'w', encoding='utf-8') as f:
+                json.dump(PROF.trace(), f)
+        if out:
+            print(f'profile: wrote {out}', file=sys.stderr)
@@ -0,0 +1,222 @@
+"""Synthetic CampaignData.js (+ Pro markdown) at N times the real size.
+
+    python -m tools.synthcampaign --scale 10 --out /tmp/synth.js --md /tmp/synth.md
+
+Missions follow the shape the patch scripts expect (cs_a, obj_oN / say_oN_k /
+act_oN / say_oN_done1 / say_oN_ambient, cs_b, complete). Text is sampled from
+the real CampaignData.js, so Korean/English lengths and the [무전] tags match
+production; quoting varies ('...', "...", `...`) and some strings carry
+escapes (\\', \\", \\n, \\u2014) or lack `en`, so every patch script has work
+to do. Output is deterministic for a given (scale, seed, source file).
+"""
+import argparse
+import random
+import re
+from pathlib import Path
+
+from tools.campaigndoc import CAMPAIGN_JS, CampaignDoc
+
+HANGUL_RE = re.compile('[가-힣]')
+SLUG_RE = re.compile(r'^c\d+_m\d+_(\w+)$')
+PRO_SPEAKERS = ['HART', 'NOVA', 'SHADE', 'RAVEN', 'KESTREL', 'YARA', 'ATLAS', 'RUNE']
+MISSIONS_PER_CHAPTER = 20
+
+
+class Corpus:
+    """String pools sampled by the generator."""
+
+    def __init__(self, header: str, ko: list[str], en: list[str], labels: list[str],
+                 maps: list[str], slugs: list[str], speakers: list[str], missions: int):
+        self.header = header
+        self.ko = ko
+        self.en = en
+        self.labels = labels
+        self.maps = maps
+        self.slugs = slugs
+        self.speakers = speakers
+        self.missions = missions
+
+    @classmethod
+    def from_doc(cls, doc: CampaignDoc) -> 'Corpus':
+        ko, en, labels, maps, slugs = set(), set(), set(), set(), set()
+        for mid, mission in doc.missions.items():
+            m = SLUG_RE.match(mid)
+            if m:
+                slugs.add(m.group(1))
+            rel = mission.get_str('map')
+            if rel:
+                maps.add(rel)
+            for step in mission.steps:
+                if step.type == 'objective' and step.get_str('text'):
+                    labels.add(step.get_str('text'))
+                for e in [step] + step.lines:
+                    t, s = e.get_str('text'), e.get_str('en')
+                    if t and HANGUL_RE.search(t):
+                        ko.add(t)
+                    if s and not HANGUL_RE.search(s):
+                        en.add(s)
+        # everything up to the missions object: CAMPAIGN_KEY, CAST, helpers
+        header = doc.text[:doc.missions_node.start + 1]
+        return cls(header, sorted(ko), sorted(en), sorted(labels), sorted(maps),
+                   sorted(slugs), sorted(doc.cast()), len(doc.missions))
+
+    @classmethod
+    def load(cls, path=CAMPAIGN_JS) -> 'Corpus':
+        return cls.from_doc(CampaignDoc.load(path))
+
+
+def js_quote(s: str, q: str) -> str:
+    s = s.replace('\\', '\\\\').replace('\n', '\\n')
+    if q == '`':
+        s = s.replace('`', '\\`').replace('${', '\\${')
+    else:
+        s = s.replace(q, '\\' + q)
+    return q + s + q
+
+
+class _Writer:
+    def __init__(self, corpus: Corpus, rng: random.Random):
+        self.c = corpus
+        self.rng = rng
+
+    def ko(self) -> str:
+        s = self.rng.choice(self.c.ko)
+        r = self.rng.random()
+        if r < 0.08:
+            s = s.replace('‘', "'").replace('’', "'")   # ASCII quotes -> \' escapes
+        elif r < 0.12:
+            s = '[무전] ' + s
+        return s
+
+    def en(self) -> str:
+        s = self.rng.choice(self.c.en)
+        r = self.rng.random()
+        if r < 0.05:
+            s = s + '\n' + self.rng.choice(self.c.en)
+        elif r < 0.10:
+            s = f'"{s}"'
+        elif r < 0.15:
+            s = s.replace('’', "'")
+        return s
+
+    def lit(self, s: str) -> str:
+        r = self.rng.random()
+        q = "'" if r < 0.6 else '"' if r < 0.85 else '`'
+        out = js_quote(s, q)
+        if '—' in out and self.rng.random() < 0.3:
+            out = out.replace('—', '\\u2014')
+        return out
+
+    def speaker(self) -> str:
+        return self.rng.choice(self.c.speakers)
+
+    def say(self, sid: str, speaker: str, text: str, en: bool = True) -> str:
+        tail = f' en: {self.lit(self.en())},' if en else ''
+        return (f"        {{\n          id: '{sid}',\n          type: 'say',\n          speaker: {speaker},\n"
+                f"          text: {self.lit(text)},{tail}\n        }},\n")
+
+    def line(self, t: str, speaker: str, text: str) -> str:
+        en = f', en: {self.lit(self.en())}' if self.rng.random() < 0.9 else ''
+        return f'{{ t: {t}, speaker: {speaker}, text: {self.lit(text)}{en} }}'
+
+    def cutscene(self, sid: str, lines: list[tuple[str, str]], title: str | None) -> str:
+        body = ', '.join(self.line(f'{0.7 + 1.15 * i:.2f}', sp, tx) for i, (sp, tx) in enumerate(lines))
+        card = f"\n          titleCard: {{ title: {js_quote(title, chr(39))}, kicker: 'OP SYNTH', sub: '' }}," if title else ''
+        return (f"        {{\n          id: '{sid}',\n          type: 'cutscene',\n"
+                f"          duration: {1.15 * len(lines) + 2.2:.1f},\n          lockPlayer: true,\n"
+                f"          cinematic: {{ bars: true, fadeIn: 0.35, fadeOut: 0.35 }},\n"
+                f"          lines: [ {body} ],{card}\n        }},\n")
+
+    def mission(self, mid: str, title: str, chapter: int, next_id: str | None, pro: dict) -> str:
+        rng = self.rng
+        out = [f"    {mid}: {{\n      id: '{mid}',\n      title: {js_quote(title, chr(39))},\n"
+               f"      chapter: {chapter},\n      map: '{rng.choice(self.c.maps)}',\n"
+               f"      bots: {{ blue: {rng.randint(2, 6)}, red: {rng.randint(8, 40)} }},\n"
+               f"      nextMissionId: {js_quote(next_id, chr(39)) if next_id else 'null'},\n"
+               "      rules: { noShop: true, noClass: true, noBandage: true, autoRegen: true },\n"
+               "      loadout: { primary: 'ar1', secondary: 'pistol1', grenades: ['smoke','frag'], extras: ['flash'] },\n"
+               "      failOnDeath: true,\n      timeLimitSec: 0,\n      script:       [\n"]
+        out.append(self.cutscene('cs_a', [(self.speaker(), self.ko()) for _ in range(rng.randint(6, 10))], title))
+        for oi in range(1, len(pro['obj']) + 1):
+            label = rng.choice(self.c.labels)
+            out.append(f"        {{\n          id: 'obj_o{oi}',\n          type: 'objective',\n"
+                       f"          key: 'o{oi}',\n          text: {self.lit(label)},\n        }},\n")
+            for k in (1, 2):
+                out.append(self.say(f'say_o{oi}_{k}', self.speaker(), self.ko(), en=rng.random() < 0.8))
+            kind = rng.choice(['reach', 'interact'])
+            acts = ', '.join(self.line(t, self.speaker(), self.ko()) for t in ('10', '22'))
+            out.append(f"        {{\n          id: 'act_o{oi}',\n          type: '{kind}',\n"
+                       f"          objectiveKey: 'o{oi}',\n          checkpointId: 'o{oi}',\n"
+                       f"          trigger: 'o{oi}',\n          label: {self.lit(label)},\n"
+                       f"          lines: [ {acts} ],\n        }},\n")
+            out.append(self.say(f'say_o{oi}_done1', 'CAST.HART', label + ' 완료. 다음으로.', en=rng.random() < 0.8))
+            out.append(self.say(f'say_o{oi}_ambient', self.speaker(), self.ko(), en=rng.random() < 0.8))
+        out.append(self.cutscene('cs_b', [(self.speaker(), self.ko()) for _ in range(rng.randint(6, 10))], None))
+        out.append("        { id: 'complete', type: 'complete' },\n      ],\n    },\n\n")
+        return ''.join(out)
+
+    def pro(self) -> dict:
+        rng = self.rng
+
+        def who():
+            name = rng.choice(PRO_SPEAKERS)
+            return name + ' [무전]' if rng.random() < 0.2 else name
+        return {
+            'cs_a': [(who(), self.ko()) for _ in range(rng.randint(6, 10))],
+            'cs_b': [(who(), self.ko()) for _ in range(rng.randint(6, 10))],
+            'obj': {oi: [(who(), self.ko()) for _ in range(rng.randint(3, 6))] for oi in range(1, rng.randint(3, 5) + 1)},
+        }
+
+
+def pro_markdown(mid: str, title: str, data: dict) -> str:
+    out = [f'# {title} (`{mid}`)', '## CUTSCENE A — 오프닝']
+    out += [f'{i}. **{who.split(" [")[0]}**: {text}' for i, (who, text) in enumerate(data['cs_a'], 1)]
+    out += ['', '## OBJECTIVES']
+    for oi, lines in data['obj'].items():
+        out.append(f'### O{oi} — 목표 {oi}')
+        out += [f'- **{who}**: {text}' for who, text in lines]
+    out.append('## CUTSCENE B — 엔딩')
+    out += [f'{i}. **{who.split(" [")[0]}**: {text}' for i, (who, text) in enumerate(data['cs_b'], 1)]
+    out += ['', '---', '']
+    return '\n'.join(out)
+
+
+def generate(scale: float, seed: int = 0, corpus: Corpus | None = None) -> tuple[str, str, list[str]]:
+    """(CampaignData.js text, Pro markdown, mission ids) with scale x the real mission count."""
+    corpus = corpus or Corpus.load()
+    rng = random.Random(f'{seed}:{scale}')
+    w = _Writer(corpus, rng)
+    n = max(1, round(corpus.missions * scale))
+    ids = []
+    for i in range(n):
+        ch, m = divmod(i, MISSIONS_PER_CHAPTER)
+        ids.append(f'c{ch + 1}_m{m + 1}_{corpus.slugs[i % len(corpus.slugs)]}')
+    js, md = [corpus.header, '\n'], []
+    for i, mid in enumerate(ids):
+        ch, m = divmod(i, MISSIONS_PER_CHAPTER)
+        title = f'CH{ch + 1} M{m + 1} — Synthetic {i}'
+        pro = w.pro()
+        js.append(w.mission(mid, title, ch + 1, ids[i + 1] if i + 1 < n else None, pro))
+        md.append(pro_markdown(mid, title, pro))
+    js.append('  },\n};\n')
+    return ''.join(js), '\n'.join(md), ids
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Write a synthetic CampaignData.js (and Pro markdown).')
+    ap.add_argument('--scale', type=float, default=1.0, help='mission count as a multiple of the real file')
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--campaign', default=str(CAMPAIGN_JS), help='source of the sampled text')
+    ap.add_argument('--out', required=True, help='CampaignData.js to write')
+    ap.add_argument('--md', help='Pro markdown to write (apply_pro_beta2 input)')
+    args = ap.parse_args(argv)
+
+    js, md, ids = generate(args.scale, args.seed, Corpus.load(args.campaign))
+    Path(args.out).write_text(js, encoding='utf-8')
+    if args.md:
+        Path(args.md).write_text(md, encoding='utf-8')
+    print(f'OK: {len(ids)} missions, {len(js.encode("utf-8")) / 1024:.0f} KB -> {args.out}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,475 @@
+"""Pre-render campaign TTS lines into per-mission voice packs.
+
+    python -m tools.tts_prerender --endpoint http://localhost:8787/tts
+    python -m tools.tts_prerender --endpoint URL --missions c1_m1_insertion --concurrency 8
+    python -m tools.tts_prerender --list                 # lines + keys, no requests
+    python -m tools.tts_prerender --stub                 # render against a local stub server
+
+Walks every `say` step and every `lines[]` entry (cutscene and timed step
+lines) of CampaignData.js and picks what CampaignRuntime would speak: the
+`en` text unless it looks like a placeholder, else the KO -> EN table
+lookup, tag/channel stripped, Hangul leftovers skipped. Voices come from
+CampaignRuntime._voiceForSpeaker() and each line is keyed with
+TTSManager's cache key, djb2(lang|voice|style|text). Lines are
+deduplicated on that key and rendered through any `/tts`-compatible
+endpoint (same JSON payload as TTSManager._fetchBuffer) with bounded
+concurrency and retries.
+
+Rendered clips are content-addressed under .cache/tts/ (sha256 of the
+request payload), so re-runs only request new or changed lines.
+
+Output, assets/audio/voice/ (loaded by TTSManager.loadVoicePack once packs are
+enabled: `window.__strikegyTTS = { packs: true }` or
+`localStorage.strikegy_tts_packs = '1'`):
+
+    manifest.json        {"version": 1, "missions": {id: "<id>.<digest>.vpk"}}
+    <id>.<digest>.vpk    4s magic b'SVPK', u16 version, u16 reserved,
+                         u32 index JSON byte length (J),
+                         J bytes UTF-8 JSON {key: [offset, length]},
+                         zero padding to a 4-byte boundary,
+                         clip bytes (offsets are relative to here)
+"""
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import re
+import struct
+import sys
+import threading
+import urllib.error
+import urllib.request
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import NamedTuple
+
+from tools.build_campaign_bundles import load_koen, normalize_key
+from tools.campaigndoc import CAMPAIGN_JS, ROOT, CampaignDoc, to_python
+
+VOICE_DIR = ROOT / 'assets' / 'audio' / 'voice'
+CLIP_DIR = ROOT / '.cache' / 'tts'
+MAGIC = b'SVPK'
+VERSION = 1
+HEADER = struct.Struct('<4sHHI')
+MIN_CLIP_BYTES = 32  # TTSManager._fetchBuffer rejects anything shorter
+DEFAULT_LANG = 'en-GB'
+FORMAT = 'mp3'
+
+# CampaignRuntime._voiceForSpeaker()
+VOICES = {
+    'RAVEN': 'en_male_01',
+    'GHOST': 'en_male_02',
+    'NOVA': 'en_female_01',
+    'KESTREL': 'en_female_02',
+    'JIN': 'en_male_03',
+    'ECHO': 'en_male_04',
+}
+DEFAULT_VOICE = 'en_neutral_01'
+
+# CampaignTranslate.js FALLBACK_PAIRS
+FALLBACK_PAIRS = [
+    ('웨이포인트', 'waypoint'),
+    ('확인.', 'Copy.'),
+    ('확인', 'Copy'),
+    ('좋아.', 'Good.'),
+    ('좋아', 'Good'),
+    ('계속 간다.', 'Keep moving.'),
+    ('계속 간다', 'Keep moving'),
+    ('조심.', 'Stay sharp.'),
+    ('조심', 'Stay sharp'),
+]
+
+# CampaignRuntime._looksBadEN() placeholders
+BAD_EN = {
+    'Paperwork is the key.',
+    'Approval pending.',
+    'Smoke out. Break their sightline.',
+    'Eyes up. Careful.',
+    'Moving. .',
+    'Moving.',
+}
+
+# String.prototype.trim() whitespace
+JS_WS = '\t\n\v\f\r \xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000\ufeff'
+HANGUL_RE = re.compile('[가-힣]')
+TAG_RE = re.compile(r'(\[[^\]]+\])\s*(.*)')
+CHANNEL_RE = re.compile(r'\[([^\]]+)\]')
+CHANNEL_PREFIX_RE = re.compile(
+    r'^\*?\s*\(?\s*(무전|속삭임|잡음|hq|본부|오버워치|내부통신|인터콤|로컬|대화|local)\s*\)?\s*\*?\s*[:：-]?\s*', re.I)
+
+
+def js_trim(s: str) -> str:
+    return s.strip(JS_WS)
+
+
+def js_str(v) -> str:
+    if v is None:
+        return ''
+    if isinstance(v, bool):
+        return 'true' if v else 'false'
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    return v if isinstance(v, str) else str(v)
+
+
+def utf16_units(s: str):
+    b = s.encode('utf-16-le', 'surrogatepass')
+    return struct.unpack(f'<{len(b) // 2}H', b)
+
+
+def djb2(s: str) -> str:
+    """djb2Hash() in TTSManager.js (xor variant over UTF-16 code units)."""
+    h = 5381
+    for c in utf16_units(s):
+        h = ((h * 33) ^ c) & 0xffffffff
+    return f'{h:x}'
+
+
+def cache_key(lang: str, voice: str, style: str, text: str) -> str:
+    return djb2(f'{lang}|{voice}|{style}|{text}')
+
+
+# --- CampaignRuntime / CampaignTranslate text selection ---------------------
+
+def translate_with(raw: str, by_mission: dict, global_map: dict) -> str:
+    full = js_trim(raw)
+    if not full:
+        return full
+    tag, body = '', full
+    m = TAG_RE.fullmatch(full)
+    if m:
+        tag, body = m.group(1), js_trim(m.group(2))
+    if not HANGUL_RE.search(body):
+        return full
+    key = normalize_key(body)
+    en = by_mission.get(key) or global_map.get(key) or ''
+    if not en:
+        k2 = normalize_key(full)
+        en = by_mission.get(k2) or global_map.get(k2) or ''
+    if not en:
+        en = body
+        for a, b in FALLBACK_PAIRS:
+            en = en.replace(a, b)
+        if en == body:
+            return full
+    if tag and not re.match(r'\[[^\]]+\]', en):
+        return js_trim(f'{tag} {en}')
+    return en
+
+
+def looks_bad_en(en_raw: str) -> bool:
+    s = js_trim(en_raw)
+    if not s or s in BAD_EN or '[]' in s:
+        return True
+    letters = len(re.findall('[A-Za-z]', s))
+    digits = len(re.findall('[0-9]', s))
+    spaces = len(re.findall(r'\s', s))
+    total = max(1, len(utf16_units(s)))
+    if letters < 6 and digits < 3:
+        return True
+    if letters / total < 0.22:
+        return True
+    return (total - letters - digits - spaces) / total > 0.55
+
+
+def speaker_tag(speaker) -> str:
+    s = js_trim(js_str(speaker))
+    if not s:
+        return ''
+    return s.split()[-1].upper()
+
+
+def strip_tag(raw: str) -> str:
+    """Text part of CampaignRuntime._stripTagAndDetectChannel()."""
+    txt = raw
+    m = CHANNEL_RE.search(txt)
+    if m:
+        txt = js_trim(txt.replace(m.group(0), '', 1))
+    return js_trim(CHANNEL_PREFIX_RE.sub('', txt, count=1))
+
+
+def subtitle_raw(obj: dict) -> str:
+    for k in ('text', 'ko', 'en'):
+        if obj.get(k) is not None:
+            return js_str(obj[k])
+    return ''
+
+
+def tts_text(obj: dict, translations: dict) -> str:
+    """What _say()/_showCommsLine() hand to TTS ('' = nothing spoken)."""
+    if obj.get('tts') is False or not strip_tag(subtitle_raw(obj)):
+        return ''
+    en = obj.get('en')
+    en_raw = js_trim(en) if isinstance(en, str) else ''
+    if en_raw and not looks_bad_en(en_raw):
+        raw = en_raw
+    else:
+        base = subtitle_raw(obj)
+        raw = translate_with(base, translations.get('mission') or {}, translations.get('global') or {}) or base
+    text = strip_tag(raw)
+    return '' if HANGUL_RE.search(text) else text
+
+
+class Line(NamedTuple):
+    mission: str
+    key: str
+    lang: str
+    voice: str
+    style: str
+    text: str
+
+    def payload(self) -> dict:
+        return {'text': self.text, 'lang': self.lang, 'voice': self.voice, 'style': self.style, 'format': FORMAT}
+
+    def digest(self) -> str:
+        raw = json.dumps(self.payload(), ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def mission_lines(mid: str, mission: dict, translations: dict) -> list[Line]:
+    """Spoken lines in script order, deduplicated on the runtime cache key."""
+    lang = js_str(mission.get('lang')) or DEFAULT_LANG
+    items = []
+    for step in mission.get('script') or []:
+        if not isinstance(step, dict):
+            continue
+        if step.get('type') == 'say':
+            items.append(step)
+        if isinstance(step.get('lines'), list):
+            items += [ln for ln in step['lines'] if isinstance(ln, dict)]
+
+    out = {}
+    for obj in items:
+        text = tts_text(obj, translations)
+        if not text:
+            continue
+        voice = VOICES.get(speaker_tag(obj.get('speaker')), DEFAULT_VOICE)
+        line = Line(mid, cache_key(lang, voice, '', text), lang, voice, '', text)
+        prev = out.setdefault(line.key, line)
+        if prev.text != text:
+            print(f'warning: {mid}: key {line.key} collides: {prev.text!r} / {text!r}', file=sys.stderr)
+    return list(out.values())
+
+
+def collect(doc: CampaignDoc, koen, missions=None) -> dict[str, list[Line]]:
+    by_mission, global_map = koen
+    refs = doc.cast()
+    out = {}
+    for mid, mission in doc.missions.items():
+        if missions and mid not in missions:
+            continue
+        translations = {'mission': by_mission.get(mid, {}), 'global': global_map}
+        out[mid] = mission_lines(mid, to_python(mission.node, refs), translations)
+    return out
+
+
+# --- rendering ---------------------------------------------------------------
+
+class RenderError(Exception):
+    pass
+
+
+def _post(endpoint: str, payload: dict, timeout: float) -> bytes:
+    req = urllib.request.Request(endpoint, data=json.dumps(payload).encode('utf-8'),
+                                 headers={'Content-Type': 'application/json'}, method='POST')
+    with urllib.request.urlopen(req, timeout=timeout) as res:
+        return res.read()
+
+
+async def render_line(line: Line, endpoint: str, sem: asyncio.Semaphore, *, retries=3, timeout=60.0) -> bytes:
+    for attempt in range(retries + 1):
+        async with sem:
+            try:
+                data = await asyncio.to_thread(_post, endpoint, line.payload(), timeout)
+            except urllib.error.HTTPError as e:
+                # client errors (bad text, auth) will not fix themselves
+                if e.code < 500 and e.code != 429:
+                    raise RenderError(f'HTTP {e.code}') from e
+                err = f'HTTP {e.code}'
+            except (urllib.error.URLError, OSError) as e:
+                err = str(getattr(e, 'reason', e))
+            else:
+                if len(data) >= MIN_CLIP_BYTES:
+                    return data
+                err = f'{len(data)} B response'
+        if attempt < retries:
+            await asyncio.sleep(0.5 * 2 ** attempt)
+    raise RenderError(err)
+
+
+async def render_all(lines, endpoint: str, store: Path = CLIP_DIR, *, concurrency=4, retries=3, timeout=60.0):
+    """Render every distinct payload not yet in `store`; returns (rendered, failed lines)."""
+    store.mkdir(parents=True, exist_ok=True)
+    todo = {}
+    for line in lines:
+        if not (store / line.digest()).exists():
+            todo.setdefault(line.digest(), line)
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(digest, line):
+        data = await render_line(line, endpoint, sem, retries=retries, timeout=timeout)
+        tmp = store / f'{digest}.tmp'
+        tmp.write_bytes(data)
+        tmp.replace(store / digest)
+
+    results = await asyncio.gather(*(one(d, ln) for d, ln in todo.items()), return_exceptions=True)
+    failed = []
+    for line, res in zip(todo.values(), results):
+        if isinstance(res, BaseException):
+            if not isinstance(res, (RenderError, OSError)):
+                raise res
+            failed.append((line, res))
+    return len(todo) - len(failed), failed
+
+
+# --- packs -------------------------------------------------------------------
+
+def build_pack(clips: list[tuple[str, bytes]]) -> bytes:
+    index, blobs, offsets = {}, [], {}
+    size = 0
+    for key, data in clips:
+        h = hashlib.sha256(data).digest()
+        if h not in offsets:
+            offsets[h] = size
+            blobs.append(data)
+            size += len(data)
+        index[key] = [offsets[h], len(data)]
+    meta = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    pad = -(HEADER.size + len(meta)) % 4
+    return b''.join([HEADER.pack(MAGIC, VERSION, 0, len(meta)), meta, b'\0' * pad, *blobs])
+
+
+def build_packs(by_mission: dict[str, list[Line]], store: Path = CLIP_DIR) -> dict[str, bytes]:
+    """File name -> contents for every pack plus manifest.json."""
+    files, manifest = {}, {}
+    for mid, lines in by_mission.items():
+        clips = [(ln.key, (store / ln.digest()).read_bytes()) for ln in lines if (store / ln.digest()).exists()]
+        if not clips:
+            continue
+        blob = build_pack(clips)
+        name = f'{mid}.{hashlib.sha256(blob).hexdigest()[:10]}.vpk'
+        files[name] = blob
+        manifest[mid] = name
+    files['manifest.json'] = (json.dumps({'version': VERSION, 'missions': manifest}, indent=1) + '\n').encode('utf-8')
+    return files
+
+
+def write_packs(files: dict[str, bytes], out_dir: Path = VOICE_DIR, missions=None) -> list[str]:
+    """Write changed files; drop superseded packs of the missions written."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    man_path = out_dir / 'manifest.json'
+    if missions and man_path.exists():
+        # partial run: keep the other missions' entries
+        old = json.loads(man_path.read_text(encoding='utf-8')).get('missions', {})
+        new = json.loads(files['manifest.json'])['missions']
+        merged = {k: v for k, v in old.items() if k not in missions} | new
+        files = dict(files)
+        files['manifest.json'] = (json.dumps({'version': VERSION, 'missions': dict(sorted(merged.items()))},
+                                             indent=1) + '\n').encode('utf-8')
+    changed = []
+    for name, blob in files.items():
+        path = out_dir / name
+        if not path.exists() or path.read_bytes() != blob:
+            path.write_bytes(blob)
+            changed.append(name)
+    live = set(json.loads(files['manifest.json'])['missions'].values())
+    for path in out_dir.glob('*.vpk'):
+        if path.name not in live:
+            path.unlink()
+            changed.append(path.name)
+    return changed
+
+
+# --- stub endpoint -----------------------------------------------------------
+
+class StubTTSHandler(BaseHTTPRequestHandler):
+    """POST /tts -> short silent WAV (length follows the text); for smoke tests."""
+    fail_every = 0
+    _count = 0
+    _lock = threading.Lock()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b'{}')
+        with self._lock:
+            StubTTSHandler._count += 1
+            n = StubTTSHandler._count
+        if self.fail_every and n % self.fail_every == 0:
+            self.send_error(503)
+            return
+        text = str(body.get('text') or '').strip()
+        if not text:
+            self.send_error(400)
+            return
+        buf = io.BytesIO()
+        with wave.open(buf, 'wb') as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(8000)
+            w.writeframes(b'\0\0' * (800 + 80 * len(text)))
+        data = buf.getvalue()
+        self.send_response(200)
+        self.send_header('Content-Type', 'audio/wav')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub(port=0, fail_every=0) -> tuple[ThreadingHTTPServer, str]:
+    handler = type('Handler', (StubTTSHandler,), {'fail_every': fail_every})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}/tts'
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Pre-render campaign TTS into per-mission voice packs.')
+    ap.add_argument('--campaign', default=str(CAMPAIGN_JS))
+    ap.add_argument('--endpoint', help='/tts-compatible URL (POST JSON, returns audio bytes)')
+    ap.add_argument('--stub', action='store_true', help='render against a local stub server (silent WAVs)')
+    ap.add_argument('--missions', nargs='*', help='mission ids (default: all)')
+    ap.add_argument('--concurrency', type=int, default=4)
+    ap.add_argument('--retries', type=int, default=3)
+    ap.add_argument('--timeout', type=float, default=60.0)
+    ap.add_argument('--store', default=str(CLIP_DIR), help='content-addressed clip directory')
+    ap.add_argument('--out', default=str(VOICE_DIR))
+    ap.add_argument('--list', action='store_true', help='print mission, key, voice, text and exit')
+    args = ap.parse_args(argv)
+
+    doc = CampaignDoc.load(args.campaign)
+    by_mission = collect(doc, load_koen(), set(args.missions or ()))
+    if args.list:
+        for lines in by_mission.values():
+            for ln in lines:
+                print(f'{ln.mission}\t{ln.key}\t{ln.voice}\t{ln.text}')
+        return
+    if bool(args.endpoint) == args.stub:
+        ap.error('pass exactly one of --endpoint / --stub')
+
+    server = None
+    endpoint = args.endpoint
+    if args.stub:
+        server, endpoint = start_stub()
+    store = Path(args.store)
+    try:
+        all_lines = [ln for lines in by_mission.values() for ln in lines]
+        rendered, failed = asyncio.run(render_all(all_lines, endpoint, store, concurrency=args.concurrency,
+                                                  retries=args.retries, timeout=args.timeout))
+    finally:
+        if server:
+            server.shutdown()
+    for line, err in failed:
+        print(f'failed: {line.mission} {line.key} {line.text[:60]!r}: {err}', file=sys.stderr)
+
+    changed = write_packs(build_packs(by_mission, store), Path(args.out), set(args.missions or ()))
+    print(f'OK: {len(by_mission)} missions, {len(all_lines)} lines, {rendered} rendered, '
+          f'{len(failed)} failed, {len(changed)} file(s) changed')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
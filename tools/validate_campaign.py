@@ -0,0 +1,299 @@
+"""Validate CampaignData.js against CAST and the campaign maps.
+
+    python -m tools.validate_campaign              # all missions
+    python -m tools.validate_campaign c1_m3_convoy # some missions
+    python -m tools.validate_campaign --strict     # warnings fail too
+    python -m tools.validate_campaign --no-cache   # re-check everything
+    python -m tools.validate_campaign --where 'speaker:nova field:en'   # missions it matches
+
+Per mission (one pass over the steps, set/dict lookups only):
+
+    E parse            the file or a mission body is not a valid literal
+    E map              `map` is missing, unreadable or not JSON
+    E speaker          `speaker` is not a known CAST.X ref or a string
+    E trigger          reach/interact/kill/defend `trigger` has no
+                       campaign trigger in the map (runtime invents one)
+    W checkpoint       `checkpointId` names no trigger in the map
+    E en-missing       a say step / dialogue line has text but no `en`
+    E en-hangul        `en` still contains Hangul
+    E quote            a string swallowed the next field (`..', en: '...`),
+                       the usual result of a quote written unescaped
+    E step-id          duplicate step id
+    W objective        `objectiveKey` matches no objective step `key`
+                       (nothing gets checked off)
+    E next-mission     `nextMissionId` is not a mission
+
+Results are cached per mission (.cache/campaign memo `validate`) keyed by
+the mission's source section, the referenced map file, CAST and the
+mission id list, so after a patch script only edited missions are
+re-checked. `--where` takes a tools.dialogue_index query and checks only
+the missions with a hit. Exit status is 1 when anything fails.
+"""
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+from bisect import bisect_right
+from pathlib import Path
+
+from tools.campaigndoc import CAMPAIGN_JS, ROOT, CampaignDoc, Entry, JSSyntaxError
+from tools.contentcache import CACHE_DIR, ContentCache
+
+VERSION = '1'
+ACTION_TYPES = {'reach', 'interact', 'kill', 'defend'}
+# CampaignRuntime.attachMap() always defines these
+DEFAULT_TRIGGERS = {'rally', 'exfil'}
+HANGUL_RE = re.compile('[가-힣]')
+MERGED_FIELD_RE = re.compile(r"""['"]\s*,\s*[A-Za-z_$][\w$]*\s*:\s*['"]""")
+MAP_FIELD_RE = re.compile(r"""\bmap\s*:\s*(['"])([^'"\n]*)\1""")
+
+
+class Issue:
+    __slots__ = ('severity', 'code', 'pos', 'mission', 'step', 'message')
+
+    def __init__(self, severity, code, pos, mission, step, message):
+        self.severity = severity
+        self.code = code
+        self.pos = pos
+        self.mission = mission
+        self.step = step
+        self.message = message
+
+    def to_json(self, base: int) -> list:
+        return [self.severity, self.code, self.pos - base, self.step, self.message]
+
+    @classmethod
+    def from_json(cls, row: list, base: int, mission: str) -> 'Issue':
+        sev, code, rel, step, msg = row
+        return cls(sev, code, rel + base, mission, step, msg)
+
+
+class MapIndex:
+    """Trigger names per map file, each file read once."""
+
+    def __init__(self, root: Path = ROOT):
+        self.root = root
+        self._triggers = {}
+
+    def path(self, rel: str) -> Path:
+        return self.root / rel
+
+    def stamp(self, rel: str) -> str:
+        try:
+            return hashlib.sha256(self.path(rel).read_bytes()).hexdigest()
+        except OSError:
+            return 'missing'
+
+    def forget(self, rel: str):
+        """Drop the cached triggers of a map that changed on disk."""
+        self._triggers.pop(rel, None)
+
+    def triggers(self, rel: str) -> set[str] | str:
+        """Trigger names, or an error message."""
+        if rel not in self._triggers:
+            try:
+                data = json.loads(self.path(rel).read_text(encoding='utf-8'))
+            except OSError:
+                self._triggers[rel] = f'map not found: {rel}'
+            except ValueError as e:
+                self._triggers[rel] = f'map is not valid JSON: {rel}: {e}'
+            else:
+                names = set(DEFAULT_TRIGGERS)
+                for holder in (data.get('campaign'), (data.get('meta') or {}).get('campaign')):
+                    if isinstance(holder, dict) and isinstance(holder.get('triggers'), dict):
+                        names.update(holder['triggers'])
+                self._triggers[rel] = names
+        return self._triggers[rel]
+
+
+def _strings(node):
+    if node.kind == 'string':
+        yield node
+    elif node.kind == 'object':
+        for p in node.value.values():
+            yield from _strings(p.value)
+    elif node.kind == 'array':
+        for v in node.value:
+            yield from _strings(v)
+
+
+def check_mission(mission, cast: set[str], mission_ids: set[str], maps: MapIndex) -> list[Issue]:
+    mid = mission.id
+    out = []
+
+    def add(sev, code, node, step, msg):
+        out.append(Issue(sev, code, node.start if node is not None else mission.start, mid, step, msg))
+
+    try:
+        mission.node
+    except JSSyntaxError as e:
+        return [Issue('E', 'parse', e.pos, mid, None, str(e))]
+
+    rel = mission.get_str('map')
+    triggers = maps.triggers(rel) if rel else 'mission has no map'
+    if isinstance(triggers, str):
+        add('E', 'map', mission.get('map'), None, triggers)
+        triggers = None
+
+    nxt = mission.get('nextMissionId')
+    if nxt is not None and nxt.kind == 'string' and nxt.value and nxt.value not in mission_ids:
+        add('E', 'next-mission', nxt, None, f'unknown nextMissionId {nxt.value!r}')
+
+    objective_keys = {s.get_str('key') for s in mission.steps if s.type == 'objective'}
+    seen_ids = set()
+
+    def check_line(entry: Entry, step_id, needs_en: bool):
+        sp = entry.get('speaker')
+        if sp is not None:
+            if sp.kind == 'ref':
+                if sp.value not in cast:
+                    add('E', 'speaker', sp, step_id, f'unknown speaker {sp.value}')
+            elif sp.kind != 'string':
+                add('E', 'speaker', sp, step_id, 'speaker is neither a CAST ref nor a string')
+        en = entry.get('en')
+        if needs_en and entry.get_str('text') and (en is None or en.kind != 'string' or not en.value.strip()):
+            add('E', 'en-missing', entry.get('text'), step_id, 'dialogue has no en')
+        if en is not None and en.kind == 'string' and HANGUL_RE.search(en.value):
+            add('E', 'en-hangul', en, step_id, f'en contains Hangul: {en.value[:40]!r}')
+
+    for step in mission.steps:
+        sid = step.id
+        if sid is not None:
+            if sid in seen_ids:
+                add('E', 'step-id', step.get('id'), sid, f'duplicate step id {sid!r}')
+            seen_ids.add(sid)
+
+        check_line(step, sid, step.type == 'say')
+        for line in step.lines:
+            check_line(line, sid, True)
+
+        if triggers is not None:
+            trg = step.get('trigger')
+            if step.type in ACTION_TYPES and trg is not None and trg.kind == 'string' and trg.value not in triggers:
+                add('E', 'trigger', trg, sid, f'trigger {trg.value!r} not in {rel}')
+            cp = step.get('checkpointId')
+            if cp is not None and cp.kind == 'string' and cp.value not in triggers:
+                add('W', 'checkpoint', cp, sid, f'checkpointId {cp.value!r} not in {rel}')
+
+        ok = step.get('objectiveKey')
+        if ok is not None and ok.kind == 'string' and ok.value not in objective_keys:
+            add('W', 'objective', ok, sid, f'objectiveKey {ok.value!r} has no objective step')
+
+        for s in _strings(step.node):
+            if MERGED_FIELD_RE.search(s.value):
+                add('E', 'quote', s, sid, f'string looks like it swallowed a field: {s.value[:60]!r}')
+    return out
+
+
+def _mission_map(doc: CampaignDoc, mid: str) -> str:
+    # cheap lookup for the cache key; the full check reads the parsed node
+    m = MAP_FIELD_RE.search(doc.section_text(mid))
+    return m.group(2) if m else ''
+
+
+def validate(doc: CampaignDoc, missions=None, cache: ContentCache | None = None, maps: MapIndex | None = None):
+    """(issues, checked, cached) for the given mission ids (default all)."""
+    maps = maps or MapIndex()
+    try:
+        cast_map = doc.cast()
+    except JSSyntaxError as e:
+        return [Issue('E', 'parse', e.pos, None, None, f'CAST: {e}')], 0, 0
+    cast = set(cast_map)
+    mission_ids = set(doc.missions)
+    shared = json.dumps([VERSION, sorted(cast), sorted(mission_ids)])
+    memo = cache.memo('validate', VERSION) if cache is not None else None
+
+    issues, checked, cached = [], 0, 0
+    for mid, mission in doc.missions.items():
+        if missions and mid not in missions:
+            continue
+        base = mission.section[0]
+        key = None
+        if memo is not None:
+            section = doc.section_text(mid)
+            rel = _mission_map(doc, mid)
+            key = ContentCache.key(shared, section, rel, maps.stamp(rel) if rel else '')
+            rows = memo.data.get(key)
+            if rows is not None:
+                memo.data.move_to_end(key)
+                memo.hits += 1
+                issues += [Issue.from_json(r, base, mid) for r in json.loads(rows)]
+                cached += 1
+                continue
+            memo.misses += 1
+        found = check_mission(mission, cast, mission_ids, maps)
+        checked += 1
+        if memo is not None:
+            memo.data[key] = json.dumps([i.to_json(base) for i in found], ensure_ascii=False)
+            memo.dirty = True
+        issues += found
+    return issues, checked, cached
+
+
+class LineIndex:
+    def __init__(self, text: str):
+        self.starts = [0] + [m.end() for m in re.finditer('\n', text)]
+
+    def where(self, pos: int) -> tuple[int, int]:
+        i = bisect_right(self.starts, pos) - 1
+        return i + 1, pos - self.starts[i] + 1
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Validate CampaignData.js (speakers, triggers, en, quotes).')
+    ap.add_argument('missions', nargs='*', help='mission ids (default: all)')
+    ap.add_argument('--campaign', default=str(CAMPAIGN_JS))
+    ap.add_argument('--strict', action='store_true', help='exit 1 on warnings too')
+    ap.add_argument('--no-cache', action='store_true', help='re-check every mission; skip the on-disk cache')
+    ap.add_argument('--cache-dir', default=str(CACHE_DIR))
+    ap.add_argument('--where', metavar='QUERY', help='only missions matching a tools.dialogue_index query')
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    path = Path(args.campaign)
+    text = path.read_text(encoding='utf-8')
+    try:
+        doc = CampaignDoc(text)
+    except JSSyntaxError as e:
+        line, col = LineIndex(text).where(e.pos)
+        print(f'{path}:{line}:{col}: E parse: {e}')
+        sys.exit(1)
+
+    unknown = [m for m in args.missions if m not in doc.missions]
+    if unknown:
+        ap.error(f'unknown mission(s): {", ".join(unknown)}')
+    missions = set(args.missions)
+    if args.where:
+        from tools.dialogue_index import INDEX_NAME, DialogueIndex, QueryError
+        index = DialogueIndex.open(doc, None if args.no_cache else Path(args.cache_dir) / INDEX_NAME)
+        try:
+            matched = set(index.missions(args.where))
+        except QueryError as e:
+            ap.error(str(e))
+        missions = (missions & matched) if missions else matched
+        if not missions:
+            print(f'OK: no mission matches {args.where!r}')
+            sys.exit(0)
+
+    with ContentCache(args.cache_dir, enabled=not args.no_cache) as cache:
+        issues, checked, cached = validate(doc, missions, cache if cache.enabled else None)
+
+    lines = LineIndex(text)
+    issues.sort(key=lambda i: i.pos)
+    for i in issues:
+        line, col = lines.where(i.pos)
+        where = '/'.join(x for x in (i.mission, i.step) if x)
+        print(f'{path}:{line}:{col}: {i.severity} {i.code}: {i.message} [{where}]')
+
+    errors = sum(i.severity == 'E' for i in issues)
+    warnings = len(issues) - errors
+    ms = (time.perf_counter() - t0) * 1000
+    print(f'{"OK" if not errors else "FAIL"}: {checked + cached} missions ({checked} checked, {cached} cached), '
+          f'{errors} error(s), {warnings} warning(s) in {ms:.0f} ms')
+    sys.exit(1 if errors or (args.strict and warnings) else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,485 @@
+"""Rebuild campaign and map artifacts as their sources change.
+
+    python -m tools.watch --serve                  # + http://localhost:8000/campaign.html?watch=1
+    python -m tools.watch --serve --host 0.0.0.0   # also reachable from the LAN
+    python -m tools.watch --pro-md Patch_4.5_Pro_Alpha_Ch2_M11-20.md --en-md HF9A_EN_dialogue.md
+    python -m tools.watch --no-passes              # only the derived artifacts
+    python -m tools.watch --once                   # one sync, then exit
+
+Watched (polled, stdlib only):
+
+    CampaignData.js      passes (tools.pipeline) -> validate + bundles of the
+                         missions whose section changed
+    --pro-md             passes again (apply_pro_beta2 reads it)
+    --en-md              re-align the changed missions (tools.align_koen),
+                         then gen_trans.mjs --pairs -> CampaignTranslationKOEN.js
+    KOEN tables          bundles of the missions whose table changed
+    maps/**/*.json       .smap + .snav of that map, validate its missions
+
+Changes are debounced (--debounce) and confirmed by content hash, so editor
+touch-saves and this tool's own writes do nothing. Unchanged missions are
+never rebuilt: bundles and validation go by per-mission section hashes, and
+the passes hit the content cache for every section they saw before.
+
+--serve also serves the repo (no-store, so a reload always gets the new
+files; dot paths such as .git/ are refused) on 127.0.0.1 unless --host
+says otherwise, with an event stream at /__watch; pages opened with ?watch=1 load
+src/core/LiveReload.js and reload when their mission or map was rebuilt.
+"""
+import argparse
+import hashlib
+import json
+import queue
+import subprocess
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote
+
+from tools import align_koen
+from tools import bake_navgrid
+from tools import build_campaign_bundles as bundles
+from tools import compile_maps
+from tools import pipeline
+from tools import validate_campaign as validate
+from tools.campaigndoc import CAMPAIGN_JS, ROOT, CampaignDoc, JSSyntaxError
+from tools.contentcache import CACHE_DIR, ContentCache
+from tools.journal import Journal
+
+ALIGNED_JSON = ROOT / '.cache' / 'watch' / 'aligned.json'
+GEN_TRANS = ROOT / 'tools' / 'gen_trans.mjs'
+
+
+def digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def stamp(path: Path):
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def rel(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+class Hub:
+    """Fan-out of rebuild events to the /__watch streams."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clients = set()
+
+    def subscribe(self) -> queue.Queue:
+        q = queue.Queue()
+        with self.lock:
+            self.clients.add(q)
+        return q
+
+    def unsubscribe(self, q):
+        with self.lock:
+            self.clients.discard(q)
+
+    def publish(self, event: dict):
+        with self.lock:
+            for q in self.clients:
+                q.put(event)
+
+
+class Handler(SimpleHTTPRequestHandler):
+    extensions_map = {**SimpleHTTPRequestHandler.extensions_map,
+                      '.js': 'text/javascript', '.mjs': 'text/javascript',
+                      '.smap': 'application/octet-stream', '.snav': 'application/octet-stream'}
+
+    def __init__(self, *args, hub: Hub, **kw):
+        self.hub = hub
+        super().__init__(*args, **kw)
+
+    def end_headers(self):
+        self.send_header('Cache-Control', 'no-store')
+        super().end_headers()
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def send_head(self):
+        # .git/, .cache/, ...: never served
+        if any(part.startswith('.') for part in unquote(self.path.split('?')[0]).split('/')):
+            self.send_error(404)
+            return None
+        return super().send_head()
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/__watch':
+            return super().do_GET()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        q = self.hub.subscribe()
+        try:
+            self.wfile.write(b'retry: 500\n\n')
+            self.wfile.flush()
+            while True:
+                try:
+                    ev = q.get(timeout=15)
+                    self.wfile.write(f'data: {json.dumps(ev, ensure_ascii=False)}\n\n'.encode('utf-8'))
+                except queue.Empty:
+                    self.wfile.write(b': keepalive\n\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.hub.unsubscribe(q)
+
+
+def serve(port: int, hub: Hub, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    httpd = ThreadingHTTPServer((host, port), partial(Handler, directory=str(ROOT), hub=hub))
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+class Watcher:
+    def __init__(self, args, cache: ContentCache, hub: Hub, log=print):
+        self.args = args
+        self.cache = cache
+        self.hub = hub
+        self.log = log
+        self.campaign = Path(args.campaign)
+        self.koen = bundles.KOEN_JS
+        self.pro_md = Path(args.pro_md) if args.pro_md else None
+        self.en_md = Path(args.en_md) if args.en_md else None
+        self.passes = [p for p in args.passes.split(',') if p] if args.passes is not None else \
+            [p.name for p in pipeline.PASSES.values() if all(getattr(args, n, None) for n in p.needs)]
+        self.stamps = {}      # path -> (mtime_ns, size) at the last poll
+        self.digests = {}     # path -> content hash last acted on
+        self.doc = None       # last CampaignDoc built from
+        self.doc_hash = None
+        self.sections = {}    # mission id -> section hash
+        self.mission_map = {} # mission id -> map path
+        self.header = None    # hash of everything before the missions (CAST, helpers)
+        self.koen_tables = ({}, {})
+        self.entries = {}     # mission id -> (index entry, bundle body)
+        self.drafts = {}      # mission id -> (draft hash, aligned pairs)
+        self.maps = validate.MapIndex()
+        self.quiet = False    # sync(): count issues instead of listing them
+
+    # -------- polling --------
+
+    def sources(self) -> list[Path]:
+        out = [self.campaign, self.koen]
+        out += [p for p in (self.pro_md, self.en_md) if p is not None]
+        return out + compile_maps.map_sources()
+
+    def poll(self) -> set[Path]:
+        changed = set()
+        seen = set()
+        for path in self.sources():
+            seen.add(path)
+            s = stamp(path)
+            if self.stamps.get(path) != s:
+                self.stamps[path] = s
+                changed.add(path)
+        for path in set(self.stamps) - seen:
+            del self.stamps[path]
+            changed.add(path)
+        return changed
+
+    def settle(self, changed: set[Path]) -> set[Path]:
+        """Keep polling until nothing changed for --debounce seconds."""
+        quiet = time.monotonic()
+        while time.monotonic() - quiet < self.args.debounce:
+            time.sleep(self.args.interval)
+            more = self.poll()
+            if more:
+                changed |= more
+                quiet = time.monotonic()
+        return changed
+
+    def fresh(self, path: Path) -> bytes | None:
+        """Contents if they differ from what was last acted on, else None."""
+        try:
+            data = path.read_bytes()
+        except OSError:
+            data = b''
+        h = digest(data)
+        if self.digests.get(path) == h:
+            return None
+        self.digests[path] = h
+        return data
+
+    def own_write(self, path: Path):
+        self.digests[path] = digest(path.read_bytes())
+        self.stamps[path] = stamp(path)
+
+    # -------- rebuilds --------
+
+    def handle(self, changed: set[Path]):
+        t0 = time.perf_counter()
+        events = []
+        for path in sorted(p for p in changed if p.suffix == '.json' and compile_maps.MAPS_DIR in p.parents):
+            ev = self.rebuild_map(path)
+            if ev:
+                events.append(ev)
+        pro = self.pro_md in changed and self.fresh(self.pro_md) is not None
+        en = self.en_md in changed and self.fresh(self.en_md) is not None
+        if self.campaign in changed or pro:
+            ev = self.rebuild_campaign(force=pro)
+            if ev:
+                events.append(ev)
+        if en:
+            self.realign()
+            changed.add(self.koen)
+        if self.koen in changed:
+            ev = self.rebuild_translations()
+            if ev:
+                events.append(ev)
+        for ev in events:
+            self.hub.publish(ev)
+        if events:
+            self.log(f'-- rebuilt in {(time.perf_counter() - t0) * 1000:.0f} ms')
+
+    def rebuild_map(self, path: Path) -> dict | None:
+        data = self.fresh(path)
+        if data is None:
+            return None
+        name = rel(path)
+        self.maps.forget(name)
+        if not data:
+            return None
+        files = []
+        try:
+            for out, blob in ((compile_maps.smap_path(path), compile_maps.compile_map(data)),
+                              (bake_navgrid.snav_path(path), bake_navgrid.bake_map(data))):
+                if not out.exists() or out.read_bytes() != blob:
+                    out.write_bytes(blob)
+                    files.append(rel(out))
+        except (ValueError, KeyError, TypeError) as e:
+            self.log(f'{name}: not rebuilt: {e}')
+            return {'kind': 'error', 'message': f'{name}: {e}'}
+        users = [mid for mid in self.sections if self.mission_map.get(mid) == name]
+        if files or not self.quiet:
+            self.log(f'{name}: {", ".join(files) or "outputs up to date"}')
+        if users and self.doc is not None:
+            self.report(self.doc, users)
+        return {'kind': 'map', 'maps': [name], 'files': files, 'missions': users}
+
+    def rebuild_campaign(self, force: bool = False) -> dict | None:
+        """Run the passes, then rebuild what the changed missions feed.
+        `force` re-runs the passes when only their other inputs changed."""
+        with open(self.campaign, encoding='utf-8', newline='') as f:
+            text = f.read()
+        h = digest(text.encode('utf-8'))
+        if h == self.digests.get(self.campaign) and not force:
+            return None
+        self.digests[self.campaign] = h
+        if self.passes:
+            journal = Journal(self.campaign)
+            try:
+                out = pipeline.run(text, self.passes, self.args, self.cache, self.args.jobs,
+                                   log=self.log, journal=journal)
+            except JSSyntaxError as e:
+                self.log(f'{rel(self.campaign)}: parse error, waiting for the next save: {e}')
+                return {'kind': 'error', 'message': str(e)}
+            if out != text:
+                pipeline.write_atomic(self.campaign, out)
+                self.own_write(self.campaign)
+                journal.flush()
+                text = out
+        h = digest(text.encode('utf-8'))
+        if h == self.doc_hash:
+            return None
+        try:
+            doc = CampaignDoc(text)
+            refs = doc.cast()
+        except JSSyntaxError as e:
+            self.log(f'{rel(self.campaign)}: parse error, waiting for the next save: {e}')
+            return {'kind': 'error', 'message': str(e)}
+
+        header = digest(text[:doc.missions_node.start].encode('utf-8'))
+        sections = {mid: digest(doc.section_text(mid).encode('utf-8')) for mid in doc.missions}
+        if header != self.header:
+            dirty = list(sections)
+        else:
+            dirty = [mid for mid, s in sections.items() if self.sections.get(mid) != s]
+        removed = [mid for mid in self.sections if mid not in sections]
+        self.header, self.sections, self.doc, self.doc_hash = header, sections, doc, h
+        self.mission_map = {mid: validate._mission_map(doc, mid) for mid in doc.missions}
+        if not dirty and not removed:
+            return None
+        try:
+            files = self.write_bundles(doc, dirty, removed, refs)
+        except (JSSyntaxError, ValueError) as e:
+            self.log(f'{rel(self.campaign)}: bundles not rebuilt: {e}')
+            return {'kind': 'error', 'message': str(e)}
+        self.report(doc, dirty)
+        self.log(f'{rel(self.campaign)}: {len(dirty)} mission(s) changed, {len(removed)} removed, '
+                 f'{len(files)} file(s) written')
+        return {'kind': 'campaign', 'missions': sorted(dirty + removed), 'files': files}
+
+    def write_bundles(self, doc: CampaignDoc, dirty, removed, refs=None) -> list[str]:
+        refs = refs if refs is not None else doc.cast()
+        for mid in dirty:
+            self.entries[mid] = bundles.build_mission(doc, mid, self.koen_tables, refs)
+        for mid in removed:
+            self.entries.pop(mid, None)
+        index = {mid: self.entries[mid][0] for mid in doc.missions}
+        files = {f'bundles/{mid}.json': self.entries[mid][1] for mid in doc.missions}
+        files['CampaignIndex.js'] = bundles.index_js(doc, index)
+        return bundles.write(files)
+
+    def rebuild_translations(self) -> dict | None:
+        if self.fresh(self.koen) is None or self.doc is None:
+            return None
+        old_mission, old_global = self.koen_tables
+        self.koen_tables = by_mission, global_map = bundles.load_koen(self.koen)
+        if global_map != old_global:
+            dirty = list(self.doc.missions)
+        else:
+            dirty = [mid for mid in self.doc.missions if by_mission.get(mid) != old_mission.get(mid)]
+        if not dirty:
+            return None
+        files = self.write_bundles(self.doc, dirty, [])
+        self.log(f'{rel(self.koen)}: {len(dirty)} mission table(s) changed, {len(files)} file(s) written')
+        return {'kind': 'campaign', 'missions': sorted(dirty), 'files': files}
+
+    def realign(self):
+        """Re-align the en draft missions whose lines changed, then regenerate
+        the KOEN tables from every mission's pairs."""
+        if self.doc is None:
+            return
+        drafts = align_koen.draft_lines(self.en_md, self.args.level)
+        changed = {}
+        for mid, lines in drafts.items():
+            h = digest(json.dumps([(ln.text, ln.speaker) for ln in lines]).encode('utf-8'))
+            if self.drafts.get(mid, (None,))[0] != h:
+                changed[mid] = (h, lines)
+        for mid in set(self.drafts) - set(drafts):
+            del self.drafts[mid]
+        if changed:
+            result = align_koen.align_all(self.doc, {mid: lines for mid, (_, lines) in changed.items()},
+                                          self.args.min_score)
+            pairs = align_koen.to_pairs(result, self.args.min_conf)
+            for mid, (h, _) in changed.items():
+                self.drafts[mid] = (h, pairs.get(mid, []))
+        if not changed:
+            return
+        ALIGNED_JSON.parent.mkdir(parents=True, exist_ok=True)
+        ALIGNED_JSON.write_text(json.dumps({mid: p for mid, (_, p) in self.drafts.items()},
+                                           ensure_ascii=False), encoding='utf-8')
+        self.log(f'{rel(self.en_md)}: {len(changed)} mission(s) re-aligned')
+        proc = subprocess.run(['node', str(GEN_TRANS), '--pairs', str(ALIGNED_JSON)], cwd=ROOT,
+                              capture_output=True, text=True)
+        if proc.returncode:
+            self.log(f'gen_trans.mjs failed:\n{proc.stderr.strip()}')
+
+    def report(self, doc: CampaignDoc, missions):
+        issues, _, _ = validate.validate(doc, set(missions), self.cache, self.maps)
+        if not issues or self.quiet:
+            return issues
+        lines = validate.LineIndex(doc.text)
+        issues.sort(key=lambda i: i.pos)
+        for i in issues[:self.args.max_issues]:
+            line, col = lines.where(i.pos)
+            where = '/'.join(x for x in (i.mission, i.step) if x)
+            self.log(f'{rel(self.campaign)}:{line}:{col}: {i.severity} {i.code}: {i.message} [{where}]')
+        if len(issues) > self.args.max_issues:
+            self.log(f'... {len(issues) - self.args.max_issues} more (python -m tools.validate_campaign)')
+        return issues
+
+    # -------- loop --------
+
+    def sync(self):
+        """First pass: bring every artifact up to date."""
+        self.poll()
+        self.quiet = True
+        self.koen_tables = bundles.load_koen(self.koen)
+        self.fresh(self.koen)
+        if self.pro_md is not None:
+            self.fresh(self.pro_md)
+        self.rebuild_campaign(force=True)
+        if self.en_md is not None:
+            self.fresh(self.en_md)
+            self.realign()
+            self.rebuild_translations()
+        for path in compile_maps.map_sources():
+            self.rebuild_map(path)
+        self.poll()  # forget our own writes
+        self.quiet = False
+        if self.doc is not None:
+            issues = validate.validate(self.doc, None, self.cache, self.maps)[0]
+            errors = sum(i.severity == 'E' for i in issues)
+            self.log(f'validate: {errors} error(s), {len(issues) - errors} warning(s) '
+                     f'(details: python -m tools.validate_campaign)')
+
+    def run(self):
+        while True:
+            changed = self.poll()
+            if changed:
+                self.handle(self.settle(changed))
+            time.sleep(self.args.interval)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Watch campaign/map sources and rebuild what they feed.')
+    ap.add_argument('--campaign', default=str(CAMPAIGN_JS))
+    ap.add_argument('--pro-md', help='Pro Alpha markdown (runs apply_pro_beta2 on change)')
+    ap.add_argument('--en-md', help='EN dialogue draft (re-aligned into CampaignTranslationKOEN.js on change)')
+    ap.add_argument('--level', type=int, default=3, help='--en-md: heading level of the mission headers')
+    ap.add_argument('--min-score', type=float, default=0.3, help='--en-md: see tools.align_koen')
+    ap.add_argument('--min-conf', type=float, default=0.3, help='--en-md: see tools.align_koen')
+    ap.add_argument('--passes', help='comma-separated pipeline passes (default: as tools.pipeline)')
+    ap.add_argument('--no-passes', dest='passes', action='store_const', const='',
+                    help='leave CampaignData.js alone; only rebuild derived files')
+    ap.add_argument('--serve', type=int, nargs='?', const=8000, metavar='PORT',
+                    help='serve the repo with live reload (default port 8000)')
+    ap.add_argument('--host', default='127.0.0.1',
+                    help='--serve: address to bind (default 127.0.0.1; 0.0.0.0 exposes it to the LAN)')
+    ap.add_argument('--debounce', type=float, default=0.15, help='seconds of quiet before rebuilding')
+    ap.add_argument('--interval', type=float, default=0.05, help='poll interval in seconds')
+    ap.add_argument('--max-issues', type=int, default=20, help='validation lines printed per rebuild')
+    ap.add_argument('--jobs', '-j', type=int, default=1)
+    ap.add_argument('--once', action='store_true', help='sync once and exit')
+    ap.add_argument('--cache-dir', default=str(CACHE_DIR))
+    args = ap.parse_args(argv)
+
+    if args.passes:
+        unknown = [p for p in args.passes.split(',') if p and p not in pipeline.PASSES]
+        if unknown:
+            ap.error(f'unknown pass(es): {", ".join(unknown)} (see python -m tools.pipeline --list)')
+        for name in args.passes.split(','):
+            missing = [n for n in pipeline.PASSES[name].needs if not getattr(args, n)] if name else []
+            if missing:
+                ap.error(f'{name} needs --{missing[0].replace("_", "-")}')
+
+    hub = Hub()
+    with ContentCache(args.cache_dir) as cache:
+        w = Watcher(args, cache, hub)
+        t0 = time.perf_counter()
+        w.sync()
+        print(f'OK: synced in {(time.perf_counter() - t0) * 1000:.0f} ms; passes: {", ".join(w.passes) or "none"}')
+        if args.once:
+            return 0
+        if args.serve is not None:
+            serve(args.serve, hub, args.host)
+            shown = 'localhost' if args.host in ('127.0.0.1', 'localhost') else args.host
+            print(f'serving {ROOT} at http://{shown}:{args.serve}/campaign.html?watch=1')
+        print('watching (Ctrl-C to stop)')
+        try:
+            w.run()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())